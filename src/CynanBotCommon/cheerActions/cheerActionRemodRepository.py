@@ -50,15 +50,18 @@ class CheerActionRemodRepository(CheerActionRemodRepositoryInterface):
             raise ValueError(f'data argument is malformed: \"{data}\"')
 
         connection = await self.__getDatabaseConnection()
-        await connection.execute(
-            '''
-                INSERT INTO cheerremodactions (broadcasteruserid, remoddatetime, userid)
-                VALUES ($1, $2, $3)
-            ''',
-            data.getBroadcasterUserId(), data.getRemodDateTime().getIsoFormatStr(), data.getUserId()
-        )
-
-        await connection.close()
+
+        try:
+            await connection.execute(
+                '''
+                    INSERT INTO cheerremodactions (broadcasteruserid, remoddatetime, userid)
+                    VALUES ($1, $2, $3)
+                ''',
+                data.getBroadcasterUserId(), data.getRemodDateTime().getIsoFormatStr(), data.getUserId()
+            )
+        finally:
+            await connection.close()
+
         self.__timber.log('CheerActionRemodRepository', f'Added remod action ({data=})')
 
     async def delete(self, broadcasterUserId: str, userId: str):
@@ -68,28 +71,34 @@ class CheerActionRemodRepository(CheerActionRemodRepositoryInterface):
             raise ValueError(f'userId argument is malformed: \"{userId}\"')
 
         connection = await self.__getDatabaseConnection()
-        await connection.execute(
-            '''
-                DELETE FROM cheerremodactions
-                WHERE broadcasteruserid = $1 AND userid = $2
-            ''',
-            broadcasterUserId, userId
-        )
-
-        await connection.close()
+
+        try:
+            await connection.execute(
+                '''
+                    DELETE FROM cheerremodactions
+                    WHERE broadcasteruserid = $1 AND userid = $2
+                ''',
+                broadcasterUserId, userId
+            )
+        finally:
+            await connection.close()
+
         self.__timber.log('CheerActionRemodRepository', f'Deleted remod action ({broadcasterUserId=}) ({userId=})')
 
     async def getAll(self) -> List[CheerActionRemodData]:
         connection = await self.__getDatabaseConnection()
-        records = await connection.fetchRows(
-            '''
-                SELECT cheerremodactions.broadcasteruserid, cheerremodactions.remoddatetime, cheerremodactions.userid, userids.username FROM cheerremodactions
-                INNER JOIN userids ON cheerremodactions.userid = userids.userid
-                ORDER BY cheerremodactions.remoddatetime ASC
-            '''
-        )
-
-        await connection.close()
+
+        try:
+            records = await connection.fetchRows(
+                '''
+                    SELECT cheerremodactions.broadcasteruserid, cheerremodactions.remoddatetime, cheerremodactions.userid, userids.username FROM cheerremodactions
+                    INNER JOIN userids ON cheerremodactions.userid = userids.userid
+                    ORDER BY cheerremodactions.remoddatetime ASC
+                '''
+            )
+        finally:
+            await connection.close()
+
         data: List[CheerActionRemodData] = list()
         now = SimpleDateTime()
 
@@ -120,29 +129,30 @@ class CheerActionRemodRepository(CheerActionRemodRepositoryInterface):
         self.__isDatabaseReady = True
         connection = await self.__backingDatabase.getConnection()
 
-        if connection.getDatabaseType() is DatabaseType.POSTGRESQL:
-            await connection.createTableIfNotExists(
-                '''
-                    CREATE TABLE IF NOT EXISTS cheerremodactions (
-                        broadcasteruserid public.citext NOT NULL,
-                        remoddatetime text NOT NULL,
-                        userid public.citext NOT NULL,
-                        PRIMARY KEY (broadcasteruserid, userid)
-                    )
-                '''
-            )
-        elif connection.getDatabaseType() is DatabaseType.SQLITE:
-            await connection.createTableIfNotExists(
-                '''
-                    CREATE TABLE IF NOT EXISTS cheerremodactions (
-                        broadcasteruserid TEXT NOT NULL COLLATE NOCASE,
-                        remoddatetime TEXT NOT NULL,
-                        userid TEXT NOT NULL COLLATE NOCASE,
-                        PRIMARY KEY (broadcasteruserid, userid)
-                    )
-                '''
-            )
-        else:
-            raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
-
-        await connection.close()
+        try:
+            if connection.getDatabaseType() is DatabaseType.POSTGRESQL:
+                await connection.createTableIfNotExists(
+                    '''
+                        CREATE TABLE IF NOT EXISTS cheerremodactions (
+                            broadcasteruserid public.citext NOT NULL,
+                            remoddatetime text NOT NULL,
+                            userid public.citext NOT NULL,
+                            PRIMARY KEY (broadcasteruserid, userid)
+                        )
+                    '''
+                )
+            elif connection.getDatabaseType() is DatabaseType.SQLITE:
+                await connection.createTableIfNotExists(
+                    '''
+                        CREATE TABLE IF NOT EXISTS cheerremodactions (
+                            broadcasteruserid TEXT NOT NULL COLLATE NOCASE,
+                            remoddatetime TEXT NOT NULL,
+                            userid TEXT NOT NULL COLLATE NOCASE,
+                            PRIMARY KEY (broadcasteruserid, userid)
+                        )
+                    '''
+                )
+            else:
+                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
+        finally:
+            await connection.close()
@@ -108,15 +108,18 @@ class CheerActionsRepository(CheerActionsRepositoryInterface):
             )
 
         connection = await self.__getDatabaseConnection()
-        await connection.execute(
-            '''
-                INSERT INTO cheeractions (actionid, actionrequirement, actiontype, amount, durationseconds, userid)
-                VALUES ($1, $2, $3, $4, $5, $6)
-            ''',
-            actionId, actionRequirement.toStr(), actionType.toStr(), amount, durationSeconds, userId
-        )
 
-        await connection.close()
+        try:
+            await connection.execute(
+                '''
+                    INSERT INTO cheeractions (actionid, actionrequirement, actiontype, amount, durationseconds, userid)
+                    VALUES ($1, $2, $3, $4, $5, $6)
+                ''',
+                actionId, actionRequirement.toStr(), actionType.toStr(), amount, durationSeconds, userId
+            )
+        finally:
+            await connection.close()
+
         self.__cache.pop(userId, None)
 
         action = await self.getAction(
@@ -150,15 +153,18 @@ class CheerActionsRepository(CheerActionsRepositoryInterface):
             return None
 
         connection = await self.__getDatabaseConnection()
-        await connection.execute(
-            '''
-                DELETE FROM cheeractions
-                WHERE actionid = $1 AND userid = $2
-            ''',
-            actionId, userId
-        )
 
-        await connection.close()
+        try:
+            await connection.execute(
+                '''
+                    DELETE FROM cheeractions
+                    WHERE actionid = $1 AND userid = $2
+                ''',
+                actionId, userId
+            )
+        finally:
+            await connection.close()
+
         self.__cache.pop(action.getUserId(), None)
         self.__timber.log('CheerActionsRepository', f'Deleted cheer action ({actionId=}) ({userId=}) ({action=})')
 
@@ -189,17 +195,20 @@ class CheerActionsRepository(CheerActionsRepositoryInterface):
             return self.__cache[userId]
 
         connection = await self.__getDatabaseConnection()
-        records = await connection.fetchRows(
-            '''
-                SELECT cheeractions.actionid, cheeractions.actionrequirement, cheeractions.actiontype, cheeractions.amount, cheeractions.durationseconds, cheeractions.userid, userids.username FROM cheeractions
-                INNER JOIN userids ON cheeractions.userid = userids.userid
-                WHERE cheeractions.userid = $1
-                ORDER BY cheeractions.amount DESC
-            ''',
-            userId
-        )
 
-        await connection.close()
+        try:
+            records = await connection.fetchRows(
+                '''
+                    SELECT cheeractions.actionid, cheeractions.actionrequirement, cheeractions.actiontype, cheeractions.amount, cheeractions.durationseconds, cheeractions.userid, userids.username FROM cheeractions
+                    INNER JOIN userids ON cheeractions.userid = userids.userid
+                    WHERE cheeractions.userid = $1
+                    ORDER BY cheeractions.amount DESC
+                ''',
+                userId
+            )
+        finally:
+            await connection.close()
+
         actions: List[CheerAction] = list()
 
         if utils.hasItems(records):
@@ -228,35 +237,36 @@ class CheerActionsRepository(CheerActionsRepositoryInterface):
         self.__isDatabaseReady = True
         connection = await self.__backingDatabase.getConnection()
 
-        if connection.getDatabaseType() is DatabaseType.POSTGRESQL:
-            await connection.createTableIfNotExists(
-                '''
-                    CREATE TABLE IF NOT EXISTS cheeractions (
-                        actionid public.citext NOT NULL,
-                        actionrequirement text NOT NULL,
-                        actiontype text NOT NULL,
-                        amount integer NOT NULL,
-                        durationseconds integer NOT NULL,
-                        userid public.citext NOT NULL,
-                        PRIMARY KEY (actionid, userid)
-                    )
-                '''
-            )
-        elif connection.getDatabaseType() is DatabaseType.SQLITE:
-            await connection.createTableIfNotExists(
-                '''
-                    CREATE TABLE IF NOT EXISTS cheeractions (
-                        actionid TEXT NOT NULL COLLATE NOCASE,
-                        actionrequirement TEXT NOT NULL,
-                        actiontype TEXT NOT NULL,
-                        amount INTEGER NOT NULL,
-                        durationseconds INTEGER NOT NULL,
-                        userid TEXT NOT NULL COLLATE NOCASE,
-                        PRIMARY KEY (actionid, userid)
-                    )
-                '''
-            )
-        else:
-            raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
-
-        await connection.close()
+        try:
+            if connection.getDatabaseType() is DatabaseType.POSTGRESQL:
+                await connection.createTableIfNotExists(
+                    '''
+                        CREATE TABLE IF NOT EXISTS cheeractions (
+                            actionid public.citext NOT NULL,
+                            actionrequirement text NOT NULL,
+                            actiontype text NOT NULL,
+                            amount integer NOT NULL,
+                            durationseconds integer NOT NULL,
+                            userid public.citext NOT NULL,
+                            PRIMARY KEY (actionid, userid)
+                        )
+                    '''
+                )
+            elif connection.getDatabaseType() is DatabaseType.SQLITE:
+                await connection.createTableIfNotExists(
+                    '''
+                        CREATE TABLE IF NOT EXISTS cheeractions (
+                            actionid TEXT NOT NULL COLLATE NOCASE,
+                            actionrequirement TEXT NOT NULL,
+                            actiontype TEXT NOT NULL,
+                            amount INTEGER NOT NULL,
+                            durationseconds INTEGER NOT NULL,
+                            userid TEXT NOT NULL COLLATE NOCASE,
+                            PRIMARY KEY (actionid, userid)
+                        )
+                    '''
+                )
+            else:
+                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
+        finally:
+            await connection.close()
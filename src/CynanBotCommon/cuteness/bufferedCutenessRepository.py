@@ -0,0 +1,294 @@
+import asyncio
+import traceback
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import CynanBotCommon.utils as utils
+    from CynanBotCommon.backgroundTaskHelper import BackgroundTaskHelper
+    from CynanBotCommon.cuteness.cutenessChampionsResult import \
+        CutenessChampionsResult
+    from CynanBotCommon.cuteness.cutenessDate import CutenessDate
+    from CynanBotCommon.cuteness.cutenessHistoryResult import \
+        CutenessHistoryResult
+    from CynanBotCommon.cuteness.cutenessIncrement import CutenessIncrement
+    from CynanBotCommon.cuteness.cutenessLeaderboardHistoryResult import \
+        CutenessLeaderboardHistoryResult
+    from CynanBotCommon.cuteness.cutenessLeaderboardResult import \
+        CutenessLeaderboardResult
+    from CynanBotCommon.cuteness.cutenessRepositoryInterface import \
+        CutenessRepositoryInterface
+    from CynanBotCommon.cuteness.cutenessResult import CutenessResult
+    from CynanBotCommon.timber.timberInterface import TimberInterface
+except:
+    import utils
+    from backgroundTaskHelper import BackgroundTaskHelper
+    from cuteness.cutenessChampionsResult import CutenessChampionsResult
+    from cuteness.cutenessDate import CutenessDate
+    from cuteness.cutenessHistoryResult import CutenessHistoryResult
+    from cuteness.cutenessIncrement import CutenessIncrement
+    from cuteness.cutenessLeaderboardHistoryResult import \
+        CutenessLeaderboardHistoryResult
+    from cuteness.cutenessLeaderboardResult import CutenessLeaderboardResult
+    from cuteness.cutenessRepositoryInterface import \
+        CutenessRepositoryInterface
+    from cuteness.cutenessResult import CutenessResult
+    from timber.timberInterface import TimberInterface
+
+
+class BufferedCutenessRepository(CutenessRepositoryInterface):
+
+    def __init__(
+        self,
+        backgroundTaskHelper: BackgroundTaskHelper,
+        cutenessRepository: CutenessRepositoryInterface,
+        timber: TimberInterface,
+        flushSleepTimeSeconds: float = 5
+    ):
+        if not isinstance(backgroundTaskHelper, BackgroundTaskHelper):
+            raise ValueError(f'backgroundTaskHelper argument is malformed: \"{backgroundTaskHelper}\"')
+        elif not isinstance(cutenessRepository, CutenessRepositoryInterface):
+            raise ValueError(f'cutenessRepository argument is malformed: \"{cutenessRepository}\"')
+        elif not isinstance(timber, TimberInterface):
+            raise ValueError(f'timber argument is malformed: \"{timber}\"')
+        elif not utils.isValidNum(flushSleepTimeSeconds):
+            raise ValueError(f'flushSleepTimeSeconds argument is malformed: \"{flushSleepTimeSeconds}\"')
+        elif flushSleepTimeSeconds < 1 or flushSleepTimeSeconds > 60:
+            raise ValueError(f'flushSleepTimeSeconds argument is out of bounds: {flushSleepTimeSeconds}')
+
+        self.__cutenessRepository: CutenessRepositoryInterface = cutenessRepository
+        self.__timber: TimberInterface = timber
+        self.__flushSleepTimeSeconds: float = flushSleepTimeSeconds
+
+        self.__bufferLock: asyncio.Lock = asyncio.Lock()
+        self.__bufferedCutenesses: Dict[Tuple[str, str, str], CutenessResult] = dict()
+        self.__flushedCutenesses: Dict[Tuple[str, str, str], int] = dict()
+
+        backgroundTaskHelper.createTask(self.__startFlushLoop())
+
+    async def fetchCuteness(
+        self,
+        twitchChannel: str,
+        userId: str,
+        userName: str,
+    ) -> CutenessResult:
+        if not utils.isValidStr(twitchChannel):
+            raise ValueError(f'twitchChannel argument is malformed: \"{twitchChannel}\"')
+        elif not utils.isValidStr(userId):
+            raise ValueError(f'userId argument is malformed: \"{userId}\"')
+        elif not utils.isValidStr(userName):
+            raise ValueError(f'userName argument is malformed: \"{userName}\"')
+
+        bufferedCuteness = self.__bufferedCutenesses.get(self.__toBufferKey(CutenessDate(), twitchChannel, userId))
+
+        if bufferedCuteness is not None:
+            return bufferedCuteness
+
+        return await self.__cutenessRepository.fetchCuteness(
+            twitchChannel = twitchChannel,
+            userId = userId,
+            userName = userName
+        )
+
+    async def fetchCutenessChampions(self, twitchChannel: str) -> CutenessChampionsResult:
+        await self.flush()
+        return await self.__cutenessRepository.fetchCutenessChampions(twitchChannel)
+
+    async def fetchCutenessHistory(
+        self,
+        twitchChannel: str,
+        userId: str,
+        userName: str
+    ) -> CutenessHistoryResult:
+        await self.flush()
+
+        return await self.__cutenessRepository.fetchCutenessHistory(
+            twitchChannel = twitchChannel,
+            userId = userId,
+            userName = userName
+        )
+
+    async def fetchCutenessIncrementedBy(
+        self,
+        incrementAmount: int,
+        twitchChannel: str,
+        userId: str,
+        userName: str
+    ) -> CutenessResult:
+        if not utils.isValidInt(incrementAmount):
+            raise ValueError(f'incrementAmount argument is malformed: \"{incrementAmount}\"')
+        elif incrementAmount < utils.getLongMinSafeSize() or incrementAmount > utils.getLongMaxSafeSize():
+            raise ValueError(f'incrementAmount argument is out of bounds: {incrementAmount}')
+        elif not utils.isValidStr(twitchChannel):
+            raise ValueError(f'twitchChannel argument is malformed: \"{twitchChannel}\"')
+        elif not utils.isValidStr(userId):
+            raise ValueError(f'userId argument is malformed: \"{userId}\"')
+        elif userId == '0':
+            raise ValueError(f'userId argument is an illegal value: \"{userId}\"')
+        elif not utils.isValidStr(userName):
+            raise ValueError(f'userName argument is malformed: \"{userName}\"')
+
+        async with self.__bufferLock:
+            return await self.__incrementBufferedCuteness(
+                incrementAmount = incrementAmount,
+                twitchChannel = twitchChannel,
+                userId = userId,
+                userName = userName
+            )
+
+    async def fetchCutenessesIncrementedBy(
+        self,
+        twitchChannel: str,
+        increments: List[CutenessIncrement],
+        cutenessDate: Optional[CutenessDate] = None
+    ) -> List[CutenessResult]:
+        if not utils.isValidStr(twitchChannel):
+            raise ValueError(f'twitchChannel argument is malformed: \"{twitchChannel}\"')
+        elif not isinstance(increments, List):
+            raise ValueError(f'increments argument is malformed: \"{increments}\"')
+        elif cutenessDate is not None and not isinstance(cutenessDate, CutenessDate):
+            raise ValueError(f'cutenessDate argument is malformed: \"{cutenessDate}\"')
+
+        userIds = set()
+
+        for increment in increments:
+            if not isinstance(increment, CutenessIncrement):
+                raise ValueError(f'increments argument contains a malformed value: \"{increment}\"')
+            elif increment.getUserId() in userIds:
+                raise ValueError(f'increments argument contains a duplicate user ID: \"{increment.getUserId()}\"')
+
+            userIds.add(increment.getUserId())
+
+        if cutenessDate is not None and cutenessDate.getStr() != CutenessDate().getStr():
+            # only the current month is buffered, so anything else goes straight through
+            await self.flush()
+
+            return await self.__cutenessRepository.fetchCutenessesIncrementedBy(
+                twitchChannel = twitchChannel,
+                increments = increments,
+                cutenessDate = cutenessDate
+            )
+
+        results: List[CutenessResult] = list()
+
+        async with self.__bufferLock:
+            for increment in increments:
+                results.append(await self.__incrementBufferedCuteness(
+                    incrementAmount = increment.getIncrementAmount(),
+                    twitchChannel = twitchChannel,
+                    userId = increment.getUserId(),
+                    userName = increment.getUserName()
+                ))
+
+        return results
+
+    async def fetchCutenessLeaderboard(
+        self,
+        twitchChannel: str,
+        specificLookupUserId: Optional[str] = None,
+        specificLookupUserName: Optional[str] = None
+    ) -> CutenessLeaderboardResult:
+        await self.flush()
+
+        return await self.__cutenessRepository.fetchCutenessLeaderboard(
+            twitchChannel = twitchChannel,
+            specificLookupUserId = specificLookupUserId,
+            specificLookupUserName = specificLookupUserName
+        )
+
+    async def fetchCutenessLeaderboardHistory(self, twitchChannel: str) -> CutenessLeaderboardHistoryResult:
+        await self.flush()
+        return await self.__cutenessRepository.fetchCutenessLeaderboardHistory(twitchChannel)
+
+    async def flush(self):
+        async with self.__bufferLock:
+            if len(self.__bufferedCutenesses) == 0:
+                return
+
+            # a user can have buffered cuteness in two months if the month changed before this
+            # flush, and each month's cuteness has to be written to that same month
+            channelMonthBufferKeys: Dict[Tuple[str, str], List[Tuple[str, str, str]]] = defaultdict(lambda: list())
+
+            for bufferKey in self.__bufferedCutenesses.keys():
+                channelMonthBufferKeys[(bufferKey[0], bufferKey[2])].append(bufferKey)
+
+            for (twitchChannel, utcYearAndMonth), bufferKeys in channelMonthBufferKeys.items():
+                increments: List[CutenessIncrement] = list()
+
+                for bufferKey in bufferKeys:
+                    bufferedCuteness = self.__bufferedCutenesses[bufferKey]
+
+                    # only the difference from what's already in the database gets written, as the
+                    # wrapped repository applies these as increments
+                    incrementAmount = bufferedCuteness.getCuteness() - self.__flushedCutenesses[bufferKey]
+
+                    if incrementAmount == 0:
+                        continue
+
+                    increments.append(CutenessIncrement(
+                        incrementAmount = incrementAmount,
+                        userId = bufferedCuteness.getUserId(),
+                        userName = bufferedCuteness.getUserName()
+                    ))
+
+                if len(increments) >= 1:
+                    await self.__cutenessRepository.fetchCutenessesIncrementedBy(
+                        twitchChannel = twitchChannel,
+                        increments = increments,
+                        cutenessDate = CutenessDate(utcYearAndMonth)
+                    )
+
+                # this month is now written, so drop it right away in case a later one fails
+                for bufferKey in bufferKeys:
+                    del self.__bufferedCutenesses[bufferKey]
+                    del self.__flushedCutenesses[bufferKey]
+
+    async def __incrementBufferedCuteness(
+        self,
+        incrementAmount: int,
+        twitchChannel: str,
+        userId: str,
+        userName: str
+    ) -> CutenessResult:
+        cutenessDate = CutenessDate()
+        bufferKey = self.__toBufferKey(cutenessDate, twitchChannel, userId)
+        bufferedCuteness = self.__bufferedCutenesses.get(bufferKey)
+
+        if bufferedCuteness is None:
+            bufferedCuteness = await self.__cutenessRepository.fetchCuteness(
+                twitchChannel = twitchChannel,
+                userId = userId,
+                userName = userName
+            )
+
+            self.__flushedCutenesses[bufferKey] = bufferedCuteness.getCuteness()
+
+        oldCuteness = bufferedCuteness.getCuteness()
+        newCuteness: int = oldCuteness + incrementAmount
+
+        if newCuteness < 0:
+            newCuteness = 0
+        elif newCuteness > utils.getLongMaxSafeSize():
+            raise OverflowError(f'New cuteness ({newCuteness}) would be too large (old cuteness = {oldCuteness}) (increment amount = {incrementAmount})')
+
+        bufferedCuteness = CutenessResult(
+            cutenessDate = cutenessDate,
+            cuteness = newCuteness,
+            userId = userId,
+            userName = userName
+        )
+
+        self.__bufferedCutenesses[bufferKey] = bufferedCuteness
+        return bufferedCuteness
+
+    async def __startFlushLoop(self):
+        while True:
+            await asyncio.sleep(self.__flushSleepTimeSeconds)
+
+            try:
+                await self.flush()
+            except Exception as e:
+                self.__timber.log('BufferedCutenessRepository', f'Encountered unknown Exception when flushing buffered cuteness: {e}', e, traceback.format_exc())
+
+    def __toBufferKey(self, cutenessDate: CutenessDate, twitchChannel: str, userId: str) -> Tuple[str, str, str]:
+        return (twitchChannel.lower(), userId.lower(), cutenessDate.getStr())
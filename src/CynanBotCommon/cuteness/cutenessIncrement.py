@@ -0,0 +1,37 @@
+try:
+    import CynanBotCommon.utils as utils
+except:
+    import utils
+
+
+class CutenessIncrement():
+
+    def __init__(
+        self,
+        incrementAmount: int,
+        userId: str,
+        userName: str
+    ):
+        if not utils.isValidInt(incrementAmount):
+            raise ValueError(f'incrementAmount argument is malformed: \"{incrementAmount}\"')
+        elif incrementAmount < utils.getLongMinSafeSize() or incrementAmount > utils.getLongMaxSafeSize():
+            raise ValueError(f'incrementAmount argument is out of bounds: {incrementAmount}')
+        elif not utils.isValidStr(userId):
+            raise ValueError(f'userId argument is malformed: \"{userId}\"')
+        elif userId == '0':
+            raise ValueError(f'userId argument is an illegal value: \"{userId}\"')
+        elif not utils.isValidStr(userName):
+            raise ValueError(f'userName argument is malformed: \"{userName}\"')
+
+        self.__incrementAmount: int = incrementAmount
+        self.__userId: str = userId
+        self.__userName: str = userName
+
+    def getIncrementAmount(self) -> int:
+        return self.__incrementAmount
+
+    def getUserId(self) -> str:
+        return self.__userId
+
+    def getUserName(self) -> str:
+        return self.__userName
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 try:
     import CynanBotCommon.utils as utils
@@ -9,6 +9,7 @@ try:
         CutenessHistoryEntry
     from CynanBotCommon.cuteness.cutenessHistoryResult import \
         CutenessHistoryResult
+    from CynanBotCommon.cuteness.cutenessIncrement import CutenessIncrement
     from CynanBotCommon.cuteness.cutenessLeaderboardEntry import \
         CutenessLeaderboardEntry
     from CynanBotCommon.cuteness.cutenessLeaderboardHistoryResult import \
@@ -29,6 +30,7 @@ except:
     from cuteness.cutenessDate import CutenessDate
     from cuteness.cutenessHistoryEntry import CutenessHistoryEntry
     from cuteness.cutenessHistoryResult import CutenessHistoryResult
+    from cuteness.cutenessIncrement import CutenessIncrement
     from cuteness.cutenessLeaderboardEntry import CutenessLeaderboardEntry
     from cuteness.cutenessLeaderboardHistoryResult import \
         CutenessLeaderboardHistoryResult
@@ -98,17 +100,19 @@ class CutenessRepository(CutenessRepositoryInterface):
         cutenessDate = CutenessDate()
 
         connection = await self.__getDatabaseConnection()
-        record = await connection.fetchRow(
-            '''
-                SELECT cuteness.cuteness, cuteness.userid, userids.username FROM cuteness
-                INNER JOIN userids ON cuteness.userid = userids.userid
-                WHERE cuteness.twitchchannel = $1 AND cuteness.userid = $2 AND cuteness.utcyearandmonth = $3
-                LIMIT 1
-            ''',
-            twitchChannel, userId, cutenessDate.getStr()
-        )
 
-        await connection.close()
+        try:
+            record = await connection.fetchRow(
+                '''
+                    SELECT cuteness.cuteness, cuteness.userid, userids.username FROM cuteness
+                    INNER JOIN userids ON cuteness.userid = userids.userid
+                    WHERE cuteness.twitchchannel = $1 AND cuteness.userid = $2 AND cuteness.utcyearandmonth = $3
+                    LIMIT 1
+                ''',
+                twitchChannel, userId, cutenessDate.getStr()
+            )
+        finally:
+            await connection.close()
 
         if not utils.hasItems(record):
             return CutenessResult(
@@ -134,19 +138,21 @@ class CutenessRepository(CutenessRepositoryInterface):
         twitchChannelUserId = await self.__userIdsRepository.requireUserId(userName = twitchChannel)
 
         connection = await self.__getDatabaseConnection()
-        records = await connection.fetchRows(
-            '''
-                SELECT cuteness.userid, userids.username, SUM(cuteness.cuteness) AS totalcuteness FROM cuteness
-                INNER JOIN userids ON cuteness.userid = userids.userid
-                WHERE cuteness.twitchchannel = $1 AND cuteness.userid != $2
-                GROUP BY cuteness.userid, userids.username
-                ORDER BY totalcuteness DESC
-                LIMIT $3
-            ''',
-            twitchChannel, twitchChannelUserId, self.__leaderboardSize
-        )
 
-        await connection.close()
+        try:
+            records = await connection.fetchRows(
+                '''
+                    SELECT cuteness.userid, userids.username, SUM(cuteness.cuteness) AS totalcuteness FROM cuteness
+                    INNER JOIN userids ON cuteness.userid = userids.userid
+                    WHERE cuteness.twitchchannel = $1 AND cuteness.userid != $2
+                    GROUP BY cuteness.userid, userids.username
+                    ORDER BY totalcuteness DESC
+                    LIMIT $3
+                ''',
+                twitchChannel, twitchChannelUserId, self.__leaderboardSize
+            )
+        finally:
+            await connection.close()
 
         if not utils.hasItems(records):
             return CutenessChampionsResult(twitchChannel = twitchChannel)
@@ -188,73 +194,74 @@ class CutenessRepository(CutenessRepositoryInterface):
         await self.__userIdsRepository.setUser(userId = userId, userName = userName)
 
         connection = await self.__getDatabaseConnection()
-        records = await connection.fetchRows(
-            '''
-                SELECT cuteness, utcyearandmonth FROM cuteness
-                WHERE twitchchannel = $1 AND userid = $2 AND cuteness IS NOT NULL AND cuteness >= 1
-                ORDER BY utcyearandmonth DESC
-                LIMIT $3
-            ''',
-            twitchChannel, userId, self.__historySize
-        )
 
-        if not utils.hasItems(records):
-            await connection.close()
-            return CutenessHistoryResult(
-                userId = userId,
-                userName = userName
+        try:
+            records = await connection.fetchRows(
+                '''
+                    SELECT cuteness, utcyearandmonth FROM cuteness
+                    WHERE twitchchannel = $1 AND userid = $2 AND cuteness IS NOT NULL AND cuteness >= 1
+                    ORDER BY utcyearandmonth DESC
+                    LIMIT $3
+                ''',
+                twitchChannel, userId, self.__historySize
             )
 
-        entries: List[CutenessHistoryEntry] = list()
-
-        for record in records:
-            entries.append(CutenessHistoryEntry(
-                cutenessDate = CutenessDate(record[1]),
-                cuteness = record[0],
-                userId = userId,
-                userName = userName
-            ))
+            if not utils.hasItems(records):
+                return CutenessHistoryResult(
+                    userId = userId,
+                    userName = userName
+                )
 
-        # sort entries into newest to oldest order
-        entries.sort(key = lambda entry: entry.getCutenessDate(), reverse = True)
+            entries: List[CutenessHistoryEntry] = list()
 
-        record = await connection.fetchRow(
-            '''
-                SELECT SUM(cuteness) FROM cuteness
-                WHERE twitchchannel = $1 AND userid = $2 AND cuteness IS NOT NULL AND cuteness >= 1
-                LIMIT 1
-            ''',
-            twitchChannel, userId
-        )
+            for record in records:
+                entries.append(CutenessHistoryEntry(
+                    cutenessDate = CutenessDate(record[1]),
+                    cuteness = record[0],
+                    userId = userId,
+                    userName = userName
+                ))
 
-        totalCuteness: int = 0
+            # sort entries into newest to oldest order
+            entries.sort(key = lambda entry: entry.getCutenessDate(), reverse = True)
 
-        if utils.hasItems(record):
-            # this should be impossible at this point, but let's just be safe
-            totalCuteness = record[0]
+            record = await connection.fetchRow(
+                '''
+                    SELECT SUM(cuteness) FROM cuteness
+                    WHERE twitchchannel = $1 AND userid = $2 AND cuteness IS NOT NULL AND cuteness >= 1
+                    LIMIT 1
+                ''',
+                twitchChannel, userId
+            )
 
-        record = await connection.fetchRow(
-            '''
-                SELECT cuteness, utcyearandmonth FROM cuteness
-                WHERE twitchchannel = $1 AND userid = $2 AND cuteness IS NOT NULL AND cuteness >= 1
-                ORDER BY cuteness DESC
-                LIMIT 1
-            ''',
-            twitchChannel, userId
-        )
+            totalCuteness: int = 0
 
-        bestCuteness: Optional[CutenessHistoryEntry] = None
+            if utils.hasItems(record):
+                # this should be impossible at this point, but let's just be safe
+                totalCuteness = record[0]
 
-        if utils.hasItems(record):
-            # again, this should be impossible here, but let's just be safe
-            bestCuteness = CutenessHistoryEntry(
-                cutenessDate = CutenessDate(record[1]),
-                cuteness = record[0],
-                userId = userId,
-                userName = userName
+            record = await connection.fetchRow(
+                '''
+                    SELECT cuteness, utcyearandmonth FROM cuteness
+                    WHERE twitchchannel = $1 AND userid = $2 AND cuteness IS NOT NULL AND cuteness >= 1
+                    ORDER BY cuteness DESC
+                    LIMIT 1
+                ''',
+                twitchChannel, userId
             )
 
-        await connection.close()
+            bestCuteness: Optional[CutenessHistoryEntry] = None
+
+            if utils.hasItems(record):
+                # again, this should be impossible here, but let's just be safe
+                bestCuteness = CutenessHistoryEntry(
+                    cutenessDate = CutenessDate(record[1]),
+                    cuteness = record[0],
+                    userId = userId,
+                    userName = userName
+                )
+        finally:
+            await connection.close()
 
         return CutenessHistoryResult(
             userId = userId,
@@ -289,37 +296,40 @@ class CutenessRepository(CutenessRepositoryInterface):
         cutenessDate = CutenessDate()
 
         connection = await self.__getDatabaseConnection()
-        record = await connection.fetchRow(
-            '''
-                SELECT cuteness FROM cuteness
-                WHERE twitchchannel = $1 AND userid = $2 AND utcyearandmonth = $3
-                LIMIT 1
-            ''',
-            twitchChannel, userId, cutenessDate.getStr()
-        )
 
-        oldCuteness: int = 0
+        try:
+            async with connection.transaction():
+                record = await connection.fetchRow(
+                    '''
+                        SELECT cuteness FROM cuteness
+                        WHERE twitchchannel = $1 AND userid = $2 AND utcyearandmonth = $3
+                        LIMIT 1
+                    ''',
+                    twitchChannel, userId, cutenessDate.getStr()
+                )
 
-        if utils.hasItems(record):
-            oldCuteness = record[0]
+                oldCuteness: int = 0
 
-        newCuteness: int = oldCuteness + incrementAmount
+                if utils.hasItems(record):
+                    oldCuteness = record[0]
 
-        if newCuteness < 0:
-            newCuteness = 0
-        elif newCuteness > utils.getLongMaxSafeSize():
-            raise OverflowError(f'New cuteness ({newCuteness}) would be too large (old cuteness = {oldCuteness}) (increment amount = {incrementAmount})')
+                newCuteness: int = oldCuteness + incrementAmount
 
-        await connection.execute(
-            '''
-                INSERT INTO cuteness (cuteness, twitchchannel, userid, utcyearandmonth)
-                VALUES ($1, $2, $3, $4)
-                ON CONFLICT (twitchchannel, userid, utcyearandmonth) DO UPDATE SET cuteness = EXCLUDED.cuteness
-            ''',
-            newCuteness, twitchChannel, userId, cutenessDate.getStr()
-        )
+                if newCuteness < 0:
+                    newCuteness = 0
+                elif newCuteness > utils.getLongMaxSafeSize():
+                    raise OverflowError(f'New cuteness ({newCuteness}) would be too large (old cuteness = {oldCuteness}) (increment amount = {incrementAmount})')
 
-        await connection.close()
+                await connection.execute(
+                    '''
+                        INSERT INTO cuteness (cuteness, twitchchannel, userid, utcyearandmonth)
+                        VALUES ($1, $2, $3, $4)
+                        ON CONFLICT (twitchchannel, userid, utcyearandmonth) DO UPDATE SET cuteness = EXCLUDED.cuteness
+                    ''',
+                    newCuteness, twitchChannel, userId, cutenessDate.getStr()
+                )
+        finally:
+            await connection.close()
 
         return CutenessResult(
             cutenessDate = cutenessDate,
@@ -328,6 +338,92 @@ class CutenessRepository(CutenessRepositoryInterface):
             userName = userName
         )
 
+    async def fetchCutenessesIncrementedBy(
+        self,
+        twitchChannel: str,
+        increments: List[CutenessIncrement],
+        cutenessDate: Optional[CutenessDate] = None
+    ) -> List[CutenessResult]:
+        if not utils.isValidStr(twitchChannel):
+            raise ValueError(f'twitchChannel argument is malformed: \"{twitchChannel}\"')
+        elif not isinstance(increments, List):
+            raise ValueError(f'increments argument is malformed: \"{increments}\"')
+        elif cutenessDate is not None and not isinstance(cutenessDate, CutenessDate):
+            raise ValueError(f'cutenessDate argument is malformed: \"{cutenessDate}\"')
+
+        results: List[CutenessResult] = list()
+
+        if len(increments) == 0:
+            return results
+
+        userIdsToUserNames: Dict[str, str] = dict()
+
+        for increment in increments:
+            if not isinstance(increment, CutenessIncrement):
+                raise ValueError(f'increments argument contains a malformed value: \"{increment}\"')
+            elif increment.getUserId() in userIdsToUserNames:
+                raise ValueError(f'increments argument contains a duplicate user ID: \"{increment.getUserId()}\"')
+
+            userIdsToUserNames[increment.getUserId()] = increment.getUserName()
+
+        await self.__userIdsRepository.setUsers(userIdsToUserNames)
+
+        if cutenessDate is None:
+            cutenessDate = CutenessDate()
+
+        userIdParameters = ', '.join(f'${index + 3}' for index in range(len(increments)))
+
+        connection = await self.__getDatabaseConnection()
+
+        try:
+            async with connection.transaction():
+                records = await connection.fetchRows(
+                    f'''
+                        SELECT userid, cuteness FROM cuteness
+                        WHERE twitchchannel = $1 AND utcyearandmonth = $2 AND userid IN ({userIdParameters})
+                    ''',
+                    twitchChannel, cutenessDate.getStr(), *[ increment.getUserId() for increment in increments ]
+                )
+
+                oldCutenesses: Dict[str, int] = dict()
+
+                if utils.hasItems(records):
+                    for record in records:
+                        oldCutenesses[record[0].lower()] = record[1]
+
+                upsertRecords: List[List[Any]] = list()
+
+                for increment in increments:
+                    oldCuteness = oldCutenesses.get(increment.getUserId().lower(), 0)
+                    newCuteness: int = oldCuteness + increment.getIncrementAmount()
+
+                    if newCuteness < 0:
+                        newCuteness = 0
+                    elif newCuteness > utils.getLongMaxSafeSize():
+                        raise OverflowError(f'New cuteness ({newCuteness}) would be too large (old cuteness = {oldCuteness}) (increment amount = {increment.getIncrementAmount()})')
+
+                    upsertRecords.append([ newCuteness, twitchChannel, increment.getUserId(), cutenessDate.getStr() ])
+
+                    results.append(CutenessResult(
+                        cutenessDate = cutenessDate,
+                        cuteness = newCuteness,
+                        userId = increment.getUserId(),
+                        userName = increment.getUserName()
+                    ))
+
+                await connection.executeMany(
+                    '''
+                        INSERT INTO cuteness (cuteness, twitchchannel, userid, utcyearandmonth)
+                        VALUES ($1, $2, $3, $4)
+                        ON CONFLICT (twitchchannel, userid, utcyearandmonth) DO UPDATE SET cuteness = EXCLUDED.cuteness
+                    ''',
+                    upsertRecords
+                )
+        finally:
+            await connection.close()
+
+        return results
+
     async def fetchCutenessLeaderboard(
         self,
         twitchChannel: str,
@@ -341,18 +437,20 @@ class CutenessRepository(CutenessRepositoryInterface):
 
         cutenessDate = CutenessDate()
         connection = await self.__getDatabaseConnection()
-        records = await connection.fetchRows(
-            '''
-                SELECT cuteness.cuteness, cuteness.userid, userids.username FROM cuteness
-                INNER JOIN userids ON cuteness.userid = userids.userid
-                WHERE cuteness.twitchchannel = $1 AND cuteness.utcyearandmonth = $2 AND cuteness.cuteness IS NOT NULL AND cuteness.cuteness >= 1 AND cuteness.userid != $3
-                ORDER BY cuteness.cuteness DESC
-                LIMIT $4
-            ''',
-            twitchChannel, cutenessDate.getStr(), twitchChannelUserId, self.__leaderboardSize
-        )
 
-        await connection.close()
+        try:
+            records = await connection.fetchRows(
+                '''
+                    SELECT cuteness.cuteness, cuteness.userid, userids.username FROM cuteness
+                    INNER JOIN userids ON cuteness.userid = userids.userid
+                    WHERE cuteness.twitchchannel = $1 AND cuteness.utcyearandmonth = $2 AND cuteness.cuteness IS NOT NULL AND cuteness.cuteness >= 1 AND cuteness.userid != $3
+                    ORDER BY cuteness.cuteness DESC
+                    LIMIT $4
+                ''',
+                twitchChannel, cutenessDate.getStr(), twitchChannelUserId, self.__leaderboardSize
+            )
+        finally:
+            await connection.close()
 
         if not utils.hasItems(records):
             return CutenessLeaderboardResult(cutenessDate = cutenessDate)
@@ -403,58 +501,62 @@ class CutenessRepository(CutenessRepositoryInterface):
 
         twitchChannelUserId = await self.__userIdsRepository.requireUserId(userName = twitchChannel)
 
+        # One windowed query fetches every month's leaderboard at once, rather than running
+        # a separate leaderboard query for each of the most recent months.
         connection = await self.__getDatabaseConnection()
-        records = await connection.fetchRows(
-            '''
-                SELECT DISTINCT utcyearandmonth FROM cuteness
-                WHERE twitchchannel = $1 AND utcyearandmonth != $2
-                ORDER BY utcyearandmonth DESC
-                LIMIT $3
-            ''',
-            twitchChannel, CutenessDate().getStr(), self.__historyLeaderboardSize
-        )
 
-        if not utils.hasItems(records):
+        try:
+            records = await connection.fetchRows(
+                '''
+                    WITH months AS (
+                        SELECT DISTINCT utcyearandmonth FROM cuteness
+                        WHERE twitchchannel = $1 AND utcyearandmonth != $2
+                        ORDER BY utcyearandmonth DESC
+                        LIMIT $3
+                    ), rankedcuteness AS (
+                        SELECT cuteness.cuteness, cuteness.userid, userids.username, cuteness.utcyearandmonth,
+                            ROW_NUMBER() OVER (PARTITION BY cuteness.utcyearandmonth ORDER BY cuteness.cuteness DESC) AS rank
+                        FROM cuteness
+                        INNER JOIN userids ON cuteness.userid = userids.userid
+                        WHERE cuteness.cuteness IS NOT NULL AND cuteness.cuteness >= 1 AND cuteness.twitchchannel = $1 AND cuteness.userid != $4 AND cuteness.utcyearandmonth IN (SELECT utcyearandmonth FROM months)
+                    )
+                    SELECT cuteness, userid, username, utcyearandmonth FROM rankedcuteness
+                    WHERE rank <= $3
+                    ORDER BY utcyearandmonth DESC, rank ASC
+                ''',
+                twitchChannel, CutenessDate().getStr(), self.__historyLeaderboardSize, twitchChannelUserId
+            )
+        finally:
             await connection.close()
+
+        if not utils.hasItems(records):
             return CutenessLeaderboardHistoryResult(twitchChannel = twitchChannel)
 
-        leaderboards: List[CutenessLeaderboardResult] = list()
+        monthsToEntries: Dict[str, List[CutenessLeaderboardEntry]] = dict()
 
         for record in records:
-            cutenessDate = CutenessDate(record[0])
-            monthRecords = await connection.fetchRows(
-                '''
-                    SELECT cuteness.cuteness, cuteness.userid, userids.username FROM cuteness
-                    INNER JOIN userids ON cuteness.userid = userids.userid
-                    WHERE cuteness.cuteness IS NOT NULL AND cuteness.cuteness >= 1 AND cuteness.twitchchannel = $1 AND cuteness.userid != $2 AND cuteness.utcyearandmonth = $3
-                    ORDER BY cuteness.cuteness DESC
-                    LIMIT $4
-                ''',
-                twitchChannel, twitchChannelUserId, cutenessDate.getStr(), self.__historyLeaderboardSize
-            )
+            entries = monthsToEntries.get(record[3])
 
-            if not utils.hasItems(monthRecords):
-                continue
+            if entries is None:
+                entries = list()
+                monthsToEntries[record[3]] = entries
 
-            entries: List[CutenessLeaderboardEntry] = list()
-            rank: int = 1
+            entries.append(CutenessLeaderboardEntry(
+                cuteness = record[0],
+                rank = len(entries) + 1,
+                userId = record[1],
+                userName = record[2]
+            ))
 
-            for monthRecord in monthRecords:
-                entries.append(CutenessLeaderboardEntry(
-                    cuteness = monthRecord[0],
-                    rank = rank,
-                    userId = monthRecord[1],
-                    userName = monthRecord[2]
-                ))
-                rank = rank + 1
+        leaderboards: List[CutenessLeaderboardResult] = list()
 
+        # records arrive newest month first, and dicts keep insertion order
+        for utcYearAndMonth, entries in monthsToEntries.items():
             leaderboards.append(CutenessLeaderboardResult(
-                cutenessDate = cutenessDate,
+                cutenessDate = CutenessDate(utcYearAndMonth),
                 entries = entries
             ))
 
-        await connection.close()
-
         return CutenessLeaderboardHistoryResult(
             twitchChannel = twitchChannel,
             leaderboards = leaderboards
@@ -471,31 +573,32 @@ class CutenessRepository(CutenessRepositoryInterface):
         self.__isDatabaseReady = True
         connection = await self.__backingDatabase.getConnection()
 
-        if connection.getDatabaseType() is DatabaseType.POSTGRESQL:
-            await connection.createTableIfNotExists(
-                '''
-                    CREATE TABLE IF NOT EXISTS cuteness (
-                        cuteness bigint DEFAULT 0 NOT NULL,
-                        twitchchannel public.citext NOT NULL,
-                        userid public.citext NOT NULL,
-                        utcyearandmonth public.citext NOT NULL,
-                        PRIMARY KEY (twitchchannel, userid, utcyearandmonth)
-                    )
-                '''
-            )
-        elif connection.getDatabaseType() is DatabaseType.SQLITE:
-            await connection.createTableIfNotExists(
-                '''
-                    CREATE TABLE IF NOT EXISTS cuteness (
-                        cuteness INTEGER NOT NULL DEFAULT 0,
-                        twitchchannel TEXT NOT NULL COLLATE NOCASE,
-                        userid TEXT NOT NULL COLLATE NOCASE,
-                        utcyearandmonth TEXT NOT NULL COLLATE NOCASE,
-                        PRIMARY KEY (twitchchannel, userid, utcyearandmonth)
-                    )
-                '''
-            )
-        else:
-            raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
-
-        await connection.close()
+        try:
+            if connection.getDatabaseType() is DatabaseType.POSTGRESQL:
+                await connection.createTableIfNotExists(
+                    '''
+                        CREATE TABLE IF NOT EXISTS cuteness (
+                            cuteness bigint DEFAULT 0 NOT NULL,
+                            twitchchannel public.citext NOT NULL,
+                            userid public.citext NOT NULL,
+                            utcyearandmonth public.citext NOT NULL,
+                            PRIMARY KEY (twitchchannel, userid, utcyearandmonth)
+                        )
+                    '''
+                )
+            elif connection.getDatabaseType() is DatabaseType.SQLITE:
+                await connection.createTableIfNotExists(
+                    '''
+                        CREATE TABLE IF NOT EXISTS cuteness (
+                            cuteness INTEGER NOT NULL DEFAULT 0,
+                            twitchchannel TEXT NOT NULL COLLATE NOCASE,
+                            userid TEXT NOT NULL COLLATE NOCASE,
+                            utcyearandmonth TEXT NOT NULL COLLATE NOCASE,
+                            PRIMARY KEY (twitchchannel, userid, utcyearandmonth)
+                        )
+                    '''
+                )
+            else:
+                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
+        finally:
+            await connection.close()
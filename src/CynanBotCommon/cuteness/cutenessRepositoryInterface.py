@@ -1,11 +1,13 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import List, Optional
 
 try:
     from CynanBotCommon.cuteness.cutenessChampionsResult import \
         CutenessChampionsResult
+    from CynanBotCommon.cuteness.cutenessDate import CutenessDate
     from CynanBotCommon.cuteness.cutenessHistoryResult import \
         CutenessHistoryResult
+    from CynanBotCommon.cuteness.cutenessIncrement import CutenessIncrement
     from CynanBotCommon.cuteness.cutenessLeaderboardHistoryResult import \
         CutenessLeaderboardHistoryResult
     from CynanBotCommon.cuteness.cutenessLeaderboardResult import \
@@ -13,7 +15,9 @@ try:
     from CynanBotCommon.cuteness.cutenessResult import CutenessResult
 except:
     from cuteness.cutenessChampionsResult import CutenessChampionsResult
+    from cuteness.cutenessDate import CutenessDate
     from cuteness.cutenessHistoryResult import CutenessHistoryResult
+    from cuteness.cutenessIncrement import CutenessIncrement
     from cuteness.cutenessLeaderboardHistoryResult import \
         CutenessLeaderboardHistoryResult
     from cuteness.cutenessLeaderboardResult import CutenessLeaderboardResult
@@ -54,6 +58,15 @@ class CutenessRepositoryInterface(ABC):
     ) -> CutenessResult:
         pass
 
+    @abstractmethod
+    async def fetchCutenessesIncrementedBy(
+        self,
+        twitchChannel: str,
+        increments: List[CutenessIncrement],
+        cutenessDate: Optional[CutenessDate] = None
+    ) -> List[CutenessResult]:
+        pass
+
     @abstractmethod
     async def fetchCutenessLeaderboard(
         self,
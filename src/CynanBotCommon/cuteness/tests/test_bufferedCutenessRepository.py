@@ -0,0 +1,205 @@
+import asyncio
+import sys
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+
+try:
+    from ...backgroundTaskHelper import BackgroundTaskHelper
+    from ...timber.timberStub import TimberStub
+    from ..bufferedCutenessRepository import BufferedCutenessRepository
+    from ..cutenessChampionsResult import CutenessChampionsResult
+    from ..cutenessDate import CutenessDate
+    from ..cutenessHistoryResult import CutenessHistoryResult
+    from ..cutenessIncrement import CutenessIncrement
+    from ..cutenessLeaderboardHistoryResult import \
+        CutenessLeaderboardHistoryResult
+    from ..cutenessLeaderboardResult import CutenessLeaderboardResult
+    from ..cutenessRepositoryInterface import CutenessRepositoryInterface
+    from ..cutenessResult import CutenessResult
+except:
+    from backgroundTaskHelper import BackgroundTaskHelper
+    from timber.timberStub import TimberStub
+
+    from cuteness.bufferedCutenessRepository import BufferedCutenessRepository
+    from cuteness.cutenessChampionsResult import CutenessChampionsResult
+    from cuteness.cutenessDate import CutenessDate
+    from cuteness.cutenessHistoryResult import CutenessHistoryResult
+    from cuteness.cutenessIncrement import CutenessIncrement
+    from cuteness.cutenessLeaderboardHistoryResult import \
+        CutenessLeaderboardHistoryResult
+    from cuteness.cutenessLeaderboardResult import CutenessLeaderboardResult
+    from cuteness.cutenessRepositoryInterface import \
+        CutenessRepositoryInterface
+    from cuteness.cutenessResult import CutenessResult
+
+
+class FakeCutenessRepository(CutenessRepositoryInterface):
+
+    def __init__(self):
+        self.monthlyCutenesses: Dict[Tuple[str, str], int] = dict()
+        self.writeCount: int = 0
+
+    def getCuteness(self, userId: str, cutenessDate: Optional[CutenessDate] = None) -> int:
+        if cutenessDate is None:
+            cutenessDate = CutenessDate()
+
+        return self.monthlyCutenesses.get((cutenessDate.getStr(), userId), 0)
+
+    def setCuteness(self, userId: str, cuteness: int):
+        self.monthlyCutenesses[(CutenessDate().getStr(), userId)] = cuteness
+
+    async def fetchCuteness(self, twitchChannel: str, userId: str, userName: str) -> CutenessResult:
+        cutenessDate = CutenessDate()
+
+        return CutenessResult(
+            cutenessDate = cutenessDate,
+            cuteness = self.getCuteness(userId, cutenessDate),
+            userId = userId,
+            userName = userName
+        )
+
+    async def fetchCutenessChampions(self, twitchChannel: str) -> CutenessChampionsResult:
+        return CutenessChampionsResult(twitchChannel = twitchChannel)
+
+    async def fetchCutenessHistory(self, twitchChannel: str, userId: str, userName: str) -> CutenessHistoryResult:
+        return CutenessHistoryResult(userId = userId, userName = userName)
+
+    async def fetchCutenessIncrementedBy(self, incrementAmount: int, twitchChannel: str, userId: str, userName: str) -> CutenessResult:
+        results = await self.fetchCutenessesIncrementedBy(twitchChannel, [ CutenessIncrement(incrementAmount, userId, userName) ])
+        return results[0]
+
+    async def fetchCutenessesIncrementedBy(self, twitchChannel: str, increments: List[CutenessIncrement], cutenessDate: Optional[CutenessDate] = None) -> List[CutenessResult]:
+        userIds = [ increment.getUserId() for increment in increments ]
+
+        if len(userIds) != len(set(userIds)):
+            raise ValueError(f'increments argument contains a duplicate user ID: \"{userIds}\"')
+
+        if cutenessDate is None:
+            cutenessDate = CutenessDate()
+
+        self.writeCount = self.writeCount + 1
+        results: List[CutenessResult] = list()
+
+        for increment in increments:
+            key = (cutenessDate.getStr(), increment.getUserId())
+            self.monthlyCutenesses[key] = max(0, self.monthlyCutenesses.get(key, 0) + increment.getIncrementAmount())
+
+            results.append(CutenessResult(
+                cutenessDate = cutenessDate,
+                cuteness = self.monthlyCutenesses[key],
+                userId = increment.getUserId(),
+                userName = increment.getUserName()
+            ))
+
+        return results
+
+    async def fetchCutenessLeaderboard(self, twitchChannel: str, specificLookupUserId: Optional[str] = None, specificLookupUserName: Optional[str] = None) -> CutenessLeaderboardResult:
+        return CutenessLeaderboardResult(cutenessDate = CutenessDate())
+
+    async def fetchCutenessLeaderboardHistory(self, twitchChannel: str) -> CutenessLeaderboardHistoryResult:
+        return CutenessLeaderboardHistoryResult(twitchChannel = twitchChannel)
+
+
+class TestBufferedCutenessRepository():
+
+    def __createRepository(self, cutenessRepository: CutenessRepositoryInterface) -> BufferedCutenessRepository:
+        return BufferedCutenessRepository(
+            backgroundTaskHelper = BackgroundTaskHelper(eventLoop = asyncio.get_running_loop()),
+            cutenessRepository = cutenessRepository,
+            timber = TimberStub(),
+            flushSleepTimeSeconds = 60
+        )
+
+    @pytest.mark.asyncio
+    async def test_fetchCutenessIncrementedBy_coalescesWrites(self):
+        fake = FakeCutenessRepository()
+        fake.setCuteness('123456', 10)
+        repository = self.__createRepository(fake)
+
+        for _ in range(50):
+            result = await repository.fetchCutenessIncrementedBy(2, 'smCharles', '123456', 'stashiocat')
+
+        assert result.getCuteness() == 110
+        assert (await repository.fetchCuteness('smCharles', '123456', 'stashiocat')).getCuteness() == 110
+        assert fake.writeCount == 0
+
+        await repository.flush()
+        assert fake.getCuteness('123456') == 110
+        assert fake.writeCount == 1
+
+    @pytest.mark.asyncio
+    async def test_fetchCutenessIncrementedBy_acrossMonthChange(self, monkeypatch):
+        fake = FakeCutenessRepository()
+        repository = self.__createRepository(fake)
+        module = sys.modules[BufferedCutenessRepository.__module__]
+
+        january = CutenessDate('2023-01')
+        february = CutenessDate('2023-02')
+
+        monkeypatch.setattr(module, 'CutenessDate', lambda utcYearAndMonthStr = None: CutenessDate(utcYearAndMonthStr or '2023-01'))
+        await repository.fetchCutenessIncrementedBy(4, 'smCharles', '123456', 'stashiocat')
+
+        monkeypatch.setattr(module, 'CutenessDate', lambda utcYearAndMonthStr = None: CutenessDate(utcYearAndMonthStr or '2023-02'))
+        await repository.fetchCutenessIncrementedBy(3, 'smCharles', '123456', 'stashiocat')
+        await repository.fetchCutenessIncrementedBy(1, 'smCharles', '654321', 'smCharles')
+
+        await repository.flush()
+        assert fake.writeCount == 2
+        assert fake.getCuteness('123456', january) == 4
+        assert fake.getCuteness('123456', february) == 3
+        assert fake.getCuteness('654321', january) == 0
+        assert fake.getCuteness('654321', february) == 1
+
+        await repository.fetchCutenessLeaderboard('smCharles')
+        assert fake.writeCount == 2
+
+    @pytest.mark.asyncio
+    async def test_fetchCutenessesIncrementedBy_withPastCutenessDate(self):
+        fake = FakeCutenessRepository()
+        repository = self.__createRepository(fake)
+        cutenessDate = CutenessDate('2023-01')
+
+        await repository.fetchCutenessIncrementedBy(2, 'smCharles', '123456', 'stashiocat')
+
+        results = await repository.fetchCutenessesIncrementedBy(
+            twitchChannel = 'smCharles',
+            increments = [ CutenessIncrement(5, '123456', 'stashiocat') ],
+            cutenessDate = cutenessDate
+        )
+
+        assert results[0].getCuteness() == 5
+        assert fake.writeCount == 2
+        assert fake.getCuteness('123456', cutenessDate) == 5
+        assert fake.getCuteness('123456') == 2
+
+    @pytest.mark.asyncio
+    async def test_fetchCutenessIncrementedBy_neverGoesBelowZero(self):
+        fake = FakeCutenessRepository()
+        fake.setCuteness('123456', 5)
+        repository = self.__createRepository(fake)
+
+        result = await repository.fetchCutenessIncrementedBy(-10, 'smCharles', '123456', 'stashiocat')
+        assert result.getCuteness() == 0
+
+        result = await repository.fetchCutenessIncrementedBy(3, 'smCharles', '123456', 'stashiocat')
+        assert result.getCuteness() == 3
+
+        await repository.flush()
+        assert fake.getCuteness('123456') == 3
+
+    @pytest.mark.asyncio
+    async def test_fetchCutenessLeaderboard_flushesFirst(self):
+        fake = FakeCutenessRepository()
+        repository = self.__createRepository(fake)
+
+        await repository.fetchCutenessesIncrementedBy('smCharles', [
+            CutenessIncrement(5, '123456', 'stashiocat'),
+            CutenessIncrement(7, '654321', 'smCharles')
+        ])
+
+        assert fake.writeCount == 0
+        await repository.fetchCutenessLeaderboard('smCharles')
+        assert fake.writeCount == 1
+        assert fake.getCuteness('123456') == 5
+        assert fake.getCuteness('654321') == 7
@@ -0,0 +1,162 @@
+import asyncio
+import os
+from datetime import datetime
+from typing import List, Optional
+
+import pytest
+
+try:
+    from ...storage.backingSqliteDatabase import BackingSqliteDatabase
+    from ...timber.timberStub import TimberStub
+    from ...twitch.twitchApiServiceInterface import TwitchApiServiceInterface
+    from ...twitch.twitchBannedUserRequest import TwitchBannedUserRequest
+    from ...twitch.twitchBannedUsersResponse import TwitchBannedUsersResponse
+    from ...twitch.twitchBanRequest import TwitchBanRequest
+    from ...twitch.twitchBanResponse import TwitchBanResponse
+    from ...twitch.twitchEmoteDetails import TwitchEmoteDetails
+    from ...twitch.twitchEventSubRequest import TwitchEventSubRequest
+    from ...twitch.twitchEventSubResponse import TwitchEventSubResponse
+    from ...twitch.twitchLiveUserDetails import TwitchLiveUserDetails
+    from ...twitch.twitchModUser import TwitchModUser
+    from ...twitch.twitchTokensDetails import TwitchTokensDetails
+    from ...twitch.twitchUnbanRequest import TwitchUnbanRequest
+    from ...twitch.twitchUserDetails import TwitchUserDetails
+    from ...twitch.twitchUserSubscriptionDetails import \
+        TwitchUserSubscriptionDetails
+    from ...users.userIdsRepository import UserIdsRepository
+    from ..cutenessDate import CutenessDate
+    from ..cutenessIncrement import CutenessIncrement
+    from ..cutenessRepository import CutenessRepository
+except:
+    from storage.backingSqliteDatabase import BackingSqliteDatabase
+    from timber.timberStub import TimberStub
+
+    from cuteness.cutenessDate import CutenessDate
+    from cuteness.cutenessIncrement import CutenessIncrement
+    from cuteness.cutenessRepository import CutenessRepository
+    from twitch.twitchApiServiceInterface import TwitchApiServiceInterface
+    from twitch.twitchBannedUserRequest import TwitchBannedUserRequest
+    from twitch.twitchBannedUsersResponse import TwitchBannedUsersResponse
+    from twitch.twitchBanRequest import TwitchBanRequest
+    from twitch.twitchBanResponse import TwitchBanResponse
+    from twitch.twitchEmoteDetails import TwitchEmoteDetails
+    from twitch.twitchEventSubRequest import TwitchEventSubRequest
+    from twitch.twitchEventSubResponse import TwitchEventSubResponse
+    from twitch.twitchLiveUserDetails import TwitchLiveUserDetails
+    from twitch.twitchModUser import TwitchModUser
+    from twitch.twitchTokensDetails import TwitchTokensDetails
+    from twitch.twitchUnbanRequest import TwitchUnbanRequest
+    from twitch.twitchUserDetails import TwitchUserDetails
+    from twitch.twitchUserSubscriptionDetails import \
+        TwitchUserSubscriptionDetails
+    from users.userIdsRepository import UserIdsRepository
+
+
+class FakeTwitchApiService(TwitchApiServiceInterface):
+
+    async def addModerator(self, broadcasterId: str, twitchAccessToken: str, userId: str) -> bool:
+        raise NotImplementedError()
+
+    async def banUser(self, twitchAccessToken: str, banRequest: TwitchBanRequest) -> TwitchBanResponse:
+        raise NotImplementedError()
+
+    async def createEventSubSubscription(self, twitchAccessToken: str, eventSubRequest: TwitchEventSubRequest) -> TwitchEventSubResponse:
+        raise NotImplementedError()
+
+    async def fetchBannedUsers(self, twitchAccessToken: str, bannedUserRequest: TwitchBannedUserRequest) -> TwitchBannedUsersResponse:
+        raise NotImplementedError()
+
+    async def fetchEmoteDetails(self, broadcasterId: str, twitchAccessToken: str) -> List[TwitchEmoteDetails]:
+        raise NotImplementedError()
+
+    async def fetchLiveUserDetails(self, twitchAccessToken: str, userNames: List[str]) -> List[TwitchLiveUserDetails]:
+        raise NotImplementedError()
+
+    async def fetchModerator(self, broadcasterId: str, twitchAccessToken: str, userId: str) -> Optional[TwitchModUser]:
+        raise NotImplementedError()
+
+    async def fetchTokens(self, code: str) -> TwitchTokensDetails:
+        raise NotImplementedError()
+
+    async def fetchUserDetails(self, twitchAccessToken: str, userName: str) -> Optional[TwitchUserDetails]:
+        raise NotImplementedError()
+
+    async def fetchUserSubscriptionDetails(self, broadcasterId: str, twitchAccessToken: str, userId: str) -> Optional[TwitchUserSubscriptionDetails]:
+        raise NotImplementedError()
+
+    async def refreshTokens(self, twitchRefreshToken: str) -> TwitchTokensDetails:
+        raise NotImplementedError()
+
+    async def unbanUser(self, twitchAccessToken: str, unbanRequest: TwitchUnbanRequest) -> bool:
+        raise NotImplementedError()
+
+    async def validateTokens(self, twitchAccessToken: str) -> Optional[datetime]:
+        raise NotImplementedError()
+
+
+class TestCutenessRepository():
+
+    @pytest.mark.asyncio
+    async def test_fetchCutenessLeaderboardHistory(self, tmp_path):
+        backingDatabase = BackingSqliteDatabase(
+            eventLoop = asyncio.get_running_loop(),
+            backingDatabaseFile = os.path.join(tmp_path, 'database.sqlite')
+        )
+
+        userIdsRepository = UserIdsRepository(
+            backingDatabase = backingDatabase,
+            timber = TimberStub(),
+            twitchApiService = FakeTwitchApiService()
+        )
+
+        cutenessRepository = CutenessRepository(
+            backingDatabase = backingDatabase,
+            userIdsRepository = userIdsRepository,
+            historyLeaderboardSize = 3
+        )
+
+        # the channel's own user is never on its leaderboard
+        await userIdsRepository.setUser('100', 'smCharles')
+
+        for utcYearAndMonth in [ '2023-01', '2023-02', '2023-03', '2023-04' ]:
+            month = int(utcYearAndMonth[-1])
+
+            await cutenessRepository.fetchCutenessesIncrementedBy(
+                twitchChannel = 'smCharles',
+                increments = [
+                    CutenessIncrement(1000, '100', 'smCharles'),
+                    CutenessIncrement(10 * month, '1', 'eddie'),
+                    CutenessIncrement(20 * month, '2', 'imyt'),
+                    CutenessIncrement(30 * month, '3', 'mandoot'),
+                    CutenessIncrement(40 * month, '4', 'stashiocat'),
+                    CutenessIncrement(50 * month, '5', 'volwrath')
+                ],
+                cutenessDate = CutenessDate(utcYearAndMonth)
+            )
+
+        # neither the current month nor any other channel belong in this history
+        await cutenessRepository.fetchCutenessesIncrementedBy(
+            twitchChannel = 'smCharles',
+            increments = [ CutenessIncrement(5000, '1', 'eddie') ]
+        )
+
+        await cutenessRepository.fetchCutenessesIncrementedBy(
+            twitchChannel = 'stashiocat',
+            increments = [ CutenessIncrement(5000, '1', 'eddie') ],
+            cutenessDate = CutenessDate('2023-04')
+        )
+
+        result = await cutenessRepository.fetchCutenessLeaderboardHistory('smCharles')
+        leaderboards = result.getLeaderboards()
+
+        assert [ leaderboard.getCutenessDate().getStr() for leaderboard in leaderboards ] == [ '2023-04', '2023-03', '2023-02' ]
+
+        for leaderboard in leaderboards:
+            month = int(leaderboard.getCutenessDate().getStr()[-1])
+            entries = leaderboard.getEntries()
+
+            assert [ entry.getUserId() for entry in entries ] == [ '5', '4', '3' ]
+            assert [ entry.getCuteness() for entry in entries ] == [ 50 * month, 40 * month, 30 * month ]
+            assert [ entry.getRank() for entry in entries ] == [ 1, 2, 3 ]
+
+        await backingDatabase.close()
@@ -89,16 +89,19 @@ class FuntoonTokensRepository(FuntoonTokensRepositoryInterface):
             return self.__cache[twitchChannel.lower()]
 
         connection = await self.__getDatabaseConnection()
-        record = await connection.fetchRow(
-            '''
-                SELECT token FROM funtoontokens
-                WHERE twitchchannel = $1
-                LIMIT 1
-            ''',
-            twitchChannel
-        )
-
-        await connection.close()
+
+        try:
+            record = await connection.fetchRow(
+                '''
+                    SELECT token FROM funtoontokens
+                    WHERE twitchchannel = $1
+                    LIMIT 1
+                ''',
+                twitchChannel
+            )
+        finally:
+            await connection.close()
+
         token: Optional[str] = None
 
         if utils.hasItems(record):
@@ -115,28 +118,30 @@ class FuntoonTokensRepository(FuntoonTokensRepositoryInterface):
         self.__isDatabaseReady = True
         connection = await self.__backingDatabase.getConnection()
 
-        if connection.getDatabaseType() is DatabaseType.POSTGRESQL:
-            await connection.createTableIfNotExists(
-                '''
-                    CREATE TABLE IF NOT EXISTS funtoontokens (
-                        token text DEFAULT NULL,
-                        twitchchannel public.citext NOT NULL PRIMARY KEY
-                    )
-                '''
-            )
-        elif connection.getDatabaseType() is DatabaseType.SQLITE:
-            await connection.createTableIfNotExists(
-                '''
-                    CREATE TABLE IF NOT EXISTS funtoontokens (
-                        token TEXT DEFAULT NULL,
-                        twitchchannel TEXT NOT NULL PRIMARY KEY COLLATE NOCASE
-                    )
-                '''
-            )
-        else:
-            raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
+        try:
+            if connection.getDatabaseType() is DatabaseType.POSTGRESQL:
+                await connection.createTableIfNotExists(
+                    '''
+                        CREATE TABLE IF NOT EXISTS funtoontokens (
+                            token text DEFAULT NULL,
+                            twitchchannel public.citext NOT NULL PRIMARY KEY
+                        )
+                    '''
+                )
+            elif connection.getDatabaseType() is DatabaseType.SQLITE:
+                await connection.createTableIfNotExists(
+                    '''
+                        CREATE TABLE IF NOT EXISTS funtoontokens (
+                            token TEXT DEFAULT NULL,
+                            twitchchannel TEXT NOT NULL PRIMARY KEY COLLATE NOCASE
+                        )
+                    '''
+                )
+            else:
+                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
+        finally:
+            await connection.close()
 
-        await connection.close()
         await self.__consumeSeedFile()
 
     async def requireToken(self, twitchChannel: str) -> str:
@@ -158,28 +163,29 @@ class FuntoonTokensRepository(FuntoonTokensRepositoryInterface):
 
         connection = await self.__getDatabaseConnection()
 
-        if utils.isValidStr(token):
-            await connection.execute(
-                '''
-                    INSERT INTO funtoontokens (token, twitchchannel)
-                    VALUES ($1, $2)
-                    ON CONFLICT (twitchchannel) DO UPDATE SET token = EXCLUDED.token
-                ''',
-                token, twitchChannel
-            )
-
-            self.__cache[twitchChannel.lower()] = token
-            self.__timber.log('FuntoonTokensRepository', f'Funtoon token for \"{twitchChannel}\" has been updated (\"{token}\")')
-        else:
-            await connection.execute(
-                '''
-                    DELETE FROM funtoontokens
-                    WHERE twitchchannel = $1
-                ''',
-                twitchChannel
-            )
-
-            self.__cache[twitchChannel.lower()] = None
-            self.__timber.log('FuntoonTokensRepository', f'Funtoon token for \"{twitchChannel}\" has been deleted')
-
-        await connection.close()
+        try:
+            if utils.isValidStr(token):
+                await connection.execute(
+                    '''
+                        INSERT INTO funtoontokens (token, twitchchannel)
+                        VALUES ($1, $2)
+                        ON CONFLICT (twitchchannel) DO UPDATE SET token = EXCLUDED.token
+                    ''',
+                    token, twitchChannel
+                )
+
+                self.__cache[twitchChannel.lower()] = token
+                self.__timber.log('FuntoonTokensRepository', f'Funtoon token for \"{twitchChannel}\" has been updated (\"{token}\")')
+            else:
+                await connection.execute(
+                    '''
+                        DELETE FROM funtoontokens
+                        WHERE twitchchannel = $1
+                    ''',
+                    twitchChannel
+                )
+
+                self.__cache[twitchChannel.lower()] = None
+                self.__timber.log('FuntoonTokensRepository', f'Funtoon token for \"{twitchChannel}\" has been deleted')
+        finally:
+            await connection.close()
@@ -0,0 +1,63 @@
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+try:
+    import CynanBotCommon.utils as utils
+except:
+    import utils
+
+
+class LruValueCache():
+
+    def __init__(self, capacity: int):
+        if not utils.isValidInt(capacity):
+            raise ValueError(f'capacity argument is malformed: \"{capacity}\"')
+        elif capacity < 1 or capacity > utils.getIntMaxSafeSize():
+            raise ValueError(f'capacity argument is out of bounds: {capacity}')
+
+        self.__capacity: int = capacity
+        self.__values: Dict[Hashable, Any] = OrderedDict()
+        self.__hitCount: int = 0
+        self.__missCount: int = 0
+
+    def clear(self):
+        self.__values.clear()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        if key is None:
+            raise ValueError(f'key argument is malformed: \"{key}\"')
+
+        value = self.__values.get(key)
+
+        if value is None:
+            self.__missCount += 1
+            return None
+
+        self.__values.move_to_end(key)
+        self.__hitCount += 1
+        return value
+
+    def getCapacity(self) -> int:
+        return self.__capacity
+
+    def getHitCount(self) -> int:
+        return self.__hitCount
+
+    def getMissCount(self) -> int:
+        return self.__missCount
+
+    def getSize(self) -> int:
+        return len(self.__values)
+
+    def put(self, key: Hashable, value: Any):
+        if key is None:
+            raise ValueError(f'key argument is malformed: \"{key}\"')
+        elif value is None:
+            raise ValueError(f'value argument is malformed: \"{value}\"')
+
+        self.__values[key] = value
+        self.__values.move_to_end(key)
+
+        if len(self.__values) > self.__capacity:
+            # evict the least recently used value
+            self.__values.popitem(last = False)
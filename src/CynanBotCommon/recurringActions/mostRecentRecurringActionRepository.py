@@ -63,16 +63,18 @@ class MostRecentRecurringActionRepository(MostRecentRecurringActionRepositoryInt
             raise ValueError(f'twitchChannel argument is malformed: \"{twitchChannel}\"')
 
         connection = await self.__getDatabaseConnection()
-        record = await connection.fetchRow(
-            '''
-                SELECT actiontype, datetime FROM mostrecentrecurringaction
-                WHERE twitchchannel = $1
-                LIMIT 1
-            ''',
-            twitchChannel
-        )
 
-        await connection.close()
+        try:
+            record = await connection.fetchRow(
+                '''
+                    SELECT actiontype, datetime FROM mostrecentrecurringaction
+                    WHERE twitchchannel = $1
+                    LIMIT 1
+                ''',
+                twitchChannel
+            )
+        finally:
+            await connection.close()
 
         if not utils.hasItems(record):
             return None
@@ -93,30 +95,31 @@ class MostRecentRecurringActionRepository(MostRecentRecurringActionRepositoryInt
         self.__isDatabaseReady = True
         connection = await self.__backingDatabase.getConnection()
 
-        if connection.getDatabaseType() is DatabaseType.POSTGRESQL:
-            await connection.createTableIfNotExists(
-                '''
-                    CREATE TABLE IF NOT EXISTS mostrecentrecurringaction (
-                        actiontype text NOT NULL,
-                        datetime text NOT NULL,
-                        twitchchannel public.citext NOT NULL PRIMARY KEY
-                    )
-                '''
-            )
-        elif connection.getDatabaseType() is DatabaseType.SQLITE:
-            await connection.createTableIfNotExists(
-                '''
-                    CREATE TABLE IF NOT EXISTS mostrecentrecurringaction (
-                        actiontype TEXT NOT NULL,
-                        datetime TEXT NOT NULL,
-                        twitchchannel TEXT NOT NULL PRIMARY KEY COLLATE NOCASE
-                    )
-                '''
-            )
-        else:
-            raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
-
-        await connection.close()
+        try:
+            if connection.getDatabaseType() is DatabaseType.POSTGRESQL:
+                await connection.createTableIfNotExists(
+                    '''
+                        CREATE TABLE IF NOT EXISTS mostrecentrecurringaction (
+                            actiontype text NOT NULL,
+                            datetime text NOT NULL,
+                            twitchchannel public.citext NOT NULL PRIMARY KEY
+                        )
+                    '''
+                )
+            elif connection.getDatabaseType() is DatabaseType.SQLITE:
+                await connection.createTableIfNotExists(
+                    '''
+                        CREATE TABLE IF NOT EXISTS mostrecentrecurringaction (
+                            actiontype TEXT NOT NULL,
+                            datetime TEXT NOT NULL,
+                            twitchchannel TEXT NOT NULL PRIMARY KEY COLLATE NOCASE
+                        )
+                    '''
+                )
+            else:
+                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
+        finally:
+            await connection.close()
 
     async def setMostRecentRecurringAction(self, action: RecurringAction):
         if not isinstance(action, RecurringAction):
@@ -126,15 +129,17 @@ class MostRecentRecurringActionRepository(MostRecentRecurringActionRepositoryInt
         nowDateTimeStr = nowDateTime.isoformat()
 
         connection = await self.__getDatabaseConnection()
-        await connection.execute(
-            '''
-                INSERT INTO mostrecentrecurringaction (actiontype, datetime, twitchchannel)
-                VALUES ($1, $2, $3)
-                ON CONFLICT (twitchchannel) DO UPDATE SET actiontype = EXCLUDED.actiontype, datetime = EXCLUDED.datetime
-            ''',
-            action.getActionType().toStr(), nowDateTimeStr, action.getTwitchChannel()
-        )
 
-        await connection.close()
+        try:
+            await connection.execute(
+                '''
+                    INSERT INTO mostrecentrecurringaction (actiontype, datetime, twitchchannel)
+                    VALUES ($1, $2, $3)
+                    ON CONFLICT (twitchchannel) DO UPDATE SET actiontype = EXCLUDED.actiontype, datetime = EXCLUDED.datetime
+                ''',
+                action.getActionType().toStr(), nowDateTimeStr, action.getTwitchChannel()
+            )
+        finally:
+            await connection.close()
 
         self.__timber.log('MostRecentRecurringActionRepository', f'Updated \"{action.getActionType()}\" for \"{action.getTwitchChannel()}\" ({nowDateTimeStr})')
@@ -97,16 +97,18 @@ class RecurringActionsRepository(RecurringActionsRepositoryInterface):
             raise ValueError(f'twitchChannel argument is malformed: \"{twitchChannel}\"')
 
         connection = await self.__getDatabaseConnection()
-        record = await connection.fetchRow(
-            '''
-                SELECT configurationjson, isenabled, minutesbetween FROM recurringactions
-                WHERE actiontype = $1 AND twitchchannel = $2
-                LIMIT 1
-            ''',
-            actionType.toStr(), twitchChannel
-        )
 
-        await connection.close()
+        try:
+            record = await connection.fetchRow(
+                '''
+                    SELECT configurationjson, isenabled, minutesbetween FROM recurringactions
+                    WHERE actiontype = $1 AND twitchchannel = $2
+                    LIMIT 1
+                ''',
+                actionType.toStr(), twitchChannel
+            )
+        finally:
+            await connection.close()
 
         if utils.hasItems(record):
             return record
@@ -186,36 +188,37 @@ class RecurringActionsRepository(RecurringActionsRepositoryInterface):
         self.__isDatabaseReady = True
         connection = await self.__backingDatabase.getConnection()
 
-        if connection.getDatabaseType() is DatabaseType.POSTGRESQL:
-            await connection.createTableIfNotExists(
-                '''
-                    CREATE TABLE IF NOT EXISTS recurringactions (
-                        actiontype text NOT NULL,
-                        configurationjson text DEFAULT NULL,
-                        isenabled smallint DEFAULT 1 NOT NULL,
-                        minutesbetween integer DEFAULT NULL,
-                        twitchchannel public.citext NOT NULL,
-                        PRIMARY KEY (actiontype, twitchchannel)
-                    )
-                '''
-            )
-        elif connection.getDatabaseType() is DatabaseType.SQLITE:
-            await connection.createTableIfNotExists(
-                '''
-                    CREATE TABLE IF NOT EXISTS recurringactions (
-                        actiontype TEXT NOT NULL,
-                        configurationjson TEXT DEFAULT NULL,
-                        isenabled INTEGER DEFAULT 1 NOT NULL,
-                        minutesbetween INTEGER DEFAULT NULL,
-                        twitchchannel TEXT NOT NULL COLLATE NOCASE,
-                        PRIMARY KEY (actiontype, twitchchannel)
-                    )
-                '''
-            )
-        else:
-            raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
-
-        await connection.close()
+        try:
+            if connection.getDatabaseType() is DatabaseType.POSTGRESQL:
+                await connection.createTableIfNotExists(
+                    '''
+                        CREATE TABLE IF NOT EXISTS recurringactions (
+                            actiontype text NOT NULL,
+                            configurationjson text DEFAULT NULL,
+                            isenabled smallint DEFAULT 1 NOT NULL,
+                            minutesbetween integer DEFAULT NULL,
+                            twitchchannel public.citext NOT NULL,
+                            PRIMARY KEY (actiontype, twitchchannel)
+                        )
+                    '''
+                )
+            elif connection.getDatabaseType() is DatabaseType.SQLITE:
+                await connection.createTableIfNotExists(
+                    '''
+                        CREATE TABLE IF NOT EXISTS recurringactions (
+                            actiontype TEXT NOT NULL,
+                            configurationjson TEXT DEFAULT NULL,
+                            isenabled INTEGER DEFAULT 1 NOT NULL,
+                            minutesbetween INTEGER DEFAULT NULL,
+                            twitchchannel TEXT NOT NULL COLLATE NOCASE,
+                            PRIMARY KEY (actiontype, twitchchannel)
+                        )
+                    '''
+                )
+            else:
+                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
+        finally:
+            await connection.close()
 
     async def setRecurringAction(self, action: RecurringAction):
         if not isinstance(action, RecurringAction):
@@ -238,13 +241,15 @@ class RecurringActionsRepository(RecurringActionsRepositoryInterface):
         isEnabled = utils.boolToNum(action.isEnabled())
 
         connection = await self.__getDatabaseConnection()
-        await connection.execute(
-            '''
-                INSERT INTO recurringactions (actiontype, configurationjson, isenabled, minutesbetween, twitchchannel)
-                VALUES ($1, $2, $3, $4, $5)
-                ON CONFLICT (actiontype, twitchchannel) DO UPDATE SET configurationjson = EXCLUDED.configurationjson, isenabled = EXCLUDED.isenabled, minutesbetween = EXCLUDED.minutesbetween
-            ''',
-            action.getActionType().toStr(), configurationJson, isEnabled, action.getMinutesBetween(), action.getTwitchChannel()
-        )
 
-        await connection.close()
+        try:
+            await connection.execute(
+                '''
+                    INSERT INTO recurringactions (actiontype, configurationjson, isenabled, minutesbetween, twitchchannel)
+                    VALUES ($1, $2, $3, $4, $5)
+                    ON CONFLICT (actiontype, twitchchannel) DO UPDATE SET configurationjson = EXCLUDED.configurationjson, isenabled = EXCLUDED.isenabled, minutesbetween = EXCLUDED.minutesbetween
+                ''',
+                action.getActionType().toStr(), configurationJson, isEnabled, action.getMinutesBetween(), action.getTwitchChannel()
+            )
+        finally:
+            await connection.close()
@@ -10,6 +10,10 @@ except:
 
 class BackingDatabase(ABC):
 
+    @abstractmethod
+    async def close(self):
+        pass
+
     @abstractmethod
     async def getConnection(self) -> DatabaseConnection:
         pass
@@ -36,6 +36,15 @@ class BackingPsqlDatabase(BackingDatabase):
 
         self.__connectionPool: Optional[asyncpg.Pool] = None
 
+    async def close(self):
+        connectionPool = self.__connectionPool
+
+        if connectionPool is None:
+            return
+
+        self.__connectionPool = None
+        await connectionPool.close()
+
     async def __createCollations(self, databaseConnection: DatabaseConnection):
         if not isinstance(databaseConnection, DatabaseConnection):
             raise ValueError(f'databaseConnection argument is malformed: \"{databaseConnection}\"')
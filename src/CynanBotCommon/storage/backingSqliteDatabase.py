@@ -1,12 +1,12 @@
 from asyncio import AbstractEventLoop
 
-import aiosqlite
-
 try:
     import CynanBotCommon.utils as utils
     from CynanBotCommon.storage.backingDatabase import BackingDatabase
     from CynanBotCommon.storage.databaseConnection import DatabaseConnection
     from CynanBotCommon.storage.databaseType import DatabaseType
+    from CynanBotCommon.storage.sqliteConnectionPool import \
+        SqliteConnectionPool
     from CynanBotCommon.storage.sqliteDatabaseConnection import \
         SqliteDatabaseConnection
 except:
@@ -14,6 +14,7 @@ except:
     from storage.backingDatabase import BackingDatabase
     from storage.databaseConnection import DatabaseConnection
     from storage.databaseType import DatabaseType
+    from storage.sqliteConnectionPool import SqliteConnectionPool
     from storage.sqliteDatabaseConnection import SqliteDatabaseConnection
 
 
@@ -22,21 +23,34 @@ class BackingSqliteDatabase(BackingDatabase):
     def __init__(
         self,
         eventLoop: AbstractEventLoop,
-        backingDatabaseFile: str = 'CynanBotCommon/storage/database.sqlite'
+        backingDatabaseFile: str = 'CynanBotCommon/storage/database.sqlite',
+        maxConnections: int = 4
     ):
         if not isinstance(eventLoop, AbstractEventLoop):
             raise ValueError(f'eventLoop argument is malformed: \"{eventLoop}\"')
         elif not utils.isValidStr(backingDatabaseFile):
             raise ValueError(f'backingDatabaseFile argument is malformed: \"{backingDatabaseFile}\"')
+        elif not utils.isValidInt(maxConnections):
+            raise ValueError(f'maxConnections argument is malformed: \"{maxConnections}\"')
+        elif maxConnections < 1 or maxConnections > 32:
+            raise ValueError(f'maxConnections argument is out of bounds: {maxConnections}')
+
+        self.__connectionPool: SqliteConnectionPool = SqliteConnectionPool(
+            eventLoop = eventLoop,
+            backingDatabaseFile = backingDatabaseFile,
+            maxConnections = maxConnections
+        )
 
-        self.__eventLoop: AbstractEventLoop = eventLoop
-        self.__backingDatabaseFile: str = backingDatabaseFile
+    async def close(self):
+        await self.__connectionPool.close()
 
     async def getConnection(self) -> DatabaseConnection:
-        return SqliteDatabaseConnection(await aiosqlite.connect(
-            database = self.__backingDatabaseFile,
-            loop = self.__eventLoop
-        ))
+        connection = await self.__connectionPool.acquire()
+
+        return SqliteDatabaseConnection(
+            connection = connection,
+            pool = self.__connectionPool
+        )
 
     def getDatabaseType(self) -> DatabaseType:
         return DatabaseType.SQLITE
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, List, Optional
+from typing import Any, AsyncContextManager, List, Optional
 
 try:
     from CynanBotCommon.storage.databaseType import DatabaseType
@@ -21,6 +21,10 @@ class DatabaseConnection(ABC):
     async def execute(self, query: str, *args: Optional[Any]):
         pass
 
+    @abstractmethod
+    async def executeMany(self, query: str, records: List[List[Any]]):
+        pass
+
     @abstractmethod
     async def fetchRow(self, query: str, *args: Optional[Any]) -> Optional[List[Any]]:
         pass
@@ -36,3 +40,7 @@ class DatabaseConnection(ABC):
     @abstractmethod
     def isClosed(self) -> bool:
         pass
+
+    @abstractmethod
+    def transaction(self) -> AsyncContextManager[None]:
+        pass
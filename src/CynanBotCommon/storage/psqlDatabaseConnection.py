@@ -1,4 +1,5 @@
-from typing import Any, List, Optional
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, List, Optional
 
 import asyncpg
 
@@ -52,8 +53,29 @@ class PsqlDatabaseConnection(DatabaseConnection):
 
         self.__requireNotClosed()
 
-        async with self.__connection.transaction():
+        if self.__connection.is_in_transaction():
             await self.__connection.execute(query, *args)
+        else:
+            async with self.__connection.transaction():
+                await self.__connection.execute(query, *args)
+
+    async def executeMany(self, query: str, records: List[List[Any]]):
+        if not utils.isValidStr(query):
+            raise ValueError(f'query argument is malformed: \"{query}\"')
+        elif not isinstance(records, List):
+            raise ValueError(f'records argument is malformed: \"{records}\"')
+
+        self.__requireNotClosed()
+
+        if len(records) == 0:
+            return
+
+        # asyncpg pipelines all of the records through a single prepared statement
+        if self.__connection.is_in_transaction():
+            await self.__connection.executemany(query, records)
+        else:
+            async with self.__connection.transaction():
+                await self.__connection.executemany(query, records)
 
     async def fetchRow(self, query: str, *args: Optional[Any]) -> Optional[List[Any]]:
         if not utils.isValidStr(query):
@@ -93,3 +115,15 @@ class PsqlDatabaseConnection(DatabaseConnection):
     def __requireNotClosed(self):
         if self.isClosed():
             raise DatabaseConnectionIsClosedException(f'This database connection has already been closed! ({self.getDatabaseType()})')
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[None]:
+        self.__requireNotClosed()
+
+        if self.__connection.is_in_transaction():
+            # nested transactions just join the outer one, rather than creating a savepoint
+            yield
+            return
+
+        async with self.__connection.transaction():
+            yield
@@ -0,0 +1,61 @@
+import pathlib
+from typing import Optional
+
+import aiosqlite
+
+try:
+    import CynanBotCommon.utils as utils
+except:
+    import utils
+
+
+class ReadOnlySqliteDatabase():
+
+    def __init__(
+        self,
+        databaseFile: str,
+        mmapSizeBytes: int = 128 * 1024 * 1024
+    ):
+        if not utils.isValidStr(databaseFile):
+            raise ValueError(f'databaseFile argument is malformed: \"{databaseFile}\"')
+        elif not utils.isValidInt(mmapSizeBytes):
+            raise ValueError(f'mmapSizeBytes argument is malformed: \"{mmapSizeBytes}\"')
+        elif mmapSizeBytes < 0 or mmapSizeBytes > utils.getLongMaxSafeSize():
+            raise ValueError(f'mmapSizeBytes argument is out of bounds: {mmapSizeBytes}')
+
+        self.__databaseFile: str = databaseFile
+        self.__mmapSizeBytes: int = mmapSizeBytes
+
+        self.__connection: Optional[aiosqlite.Connection] = None
+
+    async def close(self):
+        connection = self.__connection
+
+        if connection is None:
+            return
+
+        self.__connection = None
+        await connection.close()
+
+    async def getConnection(self) -> aiosqlite.Connection:
+        connection = self.__connection
+
+        if connection is not None:
+            return connection
+
+        # The bundled question databases never change while the bot is running, so the
+        # file can be opened as immutable, which lets SQLite skip all of its locking.
+        databaseUri = f'{pathlib.Path(self.__databaseFile).absolute().as_uri()}?mode=ro&immutable=1'
+        connection = await aiosqlite.connect(databaseUri, uri = True)
+        await connection.execute(f'PRAGMA mmap_size = {self.__mmapSizeBytes}')
+
+        if self.__connection is not None:
+            # another caller finished opening a connection while we were opening ours
+            await connection.close()
+            return self.__connection
+
+        self.__connection = connection
+        return connection
+
+    def getDatabaseFile(self) -> str:
+        return self.__databaseFile
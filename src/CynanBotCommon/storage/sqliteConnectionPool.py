@@ -0,0 +1,96 @@
+import asyncio
+from asyncio import AbstractEventLoop
+from typing import List
+
+import aiosqlite
+
+try:
+    import CynanBotCommon.utils as utils
+except:
+    import utils
+
+
+class SqliteConnectionPool():
+
+    def __init__(
+        self,
+        eventLoop: AbstractEventLoop,
+        backingDatabaseFile: str,
+        maxConnections: int = 4
+    ):
+        if not isinstance(eventLoop, AbstractEventLoop):
+            raise ValueError(f'eventLoop argument is malformed: \"{eventLoop}\"')
+        elif not utils.isValidStr(backingDatabaseFile):
+            raise ValueError(f'backingDatabaseFile argument is malformed: \"{backingDatabaseFile}\"')
+        elif not utils.isValidInt(maxConnections):
+            raise ValueError(f'maxConnections argument is malformed: \"{maxConnections}\"')
+        elif maxConnections < 1 or maxConnections > 32:
+            raise ValueError(f'maxConnections argument is out of bounds: {maxConnections}')
+
+        self.__eventLoop: AbstractEventLoop = eventLoop
+        self.__backingDatabaseFile: str = backingDatabaseFile
+        self.__maxConnections: int = maxConnections
+
+        self.__isClosed: bool = False
+        self.__semaphore: asyncio.Semaphore = asyncio.Semaphore(maxConnections)
+        self.__idleConnections: List[aiosqlite.Connection] = list()
+
+    async def acquire(self) -> aiosqlite.Connection:
+        if self.__isClosed:
+            raise RuntimeError(f'This SQLite connection pool has already been closed! ({self.__backingDatabaseFile})')
+
+        await self.__semaphore.acquire()
+
+        if len(self.__idleConnections) >= 1:
+            return self.__idleConnections.pop()
+
+        try:
+            return await self.__createConnection()
+        except:
+            self.__semaphore.release()
+            raise
+
+    async def close(self):
+        if self.__isClosed:
+            return
+
+        self.__isClosed = True
+        idleConnections = self.__idleConnections
+        self.__idleConnections = list()
+
+        for connection in idleConnections:
+            await connection.close()
+
+    async def __createConnection(self) -> aiosqlite.Connection:
+        connection = await aiosqlite.connect(
+            database = self.__backingDatabaseFile,
+            loop = self.__eventLoop
+        )
+
+        # WAL journaling lets readers on the other pooled connections proceed while
+        # one connection is writing, rather than blocking on the whole database file
+        await connection.execute('PRAGMA journal_mode = WAL')
+        return connection
+
+    def getMaxConnections(self) -> int:
+        return self.__maxConnections
+
+    def isClosed(self) -> bool:
+        return self.__isClosed
+
+    async def release(self, connection: aiosqlite.Connection):
+        if not isinstance(connection, aiosqlite.Connection):
+            raise ValueError(f'connection argument is malformed: \"{connection}\"')
+
+        try:
+            if self.__isClosed:
+                await connection.close()
+                return
+
+            if connection.in_transaction:
+                # never hand out a connection that still has uncommitted work on it
+                await connection.rollback()
+
+            self.__idleConnections.append(connection)
+        finally:
+            self.__semaphore.release()
@@ -1,4 +1,5 @@
-from typing import Any, List, Optional
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, List, Optional
 
 import aiosqlite
 
@@ -8,28 +9,41 @@ try:
     from CynanBotCommon.storage.databaseType import DatabaseType
     from CynanBotCommon.storage.exceptions import \
         DatabaseConnectionIsClosedException
+    from CynanBotCommon.storage.sqliteConnectionPool import \
+        SqliteConnectionPool
 except:
     import utils
     from storage.databaseConnection import DatabaseConnection
     from storage.databaseType import DatabaseType
     from storage.exceptions import DatabaseConnectionIsClosedException
+    from storage.sqliteConnectionPool import SqliteConnectionPool
 
 
 class SqliteDatabaseConnection(DatabaseConnection):
 
-    def __init__(self, connection: aiosqlite.Connection):
+    def __init__(self, connection: aiosqlite.Connection, pool: SqliteConnectionPool):
         if not isinstance(connection, aiosqlite.Connection):
             raise ValueError(f'connection argument is malformed: \"{connection}\"')
+        elif not isinstance(pool, SqliteConnectionPool):
+            raise ValueError(f'pool argument is malformed: \"{pool}\"')
 
         self.__connection: aiosqlite.Connection = connection
+        self.__pool: SqliteConnectionPool = pool
+
         self.__isClosed: bool = False
+        self.__isInTransaction: bool = False
 
     async def close(self):
         if self.__isClosed:
             return
 
         self.__isClosed = True
-        await self.__connection.close()
+        await self.__pool.release(self.__connection)
+
+    async def __commitIfWritten(self):
+        # statements such as INSERT ... RETURNING both write and fetch, so they need committing too
+        if not self.__isInTransaction and self.__connection.in_transaction:
+            await self.__connection.commit()
 
     async def createTableIfNotExists(self, query: str, *args: Optional[Any]):
         if not utils.isValidStr(query):
@@ -46,7 +60,28 @@ class SqliteDatabaseConnection(DatabaseConnection):
 
         self.__requireNotClosed()
         cursor = await self.__connection.execute(query, args)
-        await self.__connection.commit()
+
+        if not self.__isInTransaction:
+            await self.__connection.commit()
+
+        await cursor.close()
+
+    async def executeMany(self, query: str, records: List[List[Any]]):
+        if not utils.isValidStr(query):
+            raise ValueError(f'query argument is malformed: \"{query}\"')
+        elif not isinstance(records, List):
+            raise ValueError(f'records argument is malformed: \"{records}\"')
+
+        self.__requireNotClosed()
+
+        if len(records) == 0:
+            return
+
+        cursor = await self.__connection.executemany(query, records)
+
+        if not self.__isInTransaction:
+            await self.__connection.commit()
+
         await cursor.close()
 
     async def fetchRow(self, query: str, *args: Optional[Any]) -> Optional[List[Any]]:
@@ -56,15 +91,15 @@ class SqliteDatabaseConnection(DatabaseConnection):
         self.__requireNotClosed()
         cursor = await self.__connection.execute(query, args)
         row = await cursor.fetchone()
+        await cursor.close()
+        await self.__commitIfWritten()
 
         if not utils.hasItems(row):
-            await cursor.close()
             return None
 
         results: List[Any] = list()
         results.extend(row)
 
-        await cursor.close()
         return results
 
     async def fetchRows(self, query: str, *args: Optional[Any]) -> Optional[List[List[Any]]]:
@@ -74,9 +109,10 @@ class SqliteDatabaseConnection(DatabaseConnection):
         self.__requireNotClosed()
         cursor = await self.__connection.execute(query, args)
         rows = await cursor.fetchall()
+        await cursor.close()
+        await self.__commitIfWritten()
 
         if not utils.hasItems(rows):
-            await cursor.close()
             return None
 
         records: List[List[Any]] = list()
@@ -84,7 +120,6 @@ class SqliteDatabaseConnection(DatabaseConnection):
         for record in rows:
             records.append(list(record))
 
-        await cursor.close()
         return records
 
     def getDatabaseType(self) -> DatabaseType:
@@ -96,3 +131,28 @@ class SqliteDatabaseConnection(DatabaseConnection):
     def __requireNotClosed(self):
         if self.__isClosed:
             raise DatabaseConnectionIsClosedException(f'This database connection has already been closed! ({self.getDatabaseType()})')
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[None]:
+        self.__requireNotClosed()
+
+        if self.__isInTransaction:
+            # nested transactions just join the outer one
+            yield
+            return
+
+        # BEGIN IMMEDIATE grabs the write lock up front, so that a read-then-write
+        # transaction can't deadlock against another pooled connection doing the same
+        cursor = await self.__connection.execute('BEGIN IMMEDIATE')
+        await cursor.close()
+        self.__isInTransaction = True
+
+        try:
+            yield
+        except:
+            await self.__connection.rollback()
+            raise
+        else:
+            await self.__connection.commit()
+        finally:
+            self.__isInTransaction = False
@@ -0,0 +1,96 @@
+import random
+from array import array
+from typing import Any, List, Optional
+
+import aiosqlite
+
+try:
+    import CynanBotCommon.utils as utils
+except:
+    import utils
+
+
+class SqliteRandomRowSampler():
+
+    def __init__(self, tableName: str):
+        if not utils.isValidStr(tableName):
+            raise ValueError(f'tableName argument is malformed: \"{tableName}\"')
+
+        self.__tableName: str = tableName
+
+        self.__isLoaded: bool = False
+        self.__rowCount: int = 0
+        self.__minRowId: int = 0
+        self.__rowIds: Optional[array] = None
+
+    async def fetchRandomRow(
+        self,
+        connection: aiosqlite.Connection,
+        columns: str
+    ) -> Optional[List[Any]]:
+        if not isinstance(connection, aiosqlite.Connection):
+            raise ValueError(f'connection argument is malformed: \"{connection}\"')
+        elif not utils.isValidStr(columns):
+            raise ValueError(f'columns argument is malformed: \"{columns}\"')
+
+        if not self.__isLoaded:
+            await self.__loadRowIds(connection)
+
+        if self.__rowCount == 0:
+            return None
+
+        rowId: int = 0
+
+        if self.__rowIds is None:
+            rowId = self.__minRowId + random.randrange(self.__rowCount)
+        else:
+            rowId = self.__rowIds[random.randrange(self.__rowCount)]
+
+        cursor = await connection.execute(
+            f'''
+                SELECT {columns} FROM {self.__tableName}
+                WHERE rowid = ?
+                LIMIT 1
+            ''',
+            (rowId, )
+        )
+
+        row = await cursor.fetchone()
+        await cursor.close()
+
+        if not utils.hasItems(row):
+            return None
+
+        return list(row)
+
+    def getTableName(self) -> str:
+        return self.__tableName
+
+    async def __loadRowIds(self, connection: aiosqlite.Connection):
+        cursor = await connection.execute(f'SELECT MIN(rowid), MAX(rowid), COUNT(*) FROM {self.__tableName}')
+        row = await cursor.fetchone()
+        await cursor.close()
+
+        rowCount: int = 0
+        minRowId: int = 0
+        rowIds: Optional[array] = None
+
+        if utils.hasItems(row) and utils.isValidInt(row[2]) and row[2] >= 1:
+            rowCount = row[2]
+            minRowId = row[0]
+            maxRowId: int = row[1]
+
+            # A table without any gaps in its rowids only needs its rowid range to be
+            # sampled from. Otherwise, hold onto a compact array of every rowid.
+            if maxRowId - minRowId + 1 != rowCount:
+                cursor = await connection.execute(f'SELECT rowid FROM {self.__tableName} ORDER BY rowid ASC')
+                rows = await cursor.fetchall()
+                await cursor.close()
+
+                rowIds = array('q', (rowIdRow[0] for rowIdRow in rows))
+                rowCount = len(rowIds)
+
+        self.__rowCount = rowCount
+        self.__minRowId = minRowId
+        self.__rowIds = rowIds
+        self.__isLoaded = True
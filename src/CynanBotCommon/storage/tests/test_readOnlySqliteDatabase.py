@@ -0,0 +1,51 @@
+import os
+import sqlite3
+
+import pytest
+
+try:
+    from ..readOnlySqliteDatabase import ReadOnlySqliteDatabase
+except:
+    from storage.readOnlySqliteDatabase import ReadOnlySqliteDatabase
+
+
+class TestReadOnlySqliteDatabase():
+
+    def __createDatabase(self, tmp_path) -> str:
+        databaseFile = os.path.join(tmp_path, 'questions.sqlite')
+        connection = sqlite3.connect(databaseFile)
+        connection.execute('CREATE TABLE questions (question TEXT NOT NULL)')
+        connection.execute('INSERT INTO questions (question) VALUES (?)', ('What is the answer?', ))
+        connection.commit()
+        connection.close()
+        return databaseFile
+
+    @pytest.mark.asyncio
+    async def test_getConnection_isReused(self, tmp_path):
+        database = ReadOnlySqliteDatabase(self.__createDatabase(tmp_path))
+        connection1 = await database.getConnection()
+        connection2 = await database.getConnection()
+        await database.close()
+
+        assert connection1 is connection2
+
+    @pytest.mark.asyncio
+    async def test_getConnection_isReadOnly(self, tmp_path):
+        database = ReadOnlySqliteDatabase(self.__createDatabase(tmp_path))
+        connection = await database.getConnection()
+
+        cursor = await connection.execute('SELECT question FROM questions')
+        row = await cursor.fetchone()
+        await cursor.close()
+
+        exception: Exception = None
+
+        try:
+            await connection.execute('INSERT INTO questions (question) VALUES (?)', ('Another question?', ))
+        except Exception as e:
+            exception = e
+
+        await database.close()
+
+        assert row[0] == 'What is the answer?'
+        assert isinstance(exception, sqlite3.OperationalError)
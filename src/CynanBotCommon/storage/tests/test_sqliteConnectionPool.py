@@ -0,0 +1,80 @@
+import asyncio
+import os
+
+import pytest
+
+try:
+    from ..sqliteConnectionPool import SqliteConnectionPool
+except:
+    from storage.sqliteConnectionPool import SqliteConnectionPool
+
+
+class TestSqliteConnectionPool():
+
+    @pytest.mark.asyncio
+    async def test_acquire_enablesWalJournaling(self, tmp_path):
+        pool = SqliteConnectionPool(
+            eventLoop = asyncio.get_running_loop(),
+            backingDatabaseFile = os.path.join(tmp_path, 'database.sqlite')
+        )
+
+        connection = await pool.acquire()
+        cursor = await connection.execute('PRAGMA journal_mode')
+        row = await cursor.fetchone()
+        await cursor.close()
+        await pool.release(connection)
+        await pool.close()
+
+        assert row[0] == 'wal'
+
+    @pytest.mark.asyncio
+    async def test_acquire_reusesReleasedConnection(self, tmp_path):
+        pool = SqliteConnectionPool(
+            eventLoop = asyncio.get_running_loop(),
+            backingDatabaseFile = os.path.join(tmp_path, 'database.sqlite')
+        )
+
+        connection1 = await pool.acquire()
+        await pool.release(connection1)
+        connection2 = await pool.acquire()
+        await pool.release(connection2)
+        await pool.close()
+
+        assert connection1 is connection2
+
+    @pytest.mark.asyncio
+    async def test_acquire_waitsForReleaseWhenExhausted(self, tmp_path):
+        pool = SqliteConnectionPool(
+            eventLoop = asyncio.get_running_loop(),
+            backingDatabaseFile = os.path.join(tmp_path, 'database.sqlite'),
+            maxConnections = 1
+        )
+
+        connection1 = await pool.acquire()
+        waiter = asyncio.ensure_future(pool.acquire())
+        await asyncio.sleep(0.05)
+        assert not waiter.done()
+
+        await pool.release(connection1)
+        connection2 = await asyncio.wait_for(waiter, timeout = 1)
+        await pool.release(connection2)
+        await pool.close()
+
+        assert connection1 is connection2
+
+    @pytest.mark.asyncio
+    async def test_constructWithZeroMaxConnections(self):
+        pool: SqliteConnectionPool = None
+        exception: Exception = None
+
+        try:
+            pool = SqliteConnectionPool(
+                eventLoop = asyncio.get_running_loop(),
+                backingDatabaseFile = 'database.sqlite',
+                maxConnections = 0
+            )
+        except Exception as e:
+            exception = e
+
+        assert pool is None
+        assert isinstance(exception, ValueError)
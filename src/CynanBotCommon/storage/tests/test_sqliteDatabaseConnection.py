@@ -0,0 +1,88 @@
+import asyncio
+import os
+
+import pytest
+
+try:
+    from ..backingDatabase import BackingDatabase
+    from ..backingSqliteDatabase import BackingSqliteDatabase
+except:
+    from storage.backingDatabase import BackingDatabase
+    from storage.backingSqliteDatabase import BackingSqliteDatabase
+
+
+class TestSqliteDatabaseConnection():
+
+    async def __createBackingDatabase(self, tmp_path) -> BackingDatabase:
+        backingDatabase = BackingSqliteDatabase(
+            eventLoop = asyncio.get_running_loop(),
+            backingDatabaseFile = os.path.join(tmp_path, 'database.sqlite')
+        )
+
+        connection = await backingDatabase.getConnection()
+        await connection.createTableIfNotExists('CREATE TABLE IF NOT EXISTS numbers (number INTEGER NOT NULL)')
+        await connection.close()
+        return backingDatabase
+
+    @pytest.mark.asyncio
+    async def test_transaction_commitsAllStatements(self, tmp_path):
+        backingDatabase = await self.__createBackingDatabase(tmp_path)
+        connection = await backingDatabase.getConnection()
+
+        async with connection.transaction():
+            await connection.execute('INSERT INTO numbers (number) VALUES ($1)', 1)
+            await connection.execute('INSERT INTO numbers (number) VALUES ($1)', 2)
+
+        record = await connection.fetchRow('SELECT COUNT(*) FROM numbers')
+        await connection.close()
+        await backingDatabase.close()
+
+        assert record[0] == 2
+
+    @pytest.mark.asyncio
+    async def test_transaction_rollsBackOnException(self, tmp_path):
+        backingDatabase = await self.__createBackingDatabase(tmp_path)
+        connection = await backingDatabase.getConnection()
+        exception: Exception = None
+
+        try:
+            async with connection.transaction():
+                await connection.execute('INSERT INTO numbers (number) VALUES ($1)', 1)
+                raise RuntimeError()
+        except Exception as e:
+            exception = e
+
+        record = await connection.fetchRow('SELECT COUNT(*) FROM numbers')
+        await connection.close()
+        await backingDatabase.close()
+
+        assert isinstance(exception, RuntimeError)
+        assert record[0] == 0
+
+    @pytest.mark.asyncio
+    async def test_executeMany(self, tmp_path):
+        backingDatabase = await self.__createBackingDatabase(tmp_path)
+        connection = await backingDatabase.getConnection()
+
+        await connection.executeMany(
+            'INSERT INTO numbers (number) VALUES ($1)',
+            [ [ 1 ], [ 2 ], [ 3 ] ]
+        )
+
+        record = await connection.fetchRow('SELECT SUM(number) FROM numbers')
+        await connection.close()
+        await backingDatabase.close()
+
+        assert record[0] == 6
+
+    @pytest.mark.asyncio
+    async def test_executeMany_withEmptyList(self, tmp_path):
+        backingDatabase = await self.__createBackingDatabase(tmp_path)
+        connection = await backingDatabase.getConnection()
+        await connection.executeMany('INSERT INTO numbers (number) VALUES ($1)', list())
+
+        record = await connection.fetchRow('SELECT COUNT(*) FROM numbers')
+        await connection.close()
+        await backingDatabase.close()
+
+        assert record[0] == 0
@@ -0,0 +1,68 @@
+import os
+import sqlite3
+from typing import Set
+
+import aiosqlite
+import pytest
+
+try:
+    from ..sqliteRandomRowSampler import SqliteRandomRowSampler
+except:
+    from storage.sqliteRandomRowSampler import SqliteRandomRowSampler
+
+
+class TestSqliteRandomRowSampler():
+
+    def __createDatabase(self, tmp_path, questionIds: Set[int], deletedQuestionIds: Set[int]) -> str:
+        databaseFile = os.path.join(tmp_path, 'questions.sqlite')
+        connection = sqlite3.connect(databaseFile)
+        connection.execute('CREATE TABLE questions (questionId INTEGER NOT NULL, question TEXT NOT NULL)')
+
+        for questionId in sorted(questionIds):
+            connection.execute('INSERT INTO questions (questionId, question) VALUES (?, ?)', (questionId, f'question {questionId}'))
+
+        for questionId in deletedQuestionIds:
+            connection.execute('DELETE FROM questions WHERE questionId = ?', (questionId, ))
+
+        connection.commit()
+        connection.close()
+        return databaseFile
+
+    @pytest.mark.asyncio
+    async def test_fetchRandomRow_withContiguousRows(self, tmp_path):
+        databaseFile = self.__createDatabase(tmp_path, set(range(1, 6)), set())
+        sampler = SqliteRandomRowSampler('questions')
+        sampledQuestionIds: Set[int] = set()
+
+        async with aiosqlite.connect(databaseFile) as connection:
+            for _ in range(200):
+                row = await sampler.fetchRandomRow(connection, 'questionId, question')
+                assert row is not None
+                assert row[1] == f'question {row[0]}'
+                sampledQuestionIds.add(row[0])
+
+        assert sampledQuestionIds == set(range(1, 6))
+
+    @pytest.mark.asyncio
+    async def test_fetchRandomRow_withDeletedRows(self, tmp_path):
+        databaseFile = self.__createDatabase(tmp_path, set(range(1, 11)), { 2, 3, 7 })
+        sampler = SqliteRandomRowSampler('questions')
+        sampledQuestionIds: Set[int] = set()
+
+        async with aiosqlite.connect(databaseFile) as connection:
+            for _ in range(300):
+                row = await sampler.fetchRandomRow(connection, 'questionId')
+                assert row is not None
+                sampledQuestionIds.add(row[0])
+
+        assert sampledQuestionIds == { 1, 4, 5, 6, 8, 9, 10 }
+
+    @pytest.mark.asyncio
+    async def test_fetchRandomRow_withEmptyTable(self, tmp_path):
+        databaseFile = self.__createDatabase(tmp_path, set(), set())
+        sampler = SqliteRandomRowSampler('questions')
+
+        async with aiosqlite.connect(databaseFile) as connection:
+            row = await sampler.fetchRandomRow(connection, 'questionId')
+
+        assert row is None
@@ -55,17 +55,20 @@ class SupStreamerRepository(SupStreamerRepositoryInterface):
             return self.__cache[twitchChannelId]
 
         connection = await self.__getDatabaseConnection()
-        records = await connection.fetchRows(
-            '''
-                SELECT supstreamerchatters.mostrecentsup, supstreamerchatters.chatteruserid, userids.username FROM supstreamerchatters
-                INNER JOIN userids ON supstreamerchatters.twitchchannelid = userids.userid
-                ORDER BY supstreamerchatters.mostrecentsup ASC
-                WHERE supstreamerchatters.twitchchannelid = $1
-            ''',
-            twitchChannelId
-        )
-
-        await connection.close()
+
+        try:
+            records = await connection.fetchRows(
+                '''
+                    SELECT supstreamerchatters.mostrecentsup, supstreamerchatters.chatteruserid, userids.username FROM supstreamerchatters
+                    INNER JOIN userids ON supstreamerchatters.twitchchannelid = userids.userid
+                    ORDER BY supstreamerchatters.mostrecentsup ASC
+                    WHERE supstreamerchatters.twitchchannelid = $1
+                ''',
+                twitchChannelId
+            )
+        finally:
+            await connection.close()
+
         twitchChannelName: Optional[str] = None
         chatters: Dict[str, Optional[SupStreamerChatter]] = dict()
 
@@ -109,30 +112,31 @@ class SupStreamerRepository(SupStreamerRepositoryInterface):
         self.__isDatabaseReady = True
         connection = await self.__backingDatabase.getConnection()
 
-        if connection.getDatabaseType() is DatabaseType.POSTGRESQL:
-            await connection.createTableIfNotExists(
-                '''
-                    CREATE TABLE IF NOT EXISTS supstreamerchatters (
-                        mostrecentsup text NOT NULL,
-                        chatteruserid public.citext NOT NULL,
-                        twitchchannelid public.citext NOT NULL
-                    )
-                '''
-            )
-        elif connection.getDatabaseType() is DatabaseType.SQLITE:
-            await connection.createTableIfNotExists(
-                '''
-                    CREATE TABLE IF NOT EXISTS supstreamerchatters (
-                        mostrecentsup TEXT NOT NULL,
-                        chatteruserid TEXT NOT NULL COLLATE NOCASE,
-                        twitchchannelid TEXT NOT NULL COLLATE NOCASE
-                    )
-                '''
-            )
-        else:
-            raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
-
-        await connection.close()
+        try:
+            if connection.getDatabaseType() is DatabaseType.POSTGRESQL:
+                await connection.createTableIfNotExists(
+                    '''
+                        CREATE TABLE IF NOT EXISTS supstreamerchatters (
+                            mostrecentsup text NOT NULL,
+                            chatteruserid public.citext NOT NULL,
+                            twitchchannelid public.citext NOT NULL
+                        )
+                    '''
+                )
+            elif connection.getDatabaseType() is DatabaseType.SQLITE:
+                await connection.createTableIfNotExists(
+                    '''
+                        CREATE TABLE IF NOT EXISTS supstreamerchatters (
+                            mostrecentsup TEXT NOT NULL,
+                            chatteruserid TEXT NOT NULL COLLATE NOCASE,
+                            twitchchannelid TEXT NOT NULL COLLATE NOCASE
+                        )
+                    '''
+                )
+            else:
+                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
+        finally:
+            await connection.close()
 
     async def update(self, chatterUserId: str, twitchChannelId: str):
         if not utils.isValidStr(chatterUserId):
@@ -143,16 +147,19 @@ class SupStreamerRepository(SupStreamerRepositoryInterface):
         now = SimpleDateTime()
 
         connection = await self.__getDatabaseConnection()
-        await connection.execute(
-            '''
-                INSERT INTO supstreamerchatters (mostrecentsup, chatteruserid, twitchchannelid)
-                VALUES ($1, $2, $3)
-                ON CONFLICT (mostrecentsup, chatteruserid, twitchchannelid) DO UPDATE SET mostrecentsup = EXCLUDED.mostrecentsup
-            ''',
-            now.getIsoFormatStr(), chatterUserId, twitchChannelId
-        )
-
-        await connection.close()
+
+        try:
+            await connection.execute(
+                '''
+                    INSERT INTO supstreamerchatters (mostrecentsup, chatteruserid, twitchchannelid)
+                    VALUES ($1, $2, $3)
+                    ON CONFLICT (mostrecentsup, chatteruserid, twitchchannelid) DO UPDATE SET mostrecentsup = EXCLUDED.mostrecentsup
+                ''',
+                now.getIsoFormatStr(), chatterUserId, twitchChannelId
+            )
+        finally:
+            await connection.close()
+
         action = await self.get(twitchChannelId)
 
         if action is None:
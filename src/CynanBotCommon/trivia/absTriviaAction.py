@@ -1,6 +1,6 @@
 import random
 import string
-from abc import ABC
+from abc import ABC, abstractmethod
 
 try:
     from CynanBotCommon.trivia.triviaActionType import TriviaActionType
@@ -26,3 +26,7 @@ class AbsTriviaAction(ABC):
 
     def getTriviaActionType(self) -> TriviaActionType:
         return self.__triviaActionType
+
+    @abstractmethod
+    def getTwitchChannel(self) -> str:
+        pass
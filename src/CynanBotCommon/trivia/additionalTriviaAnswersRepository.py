@@ -161,15 +161,18 @@ class AdditionalTriviaAnswersRepository(AdditionalTriviaAnswersRepositoryInterfa
             )
 
         connection = await self.__getDatabaseConnection()
-        await connection.execute(
-            '''
-                INSERT INTO additionaltriviaanswers (additionalanswer, triviaid, triviasource, triviatype, userid)
-                VALUES ($1, $2, $3, $4, $5)
-            ''',
-            additionalAnswer, triviaId, triviaSource.toStr(), triviaType.toStr(), userId
-        )
 
-        await connection.close()
+        try:
+            await connection.execute(
+                '''
+                    INSERT INTO additionaltriviaanswers (additionalanswer, triviaid, triviasource, triviatype, userid)
+                    VALUES ($1, $2, $3, $4, $5)
+                ''',
+                additionalAnswer, triviaId, triviaSource.toStr(), triviaType.toStr(), userId
+            )
+        finally:
+            await connection.close()
+
         self.__timber.log('AdditionalTriviaAnswersRepository', f'Added additional answer (\"{additionalAnswer}\") for {triviaSource.toStr()}:{triviaId}, all answers: {additionalAnswersList}')
 
         return AdditionalTriviaAnswers(
@@ -229,15 +232,18 @@ class AdditionalTriviaAnswersRepository(AdditionalTriviaAnswersRepositoryInterfa
             return None
 
         connection = await self.__getDatabaseConnection()
-        await connection.execute(
-            '''
-                DELETE FROM additionaltriviaanswers
-                WHERE triviaid = $1 AND triviasource = $2 AND triviatype = $3
-            ''',
-            triviaId, triviaSource.toStr(), triviaType.toStr()
-        )
 
-        await connection.close()
+        try:
+            await connection.execute(
+                '''
+                    DELETE FROM additionaltriviaanswers
+                    WHERE triviaid = $1 AND triviasource = $2 AND triviatype = $3
+                ''',
+                triviaId, triviaSource.toStr(), triviaType.toStr()
+            )
+        finally:
+            await connection.close()
+
         self.__timber.log('AdditionalTriviaAnswersRepository', f'Deleted additional answers for {triviaSource.toStr()}:{triviaId} (existing additional answers were {reference.getAdditionalAnswers()})')
 
         return reference
@@ -259,17 +265,19 @@ class AdditionalTriviaAnswersRepository(AdditionalTriviaAnswersRepositoryInterfa
             return None
 
         connection = await self.__getDatabaseConnection()
-        records = await connection.fetchRows(
-            '''
-                SELECT additionaltriviaanswers.additionalanswer, additionaltriviaanswers.userid, userids.username FROM additionaltriviaanswers
-                INNER JOIN userids ON additionaltriviaanswers.userid = userids.userid
-                WHERE additionaltriviaanswers.triviaid = $1 AND additionaltriviaanswers.triviasource = $2 AND additionaltriviaanswers.triviatype = $3
-                ORDER BY additionaltriviaanswers.additionalanswer ASC
-            ''',
-            triviaId, triviaSource.toStr(), triviaType.toStr()
-        )
 
-        await connection.close()
+        try:
+            records = await connection.fetchRows(
+                '''
+                    SELECT additionaltriviaanswers.additionalanswer, additionaltriviaanswers.userid, userids.username FROM additionaltriviaanswers
+                    INNER JOIN userids ON additionaltriviaanswers.userid = userids.userid
+                    WHERE additionaltriviaanswers.triviaid = $1 AND additionaltriviaanswers.triviasource = $2 AND additionaltriviaanswers.triviatype = $3
+                    ORDER BY additionaltriviaanswers.additionalanswer ASC
+                ''',
+                triviaId, triviaSource.toStr(), triviaType.toStr()
+            )
+        finally:
+            await connection.close()
 
         if not utils.hasItems(records):
             return None
@@ -303,31 +311,32 @@ class AdditionalTriviaAnswersRepository(AdditionalTriviaAnswersRepositoryInterfa
         self.__isDatabaseReady = True
         connection = await self.__backingDatabase.getConnection()
 
-        if connection.getDatabaseType() is DatabaseType.POSTGRESQL:
-            await connection.createTableIfNotExists(
-                '''
-                    CREATE TABLE IF NOT EXISTS additionaltriviaanswers (
-                        additionalanswer text NOT NULL,
-                        triviaid public.citext NOT NULL,
-                        triviasource public.citext NOT NULL,
-                        triviatype public.citext NOT NULL,
-                        userid public.citext NOT NULL
-                    )
-                '''
-            )
-        elif connection.getDatabaseType() is DatabaseType.SQLITE:
-            await connection.createTableIfNotExists(
-                '''
-                    CREATE TABLE IF NOT EXISTS additionaltriviaanswers (
-                        additionalanswer TEXT NOT NULL,
-                        triviaid TEXT NOT NULL COLLATE NOCASE,
-                        triviasource TEXT NOT NULL COLLATE NOCASE,
-                        triviatype TEXT NOT NULL COLLATE NOCASE,
-                        userid TEXT NOT NULL COLLATE NOCASE
-                    )
-                '''
-            )
-        else:
-            raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
-
-        await connection.close()
+        try:
+            if connection.getDatabaseType() is DatabaseType.POSTGRESQL:
+                await connection.createTableIfNotExists(
+                    '''
+                        CREATE TABLE IF NOT EXISTS additionaltriviaanswers (
+                            additionalanswer text NOT NULL,
+                            triviaid public.citext NOT NULL,
+                            triviasource public.citext NOT NULL,
+                            triviatype public.citext NOT NULL,
+                            userid public.citext NOT NULL
+                        )
+                    '''
+                )
+            elif connection.getDatabaseType() is DatabaseType.SQLITE:
+                await connection.createTableIfNotExists(
+                    '''
+                        CREATE TABLE IF NOT EXISTS additionaltriviaanswers (
+                            additionalanswer TEXT NOT NULL,
+                            triviaid TEXT NOT NULL COLLATE NOCASE,
+                            triviasource TEXT NOT NULL COLLATE NOCASE,
+                            triviatype TEXT NOT NULL COLLATE NOCASE,
+                            userid TEXT NOT NULL COLLATE NOCASE
+                        )
+                    '''
+                )
+            else:
+                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
+        finally:
+            await connection.close()
@@ -86,61 +86,65 @@ class BannedTriviaGameControllersRepository(BannedTriviaGameControllersRepositor
             return AddBannedTriviaGameControllerResult.ERROR
 
         connection = await self.__getDatabaseConnection()
-        record = await connection.fetchRow(
-            '''
-                SELECT COUNT(1) FROM bannedtriviagamecontrollers
-                WHERE userid = $1
-                LIMIT 1
-            ''',
-            userId
-        )
 
-        count: Optional[int] = None
-        if utils.hasItems(record):
-            count = record[0]
+        try:
+            record = await connection.fetchRow(
+                '''
+                    SELECT COUNT(1) FROM bannedtriviagamecontrollers
+                    WHERE userid = $1
+                    LIMIT 1
+                ''',
+                userId
+            )
+
+            count: Optional[int] = None
+            if utils.hasItems(record):
+                count = record[0]
 
-        if utils.isValidInt(count) and count >= 1:
+            if utils.isValidInt(count) and count >= 1:
+                self.__timber.log('BannedTriviaGameControllersRepository', f'Tried to add userName=\"{userName}\" userId=\"{userId}\" as a banned trivia game controller, but this user has already been added as one')
+                return AddBannedTriviaGameControllerResult.ALREADY_EXISTS
+
+            await connection.execute(
+                '''
+                    INSERT INTO bannedtriviagamecontrollers (userid)
+                    VALUES ($1)
+                    ON CONFLICT (userid) DO NOTHING
+                ''',
+                userId
+            )
+        finally:
             await connection.close()
-            self.__timber.log('BannedTriviaGameControllersRepository', f'Tried to add userName=\"{userName}\" userId=\"{userId}\" as a banned trivia game controller, but this user has already been added as one')
-            return AddBannedTriviaGameControllerResult.ALREADY_EXISTS
-
-        await connection.execute(
-            '''
-                INSERT INTO bannedtriviagamecontrollers (userid)
-                VALUES ($1)
-                ON CONFLICT (userid) DO NOTHING
-            ''',
-            userId
-        )
 
-        await connection.close()
         self.__timber.log('BannedTriviaGameControllersRepository', f'Added userName=\"{userName}\" userId=\"{userId}\" as a banned trivia game controller')
 
         return AddBannedTriviaGameControllerResult.ADDED
 
     async def getBannedControllers(self) -> List[BannedTriviaGameController]:
         connection = await self.__getDatabaseConnection()
-        records = await connection.fetchRows(
-            '''
-                SELECT bannedtriviagamecontrollers.userid, userids.username FROM bannedtriviagamecontrollers
-                INNER JOIN userids ON bannedtriviagamecontrollers.userid = userids.userid
-                ORDER BY userids.username ASC
-            '''
-        )
 
-        controllers: List[BannedTriviaGameController] = list()
+        try:
+            records = await connection.fetchRows(
+                '''
+                    SELECT bannedtriviagamecontrollers.userid, userids.username FROM bannedtriviagamecontrollers
+                    INNER JOIN userids ON bannedtriviagamecontrollers.userid = userids.userid
+                    ORDER BY userids.username ASC
+                '''
+            )
 
-        if not utils.hasItems(records):
-            await connection.close()
-            return controllers
+            controllers: List[BannedTriviaGameController] = list()
+
+            if not utils.hasItems(records):
+                return controllers
 
-        for record in records:
-            controllers.append(BannedTriviaGameController(
-                userId = record[0],
-                userName = record[1]
-            ))
+            for record in records:
+                controllers.append(BannedTriviaGameController(
+                    userId = record[0],
+                    userName = record[1]
+                ))
+        finally:
+            await connection.close()
 
-        await connection.close()
         controllers.sort(key = lambda controller: controller.getUserName().lower())
 
         return controllers
@@ -156,26 +160,27 @@ class BannedTriviaGameControllersRepository(BannedTriviaGameControllersRepositor
         self.__isDatabaseReady = True
         connection = await self.__backingDatabase.getConnection()
 
-        if connection.getDatabaseType() is DatabaseType.POSTGRESQL:
-            await connection.createTableIfNotExists(
-                '''
-                    CREATE TABLE IF NOT EXISTS bannedtriviagamecontrollers (
-                        userid public.citext NOT NULL PRIMARY KEY
-                    )
-                '''
-            )
-        elif connection.getDatabaseType() is DatabaseType.SQLITE:
-            await connection.createTableIfNotExists(
-                '''
-                    CREATE TABLE IF NOT EXISTS bannedtriviagamecontrollers (
-                        userid TEXT NOT NULL PRIMARY KEY COLLATE NOCASE
-                    )
-                '''
-            )
-        else:
-            raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
-
-        await connection.close()
+        try:
+            if connection.getDatabaseType() is DatabaseType.POSTGRESQL:
+                await connection.createTableIfNotExists(
+                    '''
+                        CREATE TABLE IF NOT EXISTS bannedtriviagamecontrollers (
+                            userid public.citext NOT NULL PRIMARY KEY
+                        )
+                    '''
+                )
+            elif connection.getDatabaseType() is DatabaseType.SQLITE:
+                await connection.createTableIfNotExists(
+                    '''
+                        CREATE TABLE IF NOT EXISTS bannedtriviagamecontrollers (
+                            userid TEXT NOT NULL PRIMARY KEY COLLATE NOCASE
+                        )
+                    '''
+                )
+            else:
+                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
+        finally:
+            await connection.close()
 
     async def removeBannedController(self, userName: str) -> RemoveBannedTriviaGameControllerResult:
         if not utils.isValidStr(userName):
@@ -188,15 +193,18 @@ class BannedTriviaGameControllersRepository(BannedTriviaGameControllersRepositor
             return RemoveBannedTriviaGameControllerResult.ERROR
 
         connection = await self.__backingDatabase.getConnection()
-        await connection.execute(
-            '''
-                DELETE FROM bannedtriviagamecontrollers
-                WHERE userid = $1
-            ''',
-            userId
-        )
 
-        await connection.close()
+        try:
+            await connection.execute(
+                '''
+                    DELETE FROM bannedtriviagamecontrollers
+                    WHERE userid = $1
+                ''',
+                userId
+            )
+        finally:
+            await connection.close()
+
         self.__timber.log('BannedTriviaGameControllersRepository', f'Removed userName=\"{userName}\" userId=\"{userId}\" as a banned trivia game controller')
 
         return RemoveBannedTriviaGameControllerResult.REMOVED
@@ -1,4 +1,5 @@
-from typing import Optional
+import asyncio
+from typing import Optional, Set, Tuple
 
 try:
     import CynanBotCommon.utils as utils
@@ -41,6 +42,8 @@ class BannedTriviaIdsRepository(BannedTriviaIdsRepositoryInterface):
         self.__timber: TimberInterface = timber
 
         self.__isDatabaseReady: bool = False
+        self.__bannedTriviaIdsLock: asyncio.Lock = asyncio.Lock()
+        self.__bannedTriviaIds: Optional[Set[Tuple[str, str]]] = None
 
     async def ban(
         self,
@@ -64,19 +67,63 @@ class BannedTriviaIdsRepository(BannedTriviaIdsRepositoryInterface):
         self.__timber.log('BannedTriviaIdsRepository', f'Banning trivia question (triviaId=\"{triviaId}\", userId=\"{userId}\", triviaSource=\"{triviaSource}\")...')
 
         connection = await self.__getDatabaseConnection()
-        await connection.execute(
-            '''
-                INSERT INTO bannedtriviaids (triviaid, triviasource, userid)
-                VALUES ($1, $2, $3)
-            ''',
-            triviaId, triviaSource.toStr(), userId
-        )
 
-        await connection.close()
+        try:
+            await connection.execute(
+                '''
+                    INSERT INTO bannedtriviaids (triviaid, triviasource, userid)
+                    VALUES ($1, $2, $3)
+                ''',
+                triviaId, triviaSource.toStr(), userId
+            )
+        finally:
+            await connection.close()
+
+        bannedTriviaIds = await self.__getBannedTriviaIds()
+        bannedTriviaIds.add(self.__toBannedTriviaIdKey(triviaId, triviaSource))
+
         self.__timber.log('BannedTriviaIdsRepository', f'Banned trivia question (triviaId=\"{triviaId}\", userId=\"{userId}\", triviaSource=\"{triviaSource}\")')
 
         return BanTriviaQuestionResult.BANNED
 
+    async def clearCaches(self):
+        self.__bannedTriviaIds = None
+        self.__timber.log('BannedTriviaIdsRepository', 'Caches cleared')
+
+    async def __getBannedTriviaIds(self) -> Set[Tuple[str, str]]:
+        bannedTriviaIds = self.__bannedTriviaIds
+
+        if bannedTriviaIds is not None:
+            return bannedTriviaIds
+
+        async with self.__bannedTriviaIdsLock:
+            bannedTriviaIds = self.__bannedTriviaIds
+
+            if bannedTriviaIds is not None:
+                return bannedTriviaIds
+
+            connection = await self.__getDatabaseConnection()
+
+            try:
+                records = await connection.fetchRows(
+                    '''
+                        SELECT triviaid, triviasource FROM bannedtriviaids
+                    '''
+                )
+            finally:
+                await connection.close()
+
+            bannedTriviaIds = set()
+
+            if utils.hasItems(records):
+                for record in records:
+                    bannedTriviaIds.add((record[0].lower(), record[1].lower()))
+
+            self.__bannedTriviaIds = bannedTriviaIds
+            self.__timber.log('BannedTriviaIdsRepository', f'Loaded {len(bannedTriviaIds)} banned trivia ID(s)')
+
+            return bannedTriviaIds
+
     async def __getDatabaseConnection(self) -> DatabaseConnection:
         await self.__initDatabaseTable()
         return await self.__backingDatabase.getConnection()
@@ -92,17 +139,19 @@ class BannedTriviaIdsRepository(BannedTriviaIdsRepositoryInterface):
             raise ValueError(f'triviaSource argument is malformed: \"{triviaSource}\"')
 
         connection = await self.__getDatabaseConnection()
-        record = await connection.fetchRow(
-            '''
-                SELECT bannedtriviaids.triviaid, bannedtriviaids.triviasource, bannedtriviaids.userid, userids.username FROM bannedtriviaids
-                INNER JOIN userids ON bannedtriviaids.userid = userids.userid
-                WHERE bannedtriviaids.triviaid = $1 AND bannedtriviaids.triviasource = $2
-                LIMIT 1
-            ''',
-            triviaId, triviaSource.toStr()
-        )
 
-        await connection.close()
+        try:
+            record = await connection.fetchRow(
+                '''
+                    SELECT bannedtriviaids.triviaid, bannedtriviaids.triviasource, bannedtriviaids.userid, userids.username FROM bannedtriviaids
+                    INNER JOIN userids ON bannedtriviaids.userid = userids.userid
+                    WHERE bannedtriviaids.triviaid = $1 AND bannedtriviaids.triviasource = $2
+                    LIMIT 1
+                ''',
+                triviaId, triviaSource.toStr()
+            )
+        finally:
+            await connection.close()
 
         if not utils.hasItems(record):
             return None
@@ -121,32 +170,33 @@ class BannedTriviaIdsRepository(BannedTriviaIdsRepositoryInterface):
         self.__isDatabaseReady = True
         connection = await self.__backingDatabase.getConnection()
 
-        if connection.getDatabaseType() is DatabaseType.POSTGRESQL:
-            await connection.createTableIfNotExists(
-                '''
-                    CREATE TABLE IF NOT EXISTS bannedtriviaids (
-                        triviaid public.citext NOT NULL,
-                        triviasource public.citext NOT NULL,
-                        userid public.citext NOT NULL,
-                        PRIMARY KEY (triviaid, triviasource)
-                    )
-                '''
-            )
-        elif connection.getDatabaseType() is DatabaseType.SQLITE:
-            await connection.createTableIfNotExists(
-                '''
-                    CREATE TABLE IF NOT EXISTS bannedtriviaids (
-                        triviaid TEXT NOT NULL COLLATE NOCASE,
-                        triviasource TEXT NOT NULL COLLATE NOCASE,
-                        userid TEXT NOT NULL COLLATE NOCASE,
-                        PRIMARY KEY (triviaid, triviasource)
-                    )
-                '''
-            )
-        else:
-            raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
-
-        await connection.close()
+        try:
+            if connection.getDatabaseType() is DatabaseType.POSTGRESQL:
+                await connection.createTableIfNotExists(
+                    '''
+                        CREATE TABLE IF NOT EXISTS bannedtriviaids (
+                            triviaid public.citext NOT NULL,
+                            triviasource public.citext NOT NULL,
+                            userid public.citext NOT NULL,
+                            PRIMARY KEY (triviaid, triviasource)
+                        )
+                    '''
+                )
+            elif connection.getDatabaseType() is DatabaseType.SQLITE:
+                await connection.createTableIfNotExists(
+                    '''
+                        CREATE TABLE IF NOT EXISTS bannedtriviaids (
+                            triviaid TEXT NOT NULL COLLATE NOCASE,
+                            triviasource TEXT NOT NULL COLLATE NOCASE,
+                            userid TEXT NOT NULL COLLATE NOCASE,
+                            PRIMARY KEY (triviaid, triviasource)
+                        )
+                    '''
+                )
+            else:
+                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
+        finally:
+            await connection.close()
 
     async def isBanned(self, triviaId: str, triviaSource: TriviaSource) -> bool:
         if not utils.isValidStr(triviaId):
@@ -154,17 +204,18 @@ class BannedTriviaIdsRepository(BannedTriviaIdsRepositoryInterface):
         elif not isinstance(triviaSource, TriviaSource):
             raise ValueError(f'triviaSource argument is malformed: \"{triviaSource}\"')
 
-        info = await self.getInfo(
-            triviaId = triviaId,
-            triviaSource = triviaSource
-        )
+        # the full set of banned trivia IDs is kept in memory, so this check never touches the database
+        bannedTriviaIds = await self.__getBannedTriviaIds()
 
-        if info is None:
+        if self.__toBannedTriviaIdKey(triviaId, triviaSource) not in bannedTriviaIds:
             return False
 
-        self.__timber.log('BannedTriviaIdsRepository', f'Encountered banned trivia question ({info})')
+        self.__timber.log('BannedTriviaIdsRepository', f'Encountered banned trivia question (triviaId=\"{triviaId}\", triviaSource=\"{triviaSource}\")')
         return True
 
+    def __toBannedTriviaIdKey(self, triviaId: str, triviaSource: TriviaSource) -> Tuple[str, str]:
+        return (triviaId.lower(), triviaSource.toStr().lower())
+
     async def unban(
         self,
         triviaId: str,
@@ -184,15 +235,21 @@ class BannedTriviaIdsRepository(BannedTriviaIdsRepositoryInterface):
         self.__timber.log('BannedTriviaIdsRepository', f'Unbanning trivia question (triviaId=\"{triviaId}\", triviaSource=\"{triviaSource}\")...')
 
         connection = await self.__getDatabaseConnection()
-        await connection.execute(
-            '''
-                DELETE FROM bannedtriviaids
-                WHERE triviaid = $1 AND triviasource = $2
-            ''',
-            triviaId, triviaSource.toStr()
-        )
 
-        await connection.close()
+        try:
+            await connection.execute(
+                '''
+                    DELETE FROM bannedtriviaids
+                    WHERE triviaid = $1 AND triviasource = $2
+                ''',
+                triviaId, triviaSource.toStr()
+            )
+        finally:
+            await connection.close()
+
+        bannedTriviaIds = await self.__getBannedTriviaIds()
+        bannedTriviaIds.discard(self.__toBannedTriviaIdKey(triviaId, triviaSource))
+
         self.__timber.log('BannedTriviaIdsRepository', f'Unbanned trivia question (triviaId=\"{triviaId}\", triviaSource=\"{triviaSource}\")')
 
         return BanTriviaQuestionResult.UNBANNED
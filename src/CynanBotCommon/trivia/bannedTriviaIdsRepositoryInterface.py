@@ -1,18 +1,20 @@
-from abc import ABC, abstractmethod
+from abc import abstractmethod
 from typing import Optional
 
 try:
+    from CynanBotCommon.clearable import Clearable
     from CynanBotCommon.trivia.bannedTriviaQuestion import BannedTriviaQuestion
     from CynanBotCommon.trivia.banTriviaQuestionResult import \
         BanTriviaQuestionResult
     from CynanBotCommon.trivia.triviaSource import TriviaSource
 except:
+    from clearable import Clearable
     from trivia.bannedTriviaQuestion import BannedTriviaQuestion
     from trivia.banTriviaQuestionResult import BanTriviaQuestionResult
     from trivia.triviaSource import TriviaSource
 
 
-class BannedTriviaIdsRepositoryInterface(ABC):
+class BannedTriviaIdsRepositoryInterface(Clearable):
 
     @abstractmethod
     async def ban(
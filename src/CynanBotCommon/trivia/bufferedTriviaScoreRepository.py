@@ -0,0 +1,230 @@
+import asyncio
+import traceback
+from typing import Dict, List, Tuple
+
+try:
+    import CynanBotCommon.utils as utils
+    from CynanBotCommon.backgroundTaskHelper import BackgroundTaskHelper
+    from CynanBotCommon.timber.timberInterface import TimberInterface
+    from CynanBotCommon.trivia.triviaScoreIncrement import \
+        TriviaScoreIncrement
+    from CynanBotCommon.trivia.triviaScoreRepositoryInterface import \
+        TriviaScoreRepositoryInterface
+    from CynanBotCommon.trivia.triviaScoreResult import TriviaScoreResult
+except:
+    import utils
+    from backgroundTaskHelper import BackgroundTaskHelper
+    from timber.timberInterface import TimberInterface
+    from trivia.triviaScoreIncrement import TriviaScoreIncrement
+    from trivia.triviaScoreRepositoryInterface import \
+        TriviaScoreRepositoryInterface
+    from trivia.triviaScoreResult import TriviaScoreResult
+
+
+class BufferedTriviaScoreRepository(TriviaScoreRepositoryInterface):
+
+    def __init__(
+        self,
+        backgroundTaskHelper: BackgroundTaskHelper,
+        timber: TimberInterface,
+        triviaScoreRepository: TriviaScoreRepositoryInterface,
+        flushSleepTimeSeconds: float = 5
+    ):
+        if not isinstance(backgroundTaskHelper, BackgroundTaskHelper):
+            raise ValueError(f'backgroundTaskHelper argument is malformed: \"{backgroundTaskHelper}\"')
+        elif not isinstance(timber, TimberInterface):
+            raise ValueError(f'timber argument is malformed: \"{timber}\"')
+        elif not isinstance(triviaScoreRepository, TriviaScoreRepositoryInterface):
+            raise ValueError(f'triviaScoreRepository argument is malformed: \"{triviaScoreRepository}\"')
+        elif not utils.isValidNum(flushSleepTimeSeconds):
+            raise ValueError(f'flushSleepTimeSeconds argument is malformed: \"{flushSleepTimeSeconds}\"')
+        elif flushSleepTimeSeconds < 1 or flushSleepTimeSeconds > 60:
+            raise ValueError(f'flushSleepTimeSeconds argument is out of bounds: {flushSleepTimeSeconds}')
+
+        self.__timber: TimberInterface = timber
+        self.__triviaScoreRepository: TriviaScoreRepositoryInterface = triviaScoreRepository
+        self.__flushSleepTimeSeconds: float = flushSleepTimeSeconds
+
+        self.__bufferLock: asyncio.Lock = asyncio.Lock()
+        self.__bufferedTriviaScores: Dict[Tuple[str, str], TriviaScoreResult] = dict()
+        self.__flushedTriviaScores: Dict[Tuple[str, str], TriviaScoreResult] = dict()
+
+        backgroundTaskHelper.createTask(self.__startFlushLoop())
+
+    async def fetchTriviaScore(
+        self,
+        twitchChannel: str,
+        userId: str
+    ) -> TriviaScoreResult:
+        if not utils.isValidStr(twitchChannel):
+            raise ValueError(f'twitchChannel argument is malformed: \"{twitchChannel}\"')
+        elif not utils.isValidStr(userId):
+            raise ValueError(f'userId argument is malformed: \"{userId}\"')
+
+        return await self.__getBufferedTriviaScore(twitchChannel, userId)
+
+    async def flush(self):
+        async with self.__bufferLock:
+            if len(self.__bufferedTriviaScores) == 0:
+                return
+
+            triviaScoreIncrements: List[TriviaScoreIncrement] = list()
+
+            for bufferKey, bufferedTriviaScore in self.__bufferedTriviaScores.items():
+                flushedTriviaScore = self.__flushedTriviaScores[bufferKey]
+
+                # only the difference from what was read out of the database gets written, so that
+                # score changes made elsewhere in the meantime aren't overwritten
+                triviaScoreIncrements.append(TriviaScoreIncrement(
+                    streak = bufferedTriviaScore.getStreak(),
+                    superTriviaWinsIncrement = bufferedTriviaScore.getSuperTriviaWins() - flushedTriviaScore.getSuperTriviaWins(),
+                    triviaLossesIncrement = bufferedTriviaScore.getTriviaLosses() - flushedTriviaScore.getTriviaLosses(),
+                    triviaWinsIncrement = bufferedTriviaScore.getTriviaWins() - flushedTriviaScore.getTriviaWins(),
+                    twitchChannel = bufferedTriviaScore.getTwitchChannel(),
+                    userId = bufferedTriviaScore.getUserId()
+                ))
+
+            await self.__triviaScoreRepository.incrementTriviaScores(triviaScoreIncrements)
+            self.__bufferedTriviaScores.clear()
+            self.__flushedTriviaScores.clear()
+
+    async def __getBufferedTriviaScore(
+        self,
+        twitchChannel: str,
+        userId: str
+    ) -> TriviaScoreResult:
+        bufferedTriviaScore = self.__bufferedTriviaScores.get(self.__toBufferKey(twitchChannel, userId))
+
+        if bufferedTriviaScore is not None:
+            return bufferedTriviaScore
+
+        return await self.__triviaScoreRepository.fetchTriviaScore(
+            twitchChannel = twitchChannel,
+            userId = userId
+        )
+
+    async def incrementSuperTriviaWins(
+        self,
+        twitchChannel: str,
+        userId: str
+    ) -> TriviaScoreResult:
+        if not utils.isValidStr(twitchChannel):
+            raise ValueError(f'twitchChannel argument is malformed: \"{twitchChannel}\"')
+        elif not utils.isValidStr(userId):
+            raise ValueError(f'userId argument is malformed: \"{userId}\"')
+        elif userId == '0':
+            raise ValueError(f'userId argument is an illegal value: \"{userId}\"')
+
+        async with self.__bufferLock:
+            result = await self.__getBufferedTriviaScore(twitchChannel, userId)
+
+            return self.__putBufferedTriviaScore(result, TriviaScoreResult(
+                streak = result.getStreak(),
+                superTriviaWins = result.getSuperTriviaWins() + 1,
+                triviaLosses = result.getTriviaLosses(),
+                triviaWins = result.getTriviaWins(),
+                twitchChannel = result.getTwitchChannel(),
+                userId = result.getUserId()
+            ))
+
+    async def incrementTriviaLosses(
+        self,
+        twitchChannel: str,
+        userId: str
+    ) -> TriviaScoreResult:
+        if not utils.isValidStr(twitchChannel):
+            raise ValueError(f'twitchChannel argument is malformed: \"{twitchChannel}\"')
+        elif not utils.isValidStr(userId):
+            raise ValueError(f'userId argument is malformed: \"{userId}\"')
+        elif userId == '0':
+            raise ValueError(f'userId argument is an illegal value: \"{userId}\"')
+
+        async with self.__bufferLock:
+            result = await self.__getBufferedTriviaScore(twitchChannel, userId)
+
+            newStreak: int = 0
+            if result.getStreak() <= -1:
+                newStreak = result.getStreak() - 1
+            else:
+                newStreak = -1
+
+            return self.__putBufferedTriviaScore(result, TriviaScoreResult(
+                streak = newStreak,
+                superTriviaWins = result.getSuperTriviaWins(),
+                triviaLosses = result.getTriviaLosses() + 1,
+                triviaWins = result.getTriviaWins(),
+                twitchChannel = result.getTwitchChannel(),
+                userId = result.getUserId()
+            ))
+
+    async def incrementTriviaScores(self, triviaScoreIncrements: List[TriviaScoreIncrement]):
+        if not isinstance(triviaScoreIncrements, List):
+            raise ValueError(f'triviaScoreIncrements argument is malformed: \"{triviaScoreIncrements}\"')
+
+        for triviaScoreIncrement in triviaScoreIncrements:
+            if not isinstance(triviaScoreIncrement, TriviaScoreIncrement):
+                raise ValueError(f'triviaScoreIncrements argument contains a malformed value: \"{triviaScoreIncrement}\"')
+
+        await self.flush()
+        await self.__triviaScoreRepository.incrementTriviaScores(triviaScoreIncrements)
+
+    async def incrementTriviaWins(
+        self,
+        twitchChannel: str,
+        userId: str
+    ) -> TriviaScoreResult:
+        if not utils.isValidStr(twitchChannel):
+            raise ValueError(f'twitchChannel argument is malformed: \"{twitchChannel}\"')
+        elif not utils.isValidStr(userId):
+            raise ValueError(f'userId argument is malformed: \"{userId}\"')
+        elif userId == '0':
+            raise ValueError(f'userId argument is an illegal value: \"{userId}\"')
+
+        async with self.__bufferLock:
+            result = await self.__getBufferedTriviaScore(twitchChannel, userId)
+
+            newStreak: int = 0
+            if result.getStreak() >= 1:
+                newStreak = result.getStreak() + 1
+            else:
+                newStreak = 1
+
+            return self.__putBufferedTriviaScore(result, TriviaScoreResult(
+                streak = newStreak,
+                superTriviaWins = result.getSuperTriviaWins(),
+                triviaLosses = result.getTriviaLosses(),
+                triviaWins = result.getTriviaWins() + 1,
+                twitchChannel = result.getTwitchChannel(),
+                userId = result.getUserId()
+            ))
+
+    def __putBufferedTriviaScore(
+        self,
+        oldTriviaScore: TriviaScoreResult,
+        newTriviaScore: TriviaScoreResult
+    ) -> TriviaScoreResult:
+        self.__validateTriviaScore(newTriviaScore)
+        bufferKey = self.__toBufferKey(newTriviaScore.getTwitchChannel(), newTriviaScore.getUserId())
+
+        if bufferKey not in self.__flushedTriviaScores:
+            self.__flushedTriviaScores[bufferKey] = oldTriviaScore
+
+        self.__bufferedTriviaScores[bufferKey] = newTriviaScore
+        return newTriviaScore
+
+    async def __startFlushLoop(self):
+        while True:
+            await asyncio.sleep(self.__flushSleepTimeSeconds)
+
+            try:
+                await self.flush()
+            except Exception as e:
+                self.__timber.log('BufferedTriviaScoreRepository', f'Encountered unknown Exception when flushing buffered trivia scores: {e}', e, traceback.format_exc())
+
+    def __toBufferKey(self, twitchChannel: str, userId: str) -> Tuple[str, str]:
+        return (twitchChannel.lower(), userId.lower())
+
+    def __validateTriviaScore(self, triviaScore: TriviaScoreResult):
+        # the counts are already bounds checked by TriviaScoreResult itself
+        if triviaScore.getStreak() < utils.getIntMinSafeSize() or triviaScore.getStreak() > utils.getIntMaxSafeSize():
+            raise ValueError(f'streak is out of bounds: {triviaScore.getStreak()}')
@@ -0,0 +1,46 @@
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import CynanBotCommon.utils as utils
+except:
+    import utils
+
+
+class CompiledCorrectAnswer():
+
+    def __init__(
+        self,
+        cleanedCorrectAnswer: str,
+        words: List[str]
+    ):
+        if not utils.isValidStr(cleanedCorrectAnswer):
+            raise ValueError(f'cleanedCorrectAnswer argument is malformed: \"{cleanedCorrectAnswer}\"')
+        elif not utils.hasItems(words):
+            raise ValueError(f'words argument is malformed: \"{words}\"')
+
+        self.__cleanedCorrectAnswer: str = cleanedCorrectAnswer
+        self.__words: List[str] = words
+
+        # Variants of this answer's words, as well as of any run of its words merged together
+        # into one word. These are only filled in once a guess needs them.
+        self.__wordToVariants: Dict[str, Tuple[str, ...]] = dict()
+
+    def getCleanedCorrectAnswer(self) -> str:
+        return self.__cleanedCorrectAnswer
+
+    def getVariants(self, word: str) -> Optional[Tuple[str, ...]]:
+        return self.__wordToVariants.get(word)
+
+    def getWordCount(self) -> int:
+        return len(self.__words)
+
+    def getWords(self) -> List[str]:
+        return utils.copyList(self.__words)
+
+    def setVariants(self, word: str, variants: Tuple[str, ...]):
+        if not isinstance(word, str):
+            raise ValueError(f'word argument is malformed: \"{word}\"')
+        elif not utils.hasItems(variants):
+            raise ValueError(f'variants argument is malformed: \"{variants}\"')
+
+        self.__wordToVariants[word] = variants
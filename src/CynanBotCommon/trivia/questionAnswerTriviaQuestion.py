@@ -3,6 +3,8 @@ from typing import List, Optional
 try:
     import CynanBotCommon.utils as utils
     from CynanBotCommon.trivia.absTriviaQuestion import AbsTriviaQuestion
+    from CynanBotCommon.trivia.compiledCorrectAnswer import \
+        CompiledCorrectAnswer
     from CynanBotCommon.trivia.triviaDifficulty import TriviaDifficulty
     from CynanBotCommon.trivia.triviaExceptions import \
         NoTriviaCorrectAnswersException
@@ -11,6 +13,7 @@ try:
 except:
     import utils
     from trivia.absTriviaQuestion import AbsTriviaQuestion
+    from trivia.compiledCorrectAnswer import CompiledCorrectAnswer
     from trivia.triviaDifficulty import TriviaDifficulty
     from trivia.triviaExceptions import NoTriviaCorrectAnswersException
     from trivia.triviaSource import TriviaSource
@@ -48,6 +51,11 @@ class QuestionAnswerTriviaQuestion(AbsTriviaQuestion):
         self.__correctAnswers: List[str] = correctAnswers
         self.__cleanedCorrectAnswers: List[str] = cleanedCorrectAnswers
 
+        self.__compiledCorrectAnswers: Optional[List[CompiledCorrectAnswer]] = None
+
+    def getCompiledCorrectAnswers(self) -> Optional[List[CompiledCorrectAnswer]]:
+        return self.__compiledCorrectAnswers
+
     def getCorrectAnswers(self) -> List[str]:
         return utils.copyList(self.__correctAnswers)
 
@@ -62,3 +70,9 @@ class QuestionAnswerTriviaQuestion(AbsTriviaQuestion):
 
     def getResponses(self) -> List[str]:
         return list()
+
+    def setCompiledCorrectAnswers(self, compiledCorrectAnswers: List[CompiledCorrectAnswer]):
+        if not utils.hasItems(compiledCorrectAnswers):
+            raise ValueError(f'compiledCorrectAnswers argument is malformed: \"{compiledCorrectAnswers}\"')
+
+        self.__compiledCorrectAnswers = compiledCorrectAnswers
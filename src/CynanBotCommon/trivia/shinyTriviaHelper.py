@@ -108,7 +108,9 @@ class ShinyTriviaHelper():
         elif not utils.isValidStr(userName):
             raise ValueError(f'userName argument is malformed: \"{userName}\"')
 
-        if not await self.__triviaSettingsRepository.areShinyTriviasEnabled():
+        settingsSnapshot = await self.__triviaSettingsRepository.getSettingsSnapshot()
+
+        if not settingsSnapshot.areShinyTriviasEnabled():
             return False
 
         userPlacementOnLeaderboard = await self.__getUserPlacementOnLeaderboard(
@@ -116,7 +118,7 @@ class ShinyTriviaHelper():
             userId = userId
         )
 
-        probability = await self.__triviaSettingsRepository.getShinyProbability()
+        probability = settingsSnapshot.getShinyProbability()
 
         if userPlacementOnLeaderboard is not None and userPlacementOnLeaderboard in self.__rankToProbabilityDict:
             probability = probability * self.__rankToProbabilityDict[userPlacementOnLeaderboard]
@@ -149,10 +151,12 @@ class ShinyTriviaHelper():
         if not utils.isValidStr(twitchChannel):
             raise ValueError(f'twitchChannel argument is malformed: \"{twitchChannel}\"')
 
-        if not await self.__triviaSettingsRepository.areShinyTriviasEnabled():
+        settingsSnapshot = await self.__triviaSettingsRepository.getSettingsSnapshot()
+
+        if not settingsSnapshot.areShinyTriviasEnabled():
             return False
 
-        probability = await self.__triviaSettingsRepository.getShinyProbability()
+        probability = settingsSnapshot.getShinyProbability()
         randomNumber = random.uniform(0, 1)
 
         if randomNumber > probability:
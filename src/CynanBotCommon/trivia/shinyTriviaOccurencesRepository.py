@@ -45,6 +45,24 @@ class ShinyTriviaOccurencesRepository():
             raise ValueError(f'userId argument is an illegal value: \"{userId}\"')
 
         connection = await self.__getDatabaseConnection()
+
+        try:
+            result = await self.__fetchDetails(
+                connection = connection,
+                twitchChannel = twitchChannel,
+                userId = userId
+            )
+        finally:
+            await connection.close()
+
+        return result
+
+    async def __fetchDetails(
+        self,
+        connection: DatabaseConnection,
+        twitchChannel: str,
+        userId: str
+    ) -> ShinyTriviaResult:
         record = await connection.fetchRow(
             '''
                 SELECT count, mostrecent FROM shinytriviaoccurences
@@ -61,8 +79,6 @@ class ShinyTriviaOccurencesRepository():
             shinyCount = record[0]
             mostRecent = utils.getDateTimeFromStr(record[1])
 
-        await connection.close()
-
         return ShinyTriviaResult(
             mostRecent = mostRecent,
             newShinyCount = shinyCount,
@@ -87,26 +103,34 @@ class ShinyTriviaOccurencesRepository():
         elif userId == '0':
             raise ValueError(f'userId argument is an illegal value: \"{userId}\"')
 
-        result = await self.fetchDetails(
-            twitchChannel = twitchChannel,
-            userId = userId
-        )
-
-        newShinyCount: int = result.getOldShinyCount() + 1
-
-        newResult = ShinyTriviaResult(
-            mostRecent = datetime.now(self.__timeZone),
-            newShinyCount = newShinyCount,
-            oldShinyCount = result.getOldShinyCount(),
-            twitchChannel = result.getTwitchChannel(),
-            userId = result.getUserId()
-        )
+        connection = await self.__getDatabaseConnection()
 
-        await self.__updateShinyCount(
-            newShinyCount = newResult.getNewShinyCount(),
-            twitchChannel = newResult.getTwitchChannel(),
-            userId = newResult.getUserId()
-        )
+        try:
+            async with connection.transaction():
+                result = await self.__fetchDetails(
+                    connection = connection,
+                    twitchChannel = twitchChannel,
+                    userId = userId
+                )
+
+                newShinyCount: int = result.getOldShinyCount() + 1
+
+                newResult = ShinyTriviaResult(
+                    mostRecent = datetime.now(self.__timeZone),
+                    newShinyCount = newShinyCount,
+                    oldShinyCount = result.getOldShinyCount(),
+                    twitchChannel = result.getTwitchChannel(),
+                    userId = result.getUserId()
+                )
+
+                await self.__updateShinyCount(
+                    connection = connection,
+                    newShinyCount = newResult.getNewShinyCount(),
+                    twitchChannel = newResult.getTwitchChannel(),
+                    userId = newResult.getUserId()
+                )
+        finally:
+            await connection.close()
 
         return newResult
 
@@ -117,37 +141,39 @@ class ShinyTriviaOccurencesRepository():
         self.__isDatabaseReady = True
         connection = await self.__backingDatabase.getConnection()
 
-        if connection.getDatabaseType() is DatabaseType.POSTGRESQL:
-            await connection.createTableIfNotExists(
-                '''
-                    CREATE TABLE IF NOT EXISTS shinytriviaoccurences (
-                        count integer DEFAULT 0 NOT NULL,
-                        mostrecent text NOT NULL,
-                        twitchchannel public.citext NOT NULL,
-                        userid public.citext NOT NULL,
-                        PRIMARY KEY (twitchchannel, userid)
-                    )
-                '''
-            )
-        elif connection.getDatabaseType() is DatabaseType.SQLITE:
-            await connection.createTableIfNotExists(
-                '''
-                    CREATE TABLE IF NOT EXISTS shinytriviaoccurences (
-                        count INTEGER NOT NULL DEFAULT 0,
-                        mostrecent TEXT NOT NULL,
-                        twitchchannel TEXT NOT NULL COLLATE NOCASE,
-                        userid TEXT NOT NULL COLLATE NOCASE,
-                        PRIMARY KEY (twitchchannel, userid)
-                    )
-                '''
-            )
-        else:
-            raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
-
-        await connection.close()
+        try:
+            if connection.getDatabaseType() is DatabaseType.POSTGRESQL:
+                await connection.createTableIfNotExists(
+                    '''
+                        CREATE TABLE IF NOT EXISTS shinytriviaoccurences (
+                            count integer DEFAULT 0 NOT NULL,
+                            mostrecent text NOT NULL,
+                            twitchchannel public.citext NOT NULL,
+                            userid public.citext NOT NULL,
+                            PRIMARY KEY (twitchchannel, userid)
+                        )
+                    '''
+                )
+            elif connection.getDatabaseType() is DatabaseType.SQLITE:
+                await connection.createTableIfNotExists(
+                    '''
+                        CREATE TABLE IF NOT EXISTS shinytriviaoccurences (
+                            count INTEGER NOT NULL DEFAULT 0,
+                            mostrecent TEXT NOT NULL,
+                            twitchchannel TEXT NOT NULL COLLATE NOCASE,
+                            userid TEXT NOT NULL COLLATE NOCASE,
+                            PRIMARY KEY (twitchchannel, userid)
+                        )
+                    '''
+                )
+            else:
+                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
+        finally:
+            await connection.close()
 
     async def __updateShinyCount(
         self,
+        connection: DatabaseConnection,
         newShinyCount: int,
         twitchChannel: str,
         userId: str
@@ -166,7 +192,6 @@ class ShinyTriviaOccurencesRepository():
         nowDateTime = datetime.now(self.__timeZone)
         nowDateTimeStr = nowDateTime.isoformat()
 
-        connection = await self.__getDatabaseConnection()
         await connection.execute(
             '''
                 INSERT INTO shinytriviaoccurences (count, mostrecent, twitchchannel, userid)
@@ -175,5 +200,3 @@ class ShinyTriviaOccurencesRepository():
             ''',
             newShinyCount, nowDateTimeStr, twitchChannel, userId
         )
-
-        await connection.close()
@@ -0,0 +1,134 @@
+import asyncio
+import os
+
+import pytest
+
+try:
+    from ...storage.backingDatabase import BackingDatabase
+    from ...storage.backingSqliteDatabase import BackingSqliteDatabase
+    from ...timber.timberStub import TimberStub
+    from ..bannedTriviaIdsRepository import BannedTriviaIdsRepository
+    from ..banTriviaQuestionResult import BanTriviaQuestionResult
+    from ..triviaSource import TriviaSource
+except:
+    from storage.backingDatabase import BackingDatabase
+    from storage.backingSqliteDatabase import BackingSqliteDatabase
+    from timber.timberStub import TimberStub
+    from trivia.bannedTriviaIdsRepository import BannedTriviaIdsRepository
+    from trivia.banTriviaQuestionResult import BanTriviaQuestionResult
+    from trivia.triviaSource import TriviaSource
+
+
+class TestBannedTriviaIdsRepository():
+
+    async def __createBackingDatabase(self, tmp_path) -> BackingDatabase:
+        backingDatabase = BackingSqliteDatabase(
+            eventLoop = asyncio.get_running_loop(),
+            backingDatabaseFile = os.path.join(tmp_path, 'database.sqlite')
+        )
+
+        # banned trivia questions are joined against the user IDs table
+        connection = await backingDatabase.getConnection()
+        await connection.createTableIfNotExists(
+            '''
+                CREATE TABLE IF NOT EXISTS userids (
+                    userid TEXT NOT NULL PRIMARY KEY COLLATE NOCASE,
+                    username TEXT NOT NULL COLLATE NOCASE
+                )
+            '''
+        )
+
+        await connection.execute(
+            '''
+                INSERT INTO userids (userid, username)
+                VALUES ($1, $2)
+            ''',
+            '123456', 'smCharles'
+        )
+
+        await connection.close()
+        return backingDatabase
+
+    @pytest.mark.asyncio
+    async def test_ban(self, tmp_path):
+        backingDatabase = await self.__createBackingDatabase(tmp_path)
+        repository = BannedTriviaIdsRepository(
+            backingDatabase = backingDatabase,
+            timber = TimberStub()
+        )
+
+        assert await repository.isBanned('abc123', TriviaSource.J_SERVICE) is False
+        assert await repository.ban('abc123', '123456', TriviaSource.J_SERVICE) is BanTriviaQuestionResult.BANNED
+        assert await repository.isBanned('abc123', TriviaSource.J_SERVICE) is True
+        assert await repository.isBanned('ABC123', TriviaSource.J_SERVICE) is True
+        assert await repository.isBanned('abc123', TriviaSource.OPEN_TRIVIA_DATABASE) is False
+        assert await repository.ban('abc123', '123456', TriviaSource.J_SERVICE) is BanTriviaQuestionResult.ALREADY_BANNED
+
+        await backingDatabase.close()
+
+    @pytest.mark.asyncio
+    async def test_clearCaches(self, tmp_path):
+        backingDatabase = await self.__createBackingDatabase(tmp_path)
+        repository = BannedTriviaIdsRepository(
+            backingDatabase = backingDatabase,
+            timber = TimberStub()
+        )
+
+        assert await repository.isBanned('abc123', TriviaSource.J_SERVICE) is False
+
+        otherRepository = BannedTriviaIdsRepository(
+            backingDatabase = backingDatabase,
+            timber = TimberStub()
+        )
+
+        await otherRepository.ban('abc123', '123456', TriviaSource.J_SERVICE)
+        assert await repository.isBanned('abc123', TriviaSource.J_SERVICE) is False
+
+        await repository.clearCaches()
+        assert await repository.isBanned('abc123', TriviaSource.J_SERVICE) is True
+
+        await backingDatabase.close()
+
+    @pytest.mark.asyncio
+    async def test_getInfo_releasesConnectionWhenQueryFails(self, tmp_path):
+        # without the user IDs table, every getInfo() query fails
+        backingDatabase = BackingSqliteDatabase(
+            eventLoop = asyncio.get_running_loop(),
+            backingDatabaseFile = os.path.join(tmp_path, 'database.sqlite'),
+            maxConnections = 1
+        )
+
+        repository = BannedTriviaIdsRepository(
+            backingDatabase = backingDatabase,
+            timber = TimberStub()
+        )
+
+        for _ in range(3):
+            exception: Exception = None
+
+            try:
+                await asyncio.wait_for(repository.getInfo('abc123', TriviaSource.J_SERVICE), timeout = 1)
+            except Exception as e:
+                exception = e
+
+            assert exception is not None
+            assert not isinstance(exception, asyncio.TimeoutError)
+
+        assert await asyncio.wait_for(repository.isBanned('abc123', TriviaSource.J_SERVICE), timeout = 1) is False
+
+        await backingDatabase.close()
+
+    @pytest.mark.asyncio
+    async def test_unban(self, tmp_path):
+        backingDatabase = await self.__createBackingDatabase(tmp_path)
+        repository = BannedTriviaIdsRepository(
+            backingDatabase = backingDatabase,
+            timber = TimberStub()
+        )
+
+        assert await repository.unban('abc123', TriviaSource.J_SERVICE) is BanTriviaQuestionResult.NOT_BANNED
+        await repository.ban('abc123', '123456', TriviaSource.J_SERVICE)
+        assert await repository.unban('abc123', TriviaSource.J_SERVICE) is BanTriviaQuestionResult.UNBANNED
+        assert await repository.isBanned('abc123', TriviaSource.J_SERVICE) is False
+
+        await backingDatabase.close()
@@ -0,0 +1,151 @@
+import asyncio
+import os
+
+import pytest
+
+try:
+    from ... import utils
+    from ...backgroundTaskHelper import BackgroundTaskHelper
+    from ...storage.backingDatabase import BackingDatabase
+    from ...storage.backingSqliteDatabase import BackingSqliteDatabase
+    from ...timber.timberStub import TimberStub
+    from ..bufferedTriviaScoreRepository import BufferedTriviaScoreRepository
+    from ..triviaScoreIncrement import TriviaScoreIncrement
+    from ..triviaScoreRepository import TriviaScoreRepository
+except:
+    import utils
+    from backgroundTaskHelper import BackgroundTaskHelper
+    from storage.backingDatabase import BackingDatabase
+    from storage.backingSqliteDatabase import BackingSqliteDatabase
+    from timber.timberStub import TimberStub
+    from trivia.bufferedTriviaScoreRepository import \
+        BufferedTriviaScoreRepository
+    from trivia.triviaScoreIncrement import TriviaScoreIncrement
+    from trivia.triviaScoreRepository import TriviaScoreRepository
+
+
+class TestBufferedTriviaScoreRepository():
+
+    def __createRepositories(self, backingDatabase: BackingDatabase):
+        eventLoop = asyncio.get_running_loop()
+        triviaScoreRepository = TriviaScoreRepository(backingDatabase)
+
+        bufferedTriviaScoreRepository = BufferedTriviaScoreRepository(
+            backgroundTaskHelper = BackgroundTaskHelper(eventLoop = eventLoop),
+            timber = TimberStub(),
+            triviaScoreRepository = triviaScoreRepository,
+            flushSleepTimeSeconds = 60
+        )
+
+        return bufferedTriviaScoreRepository, triviaScoreRepository
+
+    @pytest.mark.asyncio
+    async def test_flush(self, tmp_path):
+        backingDatabase = BackingSqliteDatabase(
+            eventLoop = asyncio.get_running_loop(),
+            backingDatabaseFile = os.path.join(tmp_path, 'database.sqlite')
+        )
+
+        buffered, triviaScoreRepository = self.__createRepositories(backingDatabase)
+
+        for _ in range(5):
+            await buffered.incrementTriviaWins('smCharles', '123456')
+
+        await buffered.incrementTriviaLosses('smCharles', '123456')
+        await buffered.incrementSuperTriviaWins('smCharles', '123456')
+
+        # nothing beyond the initial empty score has been written yet
+        result = await triviaScoreRepository.fetchTriviaScore('smCharles', '123456')
+        assert result.getTriviaWins() == 0
+
+        await buffered.flush()
+
+        result = await triviaScoreRepository.fetchTriviaScore('smCharles', '123456')
+        assert result.getStreak() == -1
+        assert result.getSuperTriviaWins() == 1
+        assert result.getTriviaLosses() == 1
+        assert result.getTriviaWins() == 5
+
+        await backingDatabase.close()
+
+    @pytest.mark.asyncio
+    async def test_incrementTriviaWins_readsBufferedValue(self, tmp_path):
+        backingDatabase = BackingSqliteDatabase(
+            eventLoop = asyncio.get_running_loop(),
+            backingDatabaseFile = os.path.join(tmp_path, 'database.sqlite')
+        )
+
+        buffered, triviaScoreRepository = self.__createRepositories(backingDatabase)
+        await triviaScoreRepository.incrementTriviaWins('smCharles', '123456')
+
+        result = await buffered.incrementTriviaWins('smCharles', '123456')
+        assert result.getStreak() == 2
+        assert result.getTriviaWins() == 2
+
+        result = await buffered.fetchTriviaScore('SMCHARLES', '123456')
+        assert result.getStreak() == 2
+        assert result.getTriviaWins() == 2
+
+        await backingDatabase.close()
+
+    @pytest.mark.asyncio
+    async def test_flush_keepsWritesMadeElsewhere(self, tmp_path):
+        backingDatabase = BackingSqliteDatabase(
+            eventLoop = asyncio.get_running_loop(),
+            backingDatabaseFile = os.path.join(tmp_path, 'database.sqlite')
+        )
+
+        buffered, triviaScoreRepository = self.__createRepositories(backingDatabase)
+        await buffered.incrementTriviaWins('smCharles', '123456')
+        await buffered.incrementTriviaWins('smCharles', '123456')
+
+        # written directly, after the buffer already read this score
+        await triviaScoreRepository.incrementTriviaWins('smCharles', '123456')
+        await triviaScoreRepository.incrementSuperTriviaWins('smCharles', '123456')
+
+        await buffered.flush()
+
+        result = await triviaScoreRepository.fetchTriviaScore('smCharles', '123456')
+        assert result.getStreak() == 3
+        assert result.getSuperTriviaWins() == 1
+        assert result.getTriviaLosses() == 0
+        assert result.getTriviaWins() == 3
+
+        await backingDatabase.close()
+
+    @pytest.mark.asyncio
+    async def test_incrementTriviaLosses_outOfBounds(self, tmp_path):
+        backingDatabase = BackingSqliteDatabase(
+            eventLoop = asyncio.get_running_loop(),
+            backingDatabaseFile = os.path.join(tmp_path, 'database.sqlite')
+        )
+
+        buffered, triviaScoreRepository = self.__createRepositories(backingDatabase)
+
+        await triviaScoreRepository.incrementTriviaScores([
+            TriviaScoreIncrement(
+                streak = utils.getIntMinSafeSize(),
+                superTriviaWinsIncrement = 0,
+                triviaLossesIncrement = 1,
+                triviaWinsIncrement = 0,
+                twitchChannel = 'smCharles',
+                userId = '123456'
+            )
+        ])
+
+        exception: Exception = None
+
+        try:
+            await buffered.incrementTriviaLosses('smCharles', '123456')
+        except Exception as e:
+            exception = e
+
+        assert isinstance(exception, ValueError)
+
+        await buffered.flush()
+
+        result = await triviaScoreRepository.fetchTriviaScore('smCharles', '123456')
+        assert result.getStreak() == utils.getIntMinSafeSize()
+        assert result.getTriviaLosses() == 1
+
+        await backingDatabase.close()
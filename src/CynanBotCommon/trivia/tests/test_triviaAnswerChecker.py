@@ -1,3 +1,4 @@
+from concurrent.futures import ProcessPoolExecutor
 from typing import Set
 
 import pytest
@@ -955,6 +956,71 @@ class TestTriviaAnswerChecker():
         result = await self.triviaAnswerChecker.checkAnswer('idk', question)
         assert result is TriviaAnswerCheckResult.INCORRECT
 
+    @pytest.mark.asyncio
+    async def test_checkAnswer_withQuestionAnswerQuestionCachesCompiledCorrectAnswers(self):
+        question = QuestionAnswerTriviaQuestion(
+            correctAnswers = [ 'Kurt Vonnegut' ],
+            cleanedCorrectAnswers = [ 'kurt vonnegut' ],
+            category = None,
+            categoryId = None,
+            question = 'That one weird author guy',
+            triviaId = 'abc123',
+            triviaDifficulty = TriviaDifficulty.UNKNOWN,
+            triviaSource = TriviaSource.J_SERVICE
+        )
+
+        assert question.getCompiledCorrectAnswers() is None
+
+        result = await self.triviaAnswerChecker.checkAnswer('kurt vonnegut', question)
+        assert result is TriviaAnswerCheckResult.CORRECT
+
+        compiledCorrectAnswers = question.getCompiledCorrectAnswers()
+        assert compiledCorrectAnswers is not None
+        assert len(compiledCorrectAnswers) == 1
+        assert compiledCorrectAnswers[0].getCleanedCorrectAnswer() == 'kurt vonnegut'
+        assert compiledCorrectAnswers[0].getWords() == [ 'kurt', 'vonnegut' ]
+
+        result = await self.triviaAnswerChecker.checkAnswer('kurt vonegut', question)
+        assert result is TriviaAnswerCheckResult.CORRECT
+
+        result = await self.triviaAnswerChecker.checkAnswer('kurt cobain', question)
+        assert result is TriviaAnswerCheckResult.INCORRECT
+
+        assert question.getCompiledCorrectAnswers() is compiledCorrectAnswers
+
+    @pytest.mark.asyncio
+    async def test_checkAnswer_withQuestionAnswerQuestionAndProcessPoolExecutor(self):
+        question: AbsTriviaQuestion = QuestionAnswerTriviaQuestion(
+            correctAnswers = [ 'Kurt Vonnegut' ],
+            cleanedCorrectAnswers = [ 'kurt vonnegut' ],
+            category = None,
+            categoryId = None,
+            question = 'That one weird author guy',
+            triviaId = 'abc123',
+            triviaDifficulty = TriviaDifficulty.UNKNOWN,
+            triviaSource = TriviaSource.J_SERVICE
+        )
+
+        with ProcessPoolExecutor(max_workers = 1) as processPoolExecutor:
+            triviaAnswerChecker = TriviaAnswerChecker(
+                timber = self.timber,
+                triviaAnswerCompiler = self.triviaAnswerCompiler,
+                triviaSettingsRepository = self.triviaSettingsRepository,
+                processPoolExecutor = processPoolExecutor
+            )
+
+            result = await triviaAnswerChecker.checkAnswer('kurt vonnegut', question)
+            assert result is TriviaAnswerCheckResult.CORRECT
+
+            result = await triviaAnswerChecker.checkAnswer('kurt vonegut', question)
+            assert result is TriviaAnswerCheckResult.CORRECT
+
+            result = await triviaAnswerChecker.checkAnswer('kurtvonnegut', question)
+            assert result is TriviaAnswerCheckResult.CORRECT
+
+            result = await triviaAnswerChecker.checkAnswer('kurt cobain', question)
+            assert result is TriviaAnswerCheckResult.INCORRECT
+
     def test_sanity(self):
         assert self.triviaAnswerChecker is not None
         assert isinstance(self.triviaAnswerChecker, TriviaAnswerChecker)
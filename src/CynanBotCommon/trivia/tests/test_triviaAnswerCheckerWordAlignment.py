@@ -0,0 +1,307 @@
+from typing import Set
+
+import pytest
+
+try:
+    from ...storage.jsonStaticReader import JsonStaticReader
+    from ...timber.timberInterface import TimberInterface
+    from ...timber.timberStub import TimberStub
+    from ..questionAnswerTriviaQuestion import QuestionAnswerTriviaQuestion
+    from ..triviaAnswerChecker import TriviaAnswerChecker
+    from ..triviaAnswerCheckResult import TriviaAnswerCheckResult
+    from ..triviaAnswerCompiler import TriviaAnswerCompiler
+    from ..triviaDifficulty import TriviaDifficulty
+    from ..triviaSettingsRepository import TriviaSettingsRepository
+    from ..triviaSettingsRepositoryInterface import \
+        TriviaSettingsRepositoryInterface
+    from ..triviaSource import TriviaSource
+except:
+    from storage.jsonStaticReader import JsonStaticReader
+    from timber.timberInterface import TimberInterface
+    from timber.timberStub import TimberStub
+    from trivia.questionAnswerTriviaQuestion import \
+        QuestionAnswerTriviaQuestion
+    from trivia.triviaAnswerChecker import TriviaAnswerChecker
+    from trivia.triviaAnswerCheckResult import TriviaAnswerCheckResult
+    from trivia.triviaAnswerCompiler import TriviaAnswerCompiler
+    from trivia.triviaDifficulty import TriviaDifficulty
+    from trivia.triviaSettingsRepository import TriviaSettingsRepository
+    from trivia.triviaSettingsRepositoryInterface import \
+        TriviaSettingsRepositoryInterface
+    from trivia.triviaSource import TriviaSource
+
+
+# The expected results in this file were recorded from the answer checker as it was back when it
+# enumerated every possible merging of the guess' and answer's words. Aligning words is supposed
+# to accept and reject exactly the same guesses.
+class TestTriviaAnswerCheckerWordAlignment():
+
+    timber: TimberInterface = TimberStub()
+    triviaAnswerCompiler = TriviaAnswerCompiler(timber = timber)
+    triviaSettingsRepository: TriviaSettingsRepositoryInterface = TriviaSettingsRepository(
+        settingsJsonReader = JsonStaticReader(dict())
+    )
+    triviaAnswerChecker = TriviaAnswerChecker(
+        timber = timber,
+        triviaAnswerCompiler = triviaAnswerCompiler,
+        triviaSettingsRepository = triviaSettingsRepository
+    )
+
+    async def __createQuestion(self, correctAnswer: str) -> QuestionAnswerTriviaQuestion:
+        cleanedCorrectAnswers = await self.triviaAnswerCompiler.compileTextAnswersList([ correctAnswer ])
+
+        expandedCleanedCorrectAnswers: Set[str] = set()
+        for cleanedCorrectAnswer in cleanedCorrectAnswers:
+            expandedCleanedCorrectAnswers.update(await self.triviaAnswerCompiler.expandNumerals(cleanedCorrectAnswer))
+
+        return QuestionAnswerTriviaQuestion(
+            correctAnswers = [ correctAnswer ],
+            cleanedCorrectAnswers = list(expandedCleanedCorrectAnswers),
+            category = None,
+            categoryId = None,
+            question = 'Test question',
+            triviaId = 'abc123',
+            triviaDifficulty = TriviaDifficulty.UNKNOWN,
+            triviaSource = TriviaSource.J_SERVICE
+        )
+
+    @pytest.mark.asyncio
+    async def test_checkAnswer_withFranklinDelanoRoosevelt(self):
+        question = await self.__createQuestion('Franklin Delano Roosevelt')
+
+        result = await self.triviaAnswerChecker.checkAnswer('franklin delano roosevelt', question)
+        assert result is TriviaAnswerCheckResult.CORRECT
+
+        result = await self.triviaAnswerChecker.checkAnswer('franklin d roosevelt', question)
+        assert result is TriviaAnswerCheckResult.INCORRECT
+
+        result = await self.triviaAnswerChecker.checkAnswer('franklin roosevelt', question)
+        assert result is TriviaAnswerCheckResult.INCORRECT
+
+        result = await self.triviaAnswerChecker.checkAnswer('fdr', question)
+        assert result is TriviaAnswerCheckResult.CORRECT
+
+        result = await self.triviaAnswerChecker.checkAnswer('franklin delanor roosevelt', question)
+        assert result is TriviaAnswerCheckResult.CORRECT
+
+        result = await self.triviaAnswerChecker.checkAnswer('franklindelano roosevelt', question)
+        assert result is TriviaAnswerCheckResult.CORRECT
+
+        result = await self.triviaAnswerChecker.checkAnswer('teddy roosevelt', question)
+        assert result is TriviaAnswerCheckResult.INCORRECT
+
+    @pytest.mark.asyncio
+    async def test_checkAnswer_withIceCreamSandwich(self):
+        question = await self.__createQuestion('Ice Cream Sandwich')
+
+        result = await self.triviaAnswerChecker.checkAnswer('ice cream sandwich', question)
+        assert result is TriviaAnswerCheckResult.CORRECT
+
+        result = await self.triviaAnswerChecker.checkAnswer('icecream sandwich', question)
+        assert result is TriviaAnswerCheckResult.CORRECT
+
+        result = await self.triviaAnswerChecker.checkAnswer('ice creamsandwich', question)
+        assert result is TriviaAnswerCheckResult.CORRECT
+
+        result = await self.triviaAnswerChecker.checkAnswer('ice cream', question)
+        assert result is TriviaAnswerCheckResult.INCORRECT
+
+        result = await self.triviaAnswerChecker.checkAnswer('ice cream sandwiches', question)
+        assert result is TriviaAnswerCheckResult.CORRECT
+
+        result = await self.triviaAnswerChecker.checkAnswer('sandwich', question)
+        assert result is TriviaAnswerCheckResult.INCORRECT
+
+        result = await self.triviaAnswerChecker.checkAnswer('icecreamsandwich', question)
+        assert result is TriviaAnswerCheckResult.CORRECT
+
+    @pytest.mark.asyncio
+    async def test_checkAnswer_withKurtVonnegut(self):
+        question = await self.__createQuestion('Kurt Vonnegut')
+
+        result = await self.triviaAnswerChecker.checkAnswer('kurt vonnegut', question)
+        assert result is TriviaAnswerCheckResult.CORRECT
+
+        result = await self.triviaAnswerChecker.checkAnswer('kurt vonegut', question)
+        assert result is TriviaAnswerCheckResult.CORRECT
+
+        result = await self.triviaAnswerChecker.checkAnswer('kurtvonnegut', question)
+        assert result is TriviaAnswerCheckResult.CORRECT
+
+        result = await self.triviaAnswerChecker.checkAnswer('vonnegut', question)
+        assert result is TriviaAnswerCheckResult.INCORRECT
+
+        result = await self.triviaAnswerChecker.checkAnswer('kurt', question)
+        assert result is TriviaAnswerCheckResult.INCORRECT
+
+        result = await self.triviaAnswerChecker.checkAnswer('kurt von negut', question)
+        assert result is TriviaAnswerCheckResult.CORRECT
+
+        result = await self.triviaAnswerChecker.checkAnswer('curt vonnegut', question)
+        assert result is TriviaAnswerCheckResult.INCORRECT
+
+    @pytest.mark.asyncio
+    async def test_checkAnswer_withMountStHelens(self):
+        question = await self.__createQuestion('Mount St. Helens')
+
+        result = await self.triviaAnswerChecker.checkAnswer('mount st helens', question)
+        assert result is TriviaAnswerCheckResult.CORRECT
+
+        result = await self.triviaAnswerChecker.checkAnswer('mt st helens', question)
+        assert result is TriviaAnswerCheckResult.CORRECT
+
+        result = await self.triviaAnswerChecker.checkAnswer('mount saint helens', question)
+        assert result is TriviaAnswerCheckResult.CORRECT
+
+        result = await self.triviaAnswerChecker.checkAnswer('mt saint helens', question)
+        assert result is TriviaAnswerCheckResult.CORRECT
+
+        result = await self.triviaAnswerChecker.checkAnswer('mount helens', question)
+        assert result is TriviaAnswerCheckResult.INCORRECT
+
+        result = await self.triviaAnswerChecker.checkAnswer('mountsthelens', question)
+        assert result is TriviaAnswerCheckResult.CORRECT
+
+    @pytest.mark.asyncio
+    async def test_checkAnswer_withNewYorkCity(self):
+        question = await self.__createQuestion('New York City')
+
+        result = await self.triviaAnswerChecker.checkAnswer('new york city', question)
+        assert result is TriviaAnswerCheckResult.CORRECT
+
+        result = await self.triviaAnswerChecker.checkAnswer('newyork city', question)
+        assert result is TriviaAnswerCheckResult.CORRECT
+
+        result = await self.triviaAnswerChecker.checkAnswer('new yorkcity', question)
+        assert result is TriviaAnswerCheckResult.CORRECT
+
+        result = await self.triviaAnswerChecker.checkAnswer('newyorkcity', question)
+        assert result is TriviaAnswerCheckResult.CORRECT
+
+        result = await self.triviaAnswerChecker.checkAnswer('nyc', question)
+        assert result is TriviaAnswerCheckResult.INCORRECT
+
+        result = await self.triviaAnswerChecker.checkAnswer('new york', question)
+        assert result is TriviaAnswerCheckResult.INCORRECT
+
+        result = await self.triviaAnswerChecker.checkAnswer('york city', question)
+        assert result is TriviaAnswerCheckResult.INCORRECT
+
+        result = await self.triviaAnswerChecker.checkAnswer('new yrok city', question)
+        assert result is TriviaAnswerCheckResult.INCORRECT
+
+        result = await self.triviaAnswerChecker.checkAnswer('city new york', question)
+        assert result is TriviaAnswerCheckResult.INCORRECT
+
+    @pytest.mark.asyncio
+    async def test_checkAnswer_withSpiderman(self):
+        question = await self.__createQuestion('Spider-Man')
+
+        result = await self.triviaAnswerChecker.checkAnswer('spider man', question)
+        assert result is TriviaAnswerCheckResult.CORRECT
+
+        result = await self.triviaAnswerChecker.checkAnswer('spiderman', question)
+        assert result is TriviaAnswerCheckResult.CORRECT
+
+        result = await self.triviaAnswerChecker.checkAnswer('spidermen', question)
+        assert result is TriviaAnswerCheckResult.CORRECT
+
+        result = await self.triviaAnswerChecker.checkAnswer('spider', question)
+        assert result is TriviaAnswerCheckResult.INCORRECT
+
+        result = await self.triviaAnswerChecker.checkAnswer('man', question)
+        assert result is TriviaAnswerCheckResult.INCORRECT
+
+        result = await self.triviaAnswerChecker.checkAnswer('spider man 2', question)
+        assert result is TriviaAnswerCheckResult.INCORRECT
+
+        result = await self.triviaAnswerChecker.checkAnswer('spooder man', question)
+        assert result is TriviaAnswerCheckResult.INCORRECT
+
+    @pytest.mark.asyncio
+    async def test_checkAnswer_withSuperMarioBros(self):
+        question = await self.__createQuestion('Super Mario Bros')
+
+        result = await self.triviaAnswerChecker.checkAnswer('super mario bros', question)
+        assert result is TriviaAnswerCheckResult.CORRECT
+
+        result = await self.triviaAnswerChecker.checkAnswer('super mario brothers', question)
+        assert result is TriviaAnswerCheckResult.INCORRECT
+
+        result = await self.triviaAnswerChecker.checkAnswer('supermario bros', question)
+        assert result is TriviaAnswerCheckResult.CORRECT
+
+        result = await self.triviaAnswerChecker.checkAnswer('mario bros', question)
+        assert result is TriviaAnswerCheckResult.INCORRECT
+
+        result = await self.triviaAnswerChecker.checkAnswer('super mario', question)
+        assert result is TriviaAnswerCheckResult.INCORRECT
+
+        result = await self.triviaAnswerChecker.checkAnswer('supermariobros', question)
+        assert result is TriviaAnswerCheckResult.CORRECT
+
+    @pytest.mark.asyncio
+    async def test_checkAnswer_withTheLordOfTheRings(self):
+        question = await self.__createQuestion('The Lord of the Rings')
+
+        result = await self.triviaAnswerChecker.checkAnswer('lord of the rings', question)
+        assert result is TriviaAnswerCheckResult.CORRECT
+
+        result = await self.triviaAnswerChecker.checkAnswer('lord of rings', question)
+        assert result is TriviaAnswerCheckResult.INCORRECT
+
+        result = await self.triviaAnswerChecker.checkAnswer('lordoftherings', question)
+        assert result is TriviaAnswerCheckResult.CORRECT
+
+        result = await self.triviaAnswerChecker.checkAnswer('the lord of the rings', question)
+        assert result is TriviaAnswerCheckResult.CORRECT
+
+        result = await self.triviaAnswerChecker.checkAnswer('lord rings', question)
+        assert result is TriviaAnswerCheckResult.INCORRECT
+
+        result = await self.triviaAnswerChecker.checkAnswer('lord of the ring', question)
+        assert result is TriviaAnswerCheckResult.CORRECT
+
+    @pytest.mark.asyncio
+    async def test_checkAnswer_withTheLordOfTheRingsTheReturnOfTheKing(self):
+        question = await self.__createQuestion('The Lord of the Rings: The Return of the King')
+
+        result = await self.triviaAnswerChecker.checkAnswer('lord of the rings the return of the king', question)
+        assert result is TriviaAnswerCheckResult.CORRECT
+
+        result = await self.triviaAnswerChecker.checkAnswer('lordoftherings returnoftheking', question)
+        assert result is TriviaAnswerCheckResult.CORRECT
+
+        result = await self.triviaAnswerChecker.checkAnswer('lord of the rings return of the king', question)
+        assert result is TriviaAnswerCheckResult.INCORRECT
+
+        result = await self.triviaAnswerChecker.checkAnswer('the return of the king', question)
+        assert result is TriviaAnswerCheckResult.INCORRECT
+
+        result = await self.triviaAnswerChecker.checkAnswer('lord of the rings the return of the kings', question)
+        assert result is TriviaAnswerCheckResult.CORRECT
+
+        result = await self.triviaAnswerChecker.checkAnswer('lord of the rings the two towers', question)
+        assert result is TriviaAnswerCheckResult.INCORRECT
+
+    @pytest.mark.asyncio
+    async def test_checkAnswer_withWorldWar2(self):
+        question = await self.__createQuestion('World War 2')
+
+        result = await self.triviaAnswerChecker.checkAnswer('world war 2', question)
+        assert result is TriviaAnswerCheckResult.CORRECT
+
+        result = await self.triviaAnswerChecker.checkAnswer('world war ii', question)
+        assert result is TriviaAnswerCheckResult.CORRECT
+
+        result = await self.triviaAnswerChecker.checkAnswer('ww2', question)
+        assert result is TriviaAnswerCheckResult.INCORRECT
+
+        result = await self.triviaAnswerChecker.checkAnswer('world war two', question)
+        assert result is TriviaAnswerCheckResult.CORRECT
+
+        result = await self.triviaAnswerChecker.checkAnswer('worldwar 2', question)
+        assert result is TriviaAnswerCheckResult.CORRECT
+
+        result = await self.triviaAnswerChecker.checkAnswer('world war 1', question)
+        assert result is TriviaAnswerCheckResult.INCORRECT
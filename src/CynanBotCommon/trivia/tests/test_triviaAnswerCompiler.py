@@ -299,11 +299,21 @@ class TestTriviaAnswerCompiler():
         result: str = await self.triviaAnswerCompiler.compileTextAnswer('Between the Buried & Me')
         assert result == 'between the buried and me'
 
+    @pytest.mark.asyncio
+    async def test_compileTextAnswer_withDiacritics(self):
+        result: str = await self.triviaAnswerCompiler.compileTextAnswer('Pokémon Café')
+        assert result == 'pokemon cafe'
+
     @pytest.mark.asyncio
     async def test_compileTextAnswer_withEmptyString(self):
         result: str = await self.triviaAnswerCompiler.compileTextAnswer('')
         assert result == ''
 
+    @pytest.mark.asyncio
+    async def test_compileTextAnswer_withFancyCharacters(self):
+        result: str = await self.triviaAnswerCompiler.compileTextAnswer('𝓢𝓾𝓹𝓮𝓻 𝓶𝓮𝓽𝓻𝓸𝓲𝓭')
+        assert result == 'super metroid'
+
     @pytest.mark.asyncio
     async def test_compileTextAnswer_withHelloWorld(self):
         result: str = await self.triviaAnswerCompiler.compileTextAnswer('Hello, World!')
@@ -329,6 +339,29 @@ class TestTriviaAnswerCompiler():
         result: str = await self.triviaAnswerCompiler.compileTextAnswer('An Orange')
         assert result == 'orange'
 
+    @pytest.mark.asyncio
+    async def test_compileTextAnswer_withRepeatedAnswer(self):
+        triviaAnswerCompiler = TriviaAnswerCompiler(
+            timber = self.timber,
+            cacheSize = 2
+        )
+
+        result: str = await triviaAnswerCompiler.compileTextAnswer('The Pikachu')
+        assert result == 'pikachu'
+        assert triviaAnswerCompiler.getCacheHitCount() == 0
+        assert triviaAnswerCompiler.getCacheMissCount() == 1
+
+        result = await triviaAnswerCompiler.compileTextAnswer('The Pikachu')
+        assert result == 'pikachu'
+        assert triviaAnswerCompiler.getCacheHitCount() == 1
+        assert triviaAnswerCompiler.getCacheMissCount() == 1
+
+        await triviaAnswerCompiler.clearCaches()
+        result = await triviaAnswerCompiler.compileTextAnswer('The Pikachu')
+        assert result == 'pikachu'
+        assert triviaAnswerCompiler.getCacheHitCount() == 1
+        assert triviaAnswerCompiler.getCacheMissCount() == 2
+
     @pytest.mark.asyncio
     async def test_compileTextAnswer_withSaintNicholas(self):
         result: str = await self.triviaAnswerCompiler.compileTextAnswer('Saint Nicholas')
@@ -523,6 +556,23 @@ class TestTriviaAnswerCompiler():
         assert 'fiftieth' in result  # ordinal
         assert 'the fiftieth' in result  # ordinal preceded by 'the'
 
+    @pytest.mark.asyncio
+    async def test_compileTextAnswersList_withRepeatedAnswers(self):
+        triviaAnswerCompiler = TriviaAnswerCompiler(
+            timber = self.timber,
+            cacheSize = 2
+        )
+
+        result: List[str] = await triviaAnswerCompiler.compileTextAnswersList([ '(Eddie) Van Halen' ])
+        assert len(result) == 2
+        assert triviaAnswerCompiler.getCacheHitCount() == 0
+        assert triviaAnswerCompiler.getCacheMissCount() == 1
+
+        result = await triviaAnswerCompiler.compileTextAnswersList([ '(Eddie) Van Halen' ])
+        assert len(result) == 2
+        assert triviaAnswerCompiler.getCacheHitCount() == 1
+        assert triviaAnswerCompiler.getCacheMissCount() == 1
+
     @pytest.mark.asyncio
     async def test_compileTextAnswersList_withTheirHouse(self):
         result: List[str] = await self.triviaAnswerCompiler.compileTextAnswersList([ 'their house' ])
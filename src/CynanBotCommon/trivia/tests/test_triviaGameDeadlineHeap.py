@@ -0,0 +1,128 @@
+from datetime import datetime, timedelta, timezone
+
+try:
+    from ..absTriviaQuestion import AbsTriviaQuestion
+    from ..superTriviaGameState import SuperTriviaGameState
+    from ..triviaDifficulty import TriviaDifficulty
+    from ..triviaGameDeadlineHeap import TriviaGameDeadlineHeap
+    from ..triviaGameState import TriviaGameState
+    from ..triviaSource import TriviaSource
+    from ..trueFalseTriviaQuestion import TrueFalseTriviaQuestion
+except:
+    from trivia.absTriviaQuestion import AbsTriviaQuestion
+    from trivia.superTriviaGameState import SuperTriviaGameState
+    from trivia.triviaDifficulty import TriviaDifficulty
+    from trivia.triviaGameDeadlineHeap import TriviaGameDeadlineHeap
+    from trivia.triviaGameState import TriviaGameState
+    from trivia.triviaSource import TriviaSource
+    from trivia.trueFalseTriviaQuestion import TrueFalseTriviaQuestion
+
+
+class TestTriviaGameDeadlineHeap():
+
+    question: AbsTriviaQuestion = TrueFalseTriviaQuestion(
+        correctAnswers = [ True ],
+        category = None,
+        categoryId = None,
+        question = 'Is stashiocat a member of the Chicago Bullies?',
+        triviaId = 'def456',
+        triviaDifficulty = TriviaDifficulty.UNKNOWN,
+        triviaSource = TriviaSource.OPEN_TRIVIA_DATABASE
+    )
+
+    def __createNormalGame(self, secondsToLive: int, userId: str) -> TriviaGameState:
+        return TriviaGameState(
+            triviaQuestion = self.question,
+            basePointsForWinning = 5,
+            pointsForWinning = 5,
+            secondsToLive = secondsToLive,
+            specialTriviaStatus = None,
+            actionId = 'abc123',
+            emote = '🍔',
+            twitchChannel = 'smCharles',
+            userId = userId,
+            userName = 'stashiocat'
+        )
+
+    def __createSuperGame(self, secondsToLive: int) -> SuperTriviaGameState:
+        return SuperTriviaGameState(
+            triviaQuestion = self.question,
+            basePointsForWinning = 25,
+            perUserAttempts = 2,
+            pointsForWinning = 25,
+            regularTriviaPointsForWinning = 5,
+            secondsToLive = secondsToLive,
+            toxicTriviaPunishmentMultiplier = 2,
+            specialTriviaStatus = None,
+            actionId = 'abc123',
+            emote = '🍔',
+            twitchChannel = 'smCharles'
+        )
+
+    def test_getNextDeadline(self):
+        heap = TriviaGameDeadlineHeap()
+        game1 = self.__createNormalGame(secondsToLive = 60, userId = '111111')
+        game2 = self.__createSuperGame(secondsToLive = 30)
+        game3 = self.__createNormalGame(secondsToLive = 90, userId = '222222')
+
+        heap.push(game1)
+        heap.push(game2)
+        heap.push(game3)
+
+        assert heap.getNextDeadline() == game2.getEndTime()
+        assert heap.getSize() == 3
+
+    def test_getNextDeadline_withEmptyHeap(self):
+        heap = TriviaGameDeadlineHeap()
+        assert heap.getNextDeadline() is None
+        assert heap.getSize() == 0
+
+    def test_popExpired(self):
+        heap = TriviaGameDeadlineHeap()
+        game1 = self.__createNormalGame(secondsToLive = 60, userId = '111111')
+        game2 = self.__createSuperGame(secondsToLive = 30)
+        game3 = self.__createNormalGame(secondsToLive = 90, userId = '222222')
+
+        heap.push(game1)
+        heap.push(game2)
+        heap.push(game3)
+
+        expired = heap.popExpired(game1.getEndTime())
+        assert expired == [ game2, game1 ]
+        assert heap.getNextDeadline() == game3.getEndTime()
+        assert heap.getSize() == 1
+
+    def test_popExpired_withNothingExpired(self):
+        heap = TriviaGameDeadlineHeap()
+        game = self.__createNormalGame(secondsToLive = 60, userId = '111111')
+        heap.push(game)
+
+        assert heap.popExpired(datetime.now(timezone.utc)) == list()
+        assert heap.getSize() == 1
+
+    def test_popExpired_withSameDeadlines(self):
+        heap = TriviaGameDeadlineHeap()
+        game1 = self.__createNormalGame(secondsToLive = 60, userId = '111111')
+        game2 = self.__createNormalGame(secondsToLive = 60, userId = '222222')
+        game3 = self.__createNormalGame(secondsToLive = 60, userId = '333333')
+
+        heap.push(game1)
+        heap.push(game2)
+        heap.push(game3)
+
+        now = datetime.now(timezone.utc) + timedelta(minutes = 5)
+        assert heap.popExpired(now) == [ game1, game2, game3 ]
+
+    def test_pushWakeUp(self):
+        heap = TriviaGameDeadlineHeap()
+        game = self.__createNormalGame(secondsToLive = 60, userId = '111111')
+        wakeUp = datetime.now(timezone.utc) + timedelta(seconds = 10)
+
+        heap.push(game)
+        heap.pushWakeUp(wakeUp)
+        assert heap.getNextDeadline() == wakeUp
+        assert heap.getSize() == 2
+
+        # a wake up has no game state, so nothing is returned for it
+        assert heap.popExpired(wakeUp) == list()
+        assert heap.getNextDeadline() == game.getEndTime()
@@ -0,0 +1,875 @@
+import asyncio
+import os
+from typing import Any, Dict, List, Optional, Set
+
+import pytest
+
+try:
+    from ...backgroundTaskHelper import BackgroundTaskHelper
+    from ...cuteness.cutenessChampionsResult import CutenessChampionsResult
+    from ...cuteness.cutenessDate import CutenessDate
+    from ...cuteness.cutenessHistoryResult import CutenessHistoryResult
+    from ...cuteness.cutenessIncrement import CutenessIncrement
+    from ...cuteness.cutenessLeaderboardHistoryResult import \
+        CutenessLeaderboardHistoryResult
+    from ...cuteness.cutenessLeaderboardResult import CutenessLeaderboardResult
+    from ...cuteness.cutenessRepositoryInterface import \
+        CutenessRepositoryInterface
+    from ...cuteness.cutenessResult import CutenessResult
+    from ...storage.backingDatabase import BackingDatabase
+    from ...storage.backingSqliteDatabase import BackingSqliteDatabase
+    from ...storage.jsonStaticReader import JsonStaticReader
+    from ...timber.timberStub import TimberStub
+    from ...twitch.twitchTokensDetails import TwitchTokensDetails
+    from ...twitch.twitchTokensRepositoryInterface import \
+        TwitchTokensRepositoryInterface
+    from ...twitch.twitchTokensRepositoryListener import \
+        TwitchTokensRepositoryListener
+    from ...users.userIdsRepositoryInterface import UserIdsRepositoryInterface
+    from ..absTriviaEvent import AbsTriviaEvent
+    from ..absTriviaQuestion import AbsTriviaQuestion
+    from ..checkAnswerTriviaAction import CheckAnswerTriviaAction
+    from ..checkSuperAnswerTriviaAction import CheckSuperAnswerTriviaAction
+    from ..questionAnswerTriviaQuestion import QuestionAnswerTriviaQuestion
+    from ..queuedTriviaGameStore import QueuedTriviaGameStore
+    from ..shinyTriviaHelper import ShinyTriviaHelper
+    from ..shinyTriviaOccurencesRepository import \
+        ShinyTriviaOccurencesRepository
+    from ..startNewTriviaGameAction import StartNewTriviaGameAction
+    from ..superTriviaCooldownHelper import SuperTriviaCooldownHelper
+    from ..superTriviaGameState import SuperTriviaGameState
+    from ..toxicTriviaHelper import ToxicTriviaHelper
+    from ..toxicTriviaOccurencesRepository import \
+        ToxicTriviaOccurencesRepository
+    from ..triviaAnswerChecker import TriviaAnswerChecker
+    from ..triviaAnswerCheckResult import TriviaAnswerCheckResult
+    from ..triviaAnswerCompiler import TriviaAnswerCompiler
+    from ..triviaDifficulty import TriviaDifficulty
+    from ..triviaEmoteGeneratorInterface import TriviaEmoteGeneratorInterface
+    from ..triviaEventListener import TriviaEventListener
+    from ..triviaEventType import TriviaEventType
+    from ..triviaFetchOptions import TriviaFetchOptions
+    from ..triviaGameMachine import TriviaGameMachine
+    from ..triviaGameStore import TriviaGameStore
+    from ..triviaRepositories.triviaRepositoryInterface import \
+        TriviaRepositoryInterface
+    from ..triviaScoreIncrement import TriviaScoreIncrement
+    from ..triviaScoreRepositoryInterface import \
+        TriviaScoreRepositoryInterface
+    from ..triviaScoreResult import TriviaScoreResult
+    from ..triviaSettingsRepository import TriviaSettingsRepository
+    from ..triviaSettingsRepositoryInterface import \
+        TriviaSettingsRepositoryInterface
+    from ..triviaSource import TriviaSource
+except:
+    from backgroundTaskHelper import BackgroundTaskHelper
+    from cuteness.cutenessChampionsResult import CutenessChampionsResult
+    from cuteness.cutenessDate import CutenessDate
+    from cuteness.cutenessHistoryResult import CutenessHistoryResult
+    from cuteness.cutenessIncrement import CutenessIncrement
+    from cuteness.cutenessLeaderboardHistoryResult import \
+        CutenessLeaderboardHistoryResult
+    from cuteness.cutenessLeaderboardResult import CutenessLeaderboardResult
+    from cuteness.cutenessRepositoryInterface import \
+        CutenessRepositoryInterface
+    from cuteness.cutenessResult import CutenessResult
+    from storage.backingDatabase import BackingDatabase
+    from storage.backingSqliteDatabase import BackingSqliteDatabase
+    from storage.jsonStaticReader import JsonStaticReader
+    from timber.timberStub import TimberStub
+    from trivia.absTriviaEvent import AbsTriviaEvent
+    from trivia.absTriviaQuestion import AbsTriviaQuestion
+    from trivia.checkAnswerTriviaAction import CheckAnswerTriviaAction
+    from trivia.checkSuperAnswerTriviaAction import \
+        CheckSuperAnswerTriviaAction
+    from trivia.questionAnswerTriviaQuestion import \
+        QuestionAnswerTriviaQuestion
+    from trivia.queuedTriviaGameStore import QueuedTriviaGameStore
+    from trivia.shinyTriviaHelper import ShinyTriviaHelper
+    from trivia.shinyTriviaOccurencesRepository import \
+        ShinyTriviaOccurencesRepository
+    from trivia.startNewTriviaGameAction import StartNewTriviaGameAction
+    from trivia.superTriviaCooldownHelper import SuperTriviaCooldownHelper
+    from trivia.superTriviaGameState import SuperTriviaGameState
+    from trivia.toxicTriviaHelper import ToxicTriviaHelper
+    from trivia.toxicTriviaOccurencesRepository import \
+        ToxicTriviaOccurencesRepository
+    from trivia.triviaAnswerChecker import TriviaAnswerChecker
+    from trivia.triviaAnswerCheckResult import TriviaAnswerCheckResult
+    from trivia.triviaAnswerCompiler import TriviaAnswerCompiler
+    from trivia.triviaDifficulty import TriviaDifficulty
+    from trivia.triviaEmoteGeneratorInterface import \
+        TriviaEmoteGeneratorInterface
+    from trivia.triviaEventListener import TriviaEventListener
+    from trivia.triviaEventType import TriviaEventType
+    from trivia.triviaFetchOptions import TriviaFetchOptions
+    from trivia.triviaGameMachine import TriviaGameMachine
+    from trivia.triviaGameStore import TriviaGameStore
+    from trivia.triviaRepositories.triviaRepositoryInterface import \
+        TriviaRepositoryInterface
+    from trivia.triviaScoreIncrement import TriviaScoreIncrement
+    from trivia.triviaScoreRepositoryInterface import \
+        TriviaScoreRepositoryInterface
+    from trivia.triviaScoreResult import TriviaScoreResult
+    from trivia.triviaSettingsRepository import TriviaSettingsRepository
+    from trivia.triviaSettingsRepositoryInterface import \
+        TriviaSettingsRepositoryInterface
+    from trivia.triviaSource import TriviaSource
+
+    from twitch.twitchTokensDetails import TwitchTokensDetails
+    from twitch.twitchTokensRepositoryInterface import \
+        TwitchTokensRepositoryInterface
+    from twitch.twitchTokensRepositoryListener import \
+        TwitchTokensRepositoryListener
+    from users.userIdsRepositoryInterface import UserIdsRepositoryInterface
+
+
+class CountingTriviaGameStore(TriviaGameStore):
+
+    def __init__(self):
+        super().__init__()
+        self.getSuperGameCount: int = 0
+
+    async def getSuperGame(self, twitchChannel: str) -> Optional[SuperTriviaGameState]:
+        self.getSuperGameCount = self.getSuperGameCount + 1
+        return await super().getSuperGame(twitchChannel)
+
+
+class FakeCutenessRepository(CutenessRepositoryInterface):
+
+    def __init__(self):
+        self.incrementCount: int = 0
+
+    async def fetchCuteness(self, twitchChannel: str, userId: str, userName: str) -> CutenessResult:
+        raise NotImplementedError()
+
+    async def fetchCutenessChampions(self, twitchChannel: str) -> CutenessChampionsResult:
+        raise NotImplementedError()
+
+    async def fetchCutenessHistory(self, twitchChannel: str, userId: str, userName: str) -> CutenessHistoryResult:
+        raise NotImplementedError()
+
+    async def fetchCutenessIncrementedBy(self, incrementAmount: int, twitchChannel: str, userId: str, userName: str) -> CutenessResult:
+        self.incrementCount = self.incrementCount + 1
+
+        return CutenessResult(
+            cutenessDate = CutenessDate(),
+            cuteness = incrementAmount,
+            userId = userId,
+            userName = userName
+        )
+
+    async def fetchCutenessesIncrementedBy(self, twitchChannel: str, increments: List[CutenessIncrement], cutenessDate: Optional[CutenessDate] = None) -> List[CutenessResult]:
+        raise NotImplementedError()
+
+    async def fetchCutenessLeaderboard(self, twitchChannel: str, specificLookupUserId: Optional[str] = None, specificLookupUserName: Optional[str] = None) -> CutenessLeaderboardResult:
+        raise NotImplementedError()
+
+    async def fetchCutenessLeaderboardHistory(self, twitchChannel: str) -> CutenessLeaderboardHistoryResult:
+        raise NotImplementedError()
+
+
+class FakeTriviaAnswerChecker(TriviaAnswerChecker):
+
+    def __init__(self, triviaSettingsRepository: TriviaSettingsRepositoryInterface):
+        super().__init__(
+            timber = TimberStub(),
+            triviaAnswerCompiler = TriviaAnswerCompiler(TimberStub()),
+            triviaSettingsRepository = triviaSettingsRepository
+        )
+
+        self.checkedAnswers: List[Optional[str]] = list()
+
+    async def checkAnswer(
+        self,
+        answer: Optional[str],
+        triviaQuestion: AbsTriviaQuestion,
+        extras: Optional[Dict[str, Any]] = None
+    ) -> TriviaAnswerCheckResult:
+        self.checkedAnswers.append(answer)
+
+        if answer is not None and answer.lower().strip() in [ correctAnswer.lower() for correctAnswer in triviaQuestion.getCorrectAnswers() ]:
+            return TriviaAnswerCheckResult.CORRECT
+        else:
+            return TriviaAnswerCheckResult.INCORRECT
+
+
+class FakeTriviaEmoteGenerator(TriviaEmoteGeneratorInterface):
+
+    async def getCurrentEmoteFor(self, twitchChannel: str) -> str:
+        return '🏫'
+
+    async def getNextEmoteFor(self, twitchChannel: str) -> str:
+        return '🏫'
+
+    def getRandomEmote(self) -> str:
+        return '🏫'
+
+    async def getValidatedAndNormalizedEmote(self, emote: Optional[str]) -> Optional[str]:
+        return emote
+
+
+class FakeTriviaEventListener(TriviaEventListener):
+
+    def __init__(self, expectedEventCount: int):
+        self.events: List[AbsTriviaEvent] = list()
+        self.expectedEventCount: int = expectedEventCount
+        self.receivedExpectedEvents: asyncio.Event = asyncio.Event()
+
+    def getTriviaEventTypes(self) -> List[TriviaEventType]:
+        return [ event.getTriviaEventType() for event in self.events ]
+
+    async def onNewTriviaEvent(self, event: AbsTriviaEvent):
+        self.events.append(event)
+
+        if len(self.events) >= self.expectedEventCount:
+            self.receivedExpectedEvents.set()
+
+    async def waitForExpectedEvents(self):
+        await asyncio.wait_for(self.receivedExpectedEvents.wait(), timeout = 5)
+
+
+class FakeTriviaRepository(TriviaRepositoryInterface):
+
+    def __init__(self, slowTwitchChannels: Optional[Set[str]] = None):
+        if slowTwitchChannels is None:
+            slowTwitchChannels = set()
+
+        self.slowTwitchChannels: Set[str] = slowTwitchChannels
+        self.isFetchingAllowed: asyncio.Event = asyncio.Event()
+        self.concurrentFetchCount: int = 0
+        self.maxConcurrentFetchCount: int = 0
+
+    async def fetchTrivia(self, emote: str, triviaFetchOptions: TriviaFetchOptions) -> Optional[AbsTriviaQuestion]:
+        self.concurrentFetchCount = self.concurrentFetchCount + 1
+        self.maxConcurrentFetchCount = max(self.maxConcurrentFetchCount, self.concurrentFetchCount)
+
+        try:
+            # fetches for slow channels don't finish until the test allows it
+            if triviaFetchOptions.getTwitchChannel() in self.slowTwitchChannels:
+                await self.isFetchingAllowed.wait()
+        finally:
+            self.concurrentFetchCount = self.concurrentFetchCount - 1
+
+        return createTriviaQuestion()
+
+    def startSpooler(self):
+        pass
+
+
+class FakeTriviaScoreRepository(TriviaScoreRepositoryInterface):
+
+    def __init__(self):
+        self.superTriviaWinsCount: int = 0
+        self.triviaLossesCount: int = 0
+        self.triviaWinsCount: int = 0
+
+    async def fetchTriviaScore(self, twitchChannel: str, userId: str) -> TriviaScoreResult:
+        return self.__createTriviaScore(twitchChannel, userId)
+
+    async def incrementSuperTriviaWins(self, twitchChannel: str, userId: str) -> TriviaScoreResult:
+        self.superTriviaWinsCount = self.superTriviaWinsCount + 1
+        return self.__createTriviaScore(twitchChannel, userId)
+
+    async def incrementTriviaLosses(self, twitchChannel: str, userId: str) -> TriviaScoreResult:
+        self.triviaLossesCount = self.triviaLossesCount + 1
+        return self.__createTriviaScore(twitchChannel, userId)
+
+    async def incrementTriviaScores(self, triviaScoreIncrements: List[TriviaScoreIncrement]):
+        raise NotImplementedError()
+
+    async def incrementTriviaWins(self, twitchChannel: str, userId: str) -> TriviaScoreResult:
+        self.triviaWinsCount = self.triviaWinsCount + 1
+        return self.__createTriviaScore(twitchChannel, userId)
+
+    def __createTriviaScore(self, twitchChannel: str, userId: str) -> TriviaScoreResult:
+        return TriviaScoreResult(
+            streak = 0,
+            superTriviaWins = self.superTriviaWinsCount,
+            triviaLosses = self.triviaLossesCount,
+            triviaWins = self.triviaWinsCount,
+            twitchChannel = twitchChannel,
+            userId = userId
+        )
+
+
+class FakeTwitchTokensRepository(TwitchTokensRepositoryInterface):
+
+    async def addUser(self, code: str, twitchChannel: str):
+        raise NotImplementedError()
+
+    async def clearCaches(self):
+        pass
+
+    async def getAccessToken(self, twitchChannel: str) -> Optional[str]:
+        return None
+
+    async def getExpiringTwitchChannels(self) -> Optional[List[str]]:
+        return None
+
+    async def getRefreshToken(self, twitchChannel: str) -> Optional[str]:
+        return None
+
+    async def hasAccessToken(self, twitchChannel: str) -> bool:
+        return False
+
+    async def removeUser(self, twitchChannel: str):
+        raise NotImplementedError()
+
+    async def requireAccessToken(self, twitchChannel: str) -> str:
+        raise NotImplementedError()
+
+    async def requireRefreshToken(self, twitchChannel: str) -> str:
+        raise NotImplementedError()
+
+    async def requireTokensDetails(self, twitchChannel: str) -> TwitchTokensDetails:
+        raise NotImplementedError()
+
+    def setListener(self, listener: Optional[TwitchTokensRepositoryListener]):
+        pass
+
+    async def validateAndRefreshAccessToken(self, twitchChannel: str):
+        pass
+
+
+class FakeUserIdsRepository(UserIdsRepositoryInterface):
+
+    async def clearCaches(self):
+        pass
+
+    async def fetchAnonymousUserId(self, twitchAccessToken: str) -> Optional[str]:
+        return None
+
+    async def fetchAnonymousUserName(self, twitchAccessToken: str) -> Optional[str]:
+        return None
+
+    async def fetchUserId(self, userName: str, twitchAccessToken: Optional[str] = None) -> Optional[str]:
+        return None
+
+    async def fetchUserIdAsInt(self, userName: str, twitchAccessToken: Optional[str] = None) -> Optional[int]:
+        return None
+
+    async def fetchUserName(self, userId: str, twitchAccessToken: Optional[str] = None) -> Optional[str]:
+        return None
+
+    async def requireAnonymousUserId(self, twitchAccessToken: str) -> str:
+        raise NotImplementedError()
+
+    async def requireAnonymousUserName(self, twitchAccessToken: str) -> str:
+        raise NotImplementedError()
+
+    async def requireUserId(self, userName: str, twitchAccessToken: Optional[str] = None) -> str:
+        raise NotImplementedError()
+
+    async def requireUserIdAsInt(self, userName: str, twitchAccessToken: Optional[str] = None) -> int:
+        raise NotImplementedError()
+
+    async def requireUserName(self, userId: str, twitchAccessToken: Optional[str] = None) -> str:
+        raise NotImplementedError()
+
+    async def setUser(self, userId: str, userName: str):
+        pass
+
+    async def setUsers(self, userIdsToUserNames: Dict[str, str]):
+        pass
+
+
+def createTriviaQuestion() -> QuestionAnswerTriviaQuestion:
+    return QuestionAnswerTriviaQuestion(
+        correctAnswers = [ 'Mew' ],
+        cleanedCorrectAnswers = [ 'mew' ],
+        category = None,
+        categoryId = None,
+        question = 'Which Pokémon is said to contain the DNA of every other Pokémon?',
+        triviaId = 'abc123',
+        triviaDifficulty = TriviaDifficulty.UNKNOWN,
+        triviaSource = TriviaSource.POKE_API
+    )
+
+
+class TestTriviaGameMachine():
+
+    def __createTriviaGameMachine(
+        self,
+        backingDatabase: BackingDatabase,
+        cutenessRepository: CutenessRepositoryInterface,
+        triviaAnswerChecker: TriviaAnswerChecker,
+        triviaGameStore: TriviaGameStore,
+        triviaRepository: TriviaRepositoryInterface,
+        triviaScoreRepository: TriviaScoreRepositoryInterface,
+        triviaSettingsRepository: TriviaSettingsRepositoryInterface,
+        maxQueueSize: int = 1000,
+        maxConcurrentActionLanes: int = 8
+    ) -> TriviaGameMachine:
+        timber = TimberStub()
+
+        return TriviaGameMachine(
+            backgroundTaskHelper = BackgroundTaskHelper(eventLoop = asyncio.get_running_loop()),
+            cutenessRepository = cutenessRepository,
+            queuedTriviaGameStore = QueuedTriviaGameStore(
+                timber = timber,
+                triviaSettingsRepository = triviaSettingsRepository
+            ),
+            shinyTriviaHelper = ShinyTriviaHelper(
+                cutenessRepository = cutenessRepository,
+                shinyTriviaOccurencesRepository = ShinyTriviaOccurencesRepository(backingDatabase),
+                timber = timber,
+                triviaSettingsRepository = triviaSettingsRepository
+            ),
+            superTriviaCooldownHelper = SuperTriviaCooldownHelper(triviaSettingsRepository),
+            timber = timber,
+            toxicTriviaHelper = ToxicTriviaHelper(
+                toxicTriviaOccurencesRepository = ToxicTriviaOccurencesRepository(backingDatabase),
+                timber = timber,
+                triviaSettingsRepository = triviaSettingsRepository
+            ),
+            triviaAnswerChecker = triviaAnswerChecker,
+            triviaEmoteGenerator = FakeTriviaEmoteGenerator(),
+            triviaGameStore = triviaGameStore,
+            triviaRepository = triviaRepository,
+            triviaScoreRepository = triviaScoreRepository,
+            triviaSettingsRepository = triviaSettingsRepository,
+            twitchTokensRepository = FakeTwitchTokensRepository(),
+            userIdsRepository = FakeUserIdsRepository(),
+            maxQueueSize = maxQueueSize,
+            maxConcurrentActionLanes = maxConcurrentActionLanes
+        )
+
+    def __createStartNewTriviaGameAction(self, twitchChannel: str, userId: str) -> StartNewTriviaGameAction:
+        return StartNewTriviaGameAction(
+            isShinyTriviaEnabled = False,
+            pointsForWinning = 5,
+            secondsToLive = 60,
+            shinyMultiplier = 8,
+            twitchChannel = twitchChannel,
+            userId = userId,
+            userName = f'user{userId}',
+            triviaFetchOptions = TriviaFetchOptions(twitchChannel = twitchChannel)
+        )
+
+    def __createSuperTriviaGameState(self, twitchChannel: str) -> SuperTriviaGameState:
+        return SuperTriviaGameState(
+            triviaQuestion = createTriviaQuestion(),
+            basePointsForWinning = 25,
+            perUserAttempts = 2,
+            pointsForWinning = 25,
+            regularTriviaPointsForWinning = 5,
+            secondsToLive = 60,
+            toxicTriviaPunishmentMultiplier = 0,
+            specialTriviaStatus = None,
+            actionId = 'abc123',
+            emote = '🏫',
+            twitchChannel = twitchChannel
+        )
+
+    @pytest.mark.asyncio
+    async def test_checkSuperAnswer_withBurstOfAnswers(self, tmp_path):
+        backingDatabase = BackingSqliteDatabase(
+            eventLoop = asyncio.get_running_loop(),
+            backingDatabaseFile = os.path.join(tmp_path, 'database.sqlite')
+        )
+
+        triviaSettingsRepository = TriviaSettingsRepository(JsonStaticReader(dict()))
+        triviaAnswerChecker = FakeTriviaAnswerChecker(triviaSettingsRepository)
+        triviaGameStore = CountingTriviaGameStore()
+        await triviaGameStore.add(self.__createSuperTriviaGameState('smCharles'))
+
+        triviaGameMachine = self.__createTriviaGameMachine(
+            backingDatabase = backingDatabase,
+            cutenessRepository = FakeCutenessRepository(),
+            triviaAnswerChecker = triviaAnswerChecker,
+            triviaGameStore = triviaGameStore,
+            triviaRepository = FakeTriviaRepository(),
+            triviaScoreRepository = FakeTriviaScoreRepository(),
+            triviaSettingsRepository = triviaSettingsRepository
+        )
+
+        listener = FakeTriviaEventListener(expectedEventCount = 4)
+        triviaGameMachine.setEventListener(listener)
+        triviaGameMachine.startMachine()
+
+        for userId, answer in [ ('1', 'Pikachu'), ('2', 'Eevee'), ('3', 'Snorlax'), ('4', 'Ditto') ]:
+            triviaGameMachine.submitAction(CheckSuperAnswerTriviaAction(answer, 'smCharles', userId, f'user{userId}'))
+
+        await listener.waitForExpectedEvents()
+
+        # the whole burst was handled together, so the game was only looked up once
+        assert triviaGameStore.getSuperGameCount == 1
+        assert triviaAnswerChecker.checkedAnswers == [ 'Pikachu', 'Eevee', 'Snorlax', 'Ditto' ]
+        assert listener.getTriviaEventTypes() == [ TriviaEventType.INCORRECT_SUPER_ANSWER ] * 4
+
+        await backingDatabase.close()
+
+    @pytest.mark.asyncio
+    async def test_checkSuperAnswer_withBurstOfIdenticalAnswers(self, tmp_path):
+        backingDatabase = BackingSqliteDatabase(
+            eventLoop = asyncio.get_running_loop(),
+            backingDatabaseFile = os.path.join(tmp_path, 'database.sqlite')
+        )
+
+        triviaSettingsRepository = TriviaSettingsRepository(JsonStaticReader(dict()))
+        triviaAnswerChecker = FakeTriviaAnswerChecker(triviaSettingsRepository)
+        triviaGameStore = CountingTriviaGameStore()
+        await triviaGameStore.add(self.__createSuperTriviaGameState('smCharles'))
+
+        triviaGameMachine = self.__createTriviaGameMachine(
+            backingDatabase = backingDatabase,
+            cutenessRepository = FakeCutenessRepository(),
+            triviaAnswerChecker = triviaAnswerChecker,
+            triviaGameStore = triviaGameStore,
+            triviaRepository = FakeTriviaRepository(),
+            triviaScoreRepository = FakeTriviaScoreRepository(),
+            triviaSettingsRepository = triviaSettingsRepository
+        )
+
+        listener = FakeTriviaEventListener(expectedEventCount = 4)
+        triviaGameMachine.setEventListener(listener)
+        triviaGameMachine.startMachine()
+
+        for userId, answer in [ ('1', 'Pikachu'), ('2', ' pikachu '), ('3', 'PIKACHU'), ('4', 'Eevee') ]:
+            triviaGameMachine.submitAction(CheckSuperAnswerTriviaAction(answer, 'smCharles', userId, f'user{userId}'))
+
+        await listener.waitForExpectedEvents()
+
+        assert triviaGameStore.getSuperGameCount == 1
+        assert triviaAnswerChecker.checkedAnswers == [ 'Pikachu', 'Eevee' ]
+        assert listener.getTriviaEventTypes() == [ TriviaEventType.INCORRECT_SUPER_ANSWER ] * 4
+
+        await backingDatabase.close()
+
+    @pytest.mark.asyncio
+    async def test_checkSuperAnswer_withBurstOfCorrectAnswers(self, tmp_path):
+        backingDatabase = BackingSqliteDatabase(
+            eventLoop = asyncio.get_running_loop(),
+            backingDatabaseFile = os.path.join(tmp_path, 'database.sqlite')
+        )
+
+        cutenessRepository = FakeCutenessRepository()
+        triviaScoreRepository = FakeTriviaScoreRepository()
+        triviaSettingsRepository = TriviaSettingsRepository(JsonStaticReader(dict()))
+        triviaAnswerChecker = FakeTriviaAnswerChecker(triviaSettingsRepository)
+        triviaGameStore = CountingTriviaGameStore()
+        await triviaGameStore.add(self.__createSuperTriviaGameState('smCharles'))
+
+        triviaGameMachine = self.__createTriviaGameMachine(
+            backingDatabase = backingDatabase,
+            cutenessRepository = cutenessRepository,
+            triviaAnswerChecker = triviaAnswerChecker,
+            triviaGameStore = triviaGameStore,
+            triviaRepository = FakeTriviaRepository(),
+            triviaScoreRepository = triviaScoreRepository,
+            triviaSettingsRepository = triviaSettingsRepository
+        )
+
+        listener = FakeTriviaEventListener(expectedEventCount = 4)
+        triviaGameMachine.setEventListener(listener)
+        triviaGameMachine.startMachine()
+
+        for userId, answer in [ ('1', 'Pikachu'), ('2', 'Mew'), ('3', 'mew'), ('4', 'Eevee') ]:
+            triviaGameMachine.submitAction(CheckSuperAnswerTriviaAction(answer, 'smCharles', userId, f'user{userId}'))
+
+        await listener.waitForExpectedEvents()
+
+        # once the game has been won, the rest of the burst isn't checked at all
+        assert triviaGameStore.getSuperGameCount == 1
+        assert triviaAnswerChecker.checkedAnswers == [ 'Pikachu', 'Mew' ]
+        assert cutenessRepository.incrementCount == 1
+        assert triviaScoreRepository.superTriviaWinsCount == 1
+        assert await triviaGameStore.getSuperGame('smCharles') is None
+
+        assert listener.getTriviaEventTypes() == [
+            TriviaEventType.INCORRECT_SUPER_ANSWER,
+            TriviaEventType.SUPER_GAME_CORRECT_ANSWER,
+            TriviaEventType.SUPER_GAME_NOT_READY,
+            TriviaEventType.SUPER_GAME_NOT_READY
+        ]
+
+        assert listener.events[1].getUserId() == '2'
+
+        await backingDatabase.close()
+
+    @pytest.mark.asyncio
+    async def test_submitAction_isHandledInOrderWithinTwitchChannel(self, tmp_path):
+        backingDatabase = BackingSqliteDatabase(
+            eventLoop = asyncio.get_running_loop(),
+            backingDatabaseFile = os.path.join(tmp_path, 'database.sqlite')
+        )
+
+        triviaRepository = FakeTriviaRepository(slowTwitchChannels = { 'smCharles' })
+        triviaSettingsRepository = TriviaSettingsRepository(JsonStaticReader(dict()))
+
+        triviaGameMachine = self.__createTriviaGameMachine(
+            backingDatabase = backingDatabase,
+            cutenessRepository = FakeCutenessRepository(),
+            triviaAnswerChecker = FakeTriviaAnswerChecker(triviaSettingsRepository),
+            triviaGameStore = TriviaGameStore(),
+            triviaRepository = triviaRepository,
+            triviaScoreRepository = FakeTriviaScoreRepository(),
+            triviaSettingsRepository = triviaSettingsRepository
+        )
+
+        listener = FakeTriviaEventListener(expectedEventCount = 2)
+        triviaGameMachine.setEventListener(listener)
+        triviaGameMachine.startMachine()
+
+        triviaGameMachine.submitAction(self.__createStartNewTriviaGameAction('smCharles', '1'))
+        triviaGameMachine.submitAction(CheckAnswerTriviaAction('Mew', 'smCharles', '1', 'user1'))
+        await asyncio.sleep(0.1)
+
+        # the answer has to wait on the slow game start before it, rather than finding no game
+        assert len(listener.events) == 0
+
+        triviaRepository.isFetchingAllowed.set()
+        await listener.waitForExpectedEvents()
+
+        assert listener.getTriviaEventTypes() == [
+            TriviaEventType.NEW_GAME,
+            TriviaEventType.CORRECT_ANSWER
+        ]
+
+        await backingDatabase.close()
+
+    @pytest.mark.asyncio
+    async def test_submitAction_isHandledInParallelAcrossTwitchChannels(self, tmp_path):
+        backingDatabase = BackingSqliteDatabase(
+            eventLoop = asyncio.get_running_loop(),
+            backingDatabaseFile = os.path.join(tmp_path, 'database.sqlite')
+        )
+
+        triviaRepository = FakeTriviaRepository(slowTwitchChannels = { 'smCharles' })
+        triviaSettingsRepository = TriviaSettingsRepository(JsonStaticReader(dict()))
+
+        triviaGameMachine = self.__createTriviaGameMachine(
+            backingDatabase = backingDatabase,
+            cutenessRepository = FakeCutenessRepository(),
+            triviaAnswerChecker = FakeTriviaAnswerChecker(triviaSettingsRepository),
+            triviaGameStore = TriviaGameStore(),
+            triviaRepository = triviaRepository,
+            triviaScoreRepository = FakeTriviaScoreRepository(),
+            triviaSettingsRepository = triviaSettingsRepository
+        )
+
+        listener = FakeTriviaEventListener(expectedEventCount = 1)
+        triviaGameMachine.setEventListener(listener)
+        triviaGameMachine.startMachine()
+
+        triviaGameMachine.submitAction(self.__createStartNewTriviaGameAction('smCharles', '1'))
+        triviaGameMachine.submitAction(CheckAnswerTriviaAction('Mew', 'stashiocat', '2', 'user2'))
+
+        # smCharles is stuck fetching a question, but that doesn't hold up stashiocat
+        await listener.waitForExpectedEvents()
+        assert listener.getTriviaEventTypes() == [ TriviaEventType.GAME_NOT_READY ]
+        assert listener.events[0].getTwitchChannel() == 'stashiocat'
+
+        listener.expectedEventCount = 2
+        listener.receivedExpectedEvents.clear()
+        triviaRepository.isFetchingAllowed.set()
+        await listener.waitForExpectedEvents()
+
+        assert listener.getTriviaEventTypes() == [
+            TriviaEventType.GAME_NOT_READY,
+            TriviaEventType.NEW_GAME
+        ]
+
+        # both lanes are done, so nothing is kept around for either channel
+        await asyncio.sleep(0.1)
+        assert len(triviaGameMachine._TriviaGameMachine__actionLanes) == 0
+        assert len(triviaGameMachine._TriviaGameMachine__twitchChannelLocks) == 0
+
+        await backingDatabase.close()
+
+    @pytest.mark.asyncio
+    async def test_submitAction_withMaxConcurrentActionLanes(self, tmp_path):
+        backingDatabase = BackingSqliteDatabase(
+            eventLoop = asyncio.get_running_loop(),
+            backingDatabaseFile = os.path.join(tmp_path, 'database.sqlite')
+        )
+
+        triviaRepository = FakeTriviaRepository(slowTwitchChannels = { 'imyt', 'smCharles', 'stashiocat' })
+        triviaSettingsRepository = TriviaSettingsRepository(JsonStaticReader(dict()))
+
+        triviaGameMachine = self.__createTriviaGameMachine(
+            backingDatabase = backingDatabase,
+            cutenessRepository = FakeCutenessRepository(),
+            triviaAnswerChecker = FakeTriviaAnswerChecker(triviaSettingsRepository),
+            triviaGameStore = TriviaGameStore(),
+            triviaRepository = triviaRepository,
+            triviaScoreRepository = FakeTriviaScoreRepository(),
+            triviaSettingsRepository = triviaSettingsRepository,
+            maxConcurrentActionLanes = 2
+        )
+
+        listener = FakeTriviaEventListener(expectedEventCount = 3)
+        triviaGameMachine.setEventListener(listener)
+        triviaGameMachine.startMachine()
+
+        triviaGameMachine.submitAction(self.__createStartNewTriviaGameAction('imyt', '1'))
+        triviaGameMachine.submitAction(self.__createStartNewTriviaGameAction('smCharles', '2'))
+        triviaGameMachine.submitAction(self.__createStartNewTriviaGameAction('stashiocat', '3'))
+        await asyncio.sleep(0.1)
+
+        assert triviaRepository.concurrentFetchCount == 2
+
+        triviaRepository.isFetchingAllowed.set()
+        await listener.waitForExpectedEvents()
+
+        assert listener.getTriviaEventTypes() == [ TriviaEventType.NEW_GAME ] * 3
+        assert triviaRepository.maxConcurrentFetchCount == 2
+
+        await backingDatabase.close()
+
+    @pytest.mark.asyncio
+    async def test_submitAction_withFullActionLane(self, tmp_path):
+        backingDatabase = BackingSqliteDatabase(
+            eventLoop = asyncio.get_running_loop(),
+            backingDatabaseFile = os.path.join(tmp_path, 'database.sqlite')
+        )
+
+        triviaRepository = FakeTriviaRepository(slowTwitchChannels = { 'smCharles' })
+        triviaSettingsRepository = TriviaSettingsRepository(JsonStaticReader(dict()))
+
+        triviaGameMachine = self.__createTriviaGameMachine(
+            backingDatabase = backingDatabase,
+            cutenessRepository = FakeCutenessRepository(),
+            triviaAnswerChecker = FakeTriviaAnswerChecker(triviaSettingsRepository),
+            triviaGameStore = TriviaGameStore(),
+            triviaRepository = triviaRepository,
+            triviaScoreRepository = FakeTriviaScoreRepository(),
+            triviaSettingsRepository = triviaSettingsRepository,
+            maxQueueSize = 2
+        )
+
+        listener = FakeTriviaEventListener(expectedEventCount = 3)
+        triviaGameMachine.setEventListener(listener)
+        triviaGameMachine.startMachine()
+
+        triviaGameMachine.submitAction(self.__createStartNewTriviaGameAction('smCharles', '1'))
+        await asyncio.sleep(0.1)
+
+        # the game start is now being handled, so the lane itself has room for two more actions
+        for userId in [ '2', '3', '4', '5' ]:
+            triviaGameMachine.submitAction(CheckAnswerTriviaAction('Mew', 'smCharles', userId, f'user{userId}'))
+            await asyncio.sleep(0.01)
+
+        triviaRepository.isFetchingAllowed.set()
+        await listener.waitForExpectedEvents()
+        await asyncio.sleep(0.1)
+
+        assert listener.getTriviaEventTypes() == [
+            TriviaEventType.NEW_GAME,
+            TriviaEventType.GAME_NOT_READY,
+            TriviaEventType.GAME_NOT_READY
+        ]
+
+        assert [ event.getUserId() for event in listener.events ] == [ '1', '2', '3' ]
+
+        await backingDatabase.close()
+
+    @pytest.mark.asyncio
+    async def test_setEventListener_afterEventsWereSubmitted(self, tmp_path):
+        backingDatabase = BackingSqliteDatabase(
+            eventLoop = asyncio.get_running_loop(),
+            backingDatabaseFile = os.path.join(tmp_path, 'database.sqlite')
+        )
+
+        triviaSettingsRepository = TriviaSettingsRepository(JsonStaticReader(dict()))
+
+        triviaGameMachine = self.__createTriviaGameMachine(
+            backingDatabase = backingDatabase,
+            cutenessRepository = FakeCutenessRepository(),
+            triviaAnswerChecker = FakeTriviaAnswerChecker(triviaSettingsRepository),
+            triviaGameStore = TriviaGameStore(),
+            triviaRepository = FakeTriviaRepository(),
+            triviaScoreRepository = FakeTriviaScoreRepository(),
+            triviaSettingsRepository = triviaSettingsRepository
+        )
+
+        triviaGameMachine.startMachine()
+        triviaGameMachine.submitAction(CheckAnswerTriviaAction('Mew', 'smCharles', '1', 'user1'))
+        triviaGameMachine.submitAction(CheckAnswerTriviaAction('Mew', 'smCharles', '2', 'user2'))
+        await asyncio.sleep(0.1)
+
+        # the events were held onto until now, rather than being thrown away
+        listener = FakeTriviaEventListener(expectedEventCount = 2)
+        triviaGameMachine.setEventListener(listener)
+        await listener.waitForExpectedEvents()
+
+        assert listener.getTriviaEventTypes() == [ TriviaEventType.GAME_NOT_READY ] * 2
+        assert [ event.getUserId() for event in listener.events ] == [ '1', '2' ]
+
+        await backingDatabase.close()
+
+    @pytest.mark.asyncio
+    async def test_submitAction_eventIsReceivedWithoutPolling(self, tmp_path):
+        backingDatabase = BackingSqliteDatabase(
+            eventLoop = asyncio.get_running_loop(),
+            backingDatabaseFile = os.path.join(tmp_path, 'database.sqlite')
+        )
+
+        triviaSettingsRepository = TriviaSettingsRepository(JsonStaticReader(dict()))
+
+        triviaGameMachine = self.__createTriviaGameMachine(
+            backingDatabase = backingDatabase,
+            cutenessRepository = FakeCutenessRepository(),
+            triviaAnswerChecker = FakeTriviaAnswerChecker(triviaSettingsRepository),
+            triviaGameStore = TriviaGameStore(),
+            triviaRepository = FakeTriviaRepository(),
+            triviaScoreRepository = FakeTriviaScoreRepository(),
+            triviaSettingsRepository = triviaSettingsRepository
+        )
+
+        listener = FakeTriviaEventListener(expectedEventCount = 1)
+        triviaGameMachine.setEventListener(listener)
+        triviaGameMachine.startMachine()
+        await asyncio.sleep(0.1)
+
+        triviaGameMachine.submitAction(CheckAnswerTriviaAction('Mew', 'smCharles', '1', 'user1'))
+
+        # this is well under the smallest allowed sleepTimeSeconds, so the action and its event
+        # must have been picked up as soon as they were queued
+        await asyncio.wait_for(listener.receivedExpectedEvents.wait(), timeout = 0.2)
+
+        assert listener.getTriviaEventTypes() == [ TriviaEventType.GAME_NOT_READY ]
+
+        await backingDatabase.close()
+
+    @pytest.mark.asyncio
+    async def test_submitAction_withFullEventQueueAndNoEventListener(self, tmp_path):
+        backingDatabase = BackingSqliteDatabase(
+            eventLoop = asyncio.get_running_loop(),
+            backingDatabaseFile = os.path.join(tmp_path, 'database.sqlite')
+        )
+
+        triviaSettingsRepository = TriviaSettingsRepository(JsonStaticReader(dict()))
+
+        triviaGameMachine = self.__createTriviaGameMachine(
+            backingDatabase = backingDatabase,
+            cutenessRepository = FakeCutenessRepository(),
+            triviaAnswerChecker = FakeTriviaAnswerChecker(triviaSettingsRepository),
+            triviaGameStore = TriviaGameStore(),
+            triviaRepository = FakeTriviaRepository(),
+            triviaScoreRepository = FakeTriviaScoreRepository(),
+            triviaSettingsRepository = triviaSettingsRepository,
+            maxQueueSize = 2
+        )
+
+        triviaGameMachine.startMachine()
+
+        for userId in [ '1', '2', '3', '4', '5' ]:
+            triviaGameMachine.submitAction(CheckAnswerTriviaAction('Mew', 'smCharles', userId, f'user{userId}'))
+            await asyncio.sleep(0.01)
+
+        # the extra events were dropped rather than holding up the lane until queueTimeoutSeconds
+        await asyncio.sleep(0.1)
+        assert len(triviaGameMachine._TriviaGameMachine__actionLanes) == 0
+
+        # one event is held by the event loop while it waits for a listener, and two more fit
+        # into the event queue
+        listener = FakeTriviaEventListener(expectedEventCount = 3)
+        triviaGameMachine.setEventListener(listener)
+        await listener.waitForExpectedEvents()
+        await asyncio.sleep(0.1)
+
+        assert [ event.getUserId() for event in listener.events ] == [ '1', '2', '3' ]
+
+        await backingDatabase.close()
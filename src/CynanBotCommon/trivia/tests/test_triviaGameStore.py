@@ -321,3 +321,110 @@ class TriviaGameStoreTests():
     def test_sanity(self):
         assert self.triviaGameStore is not None
         assert isinstance(self.triviaGameStore, TriviaGameStore)
+
+
+class TestTriviaGameStore():
+
+    question: AbsTriviaQuestion = TrueFalseTriviaQuestion(
+        correctAnswers = [ True ],
+        category = None,
+        categoryId = None,
+        question = 'Is stashiocat a member of the Chicago Bullies?',
+        triviaId = 'def456',
+        triviaDifficulty = TriviaDifficulty.UNKNOWN,
+        triviaSource = TriviaSource.OPEN_TRIVIA_DATABASE
+    )
+
+    normalGame: TriviaGameState = TriviaGameState(
+        triviaQuestion = question,
+        basePointsForWinning = 5,
+        pointsForWinning = 5,
+        secondsToLive = 60,
+        specialTriviaStatus = None,
+        actionId = 'abc123',
+        emote = '🍔',
+        twitchChannel = 'smCharles',
+        userId = 'Eddie123',
+        userName = 'Eddie'
+    )
+
+    superGame: SuperTriviaGameState = SuperTriviaGameState(
+        triviaQuestion = question,
+        basePointsForWinning = 25,
+        perUserAttempts = 2,
+        pointsForWinning = 25,
+        regularTriviaPointsForWinning = 5,
+        secondsToLive = 60,
+        toxicTriviaPunishmentMultiplier = 2,
+        specialTriviaStatus = None,
+        actionId = 'abc123',
+        emote = '🍔',
+        twitchChannel = 'smCharles'
+    )
+
+    @pytest.mark.asyncio
+    async def test_getNormalGame_ignoresCase(self):
+        triviaGameStore: TriviaGameStoreInterface = TriviaGameStore()
+        await triviaGameStore.add(self.normalGame)
+
+        game = await triviaGameStore.getNormalGame(
+            twitchChannel = 'SMCHARLES',
+            userId = 'eddie123'
+        )
+
+        assert game is self.normalGame
+
+    @pytest.mark.asyncio
+    async def test_getSuperGame_ignoresCase(self):
+        triviaGameStore: TriviaGameStoreInterface = TriviaGameStore()
+        await triviaGameStore.add(self.superGame)
+
+        game = await triviaGameStore.getSuperGame('SMCHARLES')
+        assert game is self.superGame
+
+        # the normal game lookup must not find the super game
+        game = await triviaGameStore.getNormalGame(
+            twitchChannel = 'smCharles',
+            userId = 'Eddie123'
+        )
+
+        assert game is None
+
+    @pytest.mark.asyncio
+    async def test_getTwitchChannelsWithActiveSuperGames(self):
+        triviaGameStore: TriviaGameStoreInterface = TriviaGameStore()
+        assert await triviaGameStore.getTwitchChannelsWithActiveSuperGames() == list()
+
+        await triviaGameStore.add(self.normalGame)
+        assert await triviaGameStore.getTwitchChannelsWithActiveSuperGames() == list()
+
+        await triviaGameStore.add(self.superGame)
+        assert await triviaGameStore.getTwitchChannelsWithActiveSuperGames() == [ 'smcharles' ]
+
+    @pytest.mark.asyncio
+    async def test_removeNormalGame_ignoresCase(self):
+        triviaGameStore: TriviaGameStoreInterface = TriviaGameStore()
+        await triviaGameStore.add(self.normalGame)
+        await triviaGameStore.add(self.superGame)
+
+        result = await triviaGameStore.removeNormalGame(
+            twitchChannel = 'SMCHARLES',
+            userId = 'EDDIE123'
+        )
+
+        assert result is True
+        assert await triviaGameStore.getNormalGames() == list()
+        assert await triviaGameStore.getSuperGames() == [ self.superGame ]
+
+    @pytest.mark.asyncio
+    async def test_removeSuperGame_ignoresCase(self):
+        triviaGameStore: TriviaGameStoreInterface = TriviaGameStore()
+        await triviaGameStore.add(self.normalGame)
+        await triviaGameStore.add(self.superGame)
+
+        result = await triviaGameStore.removeSuperGame('SMCHARLES')
+        assert result is True
+        assert await triviaGameStore.getAll() == [ self.normalGame ]
+
+        result = await triviaGameStore.removeSuperGame('smCharles')
+        assert result is False
@@ -0,0 +1,181 @@
+import asyncio
+import os
+from asyncio import AbstractEventLoop
+from typing import Any, Coroutine, List
+
+import pytest
+
+try:
+    from ...backgroundTaskHelper import BackgroundTaskHelper
+    from ...storage.backingDatabase import BackingDatabase
+    from ...storage.backingSqliteDatabase import BackingSqliteDatabase
+    from ...storage.jsonStaticReader import JsonStaticReader
+    from ...timber.timberStub import TimberStub
+    from ..triviaContentCode import TriviaContentCode
+    from ..triviaDifficulty import TriviaDifficulty
+    from ..triviaHistoryRepository import TriviaHistoryRepository
+    from ..triviaSettingsRepository import TriviaSettingsRepository
+    from ..triviaSource import TriviaSource
+    from ..trueFalseTriviaQuestion import TrueFalseTriviaQuestion
+except:
+    from backgroundTaskHelper import BackgroundTaskHelper
+    from storage.backingDatabase import BackingDatabase
+    from storage.backingSqliteDatabase import BackingSqliteDatabase
+    from storage.jsonStaticReader import JsonStaticReader
+    from timber.timberStub import TimberStub
+    from trivia.triviaContentCode import TriviaContentCode
+    from trivia.triviaDifficulty import TriviaDifficulty
+    from trivia.triviaHistoryRepository import TriviaHistoryRepository
+    from trivia.triviaSettingsRepository import TriviaSettingsRepository
+    from trivia.triviaSource import TriviaSource
+    from trivia.trueFalseTriviaQuestion import TrueFalseTriviaQuestion
+
+
+class TaskRecordingBackgroundTaskHelper(BackgroundTaskHelper):
+
+    def __init__(self, eventLoop: AbstractEventLoop):
+        super().__init__(eventLoop = eventLoop)
+        self.tasks: List[Any] = list()
+
+    async def cancelTasks(self):
+        for task in self.tasks:
+            task.cancel()
+
+        await asyncio.gather(*self.tasks, return_exceptions = True)
+
+    def createTask(self, coro: Coroutine):
+        self.tasks.append(self.getEventLoop().create_task(coro))
+
+
+class TestTriviaHistoryRepository():
+
+    question: TrueFalseTriviaQuestion = TrueFalseTriviaQuestion(
+        correctAnswers = [ False ],
+        category = 'Pokemon',
+        categoryId = None,
+        question = 'Is Tepig a Water type?',
+        triviaId = 'abc123',
+        triviaDifficulty = TriviaDifficulty.EASY,
+        triviaSource = TriviaSource.OPEN_TRIVIA_DATABASE
+    )
+
+    def __createBackingDatabase(self, tmp_path) -> BackingDatabase:
+        return BackingSqliteDatabase(
+            eventLoop = asyncio.get_running_loop(),
+            backingDatabaseFile = os.path.join(tmp_path, 'database.sqlite')
+        )
+
+    def __createRepository(
+        self,
+        backgroundTaskHelper: BackgroundTaskHelper,
+        backingDatabase: BackingDatabase
+    ) -> TriviaHistoryRepository:
+        # the write loop never gets to run during a test, so the tests flush explicitly
+        return TriviaHistoryRepository(
+            backgroundTaskHelper = backgroundTaskHelper,
+            backingDatabase = backingDatabase,
+            timber = TimberStub(),
+            triviaSettingsRepository = TriviaSettingsRepository(JsonStaticReader(dict())),
+            queueSleepTimeSeconds = 15
+        )
+
+    @pytest.mark.asyncio
+    async def test_flush_requeuesRecordsWhenWriteFails(self, tmp_path):
+        backgroundTaskHelper = TaskRecordingBackgroundTaskHelper(asyncio.get_running_loop())
+        backingDatabase = self.__createBackingDatabase(tmp_path)
+        repository = self.__createRepository(backgroundTaskHelper, backingDatabase)
+        assert await repository.verify(self.question, '🍔', 'smCharles') is TriviaContentCode.OK
+
+        connection = await backingDatabase.getConnection()
+        await connection.execute('ALTER TABLE triviahistory RENAME TO triviahistorybackup')
+
+        exception: Exception = None
+
+        try:
+            await repository.flush()
+        except Exception as e:
+            exception = e
+
+        assert exception is not None
+
+        await connection.execute('ALTER TABLE triviahistorybackup RENAME TO triviahistory')
+        await connection.close()
+        await repository.flush()
+
+        repository = self.__createRepository(backgroundTaskHelper, backingDatabase)
+        assert await repository.verify(self.question, '🍔', 'smCharles') is TriviaContentCode.REPEAT
+
+        await backgroundTaskHelper.cancelTasks()
+        await backingDatabase.close()
+
+    @pytest.mark.asyncio
+    async def test_getMostRecentTriviaQuestionDetails(self, tmp_path):
+        backgroundTaskHelper = TaskRecordingBackgroundTaskHelper(asyncio.get_running_loop())
+        backingDatabase = self.__createBackingDatabase(tmp_path)
+        repository = self.__createRepository(backgroundTaskHelper, backingDatabase)
+        assert await repository.verify(self.question, '🍔', 'smCharles') is TriviaContentCode.OK
+
+        reference = await repository.getMostRecentTriviaQuestionDetails('🍔', 'smCharles')
+        assert reference is not None
+        assert reference.getTriviaId() == 'abc123'
+        assert reference.getTriviaSource() is TriviaSource.OPEN_TRIVIA_DATABASE
+
+        await backgroundTaskHelper.cancelTasks()
+        await backingDatabase.close()
+
+    @pytest.mark.asyncio
+    async def test_peek_doesNotWriteHistory(self, tmp_path):
+        backgroundTaskHelper = TaskRecordingBackgroundTaskHelper(asyncio.get_running_loop())
+        backingDatabase = self.__createBackingDatabase(tmp_path)
+        repository = self.__createRepository(backgroundTaskHelper, backingDatabase)
+        assert await repository.peek(self.question, 'smCharles') is TriviaContentCode.OK
+        assert await repository.peek(self.question, 'smCharles') is TriviaContentCode.OK
+        assert await repository.verify(self.question, '🍔', 'smCharles') is TriviaContentCode.OK
+        assert await repository.peek(self.question, 'smCharles') is TriviaContentCode.REPEAT
+
+        await backgroundTaskHelper.cancelTasks()
+        await backingDatabase.close()
+
+    @pytest.mark.asyncio
+    async def test_verify_isPersistedToDatabase(self, tmp_path):
+        backgroundTaskHelper = TaskRecordingBackgroundTaskHelper(asyncio.get_running_loop())
+        backingDatabase = self.__createBackingDatabase(tmp_path)
+        repository = self.__createRepository(backgroundTaskHelper, backingDatabase)
+        assert await repository.verify(self.question, '🍔', 'smCharles') is TriviaContentCode.OK
+        await repository.flush()
+
+        repository = self.__createRepository(backgroundTaskHelper, backingDatabase)
+        assert await repository.verify(self.question, '🍔', 'smCharles') is TriviaContentCode.REPEAT
+
+        await backgroundTaskHelper.cancelTasks()
+        await backingDatabase.close()
+
+    @pytest.mark.asyncio
+    async def test_verify_withExpiredHistory(self, tmp_path):
+        backgroundTaskHelper = TaskRecordingBackgroundTaskHelper(asyncio.get_running_loop())
+        backingDatabase = self.__createBackingDatabase(tmp_path)
+        repository = self.__createRepository(backgroundTaskHelper, backingDatabase)
+        assert await repository.verify(self.question, '🍔', 'smCharles') is TriviaContentCode.OK
+        await repository.flush()
+
+        connection = await backingDatabase.getConnection()
+        await connection.execute('UPDATE triviahistory SET datetime = $1', '2020-01-01T00:00:00+00:00')
+        await connection.close()
+
+        repository = self.__createRepository(backgroundTaskHelper, backingDatabase)
+        assert await repository.verify(self.question, '🍔', 'smCharles') is TriviaContentCode.OK
+
+        await backgroundTaskHelper.cancelTasks()
+        await backingDatabase.close()
+
+    @pytest.mark.asyncio
+    async def test_verify_withDifferentTwitchChannels(self, tmp_path):
+        backgroundTaskHelper = TaskRecordingBackgroundTaskHelper(asyncio.get_running_loop())
+        backingDatabase = self.__createBackingDatabase(tmp_path)
+        repository = self.__createRepository(backgroundTaskHelper, backingDatabase)
+        assert await repository.verify(self.question, '🍔', 'smCharles') is TriviaContentCode.OK
+        assert await repository.verify(self.question, '🍔', 'stashiocat') is TriviaContentCode.OK
+        assert await repository.verify(self.question, '🍔', 'SMCHARLES') is TriviaContentCode.REPEAT
+
+        await backgroundTaskHelper.cancelTasks()
+        await backingDatabase.close()
@@ -0,0 +1,199 @@
+import asyncio
+import os
+
+import pytest
+
+try:
+    from ...storage.backingDatabase import BackingDatabase
+    from ...storage.backingSqliteDatabase import BackingSqliteDatabase
+    from ...timber.timberStub import TimberStub
+    from ..multipleChoiceTriviaQuestion import MultipleChoiceTriviaQuestion
+    from ..questionAnswerTriviaConditions import \
+        QuestionAnswerTriviaConditions
+    from ..questionAnswerTriviaQuestion import QuestionAnswerTriviaQuestion
+    from ..triviaDifficulty import TriviaDifficulty
+    from ..triviaFetchOptions import TriviaFetchOptions
+    from ..triviaQuestionCache import TriviaQuestionCache
+    from ..triviaSource import TriviaSource
+    from ..triviaType import TriviaType
+    from ..trueFalseTriviaQuestion import TrueFalseTriviaQuestion
+except:
+    from storage.backingDatabase import BackingDatabase
+    from storage.backingSqliteDatabase import BackingSqliteDatabase
+    from timber.timberStub import TimberStub
+    from trivia.multipleChoiceTriviaQuestion import \
+        MultipleChoiceTriviaQuestion
+    from trivia.questionAnswerTriviaConditions import \
+        QuestionAnswerTriviaConditions
+    from trivia.questionAnswerTriviaQuestion import \
+        QuestionAnswerTriviaQuestion
+    from trivia.triviaDifficulty import TriviaDifficulty
+    from trivia.triviaFetchOptions import TriviaFetchOptions
+    from trivia.triviaQuestionCache import TriviaQuestionCache
+    from trivia.triviaSource import TriviaSource
+    from trivia.triviaType import TriviaType
+    from trivia.trueFalseTriviaQuestion import TrueFalseTriviaQuestion
+
+
+class TestTriviaQuestionCache():
+
+    def __createBackingDatabase(self, tmp_path) -> BackingDatabase:
+        return BackingSqliteDatabase(
+            eventLoop = asyncio.get_running_loop(),
+            backingDatabaseFile = os.path.join(tmp_path, 'database.sqlite')
+        )
+
+    def __createCache(
+        self,
+        backingDatabase: BackingDatabase,
+        maxSize: int = 100,
+        evictionInterval: int = 1
+    ) -> TriviaQuestionCache:
+        return TriviaQuestionCache(
+            backingDatabase = backingDatabase,
+            timber = TimberStub(),
+            maxSize = maxSize,
+            evictionInterval = evictionInterval
+        )
+
+    def __createTrueFalseQuestion(self, triviaId: str) -> TrueFalseTriviaQuestion:
+        return TrueFalseTriviaQuestion(
+            correctAnswers = [ False ],
+            category = 'Pokemon',
+            categoryId = None,
+            question = f'Is Tepig a Water type? ({triviaId})',
+            triviaId = triviaId,
+            triviaDifficulty = TriviaDifficulty.EASY,
+            triviaSource = TriviaSource.OPEN_TRIVIA_DATABASE
+        )
+
+    @pytest.mark.asyncio
+    async def test_add_evictsOldestQuestionsPastMaxSize(self, tmp_path):
+        backingDatabase = self.__createBackingDatabase(tmp_path)
+        cache = self.__createCache(backingDatabase, maxSize = 2)
+
+        await cache.add(self.__createTrueFalseQuestion('abc123'))
+        await asyncio.sleep(0.01)
+        await cache.add(self.__createTrueFalseQuestion('def456'))
+        await asyncio.sleep(0.01)
+        await cache.add(self.__createTrueFalseQuestion('ghi789'))
+
+        triviaIds = set()
+
+        for _ in range(50):
+            question = await cache.fetchRandomQuestion(TriviaFetchOptions('smCharles'))
+            triviaIds.add(question.getTriviaId())
+
+        assert triviaIds == { 'def456', 'ghi789' }
+
+        await backingDatabase.close()
+
+    @pytest.mark.asyncio
+    async def test_add_evictsOnlyEveryEvictionInterval(self, tmp_path):
+        backingDatabase = self.__createBackingDatabase(tmp_path)
+        cache = self.__createCache(backingDatabase, maxSize = 1, evictionInterval = 3)
+
+        await cache.add(self.__createTrueFalseQuestion('abc123'))
+        await asyncio.sleep(0.01)
+        await cache.add(self.__createTrueFalseQuestion('def456'))
+
+        triviaIds = set()
+
+        for _ in range(50):
+            question = await cache.fetchRandomQuestion(TriviaFetchOptions('smCharles'))
+            triviaIds.add(question.getTriviaId())
+
+        assert triviaIds == { 'abc123', 'def456' }
+
+        await asyncio.sleep(0.01)
+        await cache.add(self.__createTrueFalseQuestion('ghi789'))
+
+        for _ in range(10):
+            question = await cache.fetchRandomQuestion(TriviaFetchOptions('smCharles'))
+            assert question.getTriviaId() == 'ghi789'
+
+        await backingDatabase.close()
+
+    @pytest.mark.asyncio
+    async def test_fetchRandomQuestion_withEmptyCache(self, tmp_path):
+        backingDatabase = self.__createBackingDatabase(tmp_path)
+        cache = self.__createCache(backingDatabase)
+        question = await cache.fetchRandomQuestion(TriviaFetchOptions('smCharles'))
+        assert question is None
+
+        await backingDatabase.close()
+
+    @pytest.mark.asyncio
+    async def test_fetchRandomQuestion_withMultipleChoiceQuestion(self, tmp_path):
+        backingDatabase = self.__createBackingDatabase(tmp_path)
+        cache = self.__createCache(backingDatabase)
+
+        await cache.add(MultipleChoiceTriviaQuestion(
+            correctAnswers = [ 'Oshawott' ],
+            multipleChoiceResponses = [ 'Oshawott', 'Snivy', 'Tepig' ],
+            category = 'Pokemon',
+            categoryId = None,
+            question = 'Which of these is a Water type?',
+            triviaId = 'abc123',
+            triviaDifficulty = TriviaDifficulty.MEDIUM,
+            triviaSource = TriviaSource.WILL_FRY_TRIVIA
+        ))
+
+        question = await cache.fetchRandomQuestion(TriviaFetchOptions('smCharles'))
+        assert isinstance(question, MultipleChoiceTriviaQuestion)
+        assert question.getCorrectAnswers() == [ '[A] Oshawott' ]
+        assert question.getResponses() == [ 'Oshawott', 'Snivy', 'Tepig' ]
+        assert question.getTriviaDifficulty() is TriviaDifficulty.MEDIUM
+        assert question.getTriviaId() == 'abc123'
+        assert question.getTriviaSource() is TriviaSource.WILL_FRY_TRIVIA
+
+        await backingDatabase.close()
+
+    @pytest.mark.asyncio
+    async def test_fetchRandomQuestion_withQuestionAnswerQuestion(self, tmp_path):
+        backingDatabase = self.__createBackingDatabase(tmp_path)
+        cache = self.__createCache(backingDatabase)
+        await cache.add(self.__createTrueFalseQuestion('def456'))
+
+        await cache.add(QuestionAnswerTriviaQuestion(
+            correctAnswers = [ 'Oshawott' ],
+            cleanedCorrectAnswers = [ 'oshawott' ],
+            category = 'Pokemon',
+            categoryId = None,
+            question = 'This Water type is the Unova region\'s starter.',
+            triviaId = 'abc123',
+            triviaDifficulty = TriviaDifficulty.UNKNOWN,
+            triviaSource = TriviaSource.J_SERVICE
+        ))
+
+        question = await cache.fetchRandomQuestion(TriviaFetchOptions(
+            twitchChannel = 'smCharles',
+            questionAnswerTriviaConditions = QuestionAnswerTriviaConditions.REQUIRED
+        ))
+
+        assert isinstance(question, QuestionAnswerTriviaQuestion)
+        assert question.getCorrectAnswers() == [ 'Oshawott' ]
+        assert question.getCleanedCorrectAnswers() == [ 'oshawott' ]
+
+        question = await cache.fetchRandomQuestion(TriviaFetchOptions(
+            twitchChannel = 'smCharles',
+            questionAnswerTriviaConditions = QuestionAnswerTriviaConditions.NOT_ALLOWED
+        ))
+
+        assert isinstance(question, TrueFalseTriviaQuestion)
+        assert question.getTriviaType() is TriviaType.TRUE_FALSE
+
+        await backingDatabase.close()
+
+    @pytest.mark.asyncio
+    async def test_fetchRandomQuestion_withTrueFalseQuestion(self, tmp_path):
+        backingDatabase = self.__createBackingDatabase(tmp_path)
+        cache = self.__createCache(backingDatabase)
+        await cache.add(self.__createTrueFalseQuestion('abc123'))
+
+        question = await cache.fetchRandomQuestion(TriviaFetchOptions('smCharles'))
+        assert isinstance(question, TrueFalseTriviaQuestion)
+        assert question.getCorrectAnswerBools() == [ False ]
+        assert question.getTriviaId() == 'abc123'
+
+        await backingDatabase.close()
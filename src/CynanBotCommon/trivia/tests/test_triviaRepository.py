@@ -0,0 +1,507 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional, Set
+
+import pytest
+
+try:
+    from ...backgroundTaskHelper import BackgroundTaskHelper
+    from ...storage.jsonStaticReader import JsonStaticReader
+    from ...timber.timberStub import TimberStub
+    from ...twitch.twitchHandleProviderInterface import \
+        TwitchHandleProviderInterface
+    from ..absTriviaQuestion import AbsTriviaQuestion
+    from ..questionAnswerTriviaConditions import \
+        QuestionAnswerTriviaConditions
+    from ..questionAnswerTriviaQuestion import QuestionAnswerTriviaQuestion
+    from ..triviaContentCode import TriviaContentCode
+    from ..triviaDifficulty import TriviaDifficulty
+    from ..triviaExceptions import GenericTriviaNetworkException
+    from ..triviaFetchOptions import TriviaFetchOptions
+    from ..triviaRepositories.bongoTriviaQuestionRepository import \
+        BongoTriviaQuestionRepository
+    from ..triviaRepositories.funtoonTriviaQuestionRepository import \
+        FuntoonTriviaQuestionRepository
+    from ..triviaRepositories.jServiceTriviaQuestionRepository import \
+        JServiceTriviaQuestionRepository
+    from ..triviaRepositories.millionaireTriviaQuestionRepository import \
+        MillionaireTriviaQuestionRepository
+    from ..triviaRepositories.openTriviaDatabaseTriviaQuestionRepository import \
+        OpenTriviaDatabaseTriviaQuestionRepository
+    from ..triviaRepositories.openTriviaQaTriviaQuestionRepository import \
+        OpenTriviaQaTriviaQuestionRepository
+    from ..triviaRepositories.pkmnTriviaQuestionRepository import \
+        PkmnTriviaQuestionRepository
+    from ..triviaRepositories.triviaDatabaseTriviaQuestionRepository import \
+        TriviaDatabaseTriviaQuestionRepository
+    from ..triviaRepositories.triviaQuestionCompanyTriviaQuestionRepository import \
+        TriviaQuestionCompanyTriviaQuestionRepository
+    from ..triviaRepositories.triviaRepository import TriviaRepository
+    from ..triviaRepositories.willFryTriviaQuestionRepository import \
+        WillFryTriviaQuestionRepository
+    from ..triviaRepositories.wwtbamTriviaQuestionRepository import \
+        WwtbamTriviaQuestionRepository
+    from ..triviaSettingsRepository import TriviaSettingsRepository
+    from ..triviaSource import TriviaSource
+    from ..triviaSourceInstabilityHelper import TriviaSourceInstabilityHelper
+    from ..triviaType import TriviaType
+    from ..triviaVerifierInterface import TriviaVerifierInterface
+    from ..trueFalseTriviaQuestion import TrueFalseTriviaQuestion
+except:
+    from backgroundTaskHelper import BackgroundTaskHelper
+    from storage.jsonStaticReader import JsonStaticReader
+    from timber.timberStub import TimberStub
+
+    from trivia.absTriviaQuestion import AbsTriviaQuestion
+    from trivia.questionAnswerTriviaConditions import \
+        QuestionAnswerTriviaConditions
+    from trivia.questionAnswerTriviaQuestion import \
+        QuestionAnswerTriviaQuestion
+    from trivia.triviaContentCode import TriviaContentCode
+    from trivia.triviaDifficulty import TriviaDifficulty
+    from trivia.triviaExceptions import GenericTriviaNetworkException
+    from trivia.triviaFetchOptions import TriviaFetchOptions
+    from trivia.triviaRepositories.bongoTriviaQuestionRepository import \
+        BongoTriviaQuestionRepository
+    from trivia.triviaRepositories.funtoonTriviaQuestionRepository import \
+        FuntoonTriviaQuestionRepository
+    from trivia.triviaRepositories.jServiceTriviaQuestionRepository import \
+        JServiceTriviaQuestionRepository
+    from trivia.triviaRepositories.millionaireTriviaQuestionRepository import \
+        MillionaireTriviaQuestionRepository
+    from trivia.triviaRepositories.openTriviaDatabaseTriviaQuestionRepository import \
+        OpenTriviaDatabaseTriviaQuestionRepository
+    from trivia.triviaRepositories.openTriviaQaTriviaQuestionRepository import \
+        OpenTriviaQaTriviaQuestionRepository
+    from trivia.triviaRepositories.pkmnTriviaQuestionRepository import \
+        PkmnTriviaQuestionRepository
+    from trivia.triviaRepositories.triviaDatabaseTriviaQuestionRepository import \
+        TriviaDatabaseTriviaQuestionRepository
+    from trivia.triviaRepositories.triviaQuestionCompanyTriviaQuestionRepository import \
+        TriviaQuestionCompanyTriviaQuestionRepository
+    from trivia.triviaRepositories.triviaRepository import TriviaRepository
+    from trivia.triviaRepositories.willFryTriviaQuestionRepository import \
+        WillFryTriviaQuestionRepository
+    from trivia.triviaRepositories.wwtbamTriviaQuestionRepository import \
+        WwtbamTriviaQuestionRepository
+    from trivia.triviaSettingsRepository import TriviaSettingsRepository
+    from trivia.triviaSource import TriviaSource
+    from trivia.triviaSourceInstabilityHelper import \
+        TriviaSourceInstabilityHelper
+    from trivia.triviaType import TriviaType
+    from trivia.triviaVerifierInterface import TriviaVerifierInterface
+    from trivia.trueFalseTriviaQuestion import TrueFalseTriviaQuestion
+
+    from twitch.twitchHandleProviderInterface import \
+        TwitchHandleProviderInterface
+
+
+# Listed before the real trivia question repository in each fake's bases, so that TriviaRepository's
+# isinstance() checks still pass while none of the real repository's own setup ever runs.
+class FakeTriviaQuestionRepository():
+
+    def __init__(
+        self,
+        triviaSource: TriviaSource,
+        triviaType: TriviaType = TriviaType.TRUE_FALSE,
+        failedFetchCount: int = 0
+    ):
+        self.__triviaSource: TriviaSource = triviaSource
+        self.__triviaType: TriviaType = triviaType
+        self.failedFetchCount: int = failedFetchCount
+        self.fetchCount: int = 0
+        self.concurrentFetchCount: int = 0
+        self.maxConcurrentFetchCount: int = 0
+
+    async def fetchTriviaQuestion(self, fetchOptions: TriviaFetchOptions) -> AbsTriviaQuestion:
+        self.fetchCount = self.fetchCount + 1
+        fetchCount = self.fetchCount
+        self.concurrentFetchCount = self.concurrentFetchCount + 1
+        self.maxConcurrentFetchCount = max(self.maxConcurrentFetchCount, self.concurrentFetchCount)
+
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            self.concurrentFetchCount = self.concurrentFetchCount - 1
+
+        if fetchCount <= self.failedFetchCount:
+            raise GenericTriviaNetworkException(self.__triviaSource)
+
+        triviaId = f'{self.__triviaSource.toStr()}{fetchCount}'.lower()
+
+        if self.__triviaType is TriviaType.QUESTION_ANSWER:
+            return QuestionAnswerTriviaQuestion(
+                correctAnswers = [ 'Mew' ],
+                cleanedCorrectAnswers = [ 'mew' ],
+                category = 'Pokemon',
+                categoryId = None,
+                question = f'Which Pokemon is number 151? ({triviaId})',
+                triviaId = triviaId,
+                triviaDifficulty = TriviaDifficulty.EASY,
+                triviaSource = self.__triviaSource
+            )
+        else:
+            return TrueFalseTriviaQuestion(
+                correctAnswers = [ False ],
+                category = 'Pokemon',
+                categoryId = None,
+                question = f'Is Tepig a Water type? ({triviaId})',
+                triviaId = triviaId,
+                triviaDifficulty = TriviaDifficulty.EASY,
+                triviaSource = self.__triviaSource
+            )
+
+    def getSupportedTriviaTypes(self) -> Set[TriviaType]:
+        return { self.__triviaType }
+
+    def getTriviaSource(self) -> TriviaSource:
+        return self.__triviaSource
+
+    async def hasQuestionSetAvailable(self) -> bool:
+        return True
+
+
+class FakeBongoTriviaQuestionRepository(FakeTriviaQuestionRepository, BongoTriviaQuestionRepository):
+    pass
+
+
+class FakeFuntoonTriviaQuestionRepository(FakeTriviaQuestionRepository, FuntoonTriviaQuestionRepository):
+    pass
+
+
+class FakeJServiceTriviaQuestionRepository(FakeTriviaQuestionRepository, JServiceTriviaQuestionRepository):
+    pass
+
+
+class FakeMillionaireTriviaQuestionRepository(FakeTriviaQuestionRepository, MillionaireTriviaQuestionRepository):
+    pass
+
+
+class FakeOpenTriviaDatabaseTriviaQuestionRepository(FakeTriviaQuestionRepository, OpenTriviaDatabaseTriviaQuestionRepository):
+    pass
+
+
+class FakeOpenTriviaQaTriviaQuestionRepository(FakeTriviaQuestionRepository, OpenTriviaQaTriviaQuestionRepository):
+    pass
+
+
+class FakePkmnTriviaQuestionRepository(FakeTriviaQuestionRepository, PkmnTriviaQuestionRepository):
+    pass
+
+
+class FakeTriviaDatabaseTriviaQuestionRepository(FakeTriviaQuestionRepository, TriviaDatabaseTriviaQuestionRepository):
+    pass
+
+
+class FakeTriviaQuestionCompanyTriviaQuestionRepository(FakeTriviaQuestionRepository, TriviaQuestionCompanyTriviaQuestionRepository):
+    pass
+
+
+class FakeWillFryTriviaQuestionRepository(FakeTriviaQuestionRepository, WillFryTriviaQuestionRepository):
+    pass
+
+
+class FakeWwtbamTriviaQuestionRepository(FakeTriviaQuestionRepository, WwtbamTriviaQuestionRepository):
+    pass
+
+
+class FakeTriviaVerifier(TriviaVerifierInterface):
+
+    def __init__(self, triviaHistory: Optional[Dict[str, Set[str]]] = None):
+        if triviaHistory is None:
+            triviaHistory = dict()
+
+        self.triviaHistory: Dict[str, Set[str]] = triviaHistory
+
+    async def checkContent(
+        self,
+        question: Optional[AbsTriviaQuestion],
+        triviaFetchOptions: TriviaFetchOptions
+    ) -> TriviaContentCode:
+        if question is None:
+            return TriviaContentCode.IS_NONE
+        else:
+            return TriviaContentCode.OK
+
+    async def checkHistory(
+        self,
+        question: AbsTriviaQuestion,
+        emote: str,
+        triviaFetchOptions: TriviaFetchOptions
+    ) -> TriviaContentCode:
+        triviaContentCode = await self.peekHistory(question, triviaFetchOptions)
+
+        if triviaContentCode is TriviaContentCode.OK:
+            twitchChannel = triviaFetchOptions.getTwitchChannel().lower()
+            self.triviaHistory.setdefault(twitchChannel, set()).add(question.getTriviaId())
+
+        return triviaContentCode
+
+    async def peekHistory(
+        self,
+        question: AbsTriviaQuestion,
+        triviaFetchOptions: TriviaFetchOptions
+    ) -> TriviaContentCode:
+        twitchChannel = triviaFetchOptions.getTwitchChannel().lower()
+
+        if question.getTriviaId() in self.triviaHistory.get(twitchChannel, set()):
+            return TriviaContentCode.REPEAT
+        else:
+            return TriviaContentCode.OK
+
+
+class FakeTwitchHandleProvider(TwitchHandleProviderInterface):
+
+    async def getTwitchHandle(self) -> str:
+        return 'smCharles'
+
+
+class TestTriviaRepository():
+
+    def __createTriviaRepository(
+        self,
+        openTriviaDatabaseTriviaQuestionRepository: FakeOpenTriviaDatabaseTriviaQuestionRepository,
+        maxSuperTriviaQuestionSpoolSize: int = 0,
+        maxTriviaQuestionSpoolSize: int = 5,
+        triviaVerifier: Optional[TriviaVerifierInterface] = None,
+        jServiceTriviaQuestionRepository: Optional[FakeJServiceTriviaQuestionRepository] = None,
+        willFryTriviaQuestionRepository: Optional[FakeWillFryTriviaQuestionRepository] = None,
+        spoolIdleTimeToLive: timedelta = timedelta(hours = 1)
+    ) -> TriviaRepository:
+        triviaSources = {
+            'open_trivia_database': {
+                'is_enabled': True
+            }
+        }
+
+        if triviaVerifier is None:
+            triviaVerifier = FakeTriviaVerifier()
+
+        if jServiceTriviaQuestionRepository is not None:
+            triviaSources['j_service'] = { 'is_enabled': True }
+
+        if willFryTriviaQuestionRepository is None:
+            willFryTriviaQuestionRepository = FakeWillFryTriviaQuestionRepository(TriviaSource.WILL_FRY_TRIVIA)
+        else:
+            triviaSources['will_fry_trivia'] = { 'is_enabled': True }
+
+        triviaSettingsRepository = TriviaSettingsRepository(JsonStaticReader({
+            'max_super_trivia_question_spool_size': maxSuperTriviaQuestionSpoolSize,
+            'max_trivia_question_spool_size': maxTriviaQuestionSpoolSize,
+            'trivia_source_instability_threshold': 100,
+            'trivia_sources': triviaSources
+        }))
+
+        return TriviaRepository(
+            backgroundTaskHelper = BackgroundTaskHelper(eventLoop = asyncio.get_running_loop()),
+            bongoTriviaQuestionRepository = FakeBongoTriviaQuestionRepository(TriviaSource.BONGO),
+            funtoonTriviaQuestionRepository = FakeFuntoonTriviaQuestionRepository(TriviaSource.FUNTOON),
+            jokeTriviaQuestionRepository = None,
+            jServiceTriviaQuestionRepository = jServiceTriviaQuestionRepository,
+            lotrTriviaQuestionRepository = None,
+            millionaireTriviaQuestionRepository = FakeMillionaireTriviaQuestionRepository(TriviaSource.MILLIONAIRE),
+            quizApiTriviaQuestionRepository = None,
+            openTriviaDatabaseTriviaQuestionRepository = openTriviaDatabaseTriviaQuestionRepository,
+            openTriviaQaTriviaQuestionRepository = FakeOpenTriviaQaTriviaQuestionRepository(TriviaSource.OPEN_TRIVIA_QA),
+            pkmnTriviaQuestionRepository = FakePkmnTriviaQuestionRepository(TriviaSource.POKE_API),
+            timber = TimberStub(),
+            triviaDatabaseTriviaQuestionRepository = FakeTriviaDatabaseTriviaQuestionRepository(TriviaSource.TRIVIA_DATABASE),
+            triviaQuestionCompanyTriviaQuestionRepository = FakeTriviaQuestionCompanyTriviaQuestionRepository(TriviaSource.THE_QUESTION_CO),
+            triviaSettingsRepository = triviaSettingsRepository,
+            triviaSourceInstabilityHelper = TriviaSourceInstabilityHelper(TimberStub()),
+            triviaVerifier = triviaVerifier,
+            twitchHandleProvider = FakeTwitchHandleProvider(),
+            willFryTriviaQuestionRepository = willFryTriviaQuestionRepository,
+            wwtbamTriviaQuestionRepository = FakeWwtbamTriviaQuestionRepository(TriviaSource.WWTBAM),
+            maxConcurrentSpoolFetchesPerSource = 2,
+            spoolIdleTimeToLive = spoolIdleTimeToLive
+        )
+
+    def __getSpoolSize(self, triviaRepository: TriviaRepository, twitchChannel: str) -> int:
+        triviaQuestionSpool = triviaRepository._TriviaRepository__triviaQuestionSpools.get(twitchChannel.lower())
+
+        if triviaQuestionSpool is None:
+            return 0
+        else:
+            return triviaQuestionSpool.qsize()
+
+    def __getSuperSpoolSize(self, triviaRepository: TriviaRepository, twitchChannel: str) -> int:
+        superTriviaQuestionSpool = triviaRepository._TriviaRepository__superTriviaQuestionSpools.get(twitchChannel.lower())
+
+        if superTriviaQuestionSpool is None:
+            return 0
+        else:
+            return superTriviaQuestionSpool.qsize()
+
+    async def __refillTriviaQuestionSpools(self, triviaRepository: TriviaRepository) -> int:
+        return await triviaRepository._TriviaRepository__refillTriviaQuestionSpools()
+
+    async def __retrieveSpooledTriviaQuestion(
+        self,
+        triviaRepository: TriviaRepository,
+        triviaFetchOptions: TriviaFetchOptions
+    ) -> Optional[AbsTriviaQuestion]:
+        return await triviaRepository._TriviaRepository__retrieveSpooledTriviaQuestion(triviaFetchOptions)
+
+    @pytest.mark.asyncio
+    async def test_refillTriviaQuestionSpools_fillsEverySpoolToItsTarget(self):
+        openTriviaDatabaseTriviaQuestionRepository = FakeOpenTriviaDatabaseTriviaQuestionRepository(TriviaSource.OPEN_TRIVIA_DATABASE)
+        jServiceTriviaQuestionRepository = FakeJServiceTriviaQuestionRepository(TriviaSource.J_SERVICE, TriviaType.QUESTION_ANSWER)
+
+        triviaRepository = self.__createTriviaRepository(
+            openTriviaDatabaseTriviaQuestionRepository = openTriviaDatabaseTriviaQuestionRepository,
+            maxSuperTriviaQuestionSpoolSize = 2,
+            maxTriviaQuestionSpoolSize = 3,
+            jServiceTriviaQuestionRepository = jServiceTriviaQuestionRepository
+        )
+
+        assert await self.__refillTriviaQuestionSpools(triviaRepository) == 5
+        assert self.__getSpoolSize(triviaRepository, 'smCharles') == 3
+        assert self.__getSuperSpoolSize(triviaRepository, 'smCharles') == 2
+
+        # another channel asking for trivia gets its own spools, and only what's missing is fetched
+        assert await self.__retrieveSpooledTriviaQuestion(triviaRepository, TriviaFetchOptions('stashiocat')) is None
+        assert await self.__retrieveSpooledTriviaQuestion(triviaRepository, TriviaFetchOptions(
+            twitchChannel = 'stashiocat',
+            questionAnswerTriviaConditions = QuestionAnswerTriviaConditions.REQUIRED
+        )) is None
+        assert await self.__retrieveSpooledTriviaQuestion(triviaRepository, TriviaFetchOptions('smCharles')) is not None
+
+        assert await self.__refillTriviaQuestionSpools(triviaRepository) == 6
+        assert self.__getSpoolSize(triviaRepository, 'smCharles') == 3
+        assert self.__getSpoolSize(triviaRepository, 'stashiocat') == 3
+        assert self.__getSuperSpoolSize(triviaRepository, 'smCharles') == 2
+        assert self.__getSuperSpoolSize(triviaRepository, 'stashiocat') == 2
+
+        assert await self.__refillTriviaQuestionSpools(triviaRepository) == 0
+        assert openTriviaDatabaseTriviaQuestionRepository.fetchCount == 7
+        assert jServiceTriviaQuestionRepository.fetchCount == 4
+
+    @pytest.mark.asyncio
+    async def test_refillTriviaQuestionSpools_limitsConcurrentFetchesPerTriviaSource(self):
+        openTriviaDatabaseTriviaQuestionRepository = FakeOpenTriviaDatabaseTriviaQuestionRepository(TriviaSource.OPEN_TRIVIA_DATABASE)
+
+        triviaRepository = self.__createTriviaRepository(
+            openTriviaDatabaseTriviaQuestionRepository = openTriviaDatabaseTriviaQuestionRepository,
+            maxTriviaQuestionSpoolSize = 6
+        )
+
+        assert await self.__refillTriviaQuestionSpools(triviaRepository) == 6
+        assert openTriviaDatabaseTriviaQuestionRepository.fetchCount == 6
+        assert openTriviaDatabaseTriviaQuestionRepository.maxConcurrentFetchCount == 2
+
+    @pytest.mark.asyncio
+    async def test_refillTriviaQuestionSpools_limitsConcurrentFetchesWithManyTriviaSources(self):
+        openTriviaDatabaseTriviaQuestionRepository = FakeOpenTriviaDatabaseTriviaQuestionRepository(TriviaSource.OPEN_TRIVIA_DATABASE)
+        willFryTriviaQuestionRepository = FakeWillFryTriviaQuestionRepository(TriviaSource.WILL_FRY_TRIVIA)
+
+        triviaRepository = self.__createTriviaRepository(
+            openTriviaDatabaseTriviaQuestionRepository = openTriviaDatabaseTriviaQuestionRepository,
+            maxTriviaQuestionSpoolSize = 8,
+            willFryTriviaQuestionRepository = willFryTriviaQuestionRepository
+        )
+
+        assert await self.__refillTriviaQuestionSpools(triviaRepository) == 8
+        assert openTriviaDatabaseTriviaQuestionRepository.fetchCount + willFryTriviaQuestionRepository.fetchCount == 8
+        assert openTriviaDatabaseTriviaQuestionRepository.maxConcurrentFetchCount <= 2
+        assert willFryTriviaQuestionRepository.maxConcurrentFetchCount <= 2
+
+    @pytest.mark.asyncio
+    async def test_refillTriviaQuestionSpools_removesIdleTriviaQuestionSpools(self):
+        openTriviaDatabaseTriviaQuestionRepository = FakeOpenTriviaDatabaseTriviaQuestionRepository(TriviaSource.OPEN_TRIVIA_DATABASE)
+        jServiceTriviaQuestionRepository = FakeJServiceTriviaQuestionRepository(TriviaSource.J_SERVICE, TriviaType.QUESTION_ANSWER)
+
+        triviaRepository = self.__createTriviaRepository(
+            openTriviaDatabaseTriviaQuestionRepository = openTriviaDatabaseTriviaQuestionRepository,
+            maxSuperTriviaQuestionSpoolSize = 1,
+            maxTriviaQuestionSpoolSize = 1,
+            jServiceTriviaQuestionRepository = jServiceTriviaQuestionRepository,
+            spoolIdleTimeToLive = timedelta(minutes = 10)
+        )
+
+        for twitchChannel in [ 'imyt', 'stashiocat' ]:
+            await self.__retrieveSpooledTriviaQuestion(triviaRepository, TriviaFetchOptions(twitchChannel))
+            await self.__retrieveSpooledTriviaQuestion(triviaRepository, TriviaFetchOptions(
+                twitchChannel = twitchChannel,
+                questionAnswerTriviaConditions = QuestionAnswerTriviaConditions.REQUIRED
+            ))
+
+        assert await self.__refillTriviaQuestionSpools(triviaRepository) == 6
+
+        # stashiocat last asked for trivia longer ago than spoolIdleTimeToLive
+        spoolAccessTimes: Dict[str, datetime] = triviaRepository._TriviaRepository__spoolAccessTimes
+        spoolAccessTimes['stashiocat'] = datetime.now(timezone.utc) - timedelta(minutes = 11)
+
+        assert await self.__refillTriviaQuestionSpools(triviaRepository) == 0
+
+        superTriviaQuestionSpools = triviaRepository._TriviaRepository__superTriviaQuestionSpools
+        triviaQuestionSpools = triviaRepository._TriviaRepository__triviaQuestionSpools
+
+        # the bot's own channel is never idle, even though it never asked for trivia itself
+        assert set(superTriviaQuestionSpools.keys()) == { 'imyt', 'smcharles' }
+        assert set(triviaQuestionSpools.keys()) == { 'imyt', 'smcharles' }
+        assert 'stashiocat' not in spoolAccessTimes
+
+    @pytest.mark.asyncio
+    async def test_refillTriviaQuestionSpools_throwsOutRepeatsForOnlyThatTwitchChannel(self):
+        openTriviaDatabaseTriviaQuestionRepository = FakeOpenTriviaDatabaseTriviaQuestionRepository(TriviaSource.OPEN_TRIVIA_DATABASE)
+        firstTriviaIds = { f'{TriviaSource.OPEN_TRIVIA_DATABASE.toStr()}{index}'.lower() for index in range(1, 5) }
+
+        # every question in the first round of fetches is a recent repeat for stashiocat
+        triviaVerifier = FakeTriviaVerifier({
+            'stashiocat': set(firstTriviaIds)
+        })
+
+        triviaRepository = self.__createTriviaRepository(
+            openTriviaDatabaseTriviaQuestionRepository = openTriviaDatabaseTriviaQuestionRepository,
+            maxTriviaQuestionSpoolSize = 2,
+            triviaVerifier = triviaVerifier
+        )
+
+        await self.__retrieveSpooledTriviaQuestion(triviaRepository, TriviaFetchOptions('stashiocat'))
+
+        assert await self.__refillTriviaQuestionSpools(triviaRepository) == 2
+        assert openTriviaDatabaseTriviaQuestionRepository.fetchCount == 4
+        assert self.__getSpoolSize(triviaRepository, 'smCharles') == 2
+        assert self.__getSpoolSize(triviaRepository, 'stashiocat') == 0
+
+        assert await self.__refillTriviaQuestionSpools(triviaRepository) == 2
+        assert openTriviaDatabaseTriviaQuestionRepository.fetchCount == 6
+
+        smCharlesTriviaIds: Set[str] = set()
+        stashiocatTriviaIds: Set[str] = set()
+
+        for _ in range(2):
+            smCharlesTriviaIds.add((await self.__retrieveSpooledTriviaQuestion(triviaRepository, TriviaFetchOptions('smCharles'))).getTriviaId())
+            stashiocatTriviaIds.add((await self.__retrieveSpooledTriviaQuestion(triviaRepository, TriviaFetchOptions('stashiocat'))).getTriviaId())
+
+        assert smCharlesTriviaIds.issubset(firstTriviaIds)
+        assert stashiocatTriviaIds.isdisjoint(firstTriviaIds)
+
+        # spooling only peeks at the trivia history, it never records anything in it
+        assert triviaVerifier.triviaHistory == { 'stashiocat': firstTriviaIds }
+
+    @pytest.mark.asyncio
+    async def test_startSpooler_goesRightAroundAgainAfterSpoolingSomething(self):
+        # half of the first round of fetches fail, and the spooler's loop sleep time is at least
+        # 15 seconds, so the spool only fills up in time if the spooler goes right back around
+        openTriviaDatabaseTriviaQuestionRepository = FakeOpenTriviaDatabaseTriviaQuestionRepository(
+            triviaSource = TriviaSource.OPEN_TRIVIA_DATABASE,
+            failedFetchCount = 2
+        )
+
+        triviaRepository = self.__createTriviaRepository(
+            openTriviaDatabaseTriviaQuestionRepository = openTriviaDatabaseTriviaQuestionRepository,
+            maxTriviaQuestionSpoolSize = 4
+        )
+
+        triviaRepository.startSpooler()
+
+        for _ in range(200):
+            if self.__getSpoolSize(triviaRepository, 'smCharles') == 4:
+                break
+
+            await asyncio.sleep(0.01)
+
+        assert self.__getSpoolSize(triviaRepository, 'smCharles') == 4
+        assert openTriviaDatabaseTriviaQuestionRepository.fetchCount == 6
@@ -0,0 +1,190 @@
+import asyncio
+import os
+
+import pytest
+
+try:
+    from ... import utils
+    from ...storage.backingDatabase import BackingDatabase
+    from ...storage.backingSqliteDatabase import BackingSqliteDatabase
+    from ..triviaScoreIncrement import TriviaScoreIncrement
+    from ..triviaScoreRepository import TriviaScoreRepository
+except:
+    import utils
+    from storage.backingDatabase import BackingDatabase
+    from storage.backingSqliteDatabase import BackingSqliteDatabase
+    from trivia.triviaScoreIncrement import TriviaScoreIncrement
+    from trivia.triviaScoreRepository import TriviaScoreRepository
+
+
+class TestTriviaScoreRepository():
+
+    def __createBackingDatabase(self, tmp_path) -> BackingDatabase:
+        return BackingSqliteDatabase(
+            eventLoop = asyncio.get_running_loop(),
+            backingDatabaseFile = os.path.join(tmp_path, 'database.sqlite')
+        )
+
+    @pytest.mark.asyncio
+    async def test_fetchTriviaScore(self, tmp_path):
+        backingDatabase = self.__createBackingDatabase(tmp_path)
+        repository = TriviaScoreRepository(backingDatabase)
+        result = await repository.fetchTriviaScore('smCharles', '123456')
+        assert result.getStreak() == 0
+        assert result.getSuperTriviaWins() == 0
+        assert result.getTriviaLosses() == 0
+        assert result.getTriviaWins() == 0
+
+        await backingDatabase.close()
+
+    @pytest.mark.asyncio
+    async def test_incrementSuperTriviaWins(self, tmp_path):
+        backingDatabase = self.__createBackingDatabase(tmp_path)
+        repository = TriviaScoreRepository(backingDatabase)
+        await repository.incrementTriviaWins('smCharles', '123456')
+        result = await repository.incrementSuperTriviaWins('smCharles', '123456')
+        assert result.getStreak() == 1
+        assert result.getSuperTriviaWins() == 1
+        assert result.getTriviaWins() == 1
+
+        await backingDatabase.close()
+
+    @pytest.mark.asyncio
+    async def test_incrementTriviaLosses(self, tmp_path):
+        backingDatabase = self.__createBackingDatabase(tmp_path)
+        repository = TriviaScoreRepository(backingDatabase)
+        await repository.incrementTriviaWins('smCharles', '123456')
+        await repository.incrementTriviaWins('smCharles', '123456')
+        result = await repository.incrementTriviaLosses('smCharles', '123456')
+        assert result.getStreak() == -1
+        assert result.getTriviaLosses() == 1
+        assert result.getTriviaWins() == 2
+
+        result = await repository.incrementTriviaLosses('smCharles', '123456')
+        assert result.getStreak() == -2
+        assert result.getTriviaLosses() == 2
+
+        await backingDatabase.close()
+
+    @pytest.mark.asyncio
+    async def test_incrementTriviaScores(self, tmp_path):
+        backingDatabase = self.__createBackingDatabase(tmp_path)
+        repository = TriviaScoreRepository(backingDatabase)
+        await repository.incrementTriviaWins('smCharles', '123456')
+        await repository.incrementTriviaWins('smCharles', '654321')
+        await repository.incrementTriviaLosses('smCharles', '555555')
+
+        await repository.incrementTriviaScores([
+            # only wins, so this extends the stored win streak
+            TriviaScoreIncrement(
+                streak = 3,
+                superTriviaWinsIncrement = 1,
+                triviaLossesIncrement = 0,
+                triviaWinsIncrement = 2,
+                twitchChannel = 'smCharles',
+                userId = '123456'
+            ),
+            # both wins and losses, so this ends on its own streak
+            TriviaScoreIncrement(
+                streak = -1,
+                superTriviaWinsIncrement = 0,
+                triviaLossesIncrement = 1,
+                triviaWinsIncrement = 1,
+                twitchChannel = 'smCharles',
+                userId = '654321'
+            ),
+            # only wins, so this replaces the stored loss streak
+            TriviaScoreIncrement(
+                streak = 2,
+                superTriviaWinsIncrement = 0,
+                triviaLossesIncrement = 0,
+                triviaWinsIncrement = 2,
+                twitchChannel = 'smCharles',
+                userId = '555555'
+            )
+        ])
+
+        result = await repository.fetchTriviaScore('smCharles', '123456')
+        assert result.getStreak() == 3
+        assert result.getSuperTriviaWins() == 1
+        assert result.getTriviaLosses() == 0
+        assert result.getTriviaWins() == 3
+
+        result = await repository.fetchTriviaScore('smCharles', '654321')
+        assert result.getStreak() == -1
+        assert result.getTriviaLosses() == 1
+        assert result.getTriviaWins() == 2
+
+        result = await repository.fetchTriviaScore('smCharles', '555555')
+        assert result.getStreak() == 2
+        assert result.getTriviaLosses() == 1
+        assert result.getTriviaWins() == 2
+
+        await backingDatabase.close()
+
+    @pytest.mark.asyncio
+    async def test_incrementTriviaWins(self, tmp_path):
+        backingDatabase = self.__createBackingDatabase(tmp_path)
+        repository = TriviaScoreRepository(backingDatabase)
+        await repository.incrementTriviaLosses('smCharles', '123456')
+        result = await repository.incrementTriviaWins('smCharles', '123456')
+        assert result.getStreak() == 1
+        assert result.getTriviaWins() == 1
+
+        result = await repository.incrementTriviaWins('smCharles', '123456')
+        assert result.getStreak() == 2
+        assert result.getTriviaWins() == 2
+
+        result = await repository.fetchTriviaScore('smCharles', '123456')
+        assert result.getStreak() == 2
+        assert result.getTriviaLosses() == 1
+        assert result.getTriviaWins() == 2
+
+        await backingDatabase.close()
+
+    @pytest.mark.asyncio
+    async def test_incrementTriviaWins_concurrently(self, tmp_path):
+        backingDatabase = self.__createBackingDatabase(tmp_path)
+        repository = TriviaScoreRepository(backingDatabase)
+        await repository.fetchTriviaScore('smCharles', '123456')
+
+        await asyncio.gather(*[
+            repository.incrementTriviaWins('smCharles', '123456') for _ in range(20)
+        ])
+
+        result = await repository.fetchTriviaScore('smCharles', '123456')
+        assert result.getStreak() == 20
+        assert result.getTriviaWins() == 20
+
+        await backingDatabase.close()
+
+    @pytest.mark.asyncio
+    async def test_incrementTriviaWins_outOfBounds(self, tmp_path):
+        backingDatabase = self.__createBackingDatabase(tmp_path)
+        repository = TriviaScoreRepository(backingDatabase)
+
+        await repository.incrementTriviaScores([
+            TriviaScoreIncrement(
+                streak = 1,
+                superTriviaWinsIncrement = 0,
+                triviaLossesIncrement = 0,
+                triviaWinsIncrement = utils.getIntMaxSafeSize(),
+                twitchChannel = 'smCharles',
+                userId = '123456'
+            )
+        ])
+
+        exception: Exception = None
+
+        try:
+            await repository.incrementTriviaWins('smCharles', '123456')
+        except Exception as e:
+            exception = e
+
+        assert isinstance(exception, ValueError)
+
+        result = await repository.fetchTriviaScore('smCharles', '123456')
+        assert result.getStreak() == 1
+        assert result.getTriviaWins() == utils.getIntMaxSafeSize()
+
+        await backingDatabase.close()
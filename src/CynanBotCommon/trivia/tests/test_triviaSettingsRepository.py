@@ -0,0 +1,127 @@
+import pytest
+
+try:
+    from ...storage.jsonStaticReader import JsonStaticReader
+    from ..triviaSettingsRepository import TriviaSettingsRepository
+    from ..triviaSource import TriviaSource
+except:
+    from storage.jsonStaticReader import JsonStaticReader
+    from trivia.triviaSettingsRepository import TriviaSettingsRepository
+    from trivia.triviaSource import TriviaSource
+
+
+class TestTriviaSettingsRepository():
+
+    @pytest.mark.asyncio
+    async def test_getAvailableTriviaSourcesAndWeights(self):
+        triviaSettingsRepository = TriviaSettingsRepository(
+            settingsJsonReader = JsonStaticReader({
+                'trivia_sources': {
+                    'J_SERVICE': { 'is_enabled': True, 'weight': 3 },
+                    'LORD_OF_THE_RINGS': { 'is_enabled': False, 'weight': 2 },
+                    'OPEN_TRIVIA_DATABASE': { 'is_enabled': True }
+                }
+            })
+        )
+
+        triviaSources = await triviaSettingsRepository.getAvailableTriviaSourcesAndWeights()
+        assert triviaSources == {
+            TriviaSource.J_SERVICE: 3,
+            TriviaSource.OPEN_TRIVIA_DATABASE: 1
+        }
+
+    @pytest.mark.asyncio
+    async def test_getAvailableTriviaSourcesAndWeights_withNoTriviaSources(self):
+        triviaSettingsRepository = TriviaSettingsRepository(
+            settingsJsonReader = JsonStaticReader(dict())
+        )
+
+        exception: Exception = None
+
+        try:
+            await triviaSettingsRepository.getAvailableTriviaSourcesAndWeights()
+        except Exception as e:
+            exception = e
+
+        assert isinstance(exception, RuntimeError)
+
+    @pytest.mark.asyncio
+    async def test_getSettingsSnapshot(self):
+        triviaSettingsRepository = TriviaSettingsRepository(
+            settingsJsonReader = JsonStaticReader({
+                'levenshtein_threshold_growth_rate': 5,
+                'shiny_trivias_enabled': False
+            })
+        )
+
+        settingsSnapshot = await triviaSettingsRepository.getSettingsSnapshot()
+        assert settingsSnapshot.getLevenshteinThresholdGrowthRate() == 5
+        assert settingsSnapshot.areShinyTriviasEnabled() is False
+        assert settingsSnapshot.getMaxPhraseGuessLength() == 48
+        assert await triviaSettingsRepository.getLevenshteinThresholdGrowthRate() == 5
+        assert await triviaSettingsRepository.getSettingsSnapshot() is settingsSnapshot
+
+        await triviaSettingsRepository.clearCaches()
+        newSettingsSnapshot = await triviaSettingsRepository.getSettingsSnapshot()
+        assert newSettingsSnapshot is not settingsSnapshot
+        assert newSettingsSnapshot.getLevenshteinThresholdGrowthRate() == 5
+
+    @pytest.mark.asyncio
+    async def test_getSettingsSnapshot_isImmutable(self):
+        triviaSettingsRepository = TriviaSettingsRepository(
+            settingsJsonReader = JsonStaticReader(dict())
+        )
+
+        settingsSnapshot = await triviaSettingsRepository.getSettingsSnapshot()
+        exception: Exception = None
+
+        try:
+            settingsSnapshot._TriviaSettingsSnapshot__parsedSettings = { 'max_retry_count': 100 }
+        except Exception as e:
+            exception = e
+
+        assert isinstance(exception, AttributeError)
+        assert settingsSnapshot.getMaxRetryCount() == 5
+
+    @pytest.mark.asyncio
+    async def test_getSettingsSnapshot_withInvalidMaxRetryCount(self):
+        triviaSettingsRepository = TriviaSettingsRepository(
+            settingsJsonReader = JsonStaticReader({
+                'levenshtein_threshold_growth_rate': 5,
+                'max_retry_count': 1
+            })
+        )
+
+        settingsSnapshot = await triviaSettingsRepository.getSettingsSnapshot()
+        assert settingsSnapshot.getLevenshteinThresholdGrowthRate() == 5
+        assert await triviaSettingsRepository.getMaxPhraseGuessLength() == 48
+
+        exception: Exception = None
+
+        try:
+            settingsSnapshot.getMaxRetryCount()
+        except Exception as e:
+            exception = e
+
+        assert isinstance(exception, ValueError)
+
+    @pytest.mark.asyncio
+    async def test_getSettingsSnapshot_withMalformedSetting(self):
+        triviaSettingsRepository = TriviaSettingsRepository(
+            settingsJsonReader = JsonStaticReader({
+                'max_answer_length': 'abc',
+                'shiny_trivias_enabled': False
+            })
+        )
+
+        settingsSnapshot = await triviaSettingsRepository.getSettingsSnapshot()
+        assert settingsSnapshot.areShinyTriviasEnabled() is False
+
+        exception: Exception = None
+
+        try:
+            settingsSnapshot.getMaxAnswerLength()
+        except Exception as e:
+            exception = e
+
+        assert isinstance(exception, ValueError)
@@ -0,0 +1,199 @@
+import asyncio
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+try:
+    from ...network.exceptions import GenericNetworkException
+    from ...network.networkClientProvider import NetworkClientProvider
+    from ...network.networkClientType import NetworkClientType
+    from ...network.networkHandle import NetworkHandle
+    from ...network.networkResponse import NetworkResponse
+    from ...storage.jsonStaticReader import JsonStaticReader
+    from ...timber.timberStub import TimberStub
+    from ..triviaExceptions import (GenericTriviaNetworkException,
+                                    MalformedTriviaJsonException)
+    from ..triviaFetchOptions import TriviaFetchOptions
+    from ..triviaIdGenerator import TriviaIdGenerator
+    from ..triviaQuestionCompiler import TriviaQuestionCompiler
+    from ..triviaRepositories.willFryTriviaQuestionRepository import \
+        WillFryTriviaQuestionRepository
+    from ..triviaSettingsRepository import TriviaSettingsRepository
+except:
+    from network.exceptions import GenericNetworkException
+    from network.networkClientProvider import NetworkClientProvider
+    from network.networkClientType import NetworkClientType
+    from network.networkHandle import NetworkHandle
+    from network.networkResponse import NetworkResponse
+    from storage.jsonStaticReader import JsonStaticReader
+    from timber.timberStub import TimberStub
+
+    from trivia.triviaExceptions import (GenericTriviaNetworkException,
+                                         MalformedTriviaJsonException)
+    from trivia.triviaFetchOptions import TriviaFetchOptions
+    from trivia.triviaIdGenerator import TriviaIdGenerator
+    from trivia.triviaQuestionCompiler import TriviaQuestionCompiler
+    from trivia.triviaRepositories.willFryTriviaQuestionRepository import \
+        WillFryTriviaQuestionRepository
+    from trivia.triviaSettingsRepository import TriviaSettingsRepository
+
+
+class FakeNetworkResponse(NetworkResponse):
+
+    def __init__(self, statusCode: int, jsonResponse: Optional[List[Dict[str, Any]]]):
+        self.__statusCode: int = statusCode
+        self.__jsonResponse: Optional[List[Dict[str, Any]]] = jsonResponse
+
+    async def close(self):
+        pass
+
+    def getNetworkClientType(self) -> NetworkClientType:
+        return NetworkClientType.AIOHTTP
+
+    def getStatusCode(self) -> int:
+        return self.__statusCode
+
+    def getUrl(self) -> str:
+        raise NotImplementedError()
+
+    def isClosed(self) -> bool:
+        return False
+
+    async def json(self) -> Optional[List[Dict[str, Any]]]:
+        return self.__jsonResponse
+
+    async def read(self) -> bytes:
+        raise NotImplementedError()
+
+
+class FakeNetworkHandle(NetworkHandle):
+
+    def __init__(
+        self,
+        triviaJsons: List[Dict[str, Any]],
+        statusCode: int = 200,
+        isNetworkErrorEnabled: bool = False
+    ):
+        self.triviaJsons: List[Dict[str, Any]] = triviaJsons
+        self.statusCode: int = statusCode
+        self.isNetworkErrorEnabled: bool = isNetworkErrorEnabled
+        self.triviaFetchCount: int = 0
+
+    async def delete(self, url: str, headers: Optional[Dict[str, Any]] = None) -> NetworkResponse:
+        raise NotImplementedError()
+
+    async def get(self, url: str, headers: Optional[Dict[str, Any]] = None) -> NetworkResponse:
+        self.triviaFetchCount = self.triviaFetchCount + 1
+
+        if self.isNetworkErrorEnabled:
+            raise GenericNetworkException('network is down')
+
+        # give any other waiting callers a chance to pile up behind this fetch
+        await asyncio.sleep(0.01)
+
+        return FakeNetworkResponse(self.statusCode, self.triviaJsons)
+
+    def getNetworkClientType(self) -> NetworkClientType:
+        return NetworkClientType.AIOHTTP
+
+    async def post(self, url: str, headers: Optional[Dict[str, Any]] = None, json: Optional[Dict[str, Any]] = None) -> NetworkResponse:
+        raise NotImplementedError()
+
+
+class FakeNetworkClientProvider(NetworkClientProvider):
+
+    def __init__(self, networkHandle: NetworkHandle):
+        self.__networkHandle: NetworkHandle = networkHandle
+
+    async def get(self) -> NetworkHandle:
+        return self.__networkHandle
+
+    def getNetworkClientType(self) -> NetworkClientType:
+        return NetworkClientType.AIOHTTP
+
+
+def createTriviaJsons(count: int) -> List[Dict[str, Any]]:
+    triviaJsons: List[Dict[str, Any]] = list()
+
+    for index in range(count):
+        triviaJsons.append({
+            'category': 'Pokemon',
+            'correctAnswer': 'True',
+            'id': f'question{index}',
+            'incorrectAnswers': [ 'False' ],
+            'question': f'Question number {index}',
+            'type': 'boolean'
+        })
+
+    return triviaJsons
+
+
+class TestWillFryTriviaQuestionRepository():
+
+    def __createRepository(self, networkHandle: FakeNetworkHandle) -> WillFryTriviaQuestionRepository:
+        return WillFryTriviaQuestionRepository(
+            networkClientProvider = FakeNetworkClientProvider(networkHandle),
+            timber = TimberStub(),
+            triviaIdGenerator = TriviaIdGenerator(),
+            triviaQuestionCompiler = TriviaQuestionCompiler(),
+            triviaSettingsRepository = TriviaSettingsRepository(JsonStaticReader(dict()))
+        )
+
+    @pytest.mark.asyncio
+    async def test_fetchTriviaQuestion_oneBatchServesManyCalls(self):
+        networkHandle = FakeNetworkHandle(createTriviaJsons(5))
+        repository = self.__createRepository(networkHandle)
+
+        questions = await asyncio.gather(*[
+            repository.fetchTriviaQuestion(TriviaFetchOptions('smCharles')) for _ in range(5)
+        ])
+
+        assert networkHandle.triviaFetchCount == 1
+        assert sorted(question.getQuestion() for question in questions) == [ f'Question number {index}' for index in range(5) ]
+
+        await repository.fetchTriviaQuestion(TriviaFetchOptions('stashiocat'))
+        assert networkHandle.triviaFetchCount == 2
+
+    @pytest.mark.asyncio
+    async def test_fetchTriviaQuestion_withEmptyBatch(self):
+        networkHandle = FakeNetworkHandle(list())
+        repository = self.__createRepository(networkHandle)
+        exception: Exception = None
+
+        try:
+            await repository.fetchTriviaQuestion(TriviaFetchOptions('smCharles'))
+        except Exception as e:
+            exception = e
+
+        assert isinstance(exception, MalformedTriviaJsonException)
+
+    @pytest.mark.asyncio
+    async def test_fetchTriviaQuestion_withNetworkError(self):
+        networkHandle = FakeNetworkHandle(createTriviaJsons(5), isNetworkErrorEnabled = True)
+        repository = self.__createRepository(networkHandle)
+        exception: Exception = None
+
+        try:
+            await repository.fetchTriviaQuestion(TriviaFetchOptions('smCharles'))
+        except Exception as e:
+            exception = e
+
+        assert isinstance(exception, GenericTriviaNetworkException)
+
+        # a failed batch leaves nothing behind, so the next call fetches again
+        networkHandle.isNetworkErrorEnabled = False
+        await repository.fetchTriviaQuestion(TriviaFetchOptions('smCharles'))
+        assert networkHandle.triviaFetchCount == 2
+
+    @pytest.mark.asyncio
+    async def test_fetchTriviaQuestion_withNon200StatusCode(self):
+        networkHandle = FakeNetworkHandle(createTriviaJsons(5), statusCode = 500)
+        repository = self.__createRepository(networkHandle)
+        exception: Exception = None
+
+        try:
+            await repository.fetchTriviaQuestion(TriviaFetchOptions('smCharles'))
+        except Exception as e:
+            exception = e
+
+        assert isinstance(exception, GenericTriviaNetworkException)
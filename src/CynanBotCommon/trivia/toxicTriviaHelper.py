@@ -39,10 +39,12 @@ class ToxicTriviaHelper():
         if not utils.isValidStr(twitchChannel):
             raise ValueError(f'twitchChannel argument is malformed: \"{twitchChannel}\"')
 
-        if not await self.__triviaSettingsRepository.areToxicTriviasEnabled():
+        settingsSnapshot = await self.__triviaSettingsRepository.getSettingsSnapshot()
+
+        if not settingsSnapshot.areToxicTriviasEnabled():
             return False        
 
-        probability = await self.__triviaSettingsRepository.getToxicProbability()
+        probability = settingsSnapshot.getToxicProbability()
         randomNumber = random.uniform(0, 1)
 
         if randomNumber > probability:
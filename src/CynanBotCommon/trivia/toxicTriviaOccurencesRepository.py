@@ -45,6 +45,24 @@ class ToxicTriviaOccurencesRepository():
             raise ValueError(f'userId argument is an illegal value: \"{userId}\"')
 
         connection = await self.__getDatabaseConnection()
+
+        try:
+            result = await self.__fetchDetails(
+                connection = connection,
+                twitchChannel = twitchChannel,
+                userId = userId
+            )
+        finally:
+            await connection.close()
+
+        return result
+
+    async def __fetchDetails(
+        self,
+        connection: DatabaseConnection,
+        twitchChannel: str,
+        userId: str
+    ) -> ToxicTriviaResult:
         record = await connection.fetchRow(
             '''
                 SELECT count, mostrecent FROM toxictriviaoccurences
@@ -61,8 +79,6 @@ class ToxicTriviaOccurencesRepository():
             toxicCount = record[0]
             mostRecent = utils.getDateTimeFromStr(record[1])
 
-        await connection.close()
-
         return ToxicTriviaResult(
             mostRecent = mostRecent,
             newToxicCount = toxicCount,
@@ -87,26 +103,34 @@ class ToxicTriviaOccurencesRepository():
         elif userId == '0':
             raise ValueError(f'userId argument is an illegal value: \"{userId}\"')
 
-        result = await self.fetchDetails(
-            twitchChannel = twitchChannel,
-            userId = userId
-        )
-
-        newToxicCount: int = result.getOldToxicCount() + 1
-
-        newResult = ToxicTriviaResult(
-            mostRecent = datetime.now(self.__timeZone),
-            newToxicCount = newToxicCount,
-            oldToxicCount = result.getOldToxicCount(),
-            twitchChannel = result.getTwitchChannel(),
-            userId = result.getUserId()
-        )
+        connection = await self.__getDatabaseConnection()
 
-        await self.__updateToxicCount(
-            newToxicCount = newResult.getNewToxicCount(),
-            twitchChannel = newResult.getTwitchChannel(),
-            userId = newResult.getUserId()
-        )
+        try:
+            async with connection.transaction():
+                result = await self.__fetchDetails(
+                    connection = connection,
+                    twitchChannel = twitchChannel,
+                    userId = userId
+                )
+
+                newToxicCount: int = result.getOldToxicCount() + 1
+
+                newResult = ToxicTriviaResult(
+                    mostRecent = datetime.now(self.__timeZone),
+                    newToxicCount = newToxicCount,
+                    oldToxicCount = result.getOldToxicCount(),
+                    twitchChannel = result.getTwitchChannel(),
+                    userId = result.getUserId()
+                )
+
+                await self.__updateToxicCount(
+                    connection = connection,
+                    newToxicCount = newResult.getNewToxicCount(),
+                    twitchChannel = newResult.getTwitchChannel(),
+                    userId = newResult.getUserId()
+                )
+        finally:
+            await connection.close()
 
         return newResult
 
@@ -117,37 +141,39 @@ class ToxicTriviaOccurencesRepository():
         self.__isDatabaseReady = True
         connection = await self.__backingDatabase.getConnection()
 
-        if connection.getDatabaseType() is DatabaseType.POSTGRESQL:
-            await connection.createTableIfNotExists(
-                '''
-                    CREATE TABLE IF NOT EXISTS toxictriviaoccurences (
-                        count integer DEFAULT 0 NOT NULL,
-                        mostrecent text NOT NULL,
-                        twitchchannel public.citext NOT NULL,
-                        userid public.citext NOT NULL,
-                        PRIMARY KEY (twitchchannel, userid)
-                    )
-                '''
-            )
-        elif connection.getDatabaseType() is DatabaseType.SQLITE:
-            await connection.createTableIfNotExists(
-                '''
-                    CREATE TABLE IF NOT EXISTS toxictriviaoccurences (
-                        count INTEGER NOT NULL DEFAULT 0,
-                        mostrecent TEXT NOT NULL,
-                        twitchchannel TEXT NOT NULL COLLATE NOCASE,
-                        userid TEXT NOT NULL COLLATE NOCASE,
-                        PRIMARY KEY (twitchchannel, userid)
-                    )
-                '''
-            )
-        else:
-            raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
-
-        await connection.close()
+        try:
+            if connection.getDatabaseType() is DatabaseType.POSTGRESQL:
+                await connection.createTableIfNotExists(
+                    '''
+                        CREATE TABLE IF NOT EXISTS toxictriviaoccurences (
+                            count integer DEFAULT 0 NOT NULL,
+                            mostrecent text NOT NULL,
+                            twitchchannel public.citext NOT NULL,
+                            userid public.citext NOT NULL,
+                            PRIMARY KEY (twitchchannel, userid)
+                        )
+                    '''
+                )
+            elif connection.getDatabaseType() is DatabaseType.SQLITE:
+                await connection.createTableIfNotExists(
+                    '''
+                        CREATE TABLE IF NOT EXISTS toxictriviaoccurences (
+                            count INTEGER NOT NULL DEFAULT 0,
+                            mostrecent TEXT NOT NULL,
+                            twitchchannel TEXT NOT NULL COLLATE NOCASE,
+                            userid TEXT NOT NULL COLLATE NOCASE,
+                            PRIMARY KEY (twitchchannel, userid)
+                        )
+                    '''
+                )
+            else:
+                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
+        finally:
+            await connection.close()
 
     async def __updateToxicCount(
         self,
+        connection: DatabaseConnection,
         newToxicCount: int,
         twitchChannel: str,
         userId: str
@@ -166,7 +192,6 @@ class ToxicTriviaOccurencesRepository():
         nowDateTime = datetime.now(self.__timeZone)
         nowDateTimeStr = nowDateTime.isoformat()
 
-        connection = await self.__getDatabaseConnection()
         await connection.execute(
             '''
                     INSERT INTO toxictriviaoccurences (count, mostrecent, twitchchannel, userid)
@@ -175,5 +200,3 @@ class ToxicTriviaOccurencesRepository():
             ''',
             newToxicCount, nowDateTimeStr, twitchChannel, userId
         )
-
-        await connection.close()
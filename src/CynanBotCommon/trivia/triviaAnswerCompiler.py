@@ -1,6 +1,6 @@
 import re
 import traceback
-from typing import List, Optional, Pattern, Set
+from typing import Dict, List, Optional, Pattern, Set, Tuple
 
 import roman
 from num2words import num2words
@@ -8,22 +8,42 @@ from roman import RomanError
 
 try:
     import CynanBotCommon.utils as utils
+    from CynanBotCommon.clearable import Clearable
+    from CynanBotCommon.lruValueCache import LruValueCache
     from CynanBotCommon.timber.timberInterface import TimberInterface
     from CynanBotCommon.trivia.triviaExceptions import BadTriviaAnswerException
 except:
     import utils
+    from clearable import Clearable
+    from lruValueCache import LruValueCache
     from timber.timberInterface import TimberInterface
     from trivia.triviaExceptions import BadTriviaAnswerException
 
 
-class TriviaAnswerCompiler():
+class TriviaAnswerCompiler(Clearable):
 
-    def __init__(self, timber: TimberInterface):
+    def __init__(
+        self,
+        timber: TimberInterface,
+        cacheSize: int = 1024
+    ):
         if not isinstance(timber, TimberInterface):
             raise ValueError(f'timber argument is malformed: \"{timber}\"')
+        elif not utils.isValidInt(cacheSize):
+            raise ValueError(f'cacheSize argument is malformed: \"{cacheSize}\"')
+        elif cacheSize < 1 or cacheSize > utils.getIntMaxSafeSize():
+            raise ValueError(f'cacheSize argument is out of bounds: {cacheSize}')
 
         self.__timber: TimberInterface = timber
 
+        # Chatters very often send the exact same guess as one another, so the results of
+        # compiling and expanding guesses are cached, keyed by the raw guess.
+        self.__compileTextAnswerCache: LruValueCache = LruValueCache(cacheSize)
+        self.__compileTextAnswersListCache: LruValueCache = LruValueCache(cacheSize)
+        self.__expandNumeralsCache: LruValueCache = LruValueCache(cacheSize)
+        self.__cacheHitCount: int = 0
+        self.__cacheMissCount: int = 0
+
         self.__ampersandRegEx: Pattern = re.compile(r'(^&\s+)|(\s+&\s+)|(\s+&$)', re.IGNORECASE)
         self.__decadeRegEx: Pattern = re.compile(r'^((in\s+)?the\s+)?(\d{4})\'?s$', re.IGNORECASE)
         self.__equationRegEx: Pattern = re.compile(r'([a-z])\s*=\s*(-?(?:\d*\.)?\d+)', re.IGNORECASE)
@@ -52,39 +72,12 @@ class TriviaAnswerCompiler():
         # RegEx patterns for arabic and roman numerals, returning separate capturing groups for digits and ordinals
         self.__groupedNumeralRegEx: Pattern = re.compile(r'\b(?:(\d+)|([IVXLCDM]+))(st|nd|rd|th)?\b', re.IGNORECASE)
 
-        self.__combiningDiacriticsRegEx: Pattern = re.compile(r'[\u0300-\u036f\u1ab0-\u1aff\u1dc0-\u1dff\u20d0-\u20ff\ufe20-\ufe2f]')
-
-        self.__specialCharsRegEx: Pattern = re.compile(
-            r"""
-                (?P<a>[ÅåǺǻḀḁẚĂăẶặẮắẰằẲẳẴẵȂȃâẬậẤấẦầẪẫẨẩẢảǍǎȺⱥȦȧǠǡẠạÄäǞǟÀàȀȁÁáĀāÃãĄąᶏɑᶐⱯɐɒᴀᴬᵃᵄᶛₐªÅ∀@₳ΑαАаⲀⲁⒶⓐ⒜🅰𝔄𝔞𝕬𝖆𝓐𝓪𝒜𝒶𝔸𝕒Ａａ🄰ค𝐀𝐚𝗔𝗮𝘈𝘢𝘼𝙖𝙰𝚊Λ卂ﾑȺᗩΔልДдꚈꚉꚀꚁꙢꙣꭿꋫλ🅐🅰️ꙢꙣꙘѦԬꙙѧԭӒӓҨҩ])|
-                (?P<b>[ΒβⲂⲃВвБб𐌁ᛒ𐌱ɓʙɃƀḂḃḄḅḆḇƁᵬᶀꞖꞗᴃᴯᴮᵇƂƃ␢฿₿♭𝐁𝐛𝔹𝕓𝕭𝖇𝑩𝒃🄱🅱️Ⓑⓑ🅑ᙠᗷҍ𝔅𝔟𝓑𝓫𝗕𝗯𝘽𝙗𝘉𝘣Ｂｂ⒝𝙱𝚋𝖡𝖻🇧๖乃𝑏ƄЬᏏᖯᑲ𝒷𝚩ꓐ𝜝𝛣𝝗𐊂𝞑ℬᏴ𐊡𝐵])|
-                (?P<c>[СсɕʗᶜᶝᴄꟄꞔĆćĈĉČčĊċḈḉƇƈȻȼÇçꞒꞓↃↄ©℃¢₡₢₵₠ℂℭꜾꜿ𝑐𝗰ｃ𝕔ⲥ𐐽𝖈𝓬𝚌ꮯ𝔠ϲ𝒄𝘤𝒸𝙘𝐜𝖼ⅽ𝕮𝙲𝑪𝒞𝖢𐌂𝗖ꓚᏟＣⲤ𝓒Ⅽ𝘊𐐕𝘾🝌𝐂Ϲ𐊢𝐶])|
-                (?P<d>[ԀԁƊɗ𝓭𝚍ⅆ𝑑𝗱Ꮷ𝒅𝘥𝖉ᑯꓒ𝐝𝖽𝔡𝕕ⅾ𝒹𝙙Ꭰ𝕯ⅅ𝓓𝙳𝔇ᗪ𝑫𝘋Ⅾ𝒟𝘿ꓓ𝐃𝖣𝐷𝗗𝔻ᗞ])|
-                (?P<e>[ẹėéèеẸĖÉÈЕ𝓮𝚎ｅ𝑒𝗲ⅇ𝒆𝘦℮𝖊ℯ𝐞𝖾ꬲ𝔢𝕖ҽ𝙚𝙴𝛦𝑬𝚬𝜠𝖤Ε𝗘𐊆𝝚𝓔𝞔Ｅ𝔈𝘌Ꭼℰ𝙀ꓰⴹ])|
-                (?P<f>[f𝓯𝚏𝑓𝗳𝒇𝘧𝖋𝐟𝖿𝔣ꬵ𝕗ꞙ𝒻𝙛ẝ𝕱Ꞙ𝓕Ϝ𐊇ꓝ𝗙ℱᖴ𝙁𝙵𐊥𝐹])|
-                (?P<g>[ġĠ𝓰𝚐ɡցᶃ𝑔𝗴ｇ𝒈𝘨ℊ𝖌𝐠𝗀𝔤𝕘𝙜Ꮐ𝑮𝘎𝕲𝐆𝖦Ԍ𝔊𝔾Ᏻ𝒢𝙂ꓖ𝓖𝙶𝐺𝗚])|
-                (?P<h>[һҺᏂ𝖍𝓱𝚑ｈ𝔥ℎ𝒉𝘩հ𝒽𝙝𝐡𝗁𝗵𝕙𝑯𝚮𝕳𝛨𝖧ℋℌℍⲎ𐋏𝜢Η𝓗𝞖𝝜𝗛Н𝘏ꓧＨ𝐇𝙃𝙷Ꮋᕼ𝐻])|
-                (?P<i>[іíïІÍÏ𝓲𝞲ꙇⅈｉ𝔦𝘪ӏ𝙞𝚤𝐢𝑖𝕚𝖎Ꭵ𝚒ɩɪ𝒊𝛊ⅰı𝒾𝜾⍳𝜄ꭵ𝗂𝝸ℹι𝗶𝚰𝘭𝖨𝐥ﺍﺎ𝔩ℐℑ𐊊Ⲓ𐌉ℓ𝜤Ɩ𝞘Ι𝚕𝟏∣اＩ𝗅𝕀𝙄𝓁𐌠𝐼𝑰ǀӀᛁ𝟭𝕴ߊｌ𝛪ⵏ𝝞𝕝𝟣𝙡𝓘𝗜𝟙𝑙ןⅠ𝘐١𝒍𝖑￨𝐈۱ꓲ|ⅼ])|
-                (?P<j>[јʝЈꞲ𝖏𝓳𝚓ⅉ𝔧ｊ𝒋𝘫𝒿𝙟ϳ𝐣𝗃𝑗𝗷𝕛𝔍𝑱𝘑Ｊ𝒥𝙅Ꭻᒍ𝐉𝖩𝐽𝗝𝕁ꓙ𝕵𝓙𝙹Ϳ])|
-                (?P<k>[κΚ𝖐𝓴𝚔𝔨𝒌𝘬𝓀𝙠𝐤𝗄𝑘𝗸𝕜𝑲𝚱𝒦𝜥𝛫𝖪𝝟𝗞ⲔᛕꓗК𝓚𝞙𝔎𝘒Ꮶ𝙆Ｋ])|
-                (?P<l>[ӏḷӀḶ𝚰𝘭І𝖨𝐥ﺍﺎ𝔩ℐℑ𐊊Ⲓ𐌉ℓ𝜤Ɩ𝞘Ι𝚕𝟏∣ا𝗅𝕀𝙄𝓁𐌠𝐼𝑰ǀᛁ𝟭𝕴ߊｌ𝛪ⵏ𝝞𝕝𝟣ו𞣇𝙡𝓘𝗜𝟙𝑙ןⅠ𝘐١𝒍𝖑𝐈۱|ⅼ𝖫Ⳑ𝗟ℒ𝓛Ꮮꓡ𐐛𝘓𝙇ᒪⅬ])|
-                (?P<m>[m𝔪𝕞𝓂𝙢𝓶𝚖𝑚𝗺ⅿ𝛭𝑴𝚳𝜧𐌑𝖬𝗠ᛖ𝝡Ⲙ𝓜ΜМ𝞛ꓟ𝔐𝘔𝙈𐊰𝐌ＭⅯ𝑀ᗰℳ𝕄Ꮇ𝕸Ϻ𝙼])|
-                (?P<n>[ոՈΝれり𝒏𝘯𝖓𝐧𝗇𝔫𝕟𝓃𝙣𝓷𝚗ռ𝑛𝗻ꓠ𝛮𝐍𝖭𝚴𝔑𝜨Ｎ𝒩𝙉𝓝𝙽ℕ𝝢𝑁𝗡Ⲛ𝑵𝘕𝞜𝕹])|
-                (?P<o>[оᴏοօØøǾǿÖöȪȫÓóÒòÔôỐốỒồỔổỖỗỘộǑǒŐőŎŏȎȏȮȯȰȱỌọƟɵƠơỚớỜờỠỡỢợỞởỎỏŌōṒṓṐṑÕõȬȭṌṍṎṏǪǫȌȍǬǭꝌꝍⱺᴏᴼᵒᴑᴓꬽꬾꬿꭃꭄₒꝊꝋ∅ºΟοⲞⲟОо𐌏ՕօＯｏ◎Ⓞ⒪⓪⓿⍟Ꜿꜿ𝘰ంಂംං𝐨𐓪𝚘ဝ𝛐ഠ𝛔𝗈𝝈𝝄𝞸𝞼၀σ๐໐𝕠𐐬𝙤ە𝑜𝒐ס𝜎𝖔٥०੦૦௦౦೦൦𝜊𝝾۵𝞂𝓸𝗼ჿ߀𝛰〇𐊒𝟬𝒪𝜪ዐ𝓞𝞞𝝤ⵔ𝟢𝗢𝟘𝘖ଠ𝟎𝐎০୦𝔒𝕆𝙊𐊫𝙾ꓳ𐐄𝟶𝑶𝚶𐓂𝕺])|
-                (?P<p>[рРρ𝔭𝘱𝙥𝐩ｐ𝛠𝑝𝕡𝖕𝜚𝚙𝞎ⲣ𝝔𝛒𝒑𝟈𝝆𝓅𝜌𝗉𝞀ϱ𝗽⍴𝞺𝓹𝖯𝛲𝝦𝜬𝒫𐊕𝞠𝓟ꓑ𝗣ℙ𝘗𝐏ΡⲢᏢ𝙋ᑭＰ𝙿𝑃𝚸𝑷])|
-                (?P<q>[զԶ𝔮գ𝒒𝘲𝓆𝙦𝐪𝗊𝑞𝗾𝕢𝖖ԛ𝓺𝚚𝐐𝖰𝔔𝒬𝙌𝓠𝚀𝑄𝗤ⵕ𝑸𝘘ℚ𝕼])|
-                (?P<r>[r𝔯ꮁ𝒓𝘳ⲅᴦꭇꭈ𝓇𝙧𝐫𝗋𝑟𝗿г𝕣𝖗𝓻𝚛ᎡꓣƦ𝐑𝖱ᖇ𐒴𝑅𝗥Ꮢ𝕽𝓡𝚁ℛℜℝ])|
-                (?P<s>[ʂꟅꮪ𝐬𝗌𝑠𝘀ꜱｓ𝕤ѕ𝖘𝓼𝚜𐑈ƽ𝒮𝙎ꓢ𐐠Ѕ𝐒𝖲𝑆𝗦𐊖𝕊Տ𝕾ＳᏕ𝓢𝚂𝔖Ꮪ𝑺𝘚])|
-                (?P<t>[𝐭𝗍𝔱𝕥𝓉𝙩𝓽𝚝𝑡𝘁𝒕𝘵𝖙𝒯𝜯𝖳𝗧𐊗𐌕𝝩🝨ꓔТᎢ⊤Τ𝐓Ⲧ𝑇𐊱𝕋Ｔ𝚃𝛵𝑻𝚻])|
-                (?P<u>[υսüúùՍÜÚÙ𝐮𝔲ʋ𝙪ꭎ𐓶𝚞ꭒ𝑢𝒖𝛖ᴜ𝖚ꞟ𝜐𝗎𝓊𝝊𝓾𝞾𝞄𝘂𝘶𝒰𝙐ሀ⋃𝐔𝖴𝑈𝗨ᑌ𝖀𝓤𝚄ꓴ𐓎𝔘𝑼𝘜])|
-                (?P<v>[νѵѴⱯ∀⋁𝐯𝔳𝕧𝙫𝚟𝑣ｖט𝒗𝖛ᴠ𝗏ꮩ𝓋𝓿ⅴ𝘃𝝂𝘷𝞶Ꮩ𝐕Ⅴꓦ٧𝙑ᐯ𝑽۷𝖁ⴸ𝖵])|
-                (?P<w>[w𝐰𝗐ᴡѡաꮃ𝔴𝕨𝓌𝙬ɯ𝔀𝚠𝒘𝘸𝖜ԝ𝕎𝒲𝙒𝓦𝚆ꓪ𝑊𝗪ᎳᏔ𝖂𝐖𝖶Ԝ𝔚])|
-                (?P<x>[хҳХҲᕁ𝓍𝙭𝐱𝗑⤫𝑥𝘅⤬᙮⨯𝕩𝖝×𝔁𝚡ｘⅹ𝔵ᕽ𝒙𝘹𝒳𝜲𝓧𝞦𐊐𝝬𐌗𝗫𝘟𝐗𝔛ⵝΧⅩ𝚇ꓫⲬ᙭𝑋𐊴𝑿𝚾╳Ꭓ𝖃ᚷＸ𝛸𐌢𝖷])|
-                (?P<y>[уýУÝΥ𝙮𝐲𝝲𝑦ᶌ𝞬ʏ𝖞𝚢ｙꭚ𝒚𝓎ɣ𝗒ყ𝘆ү𝛾γ𝛄𝔂𝜸𝔶ℽ𝘺ỿϒ𝔜𝕐𝙔𝚈ⲨᎩ𐊲𝑌ꓬҮ𝒀𝖄𝖸Ｙ𝛶𝚼Ꮍ])|
-                (?P<z>[ʐżŻ𝓏𝙯ᴢ𝐳𝗓ꮓ𝔃𝚣𝔷𝒛𝘻𝗭𝚭ᏃΖ𝘡𝜡𝙕𝞕ꓜ𝝛𝐙𝑍ℤℨ𝖅Ｚ𝒵𝖹])
-            """,
-            re.VERBOSE | re.IGNORECASE
-        )
+        self.__fancyToLatinTranslationTable: Dict[int, Optional[str]] = self.__createFancyToLatinTranslationTable()
+
+    async def clearCaches(self):
+        self.__compileTextAnswerCache.clear()
+        self.__compileTextAnswersListCache.clear()
+        self.__expandNumeralsCache.clear()
 
     async def compileBoolAnswer(self, answer: Optional[str]) -> bool:
         cleanedAnswer = await self.compileTextAnswer(answer)
@@ -98,6 +91,16 @@ class TriviaAnswerCompiler():
         if not utils.isValidStr(answer):
             return ''
 
+        cachedAnswer: Optional[str] = self.__compileTextAnswerCache.get(answer)
+        if cachedAnswer is not None:
+            self.__cacheHitCount = self.__cacheHitCount + 1
+            return cachedAnswer
+
+        self.__cacheMissCount = self.__cacheMissCount + 1
+        return await self.__compileTextAnswer(answer)
+
+    async def __compileTextAnswer(self, answer: str) -> str:
+        rawAnswer = answer
         answer = answer.lower().strip()
 
         # removes HTML tag-like junk
@@ -118,6 +121,7 @@ class TriviaAnswerCompiler():
         # removes common phrase prefixes
         answer = self.__prefixRegEx.sub('', answer).strip()
 
+        self.__compileTextAnswerCache.put(rawAnswer, answer)
         return answer
 
     async def compileTextAnswersList(
@@ -131,6 +135,13 @@ class TriviaAnswerCompiler():
         if not utils.hasItems(answers):
             return list()
 
+        cacheKey = (tuple(answers), expandParentheses)
+        cachedAnswers: Optional[Tuple[str, ...]] = self.__compileTextAnswersListCache.get(cacheKey)
+        if cachedAnswers is not None:
+            self.__cacheHitCount = self.__cacheHitCount + 1
+            return list(cachedAnswers)
+
+        self.__cacheMissCount = self.__cacheMissCount + 1
         cleanedAnswers: Set[str] = set()
 
         for answer in answers:
@@ -146,10 +157,63 @@ class TriviaAnswerCompiler():
                     possibilities = [ case ]
 
                 for possibility in possibilities:
-                    cleanedAnswer = await self.compileTextAnswer(possibility)
+                    # this goes around compileTextAnswer() so that only the outer call is counted
+                    cleanedAnswer: Optional[str] = self.__compileTextAnswerCache.get(possibility)
+                    if cleanedAnswer is None:
+                        cleanedAnswer = await self.__compileTextAnswer(possibility)
+
                     cleanedAnswers.add(self.__whiteSpaceRegEx.sub(' ', cleanedAnswer).strip())
 
-        return list(answer for answer in cleanedAnswers if utils.isValidStr(answer))
+        cleanedAnswersList = list(answer for answer in cleanedAnswers if utils.isValidStr(answer))
+        self.__compileTextAnswersListCache.put(cacheKey, tuple(cleanedAnswersList))
+        return cleanedAnswersList
+
+    def __createFancyToLatinTranslationTable(self) -> Dict[int, Optional[str]]:
+        # Every special character that looks like a latin letter, grouped by that letter. If
+        # a character is listed under more than one letter, the earliest letter wins.
+        latinToSpecialChars: Dict[str, str] = {
+            'a': 'ÅåǺǻḀḁẚĂăẶặẮắẰằẲẳẴẵȂȃâẬậẤấẦầẪẫẨẩẢảǍǎȺⱥȦȧǠǡẠạÄäǞǟÀàȀȁÁáĀāÃãĄąᶏɑᶐⱯɐɒᴀᴬᵃᵄᶛₐªÅ∀@₳ΑαАаⲀⲁⒶⓐ⒜🅰𝔄𝔞𝕬𝖆𝓐𝓪𝒜𝒶𝔸𝕒Ａａ🄰ค𝐀𝐚𝗔𝗮𝘈𝘢𝘼𝙖𝙰𝚊Λ卂ﾑȺᗩΔልДдꚈꚉꚀꚁꙢꙣꭿꋫλ🅐🅰️ꙢꙣꙘѦԬꙙѧԭӒӓҨҩᲁÅ',
+            'b': 'ΒβⲂⲃВвБб𐌁ᛒ𐌱ɓʙɃƀḂḃḄḅḆḇƁᵬᶀꞖꞗᴃᴯᴮᵇƂƃ␢฿₿♭𝐁𝐛𝔹𝕓𝕭𝖇𝑩𝒃🄱🅱️Ⓑⓑ🅑ᙠᗷҍ𝔅𝔟𝓑𝓫𝗕𝗯𝘽𝙗𝘉𝘣Ｂｂ⒝𝙱𝚋𝖡𝖻🇧๖乃𝑏ƄЬᏏᖯᑲ𝒷𝚩ꓐ𝜝𝛣𝝗𐊂𝞑ℬᏴ𐊡𝐵ϐᲀ',
+            'c': 'СсɕʗᶜᶝᴄꟄꞔĆćĈĉČčĊċḈḉƇƈȻȼÇçꞒꞓↃↄ©℃¢₡₢₵₠ℂℭꜾꜿ𝑐𝗰ｃ𝕔ⲥ𐐽𝖈𝓬𝚌ꮯ𝔠ϲ𝒄𝘤𝒸𝙘𝐜𝖼ⅽ𝕮𝙲𝑪𝒞𝖢𐌂𝗖ꓚᏟＣⲤ𝓒Ⅽ𝘊𐐕𝘾🝌𝐂Ϲ𐊢𝐶ᲃ',
+            'd': 'ԀԁƊɗ𝓭𝚍ⅆ𝑑𝗱Ꮷ𝒅𝘥𝖉ᑯꓒ𝐝𝖽𝔡𝕕ⅾ𝒹𝙙Ꭰ𝕯ⅅ𝓓𝙳𝔇ᗪ𝑫𝘋Ⅾ𝒟𝘿ꓓ𝐃𝖣𝐷𝗗𝔻ᗞ',
+            'e': 'ẹėéèеẸĖÉÈЕ𝓮𝚎ｅ𝑒𝗲ⅇ𝒆𝘦℮𝖊ℯ𝐞𝖾ꬲ𝔢𝕖ҽ𝙚𝙴𝛦𝑬𝚬𝜠𝖤Ε𝗘𐊆𝝚𝓔𝞔Ｅ𝔈𝘌Ꭼℰ𝙀ꓰⴹϵ',
+            'f': 'f𝓯𝚏𝑓𝗳𝒇𝘧𝖋𝐟𝖿𝔣ꬵ𝕗ꞙ𝒻𝙛ẝ𝕱Ꞙ𝓕Ϝ𐊇ꓝ𝗙ℱᖴ𝙁𝙵𐊥𝐹',
+            'g': 'ġĠ𝓰𝚐ɡցᶃ𝑔𝗴ｇ𝒈𝘨ℊ𝖌𝐠𝗀𝔤𝕘𝙜Ꮐ𝑮𝘎𝕲𝐆𝖦Ԍ𝔊𝔾Ᏻ𝒢𝙂ꓖ𝓖𝙶𝐺𝗚',
+            'h': 'һҺᏂ𝖍𝓱𝚑ｈ𝔥ℎ𝒉𝘩հ𝒽𝙝𝐡𝗁𝗵𝕙𝑯𝚮𝕳𝛨𝖧ℋℌℍⲎ𐋏𝜢Η𝓗𝞖𝝜𝗛Н𝘏ꓧＨ𝐇𝙃𝙷Ꮋᕼ𝐻',
+            'i': 'іíïІÍÏ𝓲𝞲ꙇⅈｉ𝔦𝘪ӏ𝙞𝚤𝐢𝑖𝕚𝖎Ꭵ𝚒ɩɪ𝒊𝛊ⅰı𝒾𝜾⍳𝜄ꭵ𝗂𝝸ℹι𝗶𝚰𝘭𝖨𝐥ﺍﺎ𝔩ℐℑ𐊊Ⲓ𐌉ℓ𝜤Ɩ𝞘Ι𝚕𝟏∣اＩ𝗅𝕀𝙄𝓁𐌠𝐼𝑰ǀӀᛁ𝟭𝕴ߊｌ𝛪ⵏ𝝞𝕝𝟣𝙡𝓘𝗜𝟙𝑙ןⅠ𝘐١𝒍𝖑￨𝐈۱ꓲ|ⅼİιͅ',
+            'j': 'јʝЈꞲ𝖏𝓳𝚓ⅉ𝔧ｊ𝒋𝘫𝒿𝙟ϳ𝐣𝗃𝑗𝗷𝕛𝔍𝑱𝘑Ｊ𝒥𝙅Ꭻᒍ𝐉𝖩𝐽𝗝𝕁ꓙ𝕵𝓙𝙹Ϳ',
+            'k': 'κΚ𝖐𝓴𝚔𝔨𝒌𝘬𝓀𝙠𝐤𝗄𝑘𝗸𝕜𝑲𝚱𝒦𝜥𝛫𝖪𝝟𝗞ⲔᛕꓗК𝓚𝞙𝔎𝘒Ꮶ𝙆Ｋϰ',
+            'l': 'ӏḷӀḶ𝚰𝘭І𝖨𝐥ﺍﺎ𝔩ℐℑ𐊊Ⲓ𐌉ℓ𝜤Ɩ𝞘Ι𝚕𝟏∣ا𝗅𝕀𝙄𝓁𐌠𝐼𝑰ǀᛁ𝟭𝕴ߊｌ𝛪ⵏ𝝞𝕝𝟣ו𞣇𝙡𝓘𝗜𝟙𝑙ןⅠ𝘐١𝒍𝖑𝐈۱|ⅼ𝖫Ⳑ𝗟ℒ𝓛Ꮮꓡ𐐛𝘓𝙇ᒪⅬ',
+            'm': 'm𝔪𝕞𝓂𝙢𝓶𝚖𝑚𝗺ⅿ𝛭𝑴𝚳𝜧𐌑𝖬𝗠ᛖ𝝡Ⲙ𝓜ΜМ𝞛ꓟ𝔐𝘔𝙈𐊰𝐌ＭⅯ𝑀ᗰℳ𝕄Ꮇ𝕸Ϻ𝙼µ',
+            'n': 'ոՈΝれり𝒏𝘯𝖓𝐧𝗇𝔫𝕟𝓃𝙣𝓷𝚗ռ𝑛𝗻ꓠ𝛮𝐍𝖭𝚴𝔑𝜨Ｎ𝒩𝙉𝓝𝙽ℕ𝝢𝑁𝗡Ⲛ𝑵𝘕𝞜𝕹',
+            'o': 'оᴏοօØøǾǿÖöȪȫÓóÒòÔôỐốỒồỔổỖỗỘộǑǒŐőŎŏȎȏȮȯȰȱỌọƟɵƠơỚớỜờỠỡỢợỞởỎỏŌōṒṓṐṑÕõȬȭṌṍṎṏǪǫȌȍǬǭꝌꝍⱺᴏᴼᵒᴑᴓꬽꬾꬿꭃꭄₒꝊꝋ∅ºΟοⲞⲟОо𐌏ՕօＯｏ◎Ⓞ⒪⓪⓿⍟Ꜿꜿ𝘰ంಂംං𝐨𐓪𝚘ဝ𝛐ഠ𝛔𝗈𝝈𝝄𝞸𝞼၀σ๐໐𝕠𐐬𝙤ە𝑜𝒐ס𝜎𝖔٥०੦૦௦౦೦൦𝜊𝝾۵𝞂𝓸𝗼ჿ߀𝛰〇𐊒𝟬𝒪𝜪ዐ𝓞𝞞𝝤ⵔ𝟢𝗢𝟘𝘖ଠ𝟎𝐎০୦𝔒𝕆𝙊𐊫𝙾ꓳ𐐄𝟶𝑶𝚶𐓂𝕺ςᲂ',
+            'p': 'рРρ𝔭𝘱𝙥𝐩ｐ𝛠𝑝𝕡𝖕𝜚𝚙𝞎ⲣ𝝔𝛒𝒑𝟈𝝆𝓅𝜌𝗉𝞀ϱ𝗽⍴𝞺𝓹𝖯𝛲𝝦𝜬𝒫𐊕𝞠𝓟ꓑ𝗣ℙ𝘗𝐏ΡⲢᏢ𝙋ᑭＰ𝙿𝑃𝚸𝑷',
+            'q': 'զԶ𝔮գ𝒒𝘲𝓆𝙦𝐪𝗊𝑞𝗾𝕢𝖖ԛ𝓺𝚚𝐐𝖰𝔔𝒬𝙌𝓠𝚀𝑄𝗤ⵕ𝑸𝘘ℚ𝕼',
+            'r': 'r𝔯ꮁ𝒓𝘳ⲅᴦꭇꭈ𝓇𝙧𝐫𝗋𝑟𝗿г𝕣𝖗𝓻𝚛ᎡꓣƦ𝐑𝖱ᖇ𐒴𝑅𝗥Ꮢ𝕽𝓡𝚁ℛℜℝ',
+            's': 'ʂꟅꮪ𝐬𝗌𝑠𝘀ꜱｓ𝕤ѕ𝖘𝓼𝚜𐑈ƽ𝒮𝙎ꓢ𐐠Ѕ𝐒𝖲𝑆𝗦𐊖𝕊Տ𝕾ＳᏕ𝓢𝚂𝔖Ꮪ𝑺𝘚',
+            't': '𝐭𝗍𝔱𝕥𝓉𝙩𝓽𝚝𝑡𝘁𝒕𝘵𝖙𝒯𝜯𝖳𝗧𐊗𐌕𝝩🝨ꓔТᎢ⊤Τ𝐓Ⲧ𝑇𐊱𝕋Ｔ𝚃𝛵𝑻𝚻ᲄᲅ',
+            'u': 'υսüúùՍÜÚÙ𝐮𝔲ʋ𝙪ꭎ𐓶𝚞ꭒ𝑢𝒖𝛖ᴜ𝖚ꞟ𝜐𝗎𝓊𝝊𝓾𝞾𝞄𝘂𝘶𝒰𝙐ሀ⋃𝐔𝖴𝑈𝗨ᑌ𝖀𝓤𝚄ꓴ𐓎𝔘𝑼𝘜',
+            'v': 'νѵѴⱯ∀⋁𝐯𝔳𝕧𝙫𝚟𝑣ｖט𝒗𝖛ᴠ𝗏ꮩ𝓋𝓿ⅴ𝘃𝝂𝘷𝞶Ꮩ𝐕Ⅴꓦ٧𝙑ᐯ𝑽۷𝖁ⴸ𝖵',
+            'w': 'w𝐰𝗐ᴡѡաꮃ𝔴𝕨𝓌𝙬ɯ𝔀𝚠𝒘𝘸𝖜ԝ𝕎𝒲𝙒𝓦𝚆ꓪ𝑊𝗪ᎳᏔ𝖂𝐖𝖶Ԝ𝔚',
+            'x': 'хҳХҲᕁ𝓍𝙭𝐱𝗑⤫𝑥𝘅⤬᙮⨯𝕩𝖝×𝔁𝚡ｘⅹ𝔵ᕽ𝒙𝘹𝒳𝜲𝓧𝞦𐊐𝝬𐌗𝗫𝘟𝐗𝔛ⵝΧⅩ𝚇ꓫⲬ᙭𝑋𐊴𝑿𝚾╳Ꭓ𝖃ᚷＸ𝛸𐌢𝖷',
+            'y': 'уýУÝΥ𝙮𝐲𝝲𝑦ᶌ𝞬ʏ𝖞𝚢ｙꭚ𝒚𝓎ɣ𝗒ყ𝘆ү𝛾γ𝛄𝔂𝜸𝔶ℽ𝘺ỿϒ𝔜𝕐𝙔𝚈ⲨᎩ𐊲𝑌ꓬҮ𝒀𝖄𝖸Ｙ𝛶𝚼Ꮍ',
+            'z': 'ʐżŻ𝓏𝙯ᴢ𝐳𝗓ꮓ𝔃𝚣𝔷𝒛𝘻𝗭𝚭ᏃΖ𝘡𝜡𝙕𝞕ꓜ𝝛𝐙𝑍ℤℨ𝖅Ｚ𝒵𝖹',
+        }
+
+        translationTable: Dict[int, Optional[str]] = dict()
+
+        for latin, specialChars in latinToSpecialChars.items():
+            for specialChar in specialChars:
+                for variant in (specialChar, specialChar.lower(), specialChar.upper()):
+                    if len(variant) == 1:
+                        translationTable.setdefault(ord(variant), latin)
+
+        # combining diacritics are removed entirely
+        for start, end in ((0x0300, 0x036f), (0x1ab0, 0x1aff), (0x1dc0, 0x1dff), (0x20d0, 0x20ff), (0xfe20, 0xfe2f)):
+            for codePoint in range(start, end + 1):
+                translationTable.setdefault(codePoint, None)
+
+        return translationTable
 
     async def __expandSpecialCases(self, answer: str) -> List[str]:
         specialCases = await self.__expandSpecialCasesDecade(answer)
@@ -307,6 +371,12 @@ class TriviaAnswerCompiler():
 
     # returns text answers with all arabic and roman numerals expanded into possible full-word forms
     async def expandNumerals(self, answer: str) -> List[str]:
+        cachedAnswers: Optional[Tuple[str, ...]] = self.__expandNumeralsCache.get(answer)
+        if cachedAnswers is not None:
+            self.__cacheHitCount = self.__cacheHitCount + 1
+            return list(cachedAnswers)
+
+        self.__cacheMissCount = self.__cacheMissCount + 1
         split = self.__numeralRegEx.split(answer)
 
         for i in range(1, len(split), 2):
@@ -320,7 +390,9 @@ class TriviaAnswerCompiler():
                 # arabic numerals
                 split[i] = await self.__getArabicNumeralSubstitutes(match.group(1))
 
-        return list(set(''.join(item) for item in utils.permuteSubArrays(split)))
+        expandedAnswers = list(set(''.join(item) for item in utils.permuteSubArrays(split)))
+        self.__expandNumeralsCache.put(answer, tuple(expandedAnswers))
+        return expandedAnswers
 
     async def compileTextAnswerToMultipleChoiceOrdinal(self, answer: Optional[str]) -> int:
         if not utils.isValidStr(answer):
@@ -346,6 +418,12 @@ class TriviaAnswerCompiler():
         # this converts the answer 'A' into 0, 'B' into 1, 'C' into 2, and so on...
         return ord(cleanedAnswer.upper()) % 65
 
+    def getCacheHitCount(self) -> int:
+        return self.__cacheHitCount
+
+    def getCacheMissCount(self) -> int:
+        return self.__cacheMissCount
+
     async def __getArabicNumeralSubstitutes(self, arabicNumerals: str) -> List[str]:
         individualDigits = ' '.join([num2words(int(digit)) for digit in arabicNumerals])
         n = int(arabicNumerals)
@@ -497,11 +575,4 @@ class TriviaAnswerCompiler():
             return [ [ splitAnswer[0], *possible ] for possible in futurePossible ]
 
     async def __fancyToLatin(self, text: str) -> str:
-        text = ''.join(
-            self.__specialCharsRegEx.sub(
-                lambda m: {k: v for k, v in m.groupdict().items() if v}.popitem()[0],
-                char,
-            ) for char in text
-        )
-
-        return self.__combiningDiacriticsRegEx.sub('', text).strip()
+        return text.translate(self.__fancyToLatinTranslationTable).strip()
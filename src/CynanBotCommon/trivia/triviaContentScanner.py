@@ -129,13 +129,14 @@ class TriviaContentScanner(TriviaContentScannerInterface):
         if not isinstance(question, AbsTriviaQuestion):
             raise ValueError(f'question argument is malformed: \"{question}\"')
 
-        maxQuestionLength = await self.__triviaSettingsRepository.getMaxQuestionLength()
+        settingsSnapshot = await self.__triviaSettingsRepository.getSettingsSnapshot()
+        maxQuestionLength = settingsSnapshot.getMaxQuestionLength()
 
         if len(question.getQuestion()) >= maxQuestionLength:
             self.__timber.log('TriviaContentScanner', f'Trivia question is too long (max is {maxQuestionLength}): {question.getQuestion()}')
             return TriviaContentCode.QUESTION_TOO_LONG
 
-        maxPhraseAnswerLength = await self.__triviaSettingsRepository.getMaxPhraseAnswerLength()
+        maxPhraseAnswerLength = settingsSnapshot.getMaxPhraseAnswerLength()
 
         if question.getTriviaType() is TriviaType.QUESTION_ANSWER:
             for correctAnswer in question.getCorrectAnswers():
@@ -143,7 +144,7 @@ class TriviaContentScanner(TriviaContentScannerInterface):
                     self.__timber.log('TriviaContentScanner', f'Trivia answer is too long (max is {maxPhraseAnswerLength}): {question.getCorrectAnswers()}')
                     return TriviaContentCode.ANSWER_TOO_LONG
 
-        maxAnswerLength = await self.__triviaSettingsRepository.getMaxAnswerLength()
+        maxAnswerLength = settingsSnapshot.getMaxAnswerLength()
 
         for response in question.getResponses():
             if len(response) >= maxAnswerLength:
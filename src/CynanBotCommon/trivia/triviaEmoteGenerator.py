@@ -146,20 +146,22 @@ class TriviaEmoteGenerator(TriviaEmoteGeneratorInterface):
             raise ValueError(f'twitchChannel argument is malformed: \"{twitchChannel}\"')
 
         connection = await self.__getDatabaseConnection()
-        record = await connection.fetchRow(
-            '''
-                SELECT emoteindex FROM triviaemotes
-                WHERE twitchchannel = $1
-                LIMIT 1
-            ''',
-            twitchChannel
-        )
 
-        emoteIndex: Optional[int] = None
-        if utils.hasItems(record):
-            emoteIndex = record[0]
+        try:
+            record = await connection.fetchRow(
+                '''
+                    SELECT emoteindex FROM triviaemotes
+                    WHERE twitchchannel = $1
+                    LIMIT 1
+                ''',
+                twitchChannel
+            )
 
-        await connection.close()
+            emoteIndex: Optional[int] = None
+            if utils.hasItems(record):
+                emoteIndex = record[0]
+        finally:
+            await connection.close()
 
         if not utils.isValidInt(emoteIndex) or emoteIndex < 0 or emoteIndex >= len(self.__emotesList):
             emoteIndex = 0
@@ -178,16 +180,19 @@ class TriviaEmoteGenerator(TriviaEmoteGeneratorInterface):
         emoteIndex = (emoteIndex + 1) % len(self.__emotesList)
 
         connection = await self.__getDatabaseConnection()
-        await connection.execute(
-            '''
-                INSERT INTO triviaemotes (emoteindex, twitchchannel)
-                VALUES ($1, $2)
-                ON CONFLICT (twitchchannel) DO UPDATE SET emoteindex = EXCLUDED.emoteindex
-            ''',
-            emoteIndex, twitchChannel
-        )
-
-        await connection.close()
+
+        try:
+            await connection.execute(
+                '''
+                    INSERT INTO triviaemotes (emoteindex, twitchchannel)
+                    VALUES ($1, $2)
+                    ON CONFLICT (twitchchannel) DO UPDATE SET emoteindex = EXCLUDED.emoteindex
+                ''',
+                emoteIndex, twitchChannel
+            )
+        finally:
+            await connection.close()
+
         return self.__emotesList[emoteIndex]
 
     def getRandomEmote(self) -> str:
@@ -214,25 +219,26 @@ class TriviaEmoteGenerator(TriviaEmoteGeneratorInterface):
         self.__isDatabaseReady = True
         connection = await self.__backingDatabase.getConnection()
 
-        if connection.getDatabaseType() is DatabaseType.POSTGRESQL:
-            await connection.createTableIfNotExists(
-                '''
-                    CREATE TABLE IF NOT EXISTS triviaemotes (
-                        emoteindex smallint DEFAULT 0 NOT NULL,
-                        twitchchannel public.citext NOT NULL PRIMARY KEY
-                    )
-                '''
-            )
-        elif connection.getDatabaseType() is DatabaseType.SQLITE:
-            await connection.createTableIfNotExists(
-                '''
-                    CREATE TABLE IF NOT EXISTS triviaemotes (
-                        emoteindex INTEGER NOT NULL DEFAULT 0,
-                        twitchchannel TEXT NOT NULL PRIMARY KEY COLLATE NOCASE
-                    )
-                '''
-            )
-        else:
-            raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
-
-        await connection.close()
+        try:
+            if connection.getDatabaseType() is DatabaseType.POSTGRESQL:
+                await connection.createTableIfNotExists(
+                    '''
+                        CREATE TABLE IF NOT EXISTS triviaemotes (
+                            emoteindex smallint DEFAULT 0 NOT NULL,
+                            twitchchannel public.citext NOT NULL PRIMARY KEY
+                        )
+                    '''
+                )
+            elif connection.getDatabaseType() is DatabaseType.SQLITE:
+                await connection.createTableIfNotExists(
+                    '''
+                        CREATE TABLE IF NOT EXISTS triviaemotes (
+                            emoteindex INTEGER NOT NULL DEFAULT 0,
+                            twitchchannel TEXT NOT NULL PRIMARY KEY COLLATE NOCASE
+                        )
+                    '''
+                )
+            else:
+                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
+        finally:
+            await connection.close()
@@ -102,6 +102,12 @@ class NoTriviaQuestionException(Exception):
         super().__init__(message)
 
 
+class NoTriviaSourcesAvailableException(Exception):
+
+    def __init__(self, message: str):
+        super().__init__(message)
+
+
 class TooManyAdditionalTriviaAnswersException(Exception):
 
     def __init__(
@@ -0,0 +1,54 @@
+import heapq
+from datetime import datetime
+from itertools import count
+from typing import Iterator, List, Optional, Tuple
+
+try:
+    from CynanBotCommon.trivia.absTriviaGameState import AbsTriviaGameState
+except:
+    from trivia.absTriviaGameState import AbsTriviaGameState
+
+
+class TriviaGameDeadlineHeap():
+
+    def __init__(self):
+        # The sequence number keeps entries with the same deadline in the order that they were
+        # pushed, and stops heapq from ever needing to compare two game states with one another.
+        # An entry without a game state is a wake up that isn't tied to any one game.
+        self.__entries: List[Tuple[datetime, int, Optional[AbsTriviaGameState]]] = list()
+        self.__sequence: Iterator[int] = count()
+
+    def getNextDeadline(self) -> Optional[datetime]:
+        if len(self.__entries) == 0:
+            return None
+
+        return self.__entries[0][0]
+
+    def getSize(self) -> int:
+        return len(self.__entries)
+
+    def popExpired(self, now: datetime) -> List[AbsTriviaGameState]:
+        if not isinstance(now, datetime):
+            raise ValueError(f'now argument is malformed: \"{now}\"')
+
+        expiredStates: List[AbsTriviaGameState] = list()
+
+        while len(self.__entries) >= 1 and self.__entries[0][0] <= now:
+            state = heapq.heappop(self.__entries)[2]
+
+            if state is not None:
+                expiredStates.append(state)
+
+        return expiredStates
+
+    def push(self, state: AbsTriviaGameState):
+        if not isinstance(state, AbsTriviaGameState):
+            raise ValueError(f'state argument is malformed: \"{state}\"')
+
+        heapq.heappush(self.__entries, (state.getEndTime(), next(self.__sequence), state))
+
+    def pushWakeUp(self, deadline: datetime):
+        if not isinstance(deadline, datetime):
+            raise ValueError(f'deadline argument is malformed: \"{deadline}\"')
+
+        heapq.heappush(self.__entries, (deadline, next(self.__sequence), None))
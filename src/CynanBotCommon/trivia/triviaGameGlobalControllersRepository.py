@@ -82,48 +82,53 @@ class TriviaGameGlobalControllersRepository():
             return AddTriviaGameControllerResult.ERROR
 
         connection = await self.__getDatabaseConnection()
-        record = await connection.fetchRow(
-            '''
-                SELECT COUNT(1) FROM triviagameglobalcontrollers
-                WHERE userid = $1
-                LIMIT 1
-            ''',
-            userId
-        )
 
-        count: Optional[int] = None
-        if utils.hasItems(record):
-            count = record[0]
+        try:
+            record = await connection.fetchRow(
+                '''
+                    SELECT COUNT(1) FROM triviagameglobalcontrollers
+                    WHERE userid = $1
+                    LIMIT 1
+                ''',
+                userId
+            )
+
+            count: Optional[int] = None
+            if utils.hasItems(record):
+                count = record[0]
 
-        if utils.isValidInt(count) and count >= 1:
+            if utils.isValidInt(count) and count >= 1:
+                self.__timber.log('TriviaGameGlobalControllersRepository', f'Tried to add userName=\"{userName}\" userId=\"{userId}\" as a trivia game global controller, but this user has already been added as one')
+                return AddTriviaGameControllerResult.ALREADY_EXISTS
+
+            await connection.execute(
+                '''
+                    INSERT INTO triviagameglobalcontrollers (userid)
+                    VALUES ($1)
+                    ON CONFLICT (userid) DO NOTHING
+                ''',
+                userId
+            )
+        finally:
             await connection.close()
-            self.__timber.log('TriviaGameGlobalControllersRepository', f'Tried to add userName=\"{userName}\" userId=\"{userId}\" as a trivia game global controller, but this user has already been added as one')
-            return AddTriviaGameControllerResult.ALREADY_EXISTS
-
-        await connection.execute(
-            '''
-                INSERT INTO triviagameglobalcontrollers (userid)
-                VALUES ($1)
-                ON CONFLICT (userid) DO NOTHING
-            ''',
-            userId
-        )
 
-        await connection.close()
         self.__timber.log('TriviaGameGlobalControllersRepository', f'Added userName=\"{userName}\" userId=\"{userId}\" as a trivia game global controller')
         return AddTriviaGameControllerResult.ADDED
 
     async def getControllers(self) -> List[TriviaGameGlobalController]:
         connection = await self.__getDatabaseConnection()
-        records = await connection.fetchRows(
-            '''
-                SELECT triviagameglobalcontrollers.userid, userids.username FROM triviagameglobalcontrollers
-                INNER JOIN userids ON triviagameglobalcontrollers.userid = userids.userid
-                ORDER BY userids.username ASC
-            '''
-        )
 
-        await connection.close()
+        try:
+            records = await connection.fetchRows(
+                '''
+                    SELECT triviagameglobalcontrollers.userid, userids.username FROM triviagameglobalcontrollers
+                    INNER JOIN userids ON triviagameglobalcontrollers.userid = userids.userid
+                    ORDER BY userids.username ASC
+                '''
+            )
+        finally:
+            await connection.close()
+
         controllers: List[TriviaGameGlobalController] = list()
 
         if not utils.hasItems(records):
@@ -150,26 +155,27 @@ class TriviaGameGlobalControllersRepository():
         self.__isDatabaseReady = True
         connection = await self.__backingDatabase.getConnection()
 
-        if connection.getDatabaseType() is DatabaseType.POSTGRESQL:
-            await connection.createTableIfNotExists(
-                '''
-                    CREATE TABLE IF NOT EXISTS triviagameglobalcontrollers (
-                        userid public.citext NOT NULL PRIMARY KEY
-                    )
-                '''
-            )
-        elif connection.getDatabaseType() is DatabaseType.SQLITE:
-            await connection.createTableIfNotExists(
-                '''
-                    CREATE TABLE IF NOT EXISTS triviagameglobalcontrollers (
-                        userid TEXT NOT NULL PRIMARY KEY COLLATE NOCASE
-                    )
-                '''
-            )
-        else:
-            raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
-
-        await connection.close()
+        try:
+            if connection.getDatabaseType() is DatabaseType.POSTGRESQL:
+                await connection.createTableIfNotExists(
+                    '''
+                        CREATE TABLE IF NOT EXISTS triviagameglobalcontrollers (
+                            userid public.citext NOT NULL PRIMARY KEY
+                        )
+                    '''
+                )
+            elif connection.getDatabaseType() is DatabaseType.SQLITE:
+                await connection.createTableIfNotExists(
+                    '''
+                        CREATE TABLE IF NOT EXISTS triviagameglobalcontrollers (
+                            userid TEXT NOT NULL PRIMARY KEY COLLATE NOCASE
+                        )
+                    '''
+                )
+            else:
+                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
+        finally:
+            await connection.close()
 
     async def removeController(self, userName: str) -> RemoveTriviaGameControllerResult:
         if not utils.isValidStr(userName):
@@ -182,15 +188,18 @@ class TriviaGameGlobalControllersRepository():
             return RemoveTriviaGameControllerResult.ERROR
 
         connection = await self.__backingDatabase.getConnection()
-        await connection.execute(
-            '''
-                DELETE FROM triviagameglobalcontrollers
-                WHERE userid = $1
-            ''',
-            userId
-        )
 
-        await connection.close()
+        try:
+            await connection.execute(
+                '''
+                    DELETE FROM triviagameglobalcontrollers
+                    WHERE userid = $1
+                ''',
+                userId
+            )
+        finally:
+            await connection.close()
+
         self.__timber.log('TriviaGameGlobalControllersRepository', f'Removed userName=\"{userName}\" userId=\"{userId}\" as a trivia game global controller')
 
         return RemoveTriviaGameControllerResult.REMOVED
@@ -1,13 +1,14 @@
 import asyncio
-import queue
 import traceback
+from collections import deque
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta, timezone
-from queue import SimpleQueue
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional, Set
 
 try:
     import CynanBotCommon.utils as utils
     from CynanBotCommon.backgroundTaskHelper import BackgroundTaskHelper
+    from CynanBotCommon.cuteness.cutenessIncrement import CutenessIncrement
     from CynanBotCommon.cuteness.cutenessRepositoryInterface import \
         CutenessRepositoryInterface
     from CynanBotCommon.timber.timberInterface import TimberInterface
@@ -80,13 +81,15 @@ try:
     from CynanBotCommon.trivia.triviaGameMachineInterface import \
         TriviaGameMachineInterface
     from CynanBotCommon.trivia.triviaGameState import TriviaGameState
+    from CynanBotCommon.trivia.triviaGameDeadlineHeap import \
+        TriviaGameDeadlineHeap
     from CynanBotCommon.trivia.triviaGameStoreInterface import \
         TriviaGameStoreInterface
     from CynanBotCommon.trivia.triviaGameType import TriviaGameType
     from CynanBotCommon.trivia.triviaRepositories.triviaRepositoryInterface import \
         TriviaRepositoryInterface
-    from CynanBotCommon.trivia.triviaScoreRepository import \
-        TriviaScoreRepository
+    from CynanBotCommon.trivia.triviaScoreRepositoryInterface import \
+        TriviaScoreRepositoryInterface
     from CynanBotCommon.trivia.triviaSettingsRepositoryInterface import \
         TriviaSettingsRepositoryInterface
     from CynanBotCommon.trivia.wrongUserCheckAnswerTriviaEvent import \
@@ -98,6 +101,7 @@ try:
 except:
     import utils
     from backgroundTaskHelper import BackgroundTaskHelper
+    from cuteness.cutenessIncrement import CutenessIncrement
     from cuteness.cutenessRepositoryInterface import \
         CutenessRepositoryInterface
     from timber.timberInterface import TimberInterface
@@ -160,11 +164,13 @@ except:
                                          UnknownTriviaGameTypeException)
     from trivia.triviaGameMachineInterface import TriviaGameMachineInterface
     from trivia.triviaGameState import TriviaGameState
+    from trivia.triviaGameDeadlineHeap import TriviaGameDeadlineHeap
     from trivia.triviaGameStoreInterface import TriviaGameStoreInterface
     from trivia.triviaGameType import TriviaGameType
     from trivia.triviaRepositories.triviaRepositoryInterface import \
         TriviaRepositoryInterface
-    from trivia.triviaScoreRepository import TriviaScoreRepository
+    from trivia.triviaScoreRepositoryInterface import \
+        TriviaScoreRepositoryInterface
     from trivia.triviaSettingsRepositoryInterface import \
         TriviaSettingsRepositoryInterface
     from trivia.wrongUserCheckAnswerTriviaEvent import \
@@ -190,12 +196,14 @@ class TriviaGameMachine(TriviaGameMachineInterface):
         triviaEmoteGenerator: TriviaEmoteGeneratorInterface,
         triviaGameStore: TriviaGameStoreInterface,
         triviaRepository: TriviaRepositoryInterface,
-        triviaScoreRepository: TriviaScoreRepository,
+        triviaScoreRepository: TriviaScoreRepositoryInterface,
         triviaSettingsRepository: TriviaSettingsRepositoryInterface,
         twitchTokensRepository: TwitchTokensRepositoryInterface,
         userIdsRepository: UserIdsRepositoryInterface,
         sleepTimeSeconds: float = 0.5,
         queueTimeoutSeconds: int = 3,
+        maxQueueSize: int = 1000,
+        maxConcurrentActionLanes: int = 8,
         timeZone: timezone = timezone.utc
     ):
         if not isinstance(backgroundTaskHelper, BackgroundTaskHelper):
@@ -220,7 +228,7 @@ class TriviaGameMachine(TriviaGameMachineInterface):
             raise ValueError(f'triviaGameStore argument is malformed: \"{triviaGameStore}\"')
         elif not isinstance(triviaRepository, TriviaRepositoryInterface):
             raise ValueError(f'triviaRepository argument is malformed: \"{triviaRepository}\"')
-        elif not isinstance(triviaScoreRepository, TriviaScoreRepository):
+        elif not isinstance(triviaScoreRepository, TriviaScoreRepositoryInterface):
             raise ValueError(f'triviaScoreRepository argument is malformed: \"{triviaScoreRepository}\"')
         elif not isinstance(triviaSettingsRepository, TriviaSettingsRepositoryInterface):
             raise ValueError(f'triviaSettingsRepository argument is malformed: \"{triviaSettingsRepository}\"')
@@ -236,6 +244,14 @@ class TriviaGameMachine(TriviaGameMachineInterface):
             raise ValueError(f'queueTimeoutSeconds argument is malformed: \"{queueTimeoutSeconds}\"')
         elif queueTimeoutSeconds < 1 or queueTimeoutSeconds > 5:
             raise ValueError(f'queueTimeoutSeconds argument is out of bounds: {queueTimeoutSeconds}')
+        elif not utils.isValidInt(maxQueueSize):
+            raise ValueError(f'maxQueueSize argument is malformed: \"{maxQueueSize}\"')
+        elif maxQueueSize < 1 or maxQueueSize > utils.getIntMaxSafeSize():
+            raise ValueError(f'maxQueueSize argument is out of bounds: {maxQueueSize}')
+        elif not utils.isValidInt(maxConcurrentActionLanes):
+            raise ValueError(f'maxConcurrentActionLanes argument is malformed: \"{maxConcurrentActionLanes}\"')
+        elif maxConcurrentActionLanes < 1 or maxConcurrentActionLanes > utils.getIntMaxSafeSize():
+            raise ValueError(f'maxConcurrentActionLanes argument is out of bounds: {maxConcurrentActionLanes}')
         elif not isinstance(timeZone, timezone):
             raise ValueError(f'timeZone argument is malformed: \"{timeZone}\"')
 
@@ -250,18 +266,47 @@ class TriviaGameMachine(TriviaGameMachineInterface):
         self.__triviaEmoteGenerator: TriviaEmoteGeneratorInterface = triviaEmoteGenerator
         self.__triviaGameStore: TriviaGameStoreInterface = triviaGameStore
         self.__triviaRepository: TriviaRepositoryInterface = triviaRepository
-        self.__triviaScoreRepository: TriviaScoreRepository = triviaScoreRepository
+        self.__triviaScoreRepository: TriviaScoreRepositoryInterface = triviaScoreRepository
         self.__triviaSettingsRepository: TriviaSettingsRepositoryInterface = triviaSettingsRepository
         self.__twitchTokensRepository: TwitchTokensRepositoryInterface = twitchTokensRepository
         self.__userIdsRepository: UserIdsRepositoryInterface = userIdsRepository
+        # nothing polls anymore, so this is only the delay before retrying a super trivia game that can't start yet
         self.__sleepTimeSeconds: float = sleepTimeSeconds
         self.__queueTimeoutSeconds: int = queueTimeoutSeconds
+        self.__maxQueueSize: int = maxQueueSize
         self.__timeZone: timezone = timeZone
 
         self.__isStarted: bool = False
         self.__eventListener: Optional[TriviaEventListener] = None
-        self.__actionQueue: SimpleQueue[AbsTriviaAction] = SimpleQueue()
-        self.__eventQueue: SimpleQueue[AbsTriviaEvent] = SimpleQueue()
+        self.__eventListenerSetEvent: asyncio.Event = asyncio.Event()
+        self.__actionQueue: asyncio.Queue[AbsTriviaAction] = asyncio.Queue(maxsize = maxQueueSize)
+        self.__eventQueue: asyncio.Queue[AbsTriviaEvent] = asyncio.Queue(maxsize = maxQueueSize)
+
+        # Actions are handled in a separate lane for each Twitch channel, so that a slow action
+        # in one channel never holds up any other channel. Within a channel, actions are still
+        # handled one at a time and in order, and never interleave with the expiring of that
+        # channel's games, otherwise a game could be both won and timed out.
+        self.__actionLanes: Dict[str, Deque[AbsTriviaAction]] = dict()
+        self.__actionLanesSemaphore: asyncio.Semaphore = asyncio.Semaphore(maxConcurrentActionLanes)
+        self.__twitchChannelLocks: Dict[str, asyncio.Lock] = dict()
+        self.__twitchChannelLockUsers: Dict[str, int] = dict()
+
+        # The refresh loop sleeps until the earliest game deadline, or until it is woken up
+        # early because a game with an even earlier deadline was just added.
+        self.__triviaGameDeadlines: TriviaGameDeadlineHeap = TriviaGameDeadlineHeap()
+        self.__refreshEvent: asyncio.Event = asyncio.Event()
+
+    async def __addTriviaGame(self, state: AbsTriviaGameState):
+        if not isinstance(state, AbsTriviaGameState):
+            raise ValueError(f'state argument is malformed: \"{state}\"')
+
+        await self.__triviaGameStore.add(state)
+
+        nextDeadline = self.__triviaGameDeadlines.getNextDeadline()
+        self.__triviaGameDeadlines.push(state)
+
+        if nextDeadline is None or state.getEndTime() < nextDeadline:
+            self.__refreshEvent.set()
 
     async def __applyToxicSuperTriviaPunishment(
         self,
@@ -287,7 +332,7 @@ class TriviaGameMachine(TriviaGameMachineInterface):
             del answeredUserIds[action.getUserId()]
 
         twitchAccessToken = await self.__twitchTokensRepository.getAccessToken(state.getTwitchChannel())
-        toxicTriviaPunishments: List[ToxicTriviaPunishment] = list()
+        cutenessIncrements: List[CutenessIncrement] = list()
         totalPointsStolen = 0
 
         for userId, answerCount in answeredUserIds.items():
@@ -299,19 +344,27 @@ class TriviaGameMachine(TriviaGameMachineInterface):
                 twitchAccessToken = twitchAccessToken
             )
 
-            cutenessResult = await self.__cutenessRepository.fetchCutenessIncrementedBy(
+            cutenessIncrements.append(CutenessIncrement(
                 incrementAmount = punishedByPoints,
-                twitchChannel = state.getTwitchChannel(),
                 userId = userId,
                 userName = userName
-            )
+            ))
+
+        # all of the punishments are written to the database together in one batch
+        cutenessResults = await self.__cutenessRepository.fetchCutenessesIncrementedBy(
+            twitchChannel = state.getTwitchChannel(),
+            increments = cutenessIncrements
+        )
 
+        toxicTriviaPunishments: List[ToxicTriviaPunishment] = list()
+
+        for cutenessIncrement, cutenessResult in zip(cutenessIncrements, cutenessResults):
             toxicTriviaPunishments.append(ToxicTriviaPunishment(
                 cutenessResult = cutenessResult,
-                numberOfPunishments = answerCount,
-                punishedByPoints = punishedByPoints,
-                userId = userId,
-                userName = userName
+                numberOfPunishments = answeredUserIds[cutenessIncrement.getUserId()],
+                punishedByPoints = cutenessIncrement.getIncrementAmount(),
+                userId = cutenessIncrement.getUserId(),
+                userName = cutenessIncrement.getUserName()
             ))
 
         self.__timber.log('TriviaGameMachine', f'Applied toxic trivia punishments to {len(toxicTriviaPunishments)} user(s) in \"{state.getTwitchChannel()}\" for a total punishment of {totalPointsStolen} point(s)')
@@ -339,7 +392,7 @@ class TriviaGameMachine(TriviaGameMachineInterface):
             )
 
             self.__timber.log('TriviaGameMachine', f'Starting new queued super trivia game for \"{queuedSuperGame.getTwitchChannel()}\", with {remainingQueueSize} game(s) remaining in their queue (actionId=\"{queuedSuperGame.getActionId()}\")')
-            await self.__handleActionStartNewSuperTriviaGame(queuedSuperGame)
+            self.__submitActionToLane(queuedSuperGame)
 
     async def __checkAnswer(
         self,
@@ -352,6 +405,15 @@ class TriviaGameMachine(TriviaGameMachineInterface):
 
         return await self.__triviaAnswerChecker.checkAnswer(answer, triviaQuestion, extras)
 
+    def __getSuperAnswerGuessKey(self, answer: Optional[str], maxPhraseGuessLength: int) -> Optional[str]:
+        # TriviaAnswerChecker lowercases and strips a question/answer guess before doing anything
+        # else with it, so guesses that only differ by those are sure to have the same result.
+        # Guesses that are too long get truncated before that though, so those are left as is.
+        if not utils.isValidStr(answer) or len(answer) > maxPhraseGuessLength:
+            return answer
+
+        return answer.lower().strip()
+
     async def __handleActionCheckAnswer(self, action: CheckAnswerTriviaAction):
         if not isinstance(action, CheckAnswerTriviaAction):
             raise ValueError(f'action argument is malformed: \"{action}\"')
@@ -477,53 +539,84 @@ class TriviaGameMachine(TriviaGameMachineInterface):
         ))
 
     async def __handleActionCheckSuperAnswer(self, action: CheckSuperAnswerTriviaAction):
-        if not isinstance(action, CheckSuperAnswerTriviaAction):
-            raise ValueError(f'action argument is malformed: \"{action}\"')
-        elif action.getTriviaActionType() is not TriviaActionType.CHECK_SUPER_ANSWER:
-            raise RuntimeError(f'TriviaActionType is not {TriviaActionType.CHECK_SUPER_ANSWER}: \"{action.getTriviaActionType()}\"')
-
-        state = await self.__triviaGameStore.getSuperGame(action.getTwitchChannel())
-
-        if state is None:
-            await self.__submitEvent(SuperGameNotReadyCheckAnswerTriviaEvent(
-                actionId = action.getActionId(),
-                answer = action.getAnswer(),
-                twitchChannel = action.getTwitchChannel(),
-                userId = action.getUserId(),
-                userName = action.getUserName()
-            ))
-            return
+        await self.__handleActionsCheckSuperAnswer([ action ])
+
+    async def __handleActionsCheckSuperAnswer(self, actions: List[CheckSuperAnswerTriviaAction]):
+        if not utils.hasItems(actions):
+            raise ValueError(f'actions argument is malformed: \"{actions}\"')
+
+        for action in actions:
+            if not isinstance(action, CheckSuperAnswerTriviaAction):
+                raise ValueError(f'actions argument contains a malformed action: \"{action}\"')
+            elif action.getTriviaActionType() is not TriviaActionType.CHECK_SUPER_ANSWER:
+                raise RuntimeError(f'TriviaActionType is not {TriviaActionType.CHECK_SUPER_ANSWER}: \"{action.getTriviaActionType()}\"')
+
+        # every action here is for the same Twitch channel, so the game only needs to be looked up
+        # once for all of them
+        state = await self.__triviaGameStore.getSuperGame(actions[0].getTwitchChannel())
+        settingsSnapshot = await self.__triviaSettingsRepository.getSettingsSnapshot()
+        checkResults: Dict[Optional[str], TriviaAnswerCheckResult] = dict()
+
+        for action in actions:
+            if state is None:
+                await self.__submitEvent(SuperGameNotReadyCheckAnswerTriviaEvent(
+                    actionId = action.getActionId(),
+                    answer = action.getAnswer(),
+                    twitchChannel = action.getTwitchChannel(),
+                    userId = action.getUserId(),
+                    userName = action.getUserName()
+                ))
+                continue
+
+            if not state.isEligibleToAnswer(action.getUserId()):
+                continue
+
+            state.incrementAnswerCount(action.getUserId())
+
+            # many chatters tend to guess the same thing at the same time, so each distinct guess
+            # is only checked once
+            guessKey = self.__getSuperAnswerGuessKey(action.getAnswer(), settingsSnapshot.getMaxPhraseGuessLength())
+            checkResult = checkResults.get(guessKey)
+
+            if checkResult is None:
+                checkResult = await self.__checkAnswer(
+                    answer = action.getAnswer(),
+                    triviaQuestion = state.getTriviaQuestion(),
+                    extras = {
+                        'actionId': action.getActionId(),
+                        'twitchChannel': action.getTwitchChannel(),
+                        'userId': action.getUserId(),
+                        'userName': action.getUserName()
+                    }
+                )
 
-        if not state.isEligibleToAnswer(action.getUserId()):
-            return
+                checkResults[guessKey] = checkResult
+
+            # we're intentionally ONLY checking for TriviaAnswerCheckResult.CORRECT
+            if checkResult is not TriviaAnswerCheckResult.CORRECT:
+                await self.__submitEvent(IncorrectSuperAnswerTriviaEvent(
+                    triviaQuestion = state.getTriviaQuestion(),
+                    specialTriviaStatus = state.getSpecialTriviaStatus(),
+                    actionId = action.getActionId(),
+                    answer = action.getAnswer(),
+                    emote = state.getEmote(),
+                    gameId = state.getGameId(),
+                    twitchChannel = action.getTwitchChannel(),
+                    userId = action.getUserId(),
+                    userName = action.getUserName()
+                ))
+                continue
 
-        state.incrementAnswerCount(action.getUserId())
+            await self.__handleCorrectSuperAnswer(action, state)
 
-        checkResult = await self.__checkAnswer(
-            answer = action.getAnswer(),
-            triviaQuestion = state.getTriviaQuestion(),
-            extras = {
-                'actionId': action.getActionId(),
-                'twitchChannel': action.getTwitchChannel(),
-                'userId': action.getUserId(),
-                'userName': action.getUserName()
-            }
-        )
+            # the game is now over, so no more answers need to be checked
+            state = None
 
-        # we're intentionally ONLY checking for TriviaAnswerCheckResult.CORRECT
-        if checkResult is not TriviaAnswerCheckResult.CORRECT:
-            await self.__submitEvent(IncorrectSuperAnswerTriviaEvent(
-                triviaQuestion = state.getTriviaQuestion(),
-                specialTriviaStatus = state.getSpecialTriviaStatus(),
-                actionId = action.getActionId(),
-                answer = action.getAnswer(),
-                emote = state.getEmote(),
-                gameId = state.getGameId(),
-                twitchChannel = action.getTwitchChannel(),
-                userId = action.getUserId(),
-                userName = action.getUserName()
-            ))
-            return
+    async def __handleCorrectSuperAnswer(self, action: CheckSuperAnswerTriviaAction, state: SuperTriviaGameState):
+        if not isinstance(action, CheckSuperAnswerTriviaAction):
+            raise ValueError(f'action argument is malformed: \"{action}\"')
+        elif not isinstance(state, SuperTriviaGameState):
+            raise ValueError(f'state argument is malformed: \"{state}\"')
 
         await self.__removeSuperTriviaGame(action.getTwitchChannel())
         toxicTriviaPunishmentResult: Optional[ToxicTriviaPunishmentResult] = None
@@ -667,7 +760,7 @@ class TriviaGameMachine(TriviaGameMachineInterface):
             userName = action.getUserName()
         )
 
-        await self.__triviaGameStore.add(state)
+        await self.__addTriviaGame(state)
 
         await self.__submitEvent(NewTriviaGameEvent(
             triviaQuestion = triviaQuestion,
@@ -716,7 +809,7 @@ class TriviaGameMachine(TriviaGameMachineInterface):
             # channel is on cooldown. This situation occurs if this Twitch channel just finished answering
             # a super trivia question, and prevents us from just immediately jumping into the next super
             # trivia question.
-            self.submitAction(action)
+            self.__backgroundTaskHelper.createTask(self.__resubmitActionAfterDelay(action, self.__sleepTimeSeconds))
             return
 
         superTriviaFirstQuestionDelay = timedelta(
@@ -728,7 +821,8 @@ class TriviaGameMachine(TriviaGameMachineInterface):
             # was created too recently. We don't want super trivia questions to start instantaneously, as
             # it could mean that some people in chat are not ready to answer at first. So this minor delay
             # helps prevent such a situation.
-            self.submitAction(action)
+            remainingDelaySeconds = (action.getCreationTime() + superTriviaFirstQuestionDelay - now).total_seconds()
+            self.__backgroundTaskHelper.createTask(self.__resubmitActionAfterDelay(action, max(remainingDelaySeconds, self.__sleepTimeSeconds)))
             return
 
         emote = await self.__triviaEmoteGenerator.getNextEmoteFor(action.getTwitchChannel())
@@ -776,7 +870,7 @@ class TriviaGameMachine(TriviaGameMachineInterface):
             twitchChannel = action.getTwitchChannel()
         )
 
-        await self.__triviaGameStore.add(state)
+        await self.__addTriviaGame(state)
 
         await self.__submitEvent(NewSuperTriviaGameEvent(
             triviaQuestion = triviaQuestion,
@@ -789,26 +883,77 @@ class TriviaGameMachine(TriviaGameMachineInterface):
             twitchChannel = action.getTwitchChannel(),
         ))
 
+    async def __isTriviaGameStillActive(self, state: AbsTriviaGameState) -> bool:
+        if not isinstance(state, AbsTriviaGameState):
+            raise ValueError(f'state argument is malformed: \"{state}\"')
+
+        currentState: Optional[AbsTriviaGameState] = None
+
+        if state.getTriviaGameType() is TriviaGameType.NORMAL:
+            currentState = await self.__triviaGameStore.getNormalGame(
+                twitchChannel = state.getTwitchChannel(),
+                userId = state.getUserId()
+            )
+        elif state.getTriviaGameType() is TriviaGameType.SUPER:
+            currentState = await self.__triviaGameStore.getSuperGame(state.getTwitchChannel())
+        else:
+            raise UnknownTriviaGameTypeException(f'Unknown TriviaGameType (gameId=\"{state.getGameId()}\") (twitchChannel=\"{state.getTwitchChannel()}\") (actionId=\"{state.getActionId()}\"): \"{state.getTriviaGameType()}\"')
+
+        return currentState is not None and currentState.getGameId() == state.getGameId()
+
+    @asynccontextmanager
+    async def __lockTwitchChannel(self, twitchChannel: str) -> AsyncIterator[None]:
+        lock = self.__twitchChannelLocks.get(twitchChannel)
+
+        if lock is None:
+            lock = asyncio.Lock()
+            self.__twitchChannelLocks[twitchChannel] = lock
+
+        # everything holding or waiting on this lock is counted, so that it can be thrown away as
+        # soon as this channel is idle, without two different locks ever being handed out for it
+        self.__twitchChannelLockUsers[twitchChannel] = self.__twitchChannelLockUsers.get(twitchChannel, 0) + 1
+
+        try:
+            async with lock:
+                yield
+        finally:
+            lockUsers = self.__twitchChannelLockUsers[twitchChannel] - 1
+
+            if lockUsers == 0:
+                del self.__twitchChannelLocks[twitchChannel]
+                del self.__twitchChannelLockUsers[twitchChannel]
+            else:
+                self.__twitchChannelLockUsers[twitchChannel] = lockUsers
+
     async def __refreshStatusOfTriviaGames(self):
         await self.__removeDeadTriviaGames()
         await self.__beginQueuedTriviaGames()
 
+    async def __removeDeadTriviaGame(self, state: AbsTriviaGameState):
+        if not isinstance(state, AbsTriviaGameState):
+            raise ValueError(f'state argument is malformed: \"{state}\"')
+
+        try:
+            async with self.__lockTwitchChannel(state.getTwitchChannel().lower()):
+                # games that were already answered are left in the heap rather than searched for
+                # and removed, so they need to be skipped here
+                if not await self.__isTriviaGameStillActive(state):
+                    return
+
+                if state.getTriviaGameType() is TriviaGameType.NORMAL:
+                    await self.__removeDeadNormalTriviaGame(state)
+                elif state.getTriviaGameType() is TriviaGameType.SUPER:
+                    await self.__removeDeadSuperTriviaGame(state)
+        except Exception as e:
+            self.__timber.log('TriviaGameMachine', f'Encountered unknown Exception when removing dead trivia game (gameId=\"{state.getGameId()}\") (twitchChannel=\"{state.getTwitchChannel()}\"): {e}', e, traceback.format_exc())
+
     async def __removeDeadTriviaGames(self):
         now = datetime.now(self.__timeZone)
-        gameStates = await self.__triviaGameStore.getAll()
-        gameStatesToRemove: List[AbsTriviaGameState] = list()
-
-        for state in gameStates:
-            if state.getEndTime() < now:
-                gameStatesToRemove.append(state)
-
-        for state in gameStatesToRemove:
-            if state.getTriviaGameType() is TriviaGameType.NORMAL:
-                await self.__removeDeadNormalTriviaGame(state)
-            elif state.getTriviaGameType() is TriviaGameType.SUPER:
-                await self.__removeDeadSuperTriviaGame(state)
-            else:
-                raise UnknownTriviaGameTypeException(f'Unknown TriviaGameType (gameId=\"{state.getGameId()}\") (twitchChannel=\"{state.getTwitchChannel()}\") (actionId=\"{state.getActionId()}\"): \"{state.getTriviaGameType()}\"')
+
+        for state in self.__triviaGameDeadlines.popExpired(now):
+            # a channel that is busy handling a slow action must not hold up the expiring of any
+            # other channel's games
+            self.__backgroundTaskHelper.createTask(self.__removeDeadTriviaGame(state))
 
     async def __removeDeadNormalTriviaGame(self, state: TriviaGameState):
         if not isinstance(state, TriviaGameState):
@@ -888,68 +1033,104 @@ class TriviaGameMachine(TriviaGameMachineInterface):
         await self.__triviaGameStore.removeSuperGame(twitchChannel)
         await self.__superTriviaCooldownHelper.update(twitchChannel)
 
+        # wake up once this channel's cooldown is over, so that its next queued game can begin
+        superTriviaCooldownSeconds = await self.__triviaSettingsRepository.getSuperTriviaCooldownSeconds()
+        self.__triviaGameDeadlines.pushWakeUp(datetime.now(self.__timeZone) + timedelta(seconds = superTriviaCooldownSeconds))
+        self.__refreshEvent.set()
+
+    async def __resubmitActionAfterDelay(self, action: AbsTriviaAction, delaySeconds: float):
+        if not isinstance(action, AbsTriviaAction):
+            raise ValueError(f'action argument is malformed: \"{action}\"')
+        elif not utils.isValidNum(delaySeconds):
+            raise ValueError(f'delaySeconds argument is malformed: \"{delaySeconds}\"')
+
+        await asyncio.sleep(delaySeconds)
+        self.submitAction(action)
+
     def setEventListener(self, listener: Optional[TriviaEventListener]):
         if listener is not None and not isinstance(listener, TriviaEventListener):
             raise ValueError(f'listener argument is malformed: \"{listener}\"')
 
         self.__eventListener = listener
 
-    async def __startActionLoop(self):
-        while True:
-            actions: List[AbsTriviaAction] = list()
+        if listener is None:
+            self.__eventListenerSetEvent.clear()
+        else:
+            self.__eventListenerSetEvent.set()
+
+    async def __handleAction(self, action: AbsTriviaAction):
+        triviaActionType = action.getTriviaActionType()
+
+        if triviaActionType is TriviaActionType.CHECK_ANSWER:
+            await self.__handleActionCheckAnswer(action)
+        elif triviaActionType is TriviaActionType.CHECK_SUPER_ANSWER:
+            await self.__handleActionCheckSuperAnswer(action)
+        elif triviaActionType is TriviaActionType.CLEAR_SUPER_TRIVIA_QUEUE:
+            await self.__handleActionClearSuperTriviaQueue(action)
+        elif triviaActionType is TriviaActionType.START_NEW_GAME:
+            await self.__handleActionStartNewTriviaGame(action)
+        elif triviaActionType is TriviaActionType.START_NEW_SUPER_GAME:
+            await self.__handleActionStartNewSuperTriviaGame(action)
+        else:
+            raise UnknownTriviaActionTypeException(f'Unknown TriviaActionType: \"{triviaActionType}\"')
+
+    async def __startActionLane(self, twitchChannel: str, actionLane: Deque[AbsTriviaAction]):
+        while len(actionLane) >= 1:
+            action = actionLane.popleft()
+
+            async with self.__actionLanesSemaphore:
+                async with self.__lockTwitchChannel(twitchChannel):
+                    try:
+                        if action.getTriviaActionType() is TriviaActionType.CHECK_SUPER_ANSWER:
+                            # a burst of super trivia answers is handled all together
+                            actions: List[CheckSuperAnswerTriviaAction] = [ action ]
 
-            try:
-                while not self.__actionQueue.empty():
-                    actions.append(self.__actionQueue.get_nowait())
-            except queue.Empty as e:
-                self.__timber.log('TriviaGameMachine', f'Encountered queue.Empty when building up actions list (queue size: {self.__actionQueue.qsize()}) (actions size: {len(actions)}): {e}', e)
+                            while len(actionLane) >= 1 and actionLane[0].getTriviaActionType() is TriviaActionType.CHECK_SUPER_ANSWER:
+                                actions.append(actionLane.popleft())
 
-            try:
-                for action in actions:
-                    triviaActionType = action.getTriviaActionType()
-
-                    if triviaActionType is TriviaActionType.CHECK_ANSWER:
-                        await self.__handleActionCheckAnswer(action)
-                    elif triviaActionType is TriviaActionType.CHECK_SUPER_ANSWER:
-                        await self.__handleActionCheckSuperAnswer(action)
-                    elif triviaActionType is TriviaActionType.CLEAR_SUPER_TRIVIA_QUEUE:
-                        await self.__handleActionClearSuperTriviaQueue(action)
-                    elif triviaActionType is TriviaActionType.START_NEW_GAME:
-                        await self.__handleActionStartNewTriviaGame(action)
-                    elif triviaActionType is TriviaActionType.START_NEW_SUPER_GAME:
-                        await self.__handleActionStartNewSuperTriviaGame(action)
-                    else:
-                        raise UnknownTriviaActionTypeException(f'Unknown TriviaActionType: \"{triviaActionType}\"')
-            except Exception as e:
-                self.__timber.log('TriviaGameMachine', f'Encountered unknown Exception when looping through actions (queue size: {self.__actionQueue.qsize()}) (actions size: {len(actions)}): {e}', e, traceback.format_exc())
+                            await self.__handleActionsCheckSuperAnswer(actions)
+                        else:
+                            await self.__handleAction(action)
+                    except Exception as e:
+                        self.__timber.log('TriviaGameMachine', f'Encountered unknown Exception when handling action (twitchChannel=\"{twitchChannel}\") (lane size: {len(actionLane)}) (action: {action}): {e}', e, traceback.format_exc())
 
-            try:
-                await self.__refreshStatusOfTriviaGames()
-            except Exception as e:
-                self.__timber.log('TriviaGameMachine', f'Encountered unknown Exception when refreshing status of trivia games: {e}', e, traceback.format_exc())
+            if action.getTriviaActionType() is TriviaActionType.START_NEW_SUPER_GAME:
+                # if this game failed to start, then the next queued game can now begin
+                self.__refreshEvent.set()
+
+        # nothing is awaited between finding this lane empty and removing it, so any later
+        # action for this channel is sure to start a new lane
+        del self.__actionLanes[twitchChannel]
 
-            await asyncio.sleep(self.__sleepTimeSeconds)
+    async def __startActionLoop(self):
+        while True:
+            # wakes up as soon as an action is submitted, rather than polling for new actions
+            action = await self.__actionQueue.get()
+            self.__submitActionToLane(action)
 
     async def __startEventLoop(self):
         while True:
+            event = await self.__eventQueue.get()
             eventListener = self.__eventListener
 
-            if eventListener is not None:
-                events: List[AbsTriviaEvent] = list()
+            # events are held onto until there is an event listener to hand them to
+            while eventListener is None:
+                await self.__eventListenerSetEvent.wait()
+                eventListener = self.__eventListener
 
-                try:
-                    while not self.__eventQueue.empty():
-                        events.append(self.__eventQueue.get_nowait())
-                except queue.Empty as e:
-                    self.__timber.log('TriviaGameMachine', f'Encountered queue.Empty when building up events list (queue size: {self.__eventQueue.qsize()}) (events size: {len(events)}): {e}', e, traceback.format_exc())
+            try:
+                await eventListener.onNewTriviaEvent(event)
+            except Exception as e:
+                self.__timber.log('TriviaGameMachine', f'Encountered unknown Exception when looping through events (queue size: {self.__eventQueue.qsize()}) (event: {event}): {e}', e, traceback.format_exc())
 
-                for event in events:
-                    try:
-                        await eventListener.onNewTriviaEvent(event)
-                    except Exception as e:
-                        self.__timber.log('TriviaGameMachine', f'Encountered unknown Exception when looping through events (queue size: {self.__eventQueue.qsize()}) (event: {event}): {e}', e, traceback.format_exc())
+    async def __startRefreshLoop(self):
+        while True:
+            try:
+                await self.__refreshStatusOfTriviaGames()
+            except Exception as e:
+                self.__timber.log('TriviaGameMachine', f'Encountered unknown Exception when refreshing status of trivia games: {e}', e, traceback.format_exc())
 
-            await asyncio.sleep(self.__sleepTimeSeconds)
+            await self.__waitForNextDeadline()
 
     def startMachine(self):
         if self.__isStarted:
@@ -961,21 +1142,65 @@ class TriviaGameMachine(TriviaGameMachineInterface):
 
         self.__backgroundTaskHelper.createTask(self.__startActionLoop())
         self.__backgroundTaskHelper.createTask(self.__startEventLoop())
+        self.__backgroundTaskHelper.createTask(self.__startRefreshLoop())
 
     def submitAction(self, action: AbsTriviaAction):
         if not isinstance(action, AbsTriviaAction):
             raise ValueError(f'action argument is malformed: \"{action}\"')
 
         try:
-            self.__actionQueue.put(action, block = True, timeout = self.__queueTimeoutSeconds)
-        except queue.Full as e:
-            self.__timber.log('TriviaGameMachine', f'Encountered queue.Full when submitting a new action ({action}) into the action queue (queue size: {self.__actionQueue.qsize()}): {e}', e, traceback.format_exc())
+            self.__actionQueue.put_nowait(action)
+        except asyncio.QueueFull as e:
+            self.__timber.log('TriviaGameMachine', f'Encountered asyncio.QueueFull when submitting a new action ({action}) into the action queue (queue size: {self.__actionQueue.qsize()}): {e}', e, traceback.format_exc())
+
+    def __submitActionToLane(self, action: AbsTriviaAction):
+        if not isinstance(action, AbsTriviaAction):
+            raise ValueError(f'action argument is malformed: \"{action}\"')
+
+        twitchChannel = action.getTwitchChannel().lower()
+        actionLane = self.__actionLanes.get(twitchChannel)
+
+        if actionLane is None:
+            actionLane = deque()
+            self.__actionLanes[twitchChannel] = actionLane
+            self.__backgroundTaskHelper.createTask(self.__startActionLane(twitchChannel, actionLane))
+        elif len(actionLane) >= self.__maxQueueSize:
+            self.__timber.log('TriviaGameMachine', f'Dropping new action ({action}) as the action lane for \"{twitchChannel}\" is full (lane size: {len(actionLane)})')
+            return
+
+        actionLane.append(action)
 
     async def __submitEvent(self, event: AbsTriviaEvent):
         if not isinstance(event, AbsTriviaEvent):
             raise ValueError(f'event argument is malformed: \"{event}\"')
 
+        if self.__eventListener is None:
+            # nothing is taking events off of the queue until there is an event listener, so waiting
+            # for room would only hold up this channel's action lane
+            try:
+                self.__eventQueue.put_nowait(event)
+            except asyncio.QueueFull as e:
+                self.__timber.log('TriviaGameMachine', f'Encountered asyncio.QueueFull when submitting a new event ({event}) into the event queue while there is no event listener (queue size: {self.__eventQueue.qsize()}): {e}', e, traceback.format_exc())
+
+            return
+
         try:
-            self.__eventQueue.put(event, block = True, timeout = self.__queueTimeoutSeconds)
-        except queue.Full as e:
-            self.__timber.log('TriviaGameMachine', f'Encountered queue.Full when submitting a new event ({event}) into the event queue (queue size: {self.__eventQueue.qsize()}): {e}', e, traceback.format_exc())
+            # waits for the event listener to catch up if the event queue is full, which holds up
+            # this channel's action lane for at most queueTimeoutSeconds
+            await asyncio.wait_for(self.__eventQueue.put(event), timeout = self.__queueTimeoutSeconds)
+        except asyncio.TimeoutError as e:
+            self.__timber.log('TriviaGameMachine', f'Encountered asyncio.TimeoutError when submitting a new event ({event}) into the event queue (queue size: {self.__eventQueue.qsize()}): {e}', e, traceback.format_exc())
+
+    async def __waitForNextDeadline(self):
+        nextDeadline = self.__triviaGameDeadlines.getNextDeadline()
+        timeoutSeconds: Optional[float] = None
+
+        if nextDeadline is not None:
+            timeoutSeconds = max(0, (nextDeadline - datetime.now(self.__timeZone)).total_seconds())
+
+        try:
+            await asyncio.wait_for(self.__refreshEvent.wait(), timeout = timeoutSeconds)
+        except asyncio.TimeoutError:
+            pass
+
+        self.__refreshEvent.clear()
@@ -1,4 +1,4 @@
-from typing import List, Optional, Set
+from typing import Dict, List, Optional, Tuple
 
 try:
     import CynanBotCommon.utils as utils
@@ -23,8 +23,10 @@ except:
 class TriviaGameStore(TriviaGameStoreInterface):
 
     def __init__(self):
-        self.__normalGameStates: List[TriviaGameState] = list()
-        self.__superGameStates: List[SuperTriviaGameState] = list()
+        # normal games are keyed by lowercase Twitch channel and lowercase user ID, and super games
+        # are keyed by lowercase Twitch channel
+        self.__normalGameStates: Dict[Tuple[str, str], TriviaGameState] = dict()
+        self.__superGameStates: Dict[str, SuperTriviaGameState] = dict()
 
     async def add(self, state: AbsTriviaGameState):
         if not isinstance(state, AbsTriviaGameState):
@@ -41,21 +43,19 @@ class TriviaGameStore(TriviaGameStoreInterface):
         if not isinstance(state, TriviaGameState):
             raise ValueError(f'state argument is malformed: \"{state}\"')
 
-        self.__normalGameStates.append(state)
+        key = (state.getTwitchChannel().lower(), state.getUserId().lower())
+        self.__normalGameStates[key] = state
 
     async def __addSuperGame(self, state: SuperTriviaGameState):
         if not isinstance(state, SuperTriviaGameState):
             raise ValueError(f'state argument is malformed: \"{state}\"')
 
-        self.__superGameStates.append(state)
+        self.__superGameStates[state.getTwitchChannel().lower()] = state
 
     async def getAll(self) -> List[AbsTriviaGameState]:
-        normalGames = await self.getNormalGames()
-        superGames = await self.getSuperGames()
-
         allGames: List[AbsTriviaGameState] = list()
-        allGames.extend(normalGames)
-        allGames.extend(superGames)
+        allGames.extend(self.__normalGameStates.values())
+        allGames.extend(self.__superGameStates.values())
 
         return allGames
 
@@ -65,43 +65,22 @@ class TriviaGameStore(TriviaGameStoreInterface):
         elif not utils.isValidStr(userId):
             raise ValueError(f'userId argument is malformed: \"{userId}\"')
 
-        normalGames = await self.getNormalGames()
-        twitchChannel = twitchChannel.lower()
-        userId = userId.lower()
-
-        for state in normalGames:
-            if twitchChannel == state.getTwitchChannel().lower() and userId == state.getUserId().lower():
-                return state
-
-        return None
+        return self.__normalGameStates.get((twitchChannel.lower(), userId.lower()))
 
     async def getNormalGames(self) -> List[TriviaGameState]:
-        return utils.copyList(self.__normalGameStates)
+        return list(self.__normalGameStates.values())
 
     async def getSuperGame(self, twitchChannel: str) -> Optional[SuperTriviaGameState]:
         if not utils.isValidStr(twitchChannel):
             raise ValueError(f'twitchChannel argument is malformed: \"{twitchChannel}\"')
 
-        superGames = await self.getSuperGames()
-        twitchChannel = twitchChannel.lower()
-
-        for state in superGames:
-            if twitchChannel == state.getTwitchChannel().lower():
-                return state
-
-        return None
+        return self.__superGameStates.get(twitchChannel.lower())
 
     async def getSuperGames(self) -> List[SuperTriviaGameState]:
-        return utils.copyList(self.__superGameStates)
+        return list(self.__superGameStates.values())
 
     async def getTwitchChannelsWithActiveSuperGames(self) -> List[str]:
-        superGames = await self.getSuperGames()
-        twitchChannels: Set[str] = set()
-
-        for state in superGames:
-            twitchChannels.add(state.getTwitchChannel().lower())
-
-        return list(twitchChannels)
+        return list(self.__superGameStates.keys())
 
     async def removeNormalGame(self, twitchChannel: str, userId: str) -> bool:
         if not utils.isValidStr(twitchChannel):
@@ -109,27 +88,10 @@ class TriviaGameStore(TriviaGameStoreInterface):
         elif not utils.isValidStr(userId):
             raise ValueError(f'userId argument is malformed: \"{userId}\"')
 
-        normalGames = await self.getNormalGames()
-        twitchChannel = twitchChannel.lower()
-        userId = userId.lower()
-
-        for index, state in enumerate(normalGames):
-            if twitchChannel == state.getTwitchChannel().lower() and userId == state.getUserId().lower():
-                del self.__normalGameStates[index]
-                return True
-
-        return False
+        return self.__normalGameStates.pop((twitchChannel.lower(), userId.lower()), None) is not None
 
     async def removeSuperGame(self, twitchChannel: str) -> bool:
         if not utils.isValidStr(twitchChannel):
             raise ValueError(f'twitchChannel argument is malformed: \"{twitchChannel}\"')
 
-        superGames = await self.getSuperGames()
-        twitchChannel = twitchChannel.lower()
-
-        for index, state in enumerate(superGames):
-            if twitchChannel == state.getTwitchChannel().lower():
-                del self.__superGameStates[index]
-                return True
-
-        return False
+        return self.__superGameStates.pop(twitchChannel.lower(), None) is not None
@@ -1,8 +1,13 @@
+import asyncio
+import queue
+import traceback
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from queue import SimpleQueue
+from typing import Dict, List, Optional, Tuple
 
 try:
     import CynanBotCommon.utils as utils
+    from CynanBotCommon.backgroundTaskHelper import BackgroundTaskHelper
     from CynanBotCommon.storage.backingDatabase import BackingDatabase
     from CynanBotCommon.storage.databaseConnection import DatabaseConnection
     from CynanBotCommon.storage.databaseType import DatabaseType
@@ -19,6 +24,7 @@ try:
     from CynanBotCommon.trivia.triviaType import TriviaType
 except:
     import utils
+    from backgroundTaskHelper import BackgroundTaskHelper
     from storage.backingDatabase import BackingDatabase
     from storage.databaseConnection import DatabaseConnection
     from storage.databaseType import DatabaseType
@@ -38,26 +44,118 @@ class TriviaHistoryRepository(TriviaHistoryRepositoryInterface):
 
     def __init__(
         self,
+        backgroundTaskHelper: BackgroundTaskHelper,
         backingDatabase: BackingDatabase,
         timber: TimberInterface,
         triviaSettingsRepository: TriviaSettingsRepositoryInterface,
+        queueSleepTimeSeconds: float = 1,
         timeZone: timezone = timezone.utc
     ):
-        if not isinstance(backingDatabase, BackingDatabase):
+        if not isinstance(backgroundTaskHelper, BackgroundTaskHelper):
+            raise ValueError(f'backgroundTaskHelper argument is malformed: \"{backgroundTaskHelper}\"')
+        elif not isinstance(backingDatabase, BackingDatabase):
             raise ValueError(f'backingDatabase argument is malformed: \"{backingDatabase}\"')
         elif not isinstance(timber, TimberInterface):
             raise ValueError(f'timber argument is malformed: \"{timber}\"')
         elif not isinstance(triviaSettingsRepository, TriviaSettingsRepositoryInterface):
             raise ValueError(f'triviaSettingsRepository argument is malformed: \"{triviaSettingsRepository}\"')
+        elif not utils.isValidNum(queueSleepTimeSeconds):
+            raise ValueError(f'queueSleepTimeSeconds argument is malformed: \"{queueSleepTimeSeconds}\"')
+        elif queueSleepTimeSeconds < 1 or queueSleepTimeSeconds > 15:
+            raise ValueError(f'queueSleepTimeSeconds argument is out of bounds: {queueSleepTimeSeconds}')
         elif not isinstance(timeZone, timezone):
             raise ValueError(f'timeZone argument is malformed: \"{timeZone}\"')
 
         self.__backingDatabase: BackingDatabase = backingDatabase
         self.__timber: TimberInterface = timber
         self.__triviaSettingsRepository: TriviaSettingsRepositoryInterface = triviaSettingsRepository
+        self.__queueSleepTimeSeconds: float = queueSleepTimeSeconds
         self.__timeZone: timezone = timeZone
 
         self.__isDatabaseReady: bool = False
+        self.__historyLoadLock: asyncio.Lock = asyncio.Lock()
+        self.__historyWriteLock: asyncio.Lock = asyncio.Lock()
+        self.__channelHistories: Dict[str, Dict[Tuple[str, str, str], datetime]] = dict()
+        self.__historyWriteQueue: SimpleQueue[List[str]] = SimpleQueue()
+        self.__nextHistoryPruneDateTime: datetime = datetime.now(timeZone) + timedelta(hours = 1)
+
+        backgroundTaskHelper.createTask(self.__startHistoryWriteLoop())
+
+    async def flush(self):
+        async with self.__historyWriteLock:
+            records: List[List[str]] = list()
+
+            try:
+                while not self.__historyWriteQueue.empty():
+                    records.append(self.__historyWriteQueue.get_nowait())
+            except queue.Empty:
+                pass
+
+            if len(records) == 0:
+                return
+
+            try:
+                connection = await self.__getDatabaseConnection()
+
+                try:
+                    await connection.executeMany(
+                        '''
+                            INSERT INTO triviahistory (datetime, emote, triviaid, triviasource, triviatype, twitchchannel)
+                            VALUES ($1, $2, $3, $4, $5, $6)
+                            ON CONFLICT (triviaid, triviasource, triviatype, twitchchannel) DO UPDATE SET datetime = EXCLUDED.datetime, emote = EXCLUDED.emote
+                        ''',
+                        records
+                    )
+                finally:
+                    await connection.close()
+            except:
+                # put these records back so that they're retried on the next flush
+                for record in records:
+                    self.__historyWriteQueue.put(record)
+
+                raise
+
+    async def __getChannelHistory(self, twitchChannel: str) -> Dict[Tuple[str, str, str], datetime]:
+        if not utils.isValidStr(twitchChannel):
+            raise ValueError(f'twitchChannel argument is malformed: \"{twitchChannel}\"')
+
+        twitchChannel = twitchChannel.lower()
+        channelHistory = self.__channelHistories.get(twitchChannel)
+
+        if channelHistory is not None:
+            return channelHistory
+
+        async with self.__historyLoadLock:
+            channelHistory = self.__channelHistories.get(twitchChannel)
+
+            if channelHistory is not None:
+                return channelHistory
+
+            # only questions recent enough to still count as a repeat are ever needed
+            minimumTimeDelta = timedelta(days = await self.__triviaSettingsRepository.getMinDaysBeforeRepeatQuestion())
+            cutoffDateTime = datetime.now(self.__timeZone) - minimumTimeDelta
+
+            connection = await self.__getDatabaseConnection()
+
+            try:
+                records = await connection.fetchRows(
+                    '''
+                        SELECT datetime, triviaid, triviasource, triviatype FROM triviahistory
+                        WHERE twitchchannel = $1 AND datetime >= $2
+                    ''',
+                    twitchChannel, cutoffDateTime.isoformat()
+                )
+            finally:
+                await connection.close()
+
+            channelHistory = dict()
+
+            if utils.hasItems(records):
+                for record in records:
+                    channelHistory[(record[1].lower(), record[2].lower(), record[3].lower())] = datetime.fromisoformat(record[0])
+
+            self.__channelHistories[twitchChannel] = channelHistory
+            return channelHistory
 
     async def __getDatabaseConnection(self) -> DatabaseConnection:
         await self.__initDatabaseTable()
@@ -73,18 +171,23 @@ class TriviaHistoryRepository(TriviaHistoryRepositoryInterface):
         elif not utils.isValidStr(twitchChannel):
             raise ValueError(f'twitchChannel argument is malformed: \"{twitchChannel}\"')
 
+        # make sure that the most recently verified trivia questions have actually been written
+        await self.flush()
+
         connection = await self.__getDatabaseConnection()
-        record = await connection.fetchRow(
-            '''
-                SELECT emote, triviaid, triviasource, triviatype FROM triviahistory
-                WHERE emote IS NOT NULL AND emote = $1 AND twitchchannel = $2
-                ORDER BY datetime DESC
-                LIMIT 1
-            ''',
-            emote, twitchChannel
-        )
 
-        await connection.close()
+        try:
+            record = await connection.fetchRow(
+                '''
+                    SELECT emote, triviaid, triviasource, triviatype FROM triviahistory
+                    WHERE emote IS NOT NULL AND emote = $1 AND twitchchannel = $2
+                    ORDER BY datetime DESC
+                    LIMIT 1
+                ''',
+                emote, twitchChannel
+            )
+        finally:
+            await connection.close()
 
         if not utils.hasItems(record):
             return None
@@ -104,38 +207,94 @@ class TriviaHistoryRepository(TriviaHistoryRepositoryInterface):
         self.__isDatabaseReady = True
         connection = await self.__backingDatabase.getConnection()
 
-        if connection.getDatabaseType() is DatabaseType.POSTGRESQL:
-            await connection.createTableIfNotExists(
-                '''
-                    CREATE TABLE IF NOT EXISTS triviahistory (
-                        datetime text NOT NULL,
-                        emote text NOT NULL,
-                        triviaid public.citext NOT NULL,
-                        triviasource public.citext NOT NULL,
-                        triviatype public.citext NOT NULL,
-                        twitchchannel public.citext NOT NULL,
-                        PRIMARY KEY (triviaid, triviasource, triviatype, twitchchannel)
-                    )
-                '''
-            )
-        elif connection.getDatabaseType() is DatabaseType.SQLITE:
-            await connection.createTableIfNotExists(
-                '''
-                    CREATE TABLE IF NOT EXISTS triviahistory (
-                        datetime TEXT NOT NULL,
-                        emote TEXT NOT NULL,
-                        triviaid TEXT NOT NULL COLLATE NOCASE,
-                        triviasource TEXT NOT NULL COLLATE NOCASE,
-                        triviatype TEXT NOT NULL COLLATE NOCASE,
-                        twitchchannel TEXT NOT NULL COLLATE NOCASE,
-                        PRIMARY KEY (triviaid, triviasource, triviatype, twitchchannel)
-                    )
-                '''
-            )
-        else:
-            raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
+        try:
+            if connection.getDatabaseType() is DatabaseType.POSTGRESQL:
+                await connection.createTableIfNotExists(
+                    '''
+                        CREATE TABLE IF NOT EXISTS triviahistory (
+                            datetime text NOT NULL,
+                            emote text NOT NULL,
+                            triviaid public.citext NOT NULL,
+                            triviasource public.citext NOT NULL,
+                            triviatype public.citext NOT NULL,
+                            twitchchannel public.citext NOT NULL,
+                            PRIMARY KEY (triviaid, triviasource, triviatype, twitchchannel)
+                        )
+                    '''
+                )
+            elif connection.getDatabaseType() is DatabaseType.SQLITE:
+                await connection.createTableIfNotExists(
+                    '''
+                        CREATE TABLE IF NOT EXISTS triviahistory (
+                            datetime TEXT NOT NULL,
+                            emote TEXT NOT NULL,
+                            triviaid TEXT NOT NULL COLLATE NOCASE,
+                            triviasource TEXT NOT NULL COLLATE NOCASE,
+                            triviatype TEXT NOT NULL COLLATE NOCASE,
+                            twitchchannel TEXT NOT NULL COLLATE NOCASE,
+                            PRIMARY KEY (triviaid, triviasource, triviatype, twitchchannel)
+                        )
+                    '''
+                )
+            else:
+                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
+        finally:
+            await connection.close()
+
+    async def peek(
+        self,
+        question: AbsTriviaQuestion,
+        twitchChannel: str
+    ) -> TriviaContentCode:
+        if not isinstance(question, AbsTriviaQuestion):
+            raise ValueError(f'question argument is malformed: \"{question}\"')
+        elif not utils.isValidStr(twitchChannel):
+            raise ValueError(f'twitchChannel argument is malformed: \"{twitchChannel}\"')
+
+        # Unlike verify(), this never writes to the trivia history, so it's safe to use on
+        # questions that may never actually end up being asked.
+
+        channelHistory = await self.__getChannelHistory(twitchChannel)
+        questionDateTime = channelHistory.get(self.__toHistoryKey(question))
+
+        if questionDateTime is None:
+            return TriviaContentCode.OK
+
+        minimumTimeDelta = timedelta(days = await self.__triviaSettingsRepository.getMinDaysBeforeRepeatQuestion())
+
+        if questionDateTime + minimumTimeDelta >= datetime.now(self.__timeZone):
+            return TriviaContentCode.REPEAT
+
+        return TriviaContentCode.OK
+
+    async def __pruneChannelHistories(self):
+        now = datetime.now(self.__timeZone)
+
+        if now < self.__nextHistoryPruneDateTime:
+            return
+
+        self.__nextHistoryPruneDateTime = now + timedelta(hours = 1)
+        minimumTimeDelta = timedelta(days = await self.__triviaSettingsRepository.getMinDaysBeforeRepeatQuestion())
+        cutoffDateTime = now - minimumTimeDelta
 
-        await connection.close()
+        for channelHistory in self.__channelHistories.values():
+            expiredHistoryKeys = [ historyKey for historyKey, questionDateTime in channelHistory.items() if questionDateTime < cutoffDateTime ]
+
+            for historyKey in expiredHistoryKeys:
+                del channelHistory[historyKey]
+
+    async def __startHistoryWriteLoop(self):
+        while True:
+            await asyncio.sleep(self.__queueSleepTimeSeconds)
+
+            try:
+                await self.flush()
+                await self.__pruneChannelHistories()
+            except Exception as e:
+                self.__timber.log('TriviaHistoryRepository', f'Encountered unknown Exception when writing triviaHistory entries: {e}', e, traceback.format_exc())
+
+    def __toHistoryKey(self, question: AbsTriviaQuestion) -> Tuple[str, str, str]:
+        return (question.getTriviaId().lower(), question.getTriviaSource().toStr().lower(), question.getTriviaType().toStr().lower())
 
     async def verify(
         self,
@@ -154,50 +313,22 @@ class TriviaHistoryRepository(TriviaHistoryRepositoryInterface):
         triviaSource = question.getTriviaSource().toStr()
         triviaType = question.getTriviaType().toStr()
 
-        connection = await self.__getDatabaseConnection()
-        record = await connection.fetchRow(
-            '''
-                SELECT datetime FROM triviahistory
-                WHERE triviaid = $1 AND triviasource = $2 AND triviatype = $3 AND twitchchannel = $4
-                LIMIT 1
-            ''',
-            triviaId, triviaSource, triviaType, twitchChannel
-        )
+        channelHistory = await self.__getChannelHistory(twitchChannel)
+        historyKey = self.__toHistoryKey(question)
+        questionDateTime = channelHistory.get(historyKey)
 
         nowDateTime = datetime.now(self.__timeZone)
         nowDateTimeStr = nowDateTime.isoformat()
 
-        if not utils.hasItems(record):
-            await connection.execute(
-                '''
-                    INSERT INTO triviahistory (datetime, emote, triviaid, triviasource, triviatype, twitchchannel)
-                    VALUES ($1, $2, $3, $4, $5, $6)
-                ''',
-                nowDateTimeStr, emote, triviaId, triviaSource, triviaType, twitchChannel
-            )
+        if questionDateTime is not None:
+            minimumTimeDelta = timedelta(days = await self.__triviaSettingsRepository.getMinDaysBeforeRepeatQuestion())
 
-            await connection.close()
-            return TriviaContentCode.OK
-
-        questionDateTimeStr: str = record[0]
-        questionDateTime = datetime.fromisoformat(questionDateTimeStr)
-        minimumTimeDelta = timedelta(days = await self.__triviaSettingsRepository.getMinDaysBeforeRepeatQuestion())
-
-        if questionDateTime + minimumTimeDelta >= nowDateTime:
-            await connection.close()
-            self.__timber.log('TriviaHistoryRepository', f'Encountered duplicate triviaHistory entry that is within the window of being a repeat (now=\"{nowDateTimeStr}\" db=\"{questionDateTimeStr}\" triviaId=\"{triviaId}\" triviaSource=\"{triviaSource}\" twitchChannel=\"{twitchChannel}\"')
-            return TriviaContentCode.REPEAT
-
-        await connection.execute(
-            '''
-                UPDATE triviahistory
-                SET datetime = $1, emote = $2
-                WHERE triviaid = $3 AND triviasource = $4 AND triviatype = $5 AND twitchchannel = $6
-            ''',
-            nowDateTimeStr, emote, triviaId, triviaSource, triviaType, twitchChannel
-        )
+            if questionDateTime + minimumTimeDelta >= nowDateTime:
+                self.__timber.log('TriviaHistoryRepository', f'Encountered duplicate triviaHistory entry that is within the window of being a repeat (now=\"{nowDateTimeStr}\" db=\"{questionDateTime.isoformat()}\" triviaId=\"{triviaId}\" triviaSource=\"{triviaSource}\" twitchChannel=\"{twitchChannel}\"')
+                return TriviaContentCode.REPEAT
 
-        await connection.close()
-        self.__timber.log('TriviaHistoryRepository', f'Updated triviaHistory entry to {nowDateTimeStr} from {questionDateTimeStr} (triviaId=\"{triviaId}\" triviaSource=\"{triviaSource}\" triviaType=\"{triviaType}\" twitchChannel=\"{twitchChannel}\")')
+        # the in-memory history is updated right away, and the database is written to in the background
+        channelHistory[historyKey] = nowDateTime
+        self.__historyWriteQueue.put([ nowDateTimeStr, emote, triviaId, triviaSource, triviaType, twitchChannel ])
 
         return TriviaContentCode.OK
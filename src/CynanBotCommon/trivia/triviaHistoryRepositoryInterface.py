@@ -22,6 +22,14 @@ class TriviaHistoryRepositoryInterface(ABC):
     ) -> Optional[TriviaQuestionReference]:
         pass
 
+    @abstractmethod
+    async def peek(
+        self,
+        question: AbsTriviaQuestion,
+        twitchChannel: str
+    ) -> TriviaContentCode:
+        pass
+
     @abstractmethod
     async def verify(
         self,
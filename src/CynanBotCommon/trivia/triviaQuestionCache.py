@@ -0,0 +1,312 @@
+import json
+from datetime import datetime, timedelta, timezone
+from typing import Any, List, Optional
+
+try:
+    import CynanBotCommon.utils as utils
+    from CynanBotCommon.storage.backingDatabase import BackingDatabase
+    from CynanBotCommon.storage.databaseConnection import DatabaseConnection
+    from CynanBotCommon.storage.databaseType import DatabaseType
+    from CynanBotCommon.timber.timberInterface import TimberInterface
+    from CynanBotCommon.trivia.absTriviaQuestion import AbsTriviaQuestion
+    from CynanBotCommon.trivia.multipleChoiceTriviaQuestion import \
+        MultipleChoiceTriviaQuestion
+    from CynanBotCommon.trivia.questionAnswerTriviaQuestion import \
+        QuestionAnswerTriviaQuestion
+    from CynanBotCommon.trivia.triviaDifficulty import TriviaDifficulty
+    from CynanBotCommon.trivia.triviaFetchOptions import TriviaFetchOptions
+    from CynanBotCommon.trivia.triviaQuestionCacheInterface import \
+        TriviaQuestionCacheInterface
+    from CynanBotCommon.trivia.triviaSource import TriviaSource
+    from CynanBotCommon.trivia.triviaType import TriviaType
+    from CynanBotCommon.trivia.trueFalseTriviaQuestion import \
+        TrueFalseTriviaQuestion
+except:
+    import utils
+    from storage.backingDatabase import BackingDatabase
+    from storage.databaseConnection import DatabaseConnection
+    from storage.databaseType import DatabaseType
+    from timber.timberInterface import TimberInterface
+    from trivia.absTriviaQuestion import AbsTriviaQuestion
+    from trivia.multipleChoiceTriviaQuestion import \
+        MultipleChoiceTriviaQuestion
+    from trivia.questionAnswerTriviaQuestion import \
+        QuestionAnswerTriviaQuestion
+    from trivia.triviaDifficulty import TriviaDifficulty
+    from trivia.triviaFetchOptions import TriviaFetchOptions
+    from trivia.triviaQuestionCacheInterface import \
+        TriviaQuestionCacheInterface
+    from trivia.triviaSource import TriviaSource
+    from trivia.triviaType import TriviaType
+    from trivia.trueFalseTriviaQuestion import TrueFalseTriviaQuestion
+
+
+class TriviaQuestionCache(TriviaQuestionCacheInterface):
+
+    def __init__(
+        self,
+        backingDatabase: BackingDatabase,
+        timber: TimberInterface,
+        maxAgeDays: int = 30,
+        maxSize: int = 2000,
+        evictionInterval: int = 25,
+        timeZone: timezone = timezone.utc
+    ):
+        if not isinstance(backingDatabase, BackingDatabase):
+            raise ValueError(f'backingDatabase argument is malformed: \"{backingDatabase}\"')
+        elif not isinstance(timber, TimberInterface):
+            raise ValueError(f'timber argument is malformed: \"{timber}\"')
+        elif not utils.isValidInt(maxAgeDays):
+            raise ValueError(f'maxAgeDays argument is malformed: \"{maxAgeDays}\"')
+        elif maxAgeDays < 1 or maxAgeDays > 365:
+            raise ValueError(f'maxAgeDays argument is out of bounds: {maxAgeDays}')
+        elif not utils.isValidInt(maxSize):
+            raise ValueError(f'maxSize argument is malformed: \"{maxSize}\"')
+        elif maxSize < 1 or maxSize > 100000:
+            raise ValueError(f'maxSize argument is out of bounds: {maxSize}')
+        elif not utils.isValidInt(evictionInterval):
+            raise ValueError(f'evictionInterval argument is malformed: \"{evictionInterval}\"')
+        elif evictionInterval < 1 or evictionInterval > 1000:
+            raise ValueError(f'evictionInterval argument is out of bounds: {evictionInterval}')
+        elif not isinstance(timeZone, timezone):
+            raise ValueError(f'timeZone argument is malformed: \"{timeZone}\"')
+
+        self.__backingDatabase: BackingDatabase = backingDatabase
+        self.__timber: TimberInterface = timber
+        self.__maxAgeDays: int = maxAgeDays
+        self.__maxSize: int = maxSize
+        self.__evictionInterval: int = evictionInterval
+        self.__timeZone: timezone = timeZone
+
+        self.__isDatabaseReady: bool = False
+        self.__addsSinceEviction: int = 0
+
+    async def add(self, question: AbsTriviaQuestion):
+        if not isinstance(question, AbsTriviaQuestion):
+            raise ValueError(f'question argument is malformed: \"{question}\"')
+
+        correctAnswers: List[Any] = list()
+        cleanedCorrectAnswers: List[str] = list()
+        responses: List[str] = list()
+
+        if question.getTriviaType() is TriviaType.MULTIPLE_CHOICE and isinstance(question, MultipleChoiceTriviaQuestion):
+            responses = question.getResponses()
+
+            for ordinal in question.getCorrectAnswerOrdinals():
+                correctAnswers.append(responses[ordinal])
+        elif question.getTriviaType() is TriviaType.QUESTION_ANSWER and isinstance(question, QuestionAnswerTriviaQuestion):
+            correctAnswers = question.getCorrectAnswers()
+            cleanedCorrectAnswers = question.getCleanedCorrectAnswers()
+        elif question.getTriviaType() is TriviaType.TRUE_FALSE and isinstance(question, TrueFalseTriviaQuestion):
+            correctAnswers = question.getCorrectAnswerBools()
+        else:
+            raise RuntimeError(f'Encountered unexpected trivia question type when adding to the trivia question cache: \"{question}\"')
+
+        nowDateTime = datetime.now(self.__timeZone)
+
+        # Evicting only every evictionInterval adds lets the cache run up to evictionInterval - 1
+        # questions past maxSize in the meantime. Expired questions are already skipped by
+        # fetchRandomQuestion(), so they're harmless until then.
+        self.__addsSinceEviction = self.__addsSinceEviction + 1
+        isEvictionDue = self.__addsSinceEviction >= self.__evictionInterval
+
+        if isEvictionDue:
+            self.__addsSinceEviction = 0
+
+        connection = await self.__getDatabaseConnection()
+
+        try:
+            async with connection.transaction():
+                # An already cached question keeps its original datetime, so that a question that
+                # keeps on coming back from its trivia source still ages out of the cache eventually.
+                await connection.execute(
+                    '''
+                        INSERT INTO triviaquestioncache (category, categoryid, cleanedcorrectanswers, correctanswers, datetime, question, responses, triviadifficulty, triviaid, triviasource, triviatype)
+                        VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11)
+                        ON CONFLICT (triviaid, triviasource, triviatype) DO NOTHING
+                    ''',
+                    question.getCategory(), question.getCategoryId(), json.dumps(cleanedCorrectAnswers), json.dumps(correctAnswers), nowDateTime.isoformat(), question.getQuestion(), json.dumps(responses), question.getTriviaDifficulty().toStr(), question.getTriviaId(), question.getTriviaSource().toStr(), question.getTriviaType().toStr()
+                )
+
+                if isEvictionDue:
+                    await self.__evictQuestions(connection, nowDateTime)
+        finally:
+            await connection.close()
+
+    async def __evictQuestions(self, connection: DatabaseConnection, nowDateTime: datetime):
+        oldestDateTime = nowDateTime - timedelta(days = self.__maxAgeDays)
+
+        await connection.execute(
+            '''
+                DELETE FROM triviaquestioncache
+                WHERE datetime < $1
+            ''',
+            oldestDateTime.isoformat()
+        )
+
+        # keeps only the newest maxSize questions (SQLite needs a LIMIT in order to use OFFSET)
+        limitClause: str = ''
+
+        if connection.getDatabaseType() is DatabaseType.SQLITE:
+            limitClause = 'LIMIT -1'
+
+        await connection.execute(
+            f'''
+                DELETE FROM triviaquestioncache
+                WHERE (triviaid, triviasource, triviatype) IN (
+                    SELECT triviaid, triviasource, triviatype FROM triviaquestioncache
+                    ORDER BY datetime DESC
+                    {limitClause} OFFSET $1
+                )
+            ''',
+            self.__maxSize
+        )
+
+    async def fetchRandomQuestion(self, triviaFetchOptions: TriviaFetchOptions) -> Optional[AbsTriviaQuestion]:
+        if not isinstance(triviaFetchOptions, TriviaFetchOptions):
+            raise ValueError(f'triviaFetchOptions argument is malformed: \"{triviaFetchOptions}\"')
+
+        oldestDateTime = datetime.now(self.__timeZone) - timedelta(days = self.__maxAgeDays)
+        triviaTypeClause: str = ''
+
+        if triviaFetchOptions.requireQuestionAnswerTriviaQuestion():
+            triviaTypeClause = 'AND triviatype = $2'
+        elif not triviaFetchOptions.areQuestionAnswerTriviaQuestionsEnabled():
+            triviaTypeClause = 'AND triviatype != $2'
+
+        query = f'''
+            SELECT category, categoryid, cleanedcorrectanswers, correctanswers, question, responses, triviadifficulty, triviaid, triviasource, triviatype FROM triviaquestioncache
+            WHERE datetime >= $1 {triviaTypeClause}
+            ORDER BY RANDOM()
+            LIMIT 1
+        '''
+
+        connection = await self.__getDatabaseConnection()
+
+        try:
+            # the cache is capped at maxSize rows, so ORDER BY RANDOM() stays cheap here
+            if utils.isValidStr(triviaTypeClause):
+                record = await connection.fetchRow(query, oldestDateTime.isoformat(), TriviaType.QUESTION_ANSWER.toStr())
+            else:
+                record = await connection.fetchRow(query, oldestDateTime.isoformat())
+        finally:
+            await connection.close()
+
+        if not utils.hasItems(record):
+            return None
+
+        try:
+            return self.__createTriviaQuestion(record)
+        except Exception as e:
+            self.__timber.log('TriviaQuestionCache', f'Encountered unreadable cached trivia question ({record}): {e}', e)
+            return None
+
+    def __createTriviaQuestion(self, record: List[Any]) -> AbsTriviaQuestion:
+        category: Optional[str] = record[0]
+        categoryId: Optional[str] = record[1]
+        cleanedCorrectAnswers: List[str] = json.loads(record[2])
+        correctAnswers: List[Any] = json.loads(record[3])
+        question: str = record[4]
+        responses: List[str] = json.loads(record[5])
+        triviaDifficulty = TriviaDifficulty.fromStr(record[6])
+        triviaId: str = record[7]
+        triviaSource = TriviaSource.fromStr(record[8])
+        triviaType = TriviaType.fromStr(record[9])
+
+        if triviaType is TriviaType.MULTIPLE_CHOICE:
+            return MultipleChoiceTriviaQuestion(
+                correctAnswers = correctAnswers,
+                multipleChoiceResponses = responses,
+                category = category,
+                categoryId = categoryId,
+                question = question,
+                triviaId = triviaId,
+                triviaDifficulty = triviaDifficulty,
+                triviaSource = triviaSource
+            )
+        elif triviaType is TriviaType.QUESTION_ANSWER:
+            return QuestionAnswerTriviaQuestion(
+                correctAnswers = correctAnswers,
+                cleanedCorrectAnswers = cleanedCorrectAnswers,
+                category = category,
+                categoryId = categoryId,
+                question = question,
+                triviaId = triviaId,
+                triviaDifficulty = triviaDifficulty,
+                triviaSource = triviaSource
+            )
+        elif triviaType is TriviaType.TRUE_FALSE:
+            return TrueFalseTriviaQuestion(
+                correctAnswers = correctAnswers,
+                category = category,
+                categoryId = categoryId,
+                question = question,
+                triviaId = triviaId,
+                triviaDifficulty = triviaDifficulty,
+                triviaSource = triviaSource
+            )
+        else:
+            raise RuntimeError(f'unknown TriviaType: \"{triviaType}\"')
+
+    async def __getDatabaseConnection(self) -> DatabaseConnection:
+        await self.__initDatabaseTable()
+        return await self.__backingDatabase.getConnection()
+
+    async def __initDatabaseTable(self):
+        if self.__isDatabaseReady:
+            return
+
+        self.__isDatabaseReady = True
+        connection = await self.__backingDatabase.getConnection()
+
+        try:
+            if connection.getDatabaseType() is DatabaseType.POSTGRESQL:
+                await connection.createTableIfNotExists(
+                    '''
+                        CREATE TABLE IF NOT EXISTS triviaquestioncache (
+                            category text DEFAULT NULL,
+                            categoryid text DEFAULT NULL,
+                            cleanedcorrectanswers text NOT NULL,
+                            correctanswers text NOT NULL,
+                            datetime text NOT NULL,
+                            question text NOT NULL,
+                            responses text NOT NULL,
+                            triviadifficulty text NOT NULL,
+                            triviaid public.citext NOT NULL,
+                            triviasource public.citext NOT NULL,
+                            triviatype public.citext NOT NULL,
+                            PRIMARY KEY (triviaid, triviasource, triviatype)
+                        )
+                    '''
+                )
+            elif connection.getDatabaseType() is DatabaseType.SQLITE:
+                await connection.createTableIfNotExists(
+                    '''
+                        CREATE TABLE IF NOT EXISTS triviaquestioncache (
+                            category TEXT DEFAULT NULL,
+                            categoryid TEXT DEFAULT NULL,
+                            cleanedcorrectanswers TEXT NOT NULL,
+                            correctanswers TEXT NOT NULL,
+                            datetime TEXT NOT NULL,
+                            question TEXT NOT NULL,
+                            responses TEXT NOT NULL,
+                            triviadifficulty TEXT NOT NULL,
+                            triviaid TEXT NOT NULL COLLATE NOCASE,
+                            triviasource TEXT NOT NULL COLLATE NOCASE,
+                            triviatype TEXT NOT NULL COLLATE NOCASE,
+                            PRIMARY KEY (triviaid, triviasource, triviatype)
+                        )
+                    '''
+                )
+            else:
+                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
+
+            # both the eviction and fetchRandomQuestion() filter and sort on datetime
+            await connection.execute(
+                '''
+                    CREATE INDEX IF NOT EXISTS triviaquestioncache_datetime_idx
+                    ON triviaquestioncache (datetime)
+                '''
+            )
+        finally:
+            await connection.close()
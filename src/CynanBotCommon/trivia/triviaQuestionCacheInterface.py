@@ -0,0 +1,20 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+try:
+    from CynanBotCommon.trivia.absTriviaQuestion import AbsTriviaQuestion
+    from CynanBotCommon.trivia.triviaFetchOptions import TriviaFetchOptions
+except:
+    from trivia.absTriviaQuestion import AbsTriviaQuestion
+    from trivia.triviaFetchOptions import TriviaFetchOptions
+
+
+class TriviaQuestionCacheInterface(ABC):
+
+    @abstractmethod
+    async def add(self, question: AbsTriviaQuestion):
+        pass
+
+    @abstractmethod
+    async def fetchRandomQuestion(self, triviaFetchOptions: TriviaFetchOptions) -> Optional[AbsTriviaQuestion]:
+        pass
@@ -1,5 +1,7 @@
+import asyncio
 import traceback
-from typing import Any, Dict, List, Optional, Set
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Set
 
 try:
     import CynanBotCommon.utils as utils
@@ -62,7 +64,8 @@ class JServiceTriviaQuestionRepository(AbsTriviaQuestionRepository):
         triviaAnswerCompiler: TriviaAnswerCompiler,
         triviaIdGenerator: TriviaIdGeneratorInterface,
         triviaQuestionCompiler: TriviaQuestionCompiler,
-        triviaSettingsRepository: TriviaSettingsRepositoryInterface
+        triviaSettingsRepository: TriviaSettingsRepositoryInterface,
+        questionBatchSize: int = 50
     ):
         super().__init__(triviaSettingsRepository)
 
@@ -78,6 +81,10 @@ class JServiceTriviaQuestionRepository(AbsTriviaQuestionRepository):
             raise ValueError(f'triviaIdGenerator argument is malformed: \"{triviaIdGenerator}\"')
         elif not isinstance(triviaQuestionCompiler, TriviaQuestionCompiler):
             raise ValueError(f'triviaQuestionCompiler argument is malformed: \"{triviaQuestionCompiler}\"')
+        elif not utils.isValidInt(questionBatchSize):
+            raise ValueError(f'questionBatchSize argument is malformed: \"{questionBatchSize}\"')
+        elif questionBatchSize < 1 or questionBatchSize > 100:
+            raise ValueError(f'questionBatchSize argument is out of bounds: {questionBatchSize}')
 
         self.__additionalTriviaAnswersRepository: AdditionalTriviaAnswersRepositoryInterface = additionalTriviaAnswersRepository
         self.__networkClientProvider: NetworkClientProvider = networkClientProvider
@@ -85,40 +92,14 @@ class JServiceTriviaQuestionRepository(AbsTriviaQuestionRepository):
         self.__triviaAnswerCompiler: TriviaAnswerCompiler = triviaAnswerCompiler
         self.__triviaIdGenerator: TriviaIdGeneratorInterface = triviaIdGenerator
         self.__triviaQuestionCompiler: TriviaQuestionCompiler = triviaQuestionCompiler
+        self.__questionBatchSize: int = questionBatchSize
 
-    async def fetchTriviaQuestion(self, fetchOptions: TriviaFetchOptions) -> AbsTriviaQuestion:
-        if not isinstance(fetchOptions, TriviaFetchOptions):
-            raise ValueError(f'fetchOptions argument is malformed: \"{fetchOptions}\"')
+        self.__triviaJsonBufferLock: asyncio.Lock = asyncio.Lock()
+        self.__triviaJsonBuffer: Deque[Dict[str, Any]] = deque()
 
-        self.__timber.log('JServiceTriviaQuestionRepository', f'Fetching trivia question... (fetchOptions={fetchOptions})')
-
-        clientSession = await self.__networkClientProvider.get()
-
-        try:
-            response = await clientSession.get(f'https://jservice.io/api/random?count=1')
-        except GenericNetworkException as e:
-            self.__timber.log('JServiceTriviaQuestionRepository', f'Encountered network error: {e}', e, traceback.format_exc())
-            raise GenericTriviaNetworkException(self.getTriviaSource(), e)
-
-        if response.getStatusCode() != 200:
-            self.__timber.log('JServiceTriviaQuestionRepository', f'Encountered non-200 HTTP status code: \"{response.getStatusCode()}\"')
-            raise GenericTriviaNetworkException(self.getTriviaSource())
-
-        jsonResponse: Optional[List[Dict[str, Any]]] = await response.json()
-        await response.close()
-
-        if await self._triviaSettingsRepository.isDebugLoggingEnabled():
-            self.__timber.log('JServiceTriviaQuestionRepository', f'{jsonResponse}')
-
-        if not utils.hasItems(jsonResponse):
-            self.__timber.log('JServiceTriviaQuestionRepository', f'Rejecting jService\'s JSON data due to null/empty contents: {jsonResponse}')
-            raise MalformedTriviaJsonException(f'Rejecting jService\'s JSON data due to null/empty contents: {jsonResponse}')
-
-        triviaJson: Optional[Dict[str, Any]] = jsonResponse[0]
-
-        if not utils.hasItems(triviaJson) or 'category' not in triviaJson:
-            self.__timber.log('JServiceTriviaQuestionRepository', f'Rejecting jService\'s JSON data due to null/empty contents: {jsonResponse}')
-            raise MalformedTriviaJsonException(f'Rejecting jService\'s JSON data due to null/empty contents: {jsonResponse}')
+    async def __createTriviaQuestion(self, triviaJson: Dict[str, Any]) -> AbsTriviaQuestion:
+        if not utils.hasItems(triviaJson):
+            raise ValueError(f'triviaJson argument is malformed: \"{triviaJson}\"')
 
         category = utils.getStrFromDict(triviaJson['category'], 'title', fallback = '').encode('latin1').decode('utf-8')
         category = await self.__triviaQuestionCompiler.compileCategory(category)
@@ -174,6 +155,52 @@ class JServiceTriviaQuestionRepository(AbsTriviaQuestionRepository):
             triviaSource = TriviaSource.J_SERVICE
         )
 
+    async def __fetchTriviaJsons(self) -> List[Dict[str, Any]]:
+        self.__timber.log('JServiceTriviaQuestionRepository', f'Fetching batch of trivia questions... (questionBatchSize={self.__questionBatchSize})')
+
+        clientSession = await self.__networkClientProvider.get()
+
+        try:
+            response = await clientSession.get(f'https://jservice.io/api/random?count={self.__questionBatchSize}')
+        except GenericNetworkException as e:
+            self.__timber.log('JServiceTriviaQuestionRepository', f'Encountered network error: {e}', e, traceback.format_exc())
+            raise GenericTriviaNetworkException(self.getTriviaSource(), e)
+
+        if response.getStatusCode() != 200:
+            self.__timber.log('JServiceTriviaQuestionRepository', f'Encountered non-200 HTTP status code: \"{response.getStatusCode()}\"')
+            raise GenericTriviaNetworkException(self.getTriviaSource())
+
+        jsonResponse: Optional[List[Dict[str, Any]]] = await response.json()
+        await response.close()
+
+        if await self._triviaSettingsRepository.isDebugLoggingEnabled():
+            self.__timber.log('JServiceTriviaQuestionRepository', f'{jsonResponse}')
+
+        if not utils.hasItems(jsonResponse):
+            self.__timber.log('JServiceTriviaQuestionRepository', f'Rejecting jService\'s JSON data due to null/empty contents: {jsonResponse}')
+            raise MalformedTriviaJsonException(f'Rejecting jService\'s JSON data due to null/empty contents: {jsonResponse}')
+
+        triviaJsons: List[Dict[str, Any]] = list()
+
+        for triviaJson in jsonResponse:
+            if utils.hasItems(triviaJson) and 'category' in triviaJson:
+                triviaJsons.append(triviaJson)
+
+        if not utils.hasItems(triviaJsons):
+            self.__timber.log('JServiceTriviaQuestionRepository', f'Rejecting jService\'s JSON data due to null/empty contents: {jsonResponse}')
+            raise MalformedTriviaJsonException(f'Rejecting jService\'s JSON data due to null/empty contents: {jsonResponse}')
+
+        return triviaJsons
+
+    async def fetchTriviaQuestion(self, fetchOptions: TriviaFetchOptions) -> AbsTriviaQuestion:
+        if not isinstance(fetchOptions, TriviaFetchOptions):
+            raise ValueError(f'fetchOptions argument is malformed: \"{fetchOptions}\"')
+
+        self.__timber.log('JServiceTriviaQuestionRepository', f'Fetching trivia question... (fetchOptions={fetchOptions})')
+
+        triviaJson = await self.__retrieveOrFetchTriviaJson()
+        return await self.__createTriviaQuestion(triviaJson)
+
     def getSupportedTriviaTypes(self) -> Set[TriviaType]:
         return { TriviaType.QUESTION_ANSWER }
 
@@ -182,3 +209,11 @@ class JServiceTriviaQuestionRepository(AbsTriviaQuestionRepository):
 
     async def hasQuestionSetAvailable(self) -> bool:
         return True
+
+    async def __retrieveOrFetchTriviaJson(self) -> Dict[str, Any]:
+        async with self.__triviaJsonBufferLock:
+            if len(self.__triviaJsonBuffer) == 0:
+                self.__triviaJsonBuffer.extend(await self.__fetchTriviaJsons())
+
+            self.__timber.log('JServiceTriviaQuestionRepository', f'Retrieving buffered trivia question (current buffer size: {len(self.__triviaJsonBuffer)})')
+            return self.__triviaJsonBuffer.popleft()
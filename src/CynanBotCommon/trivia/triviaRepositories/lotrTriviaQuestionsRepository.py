@@ -2,10 +2,13 @@ from typing import Any, Dict, List, Optional, Set
 
 import aiofiles
 import aiofiles.ospath
-import aiosqlite
 
 try:
     import CynanBotCommon.utils as utils
+    from CynanBotCommon.storage.readOnlySqliteDatabase import \
+        ReadOnlySqliteDatabase
+    from CynanBotCommon.storage.sqliteRandomRowSampler import \
+        SqliteRandomRowSampler
     from CynanBotCommon.timber.timberInterface import TimberInterface
     from CynanBotCommon.trivia.absTriviaQuestion import AbsTriviaQuestion
     from CynanBotCommon.trivia.additionalTriviaAnswersRepositoryInterface import \
@@ -25,6 +28,8 @@ try:
     from CynanBotCommon.trivia.triviaType import TriviaType
 except:
     import utils
+    from storage.readOnlySqliteDatabase import ReadOnlySqliteDatabase
+    from storage.sqliteRandomRowSampler import SqliteRandomRowSampler
     from timber.timberInterface import TimberInterface
     from trivia.absTriviaQuestion import AbsTriviaQuestion
     from trivia.additionalTriviaAnswersRepositoryInterface import \
@@ -73,6 +78,9 @@ class LotrTriviaQuestionRepository(AbsTriviaQuestionRepository):
         self.__triviaQuestionCompiler: TriviaQuestionCompiler = triviaQuestionCompiler
         self.__triviaDatabaseFile: str = triviaDatabaseFile
 
+        self.__triviaDatabase: ReadOnlySqliteDatabase = ReadOnlySqliteDatabase(triviaDatabaseFile)
+        self.__rowSampler: SqliteRandomRowSampler = SqliteRandomRowSampler('lotrQuestions')
+
         self.__hasQuestionSetAvailable: Optional[bool] = None
 
     async def fetchTriviaQuestion(self, fetchOptions: TriviaFetchOptions) -> AbsTriviaQuestion:
@@ -126,16 +134,12 @@ class LotrTriviaQuestionRepository(AbsTriviaQuestionRepository):
         if not await aiofiles.ospath.exists(self.__triviaDatabaseFile):
             raise FileNotFoundError(f'LOTR trivia database file not found: \"{self.__triviaDatabaseFile}\"')
 
-        connection = await aiosqlite.connect(self.__triviaDatabaseFile)
-        cursor = await connection.execute(
-            '''
-                SELECT answerA, answerB, answerC, answerD, question, triviaId FROM lotrQuestions
-                ORDER BY RANDOM()
-                LIMIT 1
-            '''
+        connection = await self.__triviaDatabase.getConnection()
+        row = await self.__rowSampler.fetchRandomRow(
+            connection = connection,
+            columns = 'answerA, answerB, answerC, answerD, question, triviaId'
         )
 
-        row = await cursor.fetchone()
         if not utils.hasItems(row) or len(row) != 6:
             raise RuntimeError(f'Received malformed data from LOTR database: {row}')
 
@@ -154,8 +158,6 @@ class LotrTriviaQuestionRepository(AbsTriviaQuestionRepository):
             'triviaId': row[5]
         }
 
-        await cursor.close()
-        await connection.close()
         return triviaQuestionDict
 
     def getSupportedTriviaTypes(self) -> Set[TriviaType]:
@@ -2,10 +2,13 @@ from typing import Any, Dict, List, Optional, Set
 
 import aiofiles
 import aiofiles.ospath
-import aiosqlite
 
 try:
     import CynanBotCommon.utils as utils
+    from CynanBotCommon.storage.readOnlySqliteDatabase import \
+        ReadOnlySqliteDatabase
+    from CynanBotCommon.storage.sqliteRandomRowSampler import \
+        SqliteRandomRowSampler
     from CynanBotCommon.timber.timberInterface import TimberInterface
     from CynanBotCommon.trivia.absTriviaQuestion import AbsTriviaQuestion
     from CynanBotCommon.trivia.multipleChoiceTriviaQuestion import \
@@ -22,6 +25,8 @@ try:
     from CynanBotCommon.trivia.triviaType import TriviaType
 except:
     import utils
+    from storage.readOnlySqliteDatabase import ReadOnlySqliteDatabase
+    from storage.sqliteRandomRowSampler import SqliteRandomRowSampler
     from timber.timberInterface import TimberInterface
     from trivia.absTriviaQuestion import AbsTriviaQuestion
     from trivia.multipleChoiceTriviaQuestion import \
@@ -59,6 +64,9 @@ class MillionaireTriviaQuestionRepository(AbsTriviaQuestionRepository):
         self.__triviaQuestionCompiler: TriviaQuestionCompiler = triviaQuestionCompiler
         self.__triviaDatabaseFile: str = triviaDatabaseFile
 
+        self.__triviaDatabase: ReadOnlySqliteDatabase = ReadOnlySqliteDatabase(triviaDatabaseFile)
+        self.__rowSampler: SqliteRandomRowSampler = SqliteRandomRowSampler('millionaireQuestions')
+
         self.__hasQuestionSetAvailable: Optional[bool] = None
 
     async def fetchTriviaQuestion(self, fetchOptions: TriviaFetchOptions) -> AbsTriviaQuestion:
@@ -104,16 +112,12 @@ class MillionaireTriviaQuestionRepository(AbsTriviaQuestionRepository):
         if not await aiofiles.ospath.exists(self.__triviaDatabaseFile):
             raise FileNotFoundError(f'Millionaire trivia database file not found: \"{self.__triviaDatabaseFile}\"')
 
-        connection = await aiosqlite.connect(self.__triviaDatabaseFile)
-        cursor = await connection.execute(
-            '''
-                SELECT answer, question, responseA, responseB, responseC, responseD, triviaId FROM millionaireQuestions
-                ORDER BY RANDOM()
-                LIMIT 1
-            '''
+        connection = await self.__triviaDatabase.getConnection()
+        row = await self.__rowSampler.fetchRandomRow(
+            connection = connection,
+            columns = 'answer, question, responseA, responseB, responseC, responseD, triviaId'
         )
 
-        row = await cursor.fetchone()
         if not utils.hasItems(row) or len(row) != 7:
             raise RuntimeError(f'Received malformed data from Millionaire database: {row}')
 
@@ -124,8 +128,6 @@ class MillionaireTriviaQuestionRepository(AbsTriviaQuestionRepository):
             'triviaId': row[6]
         }
 
-        await cursor.close()
-        await connection.close()
         return triviaQuestionDict
 
     def getSupportedTriviaTypes(self) -> Set[TriviaType]:
@@ -1,5 +1,8 @@
+import asyncio
 import traceback
-from typing import Any, Dict, List, Optional, Set
+from collections import defaultdict, deque
+from datetime import datetime, timedelta, timezone
+from typing import Any, Deque, Dict, List, Optional, Set
 
 try:
     import CynanBotCommon.utils as utils
@@ -69,7 +72,10 @@ class OpenTriviaDatabaseTriviaQuestionRepository(AbsTriviaQuestionRepository, Cl
         timber: TimberInterface,
         triviaIdGenerator: TriviaIdGeneratorInterface,
         triviaQuestionCompiler: TriviaQuestionCompiler,
-        triviaSettingsRepository: TriviaSettingsRepositoryInterface
+        triviaSettingsRepository: TriviaSettingsRepositoryInterface,
+        questionBatchSize: int = 50,
+        bufferIdleTimeToLive: timedelta = timedelta(hours = 1),
+        timeZone: timezone = timezone.utc
     ):
         super().__init__(triviaSettingsRepository)
 
@@ -83,20 +89,112 @@ class OpenTriviaDatabaseTriviaQuestionRepository(AbsTriviaQuestionRepository, Cl
             raise ValueError(f'triviaIdGenerator argument is malformed: \"{triviaIdGenerator}\"')
         elif not isinstance(triviaQuestionCompiler, TriviaQuestionCompiler):
             raise ValueError(f'triviaQuestionCompiler argument is malformed: \"{triviaQuestionCompiler}\"')
+        elif not utils.isValidInt(questionBatchSize):
+            raise ValueError(f'questionBatchSize argument is malformed: \"{questionBatchSize}\"')
+        elif questionBatchSize < 1 or questionBatchSize > 50:
+            raise ValueError(f'questionBatchSize argument is out of bounds: {questionBatchSize}')
+        elif not isinstance(bufferIdleTimeToLive, timedelta):
+            raise ValueError(f'bufferIdleTimeToLive argument is malformed: \"{bufferIdleTimeToLive}\"')
+        elif not isinstance(timeZone, timezone):
+            raise ValueError(f'timeZone argument is malformed: \"{timeZone}\"')
 
         self.__backingDatabase: BackingDatabase = backingDatabase
         self.__networkClientProvider: NetworkClientProvider = networkClientProvider
         self.__timber: TimberInterface = timber
         self.__triviaIdGenerator: TriviaIdGeneratorInterface = triviaIdGenerator
         self.__triviaQuestionCompiler: TriviaQuestionCompiler = triviaQuestionCompiler
+        self.__questionBatchSize: int = questionBatchSize
+        self.__bufferIdleTimeToLive: timedelta = bufferIdleTimeToLive
+        self.__timeZone: timezone = timeZone
 
         self.__isDatabaseReady: bool = False
         self.__cache: Dict[str, Optional[str]] = dict()
 
+        # Session tokens are per Twitch channel, so the buffered questions (and their locks) have
+        # to be too. Otherwise, a question fetched with one channel's session token could be handed
+        # out to another channel, and one channel's fetch would hold up every other channel.
+        self.__triviaJsonBufferLocks: Dict[str, asyncio.Lock] = defaultdict(lambda: asyncio.Lock())
+        self.__triviaJsonBuffers: Dict[str, Deque[Dict[str, Any]]] = dict()
+        self.__triviaJsonBufferAccessTimes: Dict[str, datetime] = dict()
+
     async def clearCaches(self):
         self.__cache.clear()
+        self.__triviaJsonBuffers.clear()
         self.__timber.log('OpenTriviaDatabaseTriviaQuestionRepository', 'Caches cleared')
 
+    async def __createTriviaQuestion(self, triviaJson: Dict[str, Any]) -> AbsTriviaQuestion:
+        if not utils.hasItems(triviaJson):
+            raise ValueError(f'triviaJson argument is malformed: \"{triviaJson}\"')
+
+        triviaDifficulty = TriviaDifficulty.fromStr(utils.getStrFromDict(triviaJson, 'difficulty', fallback = ''))
+        triviaType = TriviaType.fromStr(utils.getStrFromDict(triviaJson, 'type'))
+
+        category = await self.__triviaQuestionCompiler.compileQuestion(
+            question = utils.getStrFromDict(triviaJson, 'category', fallback = ''),
+            htmlUnescape = True
+        )
+
+        question = await self.__triviaQuestionCompiler.compileQuestion(
+            question = utils.getStrFromDict(triviaJson, 'question'),
+            htmlUnescape = True
+        )
+
+        triviaId = await self.__triviaIdGenerator.generateQuestionId(
+            question = question,
+            category = category,
+            difficulty = triviaDifficulty.toStr()
+        )
+
+        if triviaType is TriviaType.MULTIPLE_CHOICE:
+            correctAnswer = await self.__triviaQuestionCompiler.compileResponse(
+                response = utils.getStrFromDict(triviaJson, 'correct_answer'),
+                htmlUnescape = True
+            )
+            correctAnswers: List[str] = list()
+            correctAnswers.append(correctAnswer)
+
+            incorrectAnswers = await self.__triviaQuestionCompiler.compileResponses(
+                responses = triviaJson['incorrect_answers'],
+                htmlUnescape = True
+            )
+
+            multipleChoiceResponses = await self._buildMultipleChoiceResponsesList(
+                correctAnswers = correctAnswers,
+                multipleChoiceResponses = incorrectAnswers
+            )
+
+            if await self._verifyIsActuallyMultipleChoiceQuestion(correctAnswers, multipleChoiceResponses):
+                return MultipleChoiceTriviaQuestion(
+                    correctAnswers = correctAnswers,
+                    multipleChoiceResponses = multipleChoiceResponses,
+                    category = category,
+                    categoryId = None,
+                    question = question,
+                    triviaId = triviaId,
+                    triviaDifficulty = triviaDifficulty,
+                    triviaSource = TriviaSource.OPEN_TRIVIA_DATABASE
+                )
+            else:
+                self.__timber.log('OpenTriviaDatabaseTriviaQuestionRepository', 'Encountered a multiple choice question that is better suited for true/false')
+                triviaType = TriviaType.TRUE_FALSE
+
+        if triviaType is TriviaType.TRUE_FALSE:
+            correctAnswer = utils.getBoolFromDict(triviaJson, 'correct_answer')
+            correctAnswers: List[bool] = list()
+            correctAnswers.append(correctAnswer)
+
+            return TrueFalseTriviaQuestion(
+                correctAnswers = correctAnswers,
+                category = category,
+                categoryId = None,
+                question = question,
+                triviaId = triviaId,
+                triviaDifficulty = triviaDifficulty,
+                triviaSource = TriviaSource.OPEN_TRIVIA_DATABASE
+            )
+
+        raise UnsupportedTriviaTypeException(f'triviaType \"{triviaType}\" is not supported for Open Trivia Database: {triviaJson}')
+
     async def __fetchNewSessionToken(self, twitchChannel: str) -> str:
         if not utils.isValidStr(twitchChannel):
             raise ValueError(f'twitchChannel argument is malformed: \"{twitchChannel}\"')
@@ -133,20 +231,20 @@ class OpenTriviaDatabaseTriviaQuestionRepository(AbsTriviaQuestionRepository, Cl
 
         return utils.getStrFromDict(jsonResponse, 'token')
 
-    async def fetchTriviaQuestion(self, fetchOptions: TriviaFetchOptions) -> AbsTriviaQuestion:
-        if not isinstance(fetchOptions, TriviaFetchOptions):
-            raise ValueError(f'fetchOptions argument is malformed: \"{fetchOptions}\"')
+    async def __fetchTriviaJsons(self, twitchChannel: str) -> List[Dict[str, Any]]:
+        if not utils.isValidStr(twitchChannel):
+            raise ValueError(f'twitchChannel argument is malformed: \"{twitchChannel}\"')
 
-        self.__timber.log('OpenTriviaDatabaseTriviaQuestionRepository', f'Fetching trivia question... (fetchOptions={fetchOptions})')
+        self.__timber.log('OpenTriviaDatabaseTriviaQuestionRepository', f'Fetching batch of trivia questions for \"{twitchChannel}\"... (questionBatchSize={self.__questionBatchSize})')
 
-        sessionToken = await self.__getOrFetchNewSessionToken(fetchOptions.getTwitchChannel())
+        sessionToken = await self.__getOrFetchNewSessionToken(twitchChannel)
         clientSession = await self.__networkClientProvider.get()
 
         try:
             if utils.isValidStr(sessionToken):
-                response = await clientSession.get(f'https://opentdb.com/api.php?amount=1&token={sessionToken}')
+                response = await clientSession.get(f'https://opentdb.com/api.php?amount={self.__questionBatchSize}&token={sessionToken}')
             else:
-                response = await clientSession.get('https://opentdb.com/api.php?amount=1')
+                response = await clientSession.get(f'https://opentdb.com/api.php?amount={self.__questionBatchSize}')
         except GenericNetworkException as e:
             self.__timber.log('OpenTriviaDatabaseTriviaQuestionRepository', f'Encountered network error when fetching trivia question: {e}', e, traceback.format_exc())
             raise GenericTriviaNetworkException(self.getTriviaSource(), e)
@@ -165,87 +263,33 @@ class OpenTriviaDatabaseTriviaQuestionRepository(AbsTriviaQuestionRepository, Cl
             self.__timber.log('OpenTriviaDatabaseTriviaQuestionRepository', f'Rejecting Open Trivia Database\'s JSON data due to null/empty JSON contents: {jsonResponse}')
             raise MalformedTriviaJsonException(f'Rejecting Open Trivia Database\'s JSON data due to null/empty JSON contents: {jsonResponse}')
         elif utils.getIntFromDict(jsonResponse, 'response_code', fallback = -1) != 0:
-            await self.__removeSessionToken(fetchOptions.getTwitchChannel())
+            await self.__removeSessionToken(twitchChannel)
             self.__timber.log('OpenTriviaDatabaseTriviaQuestionRepository', f'Rejecting Open Trivia Database\'s JSON data due to bad \"response_code\" value: {jsonResponse}')
             raise GenericTriviaNetworkException(f'Rejecting Open Trivia Database\'s JSON data due to bad \"response_code\" value: {jsonResponse}')
         elif not utils.hasItems(jsonResponse.get('results')):
             self.__timber.log('OpenTriviaDatabaseTriviaQuestionRepository', f'Rejecting Open Trivia Database\'s JSON data due to missing/null/empty \"results\" array: {jsonResponse}')
             raise MalformedTriviaJsonException(f'Rejecting Open Trivia Database\'s JSON data due to missing/null/empty \"results\" array: {jsonResponse}')
 
-        triviaJson: Optional[Dict[str, Any]] = jsonResponse['results'][0]
+        triviaJsons: List[Dict[str, Any]] = list()
 
-        if not utils.hasItems(triviaJson):
+        for triviaJson in jsonResponse['results']:
+            if utils.hasItems(triviaJson):
+                triviaJsons.append(triviaJson)
+
+        if not utils.hasItems(triviaJsons):
             self.__timber.log('OpenTriviaDatabaseTriviaQuestionRepository', f'Rejecting Open Trivia Database\'s JSON data due to null/empty \"results\" contents: {jsonResponse}')
             raise MalformedTriviaJsonException(f'Rejecting Open Trivia Database\'s JSON API data due to null/empty contents: {jsonResponse}')
 
-        triviaDifficulty = TriviaDifficulty.fromStr(utils.getStrFromDict(triviaJson, 'difficulty', fallback = ''))
-        triviaType = TriviaType.fromStr(utils.getStrFromDict(triviaJson, 'type'))
-
-        category = await self.__triviaQuestionCompiler.compileQuestion(
-            question = utils.getStrFromDict(triviaJson, 'category', fallback = ''),
-            htmlUnescape = True
-        )
-
-        question = await self.__triviaQuestionCompiler.compileQuestion(
-            question = utils.getStrFromDict(triviaJson, 'question'),
-            htmlUnescape = True
-        )
+        return triviaJsons
 
-        triviaId = await self.__triviaIdGenerator.generateQuestionId(
-            question = question,
-            category = category,
-            difficulty = triviaDifficulty.toStr()
-        )
-
-        if triviaType is TriviaType.MULTIPLE_CHOICE:
-            correctAnswer = await self.__triviaQuestionCompiler.compileResponse(
-                response = utils.getStrFromDict(triviaJson, 'correct_answer'),
-                htmlUnescape = True
-            )
-            correctAnswers: List[str] = list()
-            correctAnswers.append(correctAnswer)
-
-            incorrectAnswers = await self.__triviaQuestionCompiler.compileResponses(
-                responses = triviaJson['incorrect_answers'],
-                htmlUnescape = True
-            )
-
-            multipleChoiceResponses = await self._buildMultipleChoiceResponsesList(
-                correctAnswers = correctAnswers,
-                multipleChoiceResponses = incorrectAnswers
-            )
-
-            if await self._verifyIsActuallyMultipleChoiceQuestion(correctAnswers, multipleChoiceResponses):
-                return MultipleChoiceTriviaQuestion(
-                    correctAnswers = correctAnswers,
-                    multipleChoiceResponses = multipleChoiceResponses,
-                    category = category,
-                    categoryId = None,
-                    question = question,
-                    triviaId = triviaId,
-                    triviaDifficulty = triviaDifficulty,
-                    triviaSource = TriviaSource.OPEN_TRIVIA_DATABASE
-                )
-            else:
-                self.__timber.log('OpenTriviaDatabaseTriviaQuestionRepository', 'Encountered a multiple choice question that is better suited for true/false')
-                triviaType = TriviaType.TRUE_FALSE
-
-        if triviaType is TriviaType.TRUE_FALSE:
-            correctAnswer = utils.getBoolFromDict(triviaJson, 'correct_answer')
-            correctAnswers: List[bool] = list()
-            correctAnswers.append(correctAnswer)
+    async def fetchTriviaQuestion(self, fetchOptions: TriviaFetchOptions) -> AbsTriviaQuestion:
+        if not isinstance(fetchOptions, TriviaFetchOptions):
+            raise ValueError(f'fetchOptions argument is malformed: \"{fetchOptions}\"')
 
-            return TrueFalseTriviaQuestion(
-                correctAnswers = correctAnswers,
-                category = category,
-                categoryId = None,
-                question = question,
-                triviaId = triviaId,
-                triviaDifficulty = triviaDifficulty,
-                triviaSource = TriviaSource.OPEN_TRIVIA_DATABASE
-            )
+        self.__timber.log('OpenTriviaDatabaseTriviaQuestionRepository', f'Fetching trivia question... (fetchOptions={fetchOptions})')
 
-        raise UnsupportedTriviaTypeException(f'triviaType \"{triviaType}\" is not supported for Open Trivia Database: {jsonResponse}')
+        triviaJson = await self.__retrieveOrFetchTriviaJson(fetchOptions.getTwitchChannel())
+        return await self.__createTriviaQuestion(triviaJson)
 
     async def __getDatabaseConnection(self) -> DatabaseConnection:
         await self.__initDatabaseTable()
@@ -286,28 +330,46 @@ class OpenTriviaDatabaseTriviaQuestionRepository(AbsTriviaQuestionRepository, Cl
         self.__isDatabaseReady = True
         connection = await self.__backingDatabase.getConnection()
 
-        if connection.getDatabaseType() is DatabaseType.POSTGRESQL:
-            await connection.createTableIfNotExists(
-                '''
-                    CREATE TABLE IF NOT EXISTS opentriviadatabasesessiontokens (
-                        sessiontoken text DEFAULT NULL,
-                        twitchchannel public.citext NOT NULL PRIMARY KEY
-                    )
-                '''
-            )
-        elif connection.getDatabaseType() is DatabaseType.SQLITE:
-            await connection.createTableIfNotExists(
-                '''
-                    CREATE TABLE IF NOT EXISTS opentriviadatabasesessiontokens (
-                        sessiontoken TEXT DEFAULT NULL,
-                        twitchchannel TEXT NOT NULL PRIMARY KEY COLLATE NOCASE
-                    )
-                '''
-            )
-        else:
-            raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
+        try:
+            if connection.getDatabaseType() is DatabaseType.POSTGRESQL:
+                await connection.createTableIfNotExists(
+                    '''
+                        CREATE TABLE IF NOT EXISTS opentriviadatabasesessiontokens (
+                            sessiontoken text DEFAULT NULL,
+                            twitchchannel public.citext NOT NULL PRIMARY KEY
+                        )
+                    '''
+                )
+            elif connection.getDatabaseType() is DatabaseType.SQLITE:
+                await connection.createTableIfNotExists(
+                    '''
+                        CREATE TABLE IF NOT EXISTS opentriviadatabasesessiontokens (
+                            sessiontoken TEXT DEFAULT NULL,
+                            twitchchannel TEXT NOT NULL PRIMARY KEY COLLATE NOCASE
+                        )
+                    '''
+                )
+            else:
+                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
+        finally:
+            await connection.close()
+
+    def __removeIdleTriviaJsonBuffers(self):
+        now = datetime.now(self.__timeZone)
+
+        for twitchChannel, accessTime in list(self.__triviaJsonBufferAccessTimes.items()):
+            if now - accessTime <= self.__bufferIdleTimeToLive:
+                continue
 
-        await connection.close()
+            triviaJsonBufferLock = self.__triviaJsonBufferLocks.get(twitchChannel)
+
+            if triviaJsonBufferLock is not None and triviaJsonBufferLock.locked():
+                continue
+
+            self.__triviaJsonBufferAccessTimes.pop(twitchChannel, None)
+            self.__triviaJsonBufferLocks.pop(twitchChannel, None)
+            self.__triviaJsonBuffers.pop(twitchChannel, None)
+            self.__timber.log('OpenTriviaDatabaseTriviaQuestionRepository', f'Removed idle trivia question buffer for \"{twitchChannel}\"')
 
     async def __removeSessionToken(self, twitchChannel: str):
         if not utils.isValidStr(twitchChannel):
@@ -318,6 +380,29 @@ class OpenTriviaDatabaseTriviaQuestionRepository(AbsTriviaQuestionRepository, Cl
             twitchChannel = twitchChannel
         )
 
+    async def __retrieveOrFetchTriviaJson(self, twitchChannel: str) -> Dict[str, Any]:
+        if not utils.isValidStr(twitchChannel):
+            raise ValueError(f'twitchChannel argument is malformed: \"{twitchChannel}\"')
+
+        # this is recorded before waiting on the lock, so a channel with a caller waiting on its
+        # lock is never idle
+        self.__triviaJsonBufferAccessTimes[twitchChannel.lower()] = datetime.now(self.__timeZone)
+        self.__removeIdleTriviaJsonBuffers()
+
+        # holding the lock while fetching makes concurrent callers share this batch
+        async with self.__triviaJsonBufferLocks[twitchChannel.lower()]:
+            triviaJsonBuffer = self.__triviaJsonBuffers.get(twitchChannel.lower())
+
+            if triviaJsonBuffer is None:
+                triviaJsonBuffer = deque()
+                self.__triviaJsonBuffers[twitchChannel.lower()] = triviaJsonBuffer
+
+            if len(triviaJsonBuffer) == 0:
+                triviaJsonBuffer.extend(await self.__fetchTriviaJsons(twitchChannel))
+
+            self.__timber.log('OpenTriviaDatabaseTriviaQuestionRepository', f'Retrieving buffered trivia question for \"{twitchChannel}\" (current buffer size: {len(triviaJsonBuffer)})')
+            return triviaJsonBuffer.popleft()
+
     async def __retrieveSessionToken(self, twitchChannel: str) -> Optional[str]:
         if not utils.isValidStr(twitchChannel):
             raise ValueError(f'twitchChannel argument is malformed: \"{twitchChannel}\"')
@@ -328,16 +413,18 @@ class OpenTriviaDatabaseTriviaQuestionRepository(AbsTriviaQuestionRepository, Cl
             return sessionToken
 
         connection = await self.__getDatabaseConnection()
-        record = await connection.fetchRow(
-            '''
-                SELECT sessiontoken FROM opentriviadatabasesessiontokens
-                WHERE twitchchannel = $1
-                LIMIT 1
-            ''',
-            twitchChannel
-        )
 
-        await connection.close()
+        try:
+            record = await connection.fetchRow(
+                '''
+                    SELECT sessiontoken FROM opentriviadatabasesessiontokens
+                    WHERE twitchchannel = $1
+                    LIMIT 1
+                ''',
+                twitchChannel
+            )
+        finally:
+            await connection.close()
 
         if utils.hasItems(record):
             sessionToken = record[0]
@@ -358,26 +445,27 @@ class OpenTriviaDatabaseTriviaQuestionRepository(AbsTriviaQuestionRepository, Cl
 
         connection = await self.__getDatabaseConnection()
 
-        if utils.isValidStr(sessionToken):
-            await connection.execute(
-                '''
-                    INSERT INTO opentriviadatabasesessiontokens (sessiontoken, twitchchannel)
-                    VALUES ($1, $2)
-                    ON CONFLICT (twitchchannel) DO UPDATE SET sessiontoken = EXCLUDED.sessiontoken
-                ''',
-                sessionToken, twitchChannel
-            )
-
-            self.__cache[twitchChannel.lower()] = sessionToken
-        else:
-            await connection.execute(
-                '''
-                    DELETE FROM opentriviadatabasesessiontokens
-                    WHERE twitchchannel = $1
-                ''',
-                twitchChannel
-            )
+        try:
+            if utils.isValidStr(sessionToken):
+                await connection.execute(
+                    '''
+                        INSERT INTO opentriviadatabasesessiontokens (sessiontoken, twitchchannel)
+                        VALUES ($1, $2)
+                        ON CONFLICT (twitchchannel) DO UPDATE SET sessiontoken = EXCLUDED.sessiontoken
+                    ''',
+                    sessionToken, twitchChannel
+                )
 
-            self.__cache.pop(twitchChannel.lower(), None)
+                self.__cache[twitchChannel.lower()] = sessionToken
+            else:
+                await connection.execute(
+                    '''
+                        DELETE FROM opentriviadatabasesessiontokens
+                        WHERE twitchchannel = $1
+                    ''',
+                    twitchChannel
+                )
 
-        await connection.close()
+                self.__cache.pop(twitchChannel.lower(), None)
+        finally:
+            await connection.close()
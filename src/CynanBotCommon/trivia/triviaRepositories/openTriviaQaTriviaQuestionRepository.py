@@ -2,10 +2,13 @@ from typing import Any, Dict, List, Optional, Set
 
 import aiofiles
 import aiofiles.ospath
-import aiosqlite
 
 try:
     import CynanBotCommon.utils as utils
+    from CynanBotCommon.storage.readOnlySqliteDatabase import \
+        ReadOnlySqliteDatabase
+    from CynanBotCommon.storage.sqliteRandomRowSampler import \
+        SqliteRandomRowSampler
     from CynanBotCommon.timber.timberInterface import TimberInterface
     from CynanBotCommon.trivia.absTriviaQuestion import AbsTriviaQuestion
     from CynanBotCommon.trivia.multipleChoiceTriviaQuestion import \
@@ -26,6 +29,8 @@ try:
         TrueFalseTriviaQuestion
 except:
     import utils
+    from storage.readOnlySqliteDatabase import ReadOnlySqliteDatabase
+    from storage.sqliteRandomRowSampler import SqliteRandomRowSampler
     from timber.timberInterface import TimberInterface
     from trivia.absTriviaQuestion import AbsTriviaQuestion
     from trivia.multipleChoiceTriviaQuestion import \
@@ -65,6 +70,9 @@ class OpenTriviaQaTriviaQuestionRepository(AbsTriviaQuestionRepository):
         self.__triviaQuestionCompiler: TriviaQuestionCompiler = triviaQuestionCompiler
         self.__triviaDatabaseFile: str = triviaDatabaseFile
 
+        self.__triviaDatabase: ReadOnlySqliteDatabase = ReadOnlySqliteDatabase(triviaDatabaseFile)
+        self.__rowSampler: SqliteRandomRowSampler = SqliteRandomRowSampler('triviaQuestions')
+
         self.__hasQuestionSetAvailable: Optional[bool] = None
 
     async def fetchTriviaQuestion(self, fetchOptions: TriviaFetchOptions) -> AbsTriviaQuestion:
@@ -132,16 +140,12 @@ class OpenTriviaQaTriviaQuestionRepository(AbsTriviaQuestionRepository):
         if not await aiofiles.ospath.exists(self.__triviaDatabaseFile):
             raise FileNotFoundError(f'Open Trivia QA trivia database file not found: \"{self.__triviaDatabaseFile}\"')
 
-        connection = await aiosqlite.connect(self.__triviaDatabaseFile)
-        cursor = await connection.execute(
-            '''
-                SELECT correctAnswer, newCategory, question, questionId, questionType, response1, response2, response3, response4 FROM triviaQuestions
-                ORDER BY RANDOM()
-                LIMIT 1
-            '''
+        connection = await self.__triviaDatabase.getConnection()
+        row = await self.__rowSampler.fetchRandomRow(
+            connection = connection,
+            columns = 'correctAnswer, newCategory, question, questionId, questionType, response1, response2, response3, response4'
         )
 
-        row = await cursor.fetchone()
         if not utils.hasItems(row) or len(row) != 9:
             raise RuntimeError(f'Received malformed data from OpenTriviaQaTriviaQuestion database: {row}')
 
@@ -154,8 +158,6 @@ class OpenTriviaQaTriviaQuestionRepository(AbsTriviaQuestionRepository):
             'responses': [ row[5], row[6], row[7], row[8] ]
         }
 
-        await cursor.close()
-        await connection.close()
         return triviaQuestionDict
 
     def getSupportedTriviaTypes(self) -> Set[TriviaType]:
@@ -2,10 +2,13 @@ from typing import Any, Dict, List, Optional, Set
 
 import aiofiles
 import aiofiles.ospath
-import aiosqlite
 
 try:
     import CynanBotCommon.utils as utils
+    from CynanBotCommon.storage.readOnlySqliteDatabase import \
+        ReadOnlySqliteDatabase
+    from CynanBotCommon.storage.sqliteRandomRowSampler import \
+        SqliteRandomRowSampler
     from CynanBotCommon.timber.timberInterface import TimberInterface
     from CynanBotCommon.trivia.absTriviaQuestion import AbsTriviaQuestion
     from CynanBotCommon.trivia.multipleChoiceTriviaQuestion import \
@@ -26,6 +29,8 @@ try:
         TrueFalseTriviaQuestion
 except:
     import utils
+    from storage.readOnlySqliteDatabase import ReadOnlySqliteDatabase
+    from storage.sqliteRandomRowSampler import SqliteRandomRowSampler
     from timber.timberInterface import TimberInterface
     from trivia.absTriviaQuestion import AbsTriviaQuestion
     from trivia.triviaDifficulty import TriviaDifficulty
@@ -63,6 +68,9 @@ class TriviaDatabaseTriviaQuestionRepository(AbsTriviaQuestionRepository):
         self.__triviaQuestionCompiler: TriviaQuestionCompiler = triviaQuestionCompiler
         self.__triviaDatabaseFile: str = triviaDatabaseFile
 
+        self.__triviaDatabase: ReadOnlySqliteDatabase = ReadOnlySqliteDatabase(triviaDatabaseFile)
+        self.__rowSampler: SqliteRandomRowSampler = SqliteRandomRowSampler('tdQuestions')
+
         self.__hasQuestionSetAvailable: Optional[bool] = None
 
     async def fetchTriviaQuestion(self, fetchOptions: TriviaFetchOptions) -> AbsTriviaQuestion:
@@ -129,16 +137,12 @@ class TriviaDatabaseTriviaQuestionRepository(AbsTriviaQuestionRepository):
         if not await aiofiles.ospath.exists(self.__triviaDatabaseFile):
             raise FileNotFoundError(f'Trivia Database trivia database file not found: \"{self.__triviaDatabaseFile}\"')
 
-        connection = await aiosqlite.connect(self.__triviaDatabaseFile)
-        cursor = await connection.execute(
-            '''
-                SELECT category, correctAnswer, difficulty, question, questionId, triviaType, wrongAnswer1, wrongAnswer2, wrongAnswer3 FROM tdQuestions
-                ORDER BY RANDOM()
-                LIMIT 1
-            '''
+        connection = await self.__triviaDatabase.getConnection()
+        row = await self.__rowSampler.fetchRandomRow(
+            connection = connection,
+            columns = 'category, correctAnswer, difficulty, question, questionId, triviaType, wrongAnswer1, wrongAnswer2, wrongAnswer3'
         )
 
-        row = await cursor.fetchone()
         if not utils.hasItems(row) or len(row) != 9:
             raise RuntimeError(f'Received malformed data from {self.getTriviaSource()} database: {row}')
 
@@ -152,8 +156,6 @@ class TriviaDatabaseTriviaQuestionRepository(AbsTriviaQuestionRepository):
             'wrongAnswers': [ row[6], row[7], row[8] ]
         }
 
-        await cursor.close()
-        await connection.close()
         return triviaQuestionDict
 
     def getSupportedTriviaTypes(self) -> Set[TriviaType]:
@@ -79,34 +79,36 @@ class TriviaGameControllersRepository():
             return AddTriviaGameControllerResult.ERROR
 
         connection = await self.__getDatabaseConnection()
-        record = await connection.fetchRow(
-            '''
-                SELECT COUNT(1) FROM triviagamecontrollers
-                WHERE twitchchannel = $1 AND userid = $2
-                LIMIT 1
-            ''',
-            twitchChannel, userId
-        )
 
-        count: Optional[int] = None
-        if utils.hasItems(record):
-            count = record[0]
+        try:
+            record = await connection.fetchRow(
+                '''
+                    SELECT COUNT(1) FROM triviagamecontrollers
+                    WHERE twitchchannel = $1 AND userid = $2
+                    LIMIT 1
+                ''',
+                twitchChannel, userId
+            )
+
+            count: Optional[int] = None
+            if utils.hasItems(record):
+                count = record[0]
 
-        if utils.isValidInt(count) and count >= 1:
+            if utils.isValidInt(count) and count >= 1:
+                self.__timber.log('TriviaGameControllersRepository', f'Tried to add userName=\"{userName}\" userId=\"{userId}\" as a trivia game controller for \"{twitchChannel}\", but this user has already been added as one')
+                return AddTriviaGameControllerResult.ALREADY_EXISTS
+
+            await connection.execute(
+                '''
+                    INSERT INTO triviagamecontrollers (twitchchannel, userid)
+                    VALUES ($1, $2)
+                    ON CONFLICT (twitchchannel, userid) DO NOTHING
+                ''',
+                twitchChannel, userId
+            )
+        finally:
             await connection.close()
-            self.__timber.log('TriviaGameControllersRepository', f'Tried to add userName=\"{userName}\" userId=\"{userId}\" as a trivia game controller for \"{twitchChannel}\", but this user has already been added as one')
-            return AddTriviaGameControllerResult.ALREADY_EXISTS
-
-        await connection.execute(
-            '''
-                INSERT INTO triviagamecontrollers (twitchchannel, userid)
-                VALUES ($1, $2)
-                ON CONFLICT (twitchchannel, userid) DO NOTHING
-            ''',
-            twitchChannel, userId
-        )
 
-        await connection.close()
         self.__timber.log('TriviaGameControllersRepository', f'Added userName=\"{userName}\" userId=\"{userId}\" as a trivia game controller for \"{twitchChannel}\"')
 
         return AddTriviaGameControllerResult.ADDED
@@ -116,17 +118,20 @@ class TriviaGameControllersRepository():
             raise ValueError(f'twitchChannel argument is malformed: \"{twitchChannel}\"')
 
         connection = await self.__getDatabaseConnection()
-        records = await connection.fetchRows(
-            '''
-                SELECT triviagamecontrollers.twitchchannel, triviagamecontrollers.userid, userids.username FROM triviagamecontrollers
-                INNER JOIN userids ON triviagamecontrollers.userid = userids.userid
-                WHERE triviagamecontrollers.twitchchannel = $1
-                ORDER BY userids.username ASC
-            ''',
-            twitchChannel
-        )
 
-        await connection.close()
+        try:
+            records = await connection.fetchRows(
+                '''
+                    SELECT triviagamecontrollers.twitchchannel, triviagamecontrollers.userid, userids.username FROM triviagamecontrollers
+                    INNER JOIN userids ON triviagamecontrollers.userid = userids.userid
+                    WHERE triviagamecontrollers.twitchchannel = $1
+                    ORDER BY userids.username ASC
+                ''',
+                twitchChannel
+            )
+        finally:
+            await connection.close()
+
         controllers: List[TriviaGameController] = list()
 
         if not utils.hasItems(records):
@@ -153,30 +158,31 @@ class TriviaGameControllersRepository():
         self.__isDatabaseReady = True
         connection = await self.__backingDatabase.getConnection()
 
-        if connection.getDatabaseType() is DatabaseType.POSTGRESQL:
-            await connection.createTableIfNotExists(
-                '''
-                    CREATE TABLE IF NOT EXISTS triviagamecontrollers (
-                        twitchchannel public.citext NOT NULL,
-                        userid public.citext NOT NULL,
-                        PRIMARY KEY (twitchchannel, userid)
-                    )
-                '''
-            )
-        elif connection.getDatabaseType() is DatabaseType.SQLITE:
-            await connection.createTableIfNotExists(
-                '''
-                    CREATE TABLE IF NOT EXISTS triviagamecontrollers (
-                        twitchchannel TEXT NOT NULL COLLATE NOCASE,
-                        userid TEXT NOT NULL COLLATE NOCASE,
-                        PRIMARY KEY (twitchchannel, userid)
-                    )
-                '''
-            )
-        else:
-            raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
-
-        await connection.close()
+        try:
+            if connection.getDatabaseType() is DatabaseType.POSTGRESQL:
+                await connection.createTableIfNotExists(
+                    '''
+                        CREATE TABLE IF NOT EXISTS triviagamecontrollers (
+                            twitchchannel public.citext NOT NULL,
+                            userid public.citext NOT NULL,
+                            PRIMARY KEY (twitchchannel, userid)
+                        )
+                    '''
+                )
+            elif connection.getDatabaseType() is DatabaseType.SQLITE:
+                await connection.createTableIfNotExists(
+                    '''
+                        CREATE TABLE IF NOT EXISTS triviagamecontrollers (
+                            twitchchannel TEXT NOT NULL COLLATE NOCASE,
+                            userid TEXT NOT NULL COLLATE NOCASE,
+                            PRIMARY KEY (twitchchannel, userid)
+                        )
+                    '''
+                )
+            else:
+                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
+        finally:
+            await connection.close()
 
     async def removeController(
         self,
@@ -195,15 +201,18 @@ class TriviaGameControllersRepository():
             return RemoveTriviaGameControllerResult.ERROR
 
         connection = await self.__backingDatabase.getConnection()
-        await connection.execute(
-            '''
-                DELETE FROM triviagamecontrollers
-                WHERE twitchchannel = $1 AND userid = $2
-            ''',
-            twitchChannel, userId
-        )
 
-        await connection.close()
+        try:
+            await connection.execute(
+                '''
+                    DELETE FROM triviagamecontrollers
+                    WHERE twitchchannel = $1 AND userid = $2
+                ''',
+                twitchChannel, userId
+            )
+        finally:
+            await connection.close()
+
         self.__timber.log('TriviaGameControllersRepository', f'Removed userName=\"{userName}\" userId=\"{userId}\" as a trivia game controller for \"{twitchChannel}\"')
 
         return RemoveTriviaGameControllerResult.REMOVED
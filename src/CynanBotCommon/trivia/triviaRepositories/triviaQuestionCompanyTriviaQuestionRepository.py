@@ -2,10 +2,13 @@ from typing import Any, Dict, List, Optional, Set
 
 import aiofiles
 import aiofiles.ospath
-import aiosqlite
 
 try:
     import CynanBotCommon.utils as utils
+    from CynanBotCommon.storage.readOnlySqliteDatabase import \
+        ReadOnlySqliteDatabase
+    from CynanBotCommon.storage.sqliteRandomRowSampler import \
+        SqliteRandomRowSampler
     from CynanBotCommon.timber.timberInterface import TimberInterface
     from CynanBotCommon.trivia.absTriviaQuestion import AbsTriviaQuestion
     from CynanBotCommon.trivia.multipleChoiceTriviaQuestion import \
@@ -24,6 +27,8 @@ try:
     from CynanBotCommon.trivia.triviaType import TriviaType
 except:
     import utils
+    from storage.readOnlySqliteDatabase import ReadOnlySqliteDatabase
+    from storage.sqliteRandomRowSampler import SqliteRandomRowSampler
     from timber.timberInterface import TimberInterface
     from trivia.absTriviaQuestion import AbsTriviaQuestion
     from trivia.triviaDifficulty import TriviaDifficulty
@@ -60,6 +65,9 @@ class TriviaQuestionCompanyTriviaQuestionRepository(AbsTriviaQuestionRepository)
         self.__triviaQuestionCompiler: TriviaQuestionCompiler = triviaQuestionCompiler
         self.__triviaDatabaseFile: str = triviaDatabaseFile
 
+        self.__triviaDatabase: ReadOnlySqliteDatabase = ReadOnlySqliteDatabase(triviaDatabaseFile)
+        self.__rowSampler: SqliteRandomRowSampler = SqliteRandomRowSampler('tqcQuestions')
+
         self.__hasQuestionSetAvailable: Optional[bool] = None
 
     async def fetchTriviaQuestion(self, fetchOptions: TriviaFetchOptions) -> AbsTriviaQuestion:
@@ -111,16 +119,12 @@ class TriviaQuestionCompanyTriviaQuestionRepository(AbsTriviaQuestionRepository)
         if not await aiofiles.ospath.exists(self.__triviaDatabaseFile):
             raise FileNotFoundError(f'Trivia Question Company trivia database file not found: \"{self.__triviaDatabaseFile}\"')
 
-        connection = await aiosqlite.connect(self.__triviaDatabaseFile)
-        cursor = await connection.execute(
-            '''
-                SELECT category, correctAnswerIndex, difficulty, question, questionId, questionType, response0, response1, response2, response3 FROM tqcQuestions
-                ORDER BY RANDOM()
-                LIMIT 1
-            '''
+        connection = await self.__triviaDatabase.getConnection()
+        row = await self.__rowSampler.fetchRandomRow(
+            connection = connection,
+            columns = 'category, correctAnswerIndex, difficulty, question, questionId, questionType, response0, response1, response2, response3'
         )
 
-        row = await cursor.fetchone()
         if not utils.hasItems(row) or len(row) != 10:
             raise RuntimeError(f'Received malformed data from {self.getTriviaSource()} database: {row}')
 
@@ -134,8 +138,6 @@ class TriviaQuestionCompanyTriviaQuestionRepository(AbsTriviaQuestionRepository)
             'responses': [ row[6], row[7], row[8], row[9] ]
         }
 
-        await cursor.close()
-        await connection.close()
         return questionDict
 
     def getSupportedTriviaTypes(self) -> Set[TriviaType]:
@@ -2,8 +2,10 @@ import asyncio
 import queue
 import random
 import traceback
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
 from queue import SimpleQueue
-from typing import Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set
 
 try:
     import CynanBotCommon.utils as utils
@@ -19,8 +21,10 @@ try:
         GenericTriviaNetworkException, MalformedTriviaJsonException,
         NoTriviaCorrectAnswersException,
         NoTriviaMultipleChoiceResponsesException, NoTriviaQuestionException,
-        TooManyTriviaFetchAttemptsException)
+        NoTriviaSourcesAvailableException, TooManyTriviaFetchAttemptsException)
     from CynanBotCommon.trivia.triviaFetchOptions import TriviaFetchOptions
+    from CynanBotCommon.trivia.triviaQuestionCacheInterface import \
+        TriviaQuestionCacheInterface
     from CynanBotCommon.trivia.triviaRepositories.bongoTriviaQuestionRepository import \
         BongoTriviaQuestionRepository
     from CynanBotCommon.trivia.triviaRepositories.funtoonTriviaQuestionRepository import \
@@ -77,8 +81,10 @@ except:
         GenericTriviaNetworkException, MalformedTriviaJsonException,
         NoTriviaCorrectAnswersException,
         NoTriviaMultipleChoiceResponsesException, NoTriviaQuestionException,
-        TooManyTriviaFetchAttemptsException)
+        NoTriviaSourcesAvailableException, TooManyTriviaFetchAttemptsException)
     from trivia.triviaFetchOptions import TriviaFetchOptions
+    from trivia.triviaQuestionCacheInterface import \
+        TriviaQuestionCacheInterface
     from trivia.triviaRepositories.funtoonTriviaQuestionRepository import \
         FuntoonTriviaQuestionRepository
     from trivia.triviaRepositories.jokeTriviaQuestionRepository import \
@@ -143,8 +149,12 @@ class TriviaRepository(TriviaRepositoryInterface):
         twitchHandleProvider: TwitchHandleProviderInterface,
         willFryTriviaQuestionRepository: WillFryTriviaQuestionRepository,
         wwtbamTriviaQuestionRepository: WwtbamTriviaQuestionRepository,
+        triviaQuestionCache: Optional[TriviaQuestionCacheInterface] = None,
+        maxConcurrentSpoolFetchesPerSource: int = 2,
         spoolerLoopSleepTimeSeconds: float = 120,
-        triviaRetrySleepTimeSeconds: float = 0.25
+        triviaRetrySleepTimeSeconds: float = 0.25,
+        spoolIdleTimeToLive: timedelta = timedelta(hours = 1),
+        timeZone: timezone = timezone.utc
     ):
         if not isinstance(backgroundTaskHelper, BackgroundTaskHelper):
             raise ValueError(f'backgroundTaskHelper argument is malformed: \"{backgroundTaskHelper}\"')
@@ -186,6 +196,12 @@ class TriviaRepository(TriviaRepositoryInterface):
             raise ValueError(f'willFryTriviaQuestionRepository argument is malformed: \"{willFryTriviaQuestionRepository}\"')
         elif not isinstance(wwtbamTriviaQuestionRepository, WwtbamTriviaQuestionRepository):
             raise ValueError(f'wwtbamTriviaQuestionRepository argument is malformed: \"{wwtbamTriviaQuestionRepository}\"')
+        elif triviaQuestionCache is not None and not isinstance(triviaQuestionCache, TriviaQuestionCacheInterface):
+            raise ValueError(f'triviaQuestionCache argument is malformed: \"{triviaQuestionCache}\"')
+        elif not utils.isValidInt(maxConcurrentSpoolFetchesPerSource):
+            raise ValueError(f'maxConcurrentSpoolFetchesPerSource argument is malformed: \"{maxConcurrentSpoolFetchesPerSource}\"')
+        elif maxConcurrentSpoolFetchesPerSource < 1 or maxConcurrentSpoolFetchesPerSource > 8:
+            raise ValueError(f'maxConcurrentSpoolFetchesPerSource argument is out of bounds: {maxConcurrentSpoolFetchesPerSource}')
         elif not utils.isValidNum(spoolerLoopSleepTimeSeconds):
             raise ValueError(f'spoolerLoopSleepTimeSeconds argument is malformed: \"{spoolerLoopSleepTimeSeconds}\"')
         elif spoolerLoopSleepTimeSeconds < 15 or spoolerLoopSleepTimeSeconds > 300:
@@ -194,6 +210,10 @@ class TriviaRepository(TriviaRepositoryInterface):
             raise ValueError(f'triviaRetrySleepTimeSeconds argument is malformed: \"{triviaRetrySleepTimeSeconds}\"')
         elif triviaRetrySleepTimeSeconds < 0.25 or triviaRetrySleepTimeSeconds > 3:
             raise ValueError(f'triviaRetrySleepTimeSeconds argument is out of bounds: {triviaRetrySleepTimeSeconds}')
+        elif not isinstance(spoolIdleTimeToLive, timedelta):
+            raise ValueError(f'spoolIdleTimeToLive argument is malformed: \"{spoolIdleTimeToLive}\"')
+        elif not isinstance(timeZone, timezone):
+            raise ValueError(f'timeZone argument is malformed: \"{timeZone}\"')
 
         self.__backgroundTaskHelper: BackgroundTaskHelper = backgroundTaskHelper
         self.__bongoTriviaQuestionRepository: TriviaQuestionRepositoryInterface = bongoTriviaQuestionRepository
@@ -215,17 +235,45 @@ class TriviaRepository(TriviaRepositoryInterface):
         self.__twitchHandleProvider: TwitchHandleProviderInterface = twitchHandleProvider
         self.__willFryTriviaQuestionRepository: TriviaQuestionRepositoryInterface = willFryTriviaQuestionRepository
         self.__wwtbamTriviaQuestionRepository: TriviaQuestionRepositoryInterface = wwtbamTriviaQuestionRepository
+        self.__triviaQuestionCache: Optional[TriviaQuestionCacheInterface] = triviaQuestionCache
+        self.__maxConcurrentSpoolFetchesPerSource: int = maxConcurrentSpoolFetchesPerSource
         self.__spoolerLoopSleepTimeSeconds: float = spoolerLoopSleepTimeSeconds
         self.__triviaRetrySleepTimeSeconds: float = triviaRetrySleepTimeSeconds
+        self.__spoolIdleTimeToLive: timedelta = spoolIdleTimeToLive
+        self.__timeZone: timezone = timeZone
 
         self.__isSpoolerStarted: bool = False
+        self.__spoolRefillEvent: asyncio.Event = asyncio.Event()
+        self.__spoolFetchSemaphores: Dict[TriviaSource, asyncio.Semaphore] = defaultdict(lambda: asyncio.Semaphore(self.__maxConcurrentSpoolFetchesPerSource))
         self.__triviaSourceToRepositoryMap: Dict[TriviaSource, Optional[TriviaQuestionRepositoryInterface]] = self.__createTriviaSourceToRepositoryMap()
-        self.__superTriviaQuestionSpool: SimpleQueue[QuestionAnswerTriviaQuestion] = SimpleQueue()
-        self.__triviaQuestionSpool: SimpleQueue[AbsTriviaQuestion] = SimpleQueue()
+        self.__superTriviaQuestionSpools: Dict[str, SimpleQueue[QuestionAnswerTriviaQuestion]] = dict()
+        self.__triviaQuestionSpools: Dict[str, SimpleQueue[AbsTriviaQuestion]] = dict()
+        self.__spoolAccessTimes: Dict[str, datetime] = dict()
 
-    async def __chooseRandomTriviaSource(self, triviaFetchOptions: TriviaFetchOptions) -> TriviaQuestionRepositoryInterface:
+    async def __cacheTriviaQuestion(self, question: AbsTriviaQuestion):
+        if not isinstance(question, AbsTriviaQuestion):
+            raise ValueError(f'question argument is malformed: \"{question}\"')
+
+        triviaQuestionCache = self.__triviaQuestionCache
+
+        # local trivia sources are always available, so only network trivia sources get cached
+        if triviaQuestionCache is None or question.getTriviaSource().isLocal():
+            return
+
+        try:
+            await triviaQuestionCache.add(question)
+        except Exception as e:
+            self.__timber.log('TriviaRepository', f'Encountered unknown Exception when adding trivia question to the trivia question cache (triviaSource=\"{question.getTriviaSource()}\") (triviaId=\"{question.getTriviaId()}\"): {e}', e, traceback.format_exc())
+
+    async def __chooseRandomTriviaSource(
+        self,
+        triviaFetchOptions: TriviaFetchOptions,
+        triviaSourcesToAvoid: Optional[Set[TriviaSource]] = None
+    ) -> TriviaQuestionRepositoryInterface:
         if not isinstance(triviaFetchOptions, TriviaFetchOptions):
             raise ValueError(f'triviaFetchOptions argument is malformed: \"{triviaFetchOptions}\"')
+        elif triviaSourcesToAvoid is not None and not isinstance(triviaSourcesToAvoid, Set):
+            raise ValueError(f'triviaSourcesToAvoid argument is malformed: \"{triviaSourcesToAvoid}\"')
 
         triviaSourcesAndWeights: Dict[TriviaSource, int] = await self.__triviaSettingsRepository.getAvailableTriviaSourcesAndWeights()
         triviaSourcesToRemove: Set[TriviaSource] = await self.__getCurrentlyInvalidTriviaSources(triviaFetchOptions)
@@ -235,7 +283,13 @@ class TriviaRepository(TriviaRepositoryInterface):
                 del triviaSourcesAndWeights[triviaSourceToRemove]
 
         if not utils.hasItems(triviaSourcesAndWeights):
-            raise RuntimeError(f'There are no trivia sources available to be fetched from! TriviaFetchOptions are: {triviaFetchOptions}')
+            raise NoTriviaSourcesAvailableException(f'There are no trivia sources available to be fetched from! TriviaFetchOptions are: {triviaFetchOptions}')
+
+        # avoided trivia sources are only a preference, so they're still used when nothing else is left
+        if utils.hasItems(triviaSourcesToAvoid) and not triviaSourcesToAvoid.issuperset(triviaSourcesAndWeights.keys()):
+            for triviaSourceToAvoid in triviaSourcesToAvoid:
+                if triviaSourceToAvoid in triviaSourcesAndWeights:
+                    del triviaSourcesAndWeights[triviaSourceToAvoid]
 
         triviaSources: List[TriviaSource] = list()
         triviaWeights: List[int] = list()
@@ -292,38 +346,63 @@ class TriviaRepository(TriviaRepositoryInterface):
         retryCount: int = 0
         maxRetryCount = await self.__triviaSettingsRepository.getMaxRetryCount()
         attemptedTriviaSources: List[TriviaSource] = list()
+        isTriviaSourceFailure = False
 
         while retryCount < maxRetryCount:
             question = await self.__retrieveSpooledTriviaQuestion(triviaFetchOptions)
 
-            if question is None:
-                triviaQuestionRepository = await self.__chooseRandomTriviaSource(triviaFetchOptions)
-                triviaSource = triviaQuestionRepository.getTriviaSource()
-                attemptedTriviaSources.append(triviaSource)
+            # right after a trivia source has failed, fall back on the trivia question cache rather
+            # than trying yet another (possibly slow or unstable) trivia source
+            if question is None and isTriviaSourceFailure:
+                question = await self.__retrieveCachedTriviaQuestion(triviaFetchOptions)
+
+            isFreshlyFetched = False
+            isTriviaSourceFailure = False
 
+            if question is None:
                 try:
-                    question = await triviaQuestionRepository.fetchTriviaQuestion(triviaFetchOptions)
-                except (NoTriviaCorrectAnswersException, NoTriviaMultipleChoiceResponsesException, NoTriviaQuestionException) as e:
-                    self.__timber.log('TriviaRepository', f'Failed to fetch trivia question due to malformed data (trivia source was \"{triviaSource}\"): {e}', e, traceback.format_exc())
-                except GenericTriviaNetworkException as e:
-                    errorCount = self.__triviaSourceInstabilityHelper.incrementErrorCount(triviaSource)
-                    self.__timber.log('TriviaRepository', f'Encountered network Exception when fetching trivia question (trivia source was \"{triviaSource}\") (new error count is {errorCount}): {e}', e, traceback.format_exc())
-                except MalformedTriviaJsonException as e:
-                    errorCount = self.__triviaSourceInstabilityHelper.incrementErrorCount(triviaSource)
-                    self.__timber.log('TriviaRepository', f'Encountered malformed JSON Exception when fetching trivia question (trivia source was \"{triviaSource}\") (new error count is {errorCount}): {e}', e, traceback.format_exc())
-                except Exception as e:
-                    errorCount = self.__triviaSourceInstabilityHelper.incrementErrorCount(triviaSource)
-                    self.__timber.log('TriviaRepository', f'Encountered unknown Exception when fetching trivia question (trivia source was \"{triviaSource}\") (new error count is {errorCount}): {e}', e, traceback.format_exc())
+                    triviaQuestionRepository = await self.__chooseRandomTriviaSource(triviaFetchOptions)
+                except NoTriviaSourcesAvailableException:
+                    # every trivia source is currently unavailable, so the trivia question cache is all that's left
+                    question = await self.__retrieveCachedTriviaQuestion(triviaFetchOptions)
+
+                    if question is None:
+                        raise
+                else:
+                    isFreshlyFetched = True
+                    triviaSource = triviaQuestionRepository.getTriviaSource()
+                    attemptedTriviaSources.append(triviaSource)
+
+                    try:
+                        question = await triviaQuestionRepository.fetchTriviaQuestion(triviaFetchOptions)
+                    except (NoTriviaCorrectAnswersException, NoTriviaMultipleChoiceResponsesException, NoTriviaQuestionException) as e:
+                        self.__timber.log('TriviaRepository', f'Failed to fetch trivia question due to malformed data (trivia source was \"{triviaSource}\"): {e}', e, traceback.format_exc())
+                    except GenericTriviaNetworkException as e:
+                        isTriviaSourceFailure = True
+                        errorCount = self.__triviaSourceInstabilityHelper.incrementErrorCount(triviaSource)
+                        self.__timber.log('TriviaRepository', f'Encountered network Exception when fetching trivia question (trivia source was \"{triviaSource}\") (new error count is {errorCount}): {e}', e, traceback.format_exc())
+                    except MalformedTriviaJsonException as e:
+                        isTriviaSourceFailure = True
+                        errorCount = self.__triviaSourceInstabilityHelper.incrementErrorCount(triviaSource)
+                        self.__timber.log('TriviaRepository', f'Encountered malformed JSON Exception when fetching trivia question (trivia source was \"{triviaSource}\") (new error count is {errorCount}): {e}', e, traceback.format_exc())
+                    except Exception as e:
+                        isTriviaSourceFailure = True
+                        errorCount = self.__triviaSourceInstabilityHelper.incrementErrorCount(triviaSource)
+                        self.__timber.log('TriviaRepository', f'Encountered unknown Exception when fetching trivia question (trivia source was \"{triviaSource}\") (new error count is {errorCount}): {e}', e, traceback.format_exc())
 
             if await self.__verifyTriviaQuestionContent(
                 question = question,
                 triviaFetchOptions = triviaFetchOptions
-            ) and await self.__verifyTriviaQuestionIsNotDuplicate(
-                question = question,
-                emote = emote,
-                triviaFetchOptions = triviaFetchOptions
             ):
-                return question
+                if isFreshlyFetched:
+                    await self.__cacheTriviaQuestion(question)
+
+                if await self.__verifyTriviaQuestionIsNotDuplicate(
+                    question = question,
+                    emote = emote,
+                    triviaFetchOptions = triviaFetchOptions
+                ):
+                    return question
 
             question = None
             retryCount = retryCount + 1
@@ -382,6 +461,39 @@ class TriviaRepository(TriviaRepositoryInterface):
 
         return unstableTriviaSources
 
+    def __getBusySpoolTriviaSources(self) -> Set[TriviaSource]:
+        busyTriviaSources: Set[TriviaSource] = set()
+
+        for triviaSource, semaphore in self.__spoolFetchSemaphores.items():
+            if semaphore.locked():
+                busyTriviaSources.add(triviaSource)
+
+        return busyTriviaSources
+
+    def __getOrCreateSuperTriviaQuestionSpool(self, twitchChannel: str) -> SimpleQueue[QuestionAnswerTriviaQuestion]:
+        if not utils.isValidStr(twitchChannel):
+            raise ValueError(f'twitchChannel argument is malformed: \"{twitchChannel}\"')
+
+        superTriviaQuestionSpool = self.__superTriviaQuestionSpools.get(twitchChannel.lower())
+
+        if superTriviaQuestionSpool is None:
+            superTriviaQuestionSpool = SimpleQueue()
+            self.__superTriviaQuestionSpools[twitchChannel.lower()] = superTriviaQuestionSpool
+
+        return superTriviaQuestionSpool
+
+    def __getOrCreateTriviaQuestionSpool(self, twitchChannel: str) -> SimpleQueue[AbsTriviaQuestion]:
+        if not utils.isValidStr(twitchChannel):
+            raise ValueError(f'twitchChannel argument is malformed: \"{twitchChannel}\"')
+
+        triviaQuestionSpool = self.__triviaQuestionSpools.get(twitchChannel.lower())
+
+        if triviaQuestionSpool is None:
+            triviaQuestionSpool = SimpleQueue()
+            self.__triviaQuestionSpools[twitchChannel.lower()] = triviaQuestionSpool
+
+        return triviaQuestionSpool
+
     async def __isJokeTriviaQuestionRepositoryAvailable(self) -> bool:
         return self.__jokeTriviaQuestionRepository is not None
 
@@ -394,6 +506,94 @@ class TriviaRepository(TriviaRepositoryInterface):
     async def __isQuizApiTriviaQuestionRepositoryAvailable(self) -> bool:
         return self.__quizApiTriviaQuestionRepository is not None
 
+    async def __refillTriviaQuestionSpools(self) -> int:
+        # The bot's own channel always has spools. Any other channel gets its own spools once it
+        # first fetches trivia.
+        twitchHandle = await self.__twitchHandleProvider.getTwitchHandle()
+        self.__getOrCreateSuperTriviaQuestionSpool(twitchHandle)
+        self.__getOrCreateTriviaQuestionSpool(twitchHandle)
+        self.__removeIdleTriviaQuestionSpools(twitchHandle)
+
+        maxSuperTriviaQuestionSpoolSize = await self.__triviaSettingsRepository.getMaxSuperTriviaQuestionSpoolSize()
+        maxTriviaQuestionSpoolSize = await self.__triviaSettingsRepository.getMaxTriviaQuestionSpoolSize()
+
+        coroutines: List[Any] = list()
+        superTriviaQuestionsNeeded = 0
+        triviaQuestionsNeeded = 0
+
+        for twitchChannel, superTriviaQuestionSpool in list(self.__superTriviaQuestionSpools.items()):
+            for _ in range(max(0, maxSuperTriviaQuestionSpoolSize - superTriviaQuestionSpool.qsize())):
+                coroutines.append(self.__spoolNewSuperTriviaQuestion(twitchChannel))
+                superTriviaQuestionsNeeded = superTriviaQuestionsNeeded + 1
+
+        for twitchChannel, triviaQuestionSpool in list(self.__triviaQuestionSpools.items()):
+            for _ in range(max(0, maxTriviaQuestionSpoolSize - triviaQuestionSpool.qsize())):
+                coroutines.append(self.__spoolNewTriviaQuestion(twitchChannel))
+                triviaQuestionsNeeded = triviaQuestionsNeeded + 1
+
+        if len(coroutines) == 0:
+            return 0
+
+        self.__timber.log('TriviaRepository', f'Refilling trivia question spools (superTriviaQuestionsNeeded=\"{superTriviaQuestionsNeeded}\") (triviaQuestionsNeeded=\"{triviaQuestionsNeeded}\")')
+
+        # each fetch picks its own random trivia source, and the per source semaphores make sure
+        # that no one source ends up with too many of these fetches at once
+        results = await asyncio.gather(*coroutines, return_exceptions = True)
+        spooledCount = 0
+
+        for result in results:
+            if isinstance(result, Exception):
+                self.__timber.log('TriviaRepository', f'Encountered unknown Exception when refilling trivia question spools: {result}', result)
+            elif result is True:
+                spooledCount = spooledCount + 1
+
+        self.__timber.log('TriviaRepository', f'Finished refilling trivia question spools (spooledCount=\"{spooledCount}\")')
+        return spooledCount
+
+    def __removeIdleTriviaQuestionSpools(self, twitchHandle: str):
+        if not utils.isValidStr(twitchHandle):
+            raise ValueError(f'twitchHandle argument is malformed: \"{twitchHandle}\"')
+
+        # spools for channels that haven't asked for trivia in a while are dropped, so that they
+        # don't keep on being refilled forever
+        now = datetime.now(self.__timeZone)
+        twitchChannels = set(self.__superTriviaQuestionSpools.keys()) | set(self.__triviaQuestionSpools.keys())
+        twitchChannels.discard(twitchHandle.lower())
+
+        for twitchChannel in twitchChannels:
+            accessTime = self.__spoolAccessTimes.get(twitchChannel)
+
+            if accessTime is not None and now - accessTime <= self.__spoolIdleTimeToLive:
+                continue
+
+            self.__superTriviaQuestionSpools.pop(twitchChannel, None)
+            self.__triviaQuestionSpools.pop(twitchChannel, None)
+            self.__spoolAccessTimes.pop(twitchChannel, None)
+            self.__timber.log('TriviaRepository', f'Removed idle trivia question spools for \"{twitchChannel}\"')
+
+    async def __retrieveCachedTriviaQuestion(
+        self,
+        triviaFetchOptions: TriviaFetchOptions
+    ) -> Optional[AbsTriviaQuestion]:
+        if not isinstance(triviaFetchOptions, TriviaFetchOptions):
+            raise ValueError(f'triviaFetchOptions argument is malformed: \"{triviaFetchOptions}\"')
+
+        triviaQuestionCache = self.__triviaQuestionCache
+
+        if triviaQuestionCache is None:
+            return None
+
+        try:
+            question = await triviaQuestionCache.fetchRandomQuestion(triviaFetchOptions)
+        except Exception as e:
+            self.__timber.log('TriviaRepository', f'Encountered unknown Exception when retrieving trivia question from the trivia question cache: {e}', e, traceback.format_exc())
+            return None
+
+        if question is not None:
+            self.__timber.log('TriviaRepository', f'Retrieved cached trivia question for \"{triviaFetchOptions.getTwitchChannel()}\" (triviaSource=\"{question.getTriviaSource()}\") (triviaId=\"{question.getTriviaId()}\")')
+
+        return question
+
     async def __retrieveSpooledTriviaQuestion(
         self,
         triviaFetchOptions: TriviaFetchOptions
@@ -401,40 +601,60 @@ class TriviaRepository(TriviaRepositoryInterface):
         if not isinstance(triviaFetchOptions, TriviaFetchOptions):
             raise ValueError(f'triviaFetchOptions argument is malformed: \"{triviaFetchOptions}\"')
 
+        twitchChannel = triviaFetchOptions.getTwitchChannel()
+        self.__spoolAccessTimes[twitchChannel.lower()] = datetime.now(self.__timeZone)
+
+        # Whether or not there's a spooled question here, this channel is now known to want trivia,
+        # so wake the spooler up to top off (or start) this channel's spools.
+        self.__spoolRefillEvent.set()
+
         if triviaFetchOptions.requireQuestionAnswerTriviaQuestion():
-            if not self.__superTriviaQuestionSpool.empty():
+            superTriviaQuestionSpool = self.__getOrCreateSuperTriviaQuestionSpool(twitchChannel)
+
+            if not superTriviaQuestionSpool.empty():
                 try:
-                    self.__timber.log('TriviaRepository', f'Retrieving spooled super trivia question (current qsize: {self.__superTriviaQuestionSpool.qsize()})')
-                    return self.__superTriviaQuestionSpool.get_nowait()
+                    self.__timber.log('TriviaRepository', f'Retrieving spooled super trivia question for \"{twitchChannel}\" (current qsize: {superTriviaQuestionSpool.qsize()})')
+                    return superTriviaQuestionSpool.get_nowait()
                 except queue.Empty as e:
-                    self.__timber.log('TriviaRepository', f'Encountered queue.Empty when trying to retrieve a spooled super trivia question', e, traceback.format_exc())
+                    self.__timber.log('TriviaRepository', f'Encountered queue.Empty when trying to retrieve a spooled super trivia question for \"{twitchChannel}\"', e, traceback.format_exc())
         else:
-            if not self.__triviaQuestionSpool.empty():
+            triviaQuestionSpool = self.__getOrCreateTriviaQuestionSpool(twitchChannel)
+
+            if not triviaQuestionSpool.empty():
                 try:
-                    self.__timber.log('TriviaRepository', f'Retrieving spooled trivia question (current qsize: {self.__triviaQuestionSpool.qsize()})')
-                    return self.__triviaQuestionSpool.get_nowait()
+                    self.__timber.log('TriviaRepository', f'Retrieving spooled trivia question for \"{twitchChannel}\" (current qsize: {triviaQuestionSpool.qsize()})')
+                    return triviaQuestionSpool.get_nowait()
                 except queue.Empty as e:
-                    self.__timber.log('TriviaRepository', f'Encountered queue.Empty when trying to retrieve a spooled trivia question', e, traceback.format_exc())
+                    self.__timber.log('TriviaRepository', f'Encountered queue.Empty when trying to retrieve a spooled trivia question for \"{twitchChannel}\"', e, traceback.format_exc())
 
         return None
 
-    async def __spoolNewSuperTriviaQuestion(self):
-        if self.__superTriviaQuestionSpool.qsize() >= await self.__triviaSettingsRepository.getMaxSuperTriviaQuestionSpoolSize():
-            return
+    async def __spoolNewSuperTriviaQuestion(self, twitchChannel: str) -> bool:
+        if not utils.isValidStr(twitchChannel):
+            raise ValueError(f'twitchChannel argument is malformed: \"{twitchChannel}\"')
+
+        superTriviaQuestionSpool = self.__getOrCreateSuperTriviaQuestionSpool(twitchChannel)
+
+        if superTriviaQuestionSpool.qsize() >= await self.__triviaSettingsRepository.getMaxSuperTriviaQuestionSpoolSize():
+            return False
 
         triviaFetchOptions = TriviaFetchOptions(
-            twitchChannel = await self.__twitchHandleProvider.getTwitchHandle(),
+            twitchChannel = twitchChannel,
             isJokeTriviaRepositoryEnabled = False,
             questionAnswerTriviaConditions = QuestionAnswerTriviaConditions.REQUIRED
         )
 
-        self.__timber.log('TriviaRepository', f'Spooling up a super trivia question (current qsize: {self.__superTriviaQuestionSpool.qsize()})')
-        triviaQuestionRepository = await self.__chooseRandomTriviaSource(triviaFetchOptions)
+        self.__timber.log('TriviaRepository', f'Spooling up a super trivia question for \"{twitchChannel}\" (current qsize: {superTriviaQuestionSpool.qsize()})')
+        triviaQuestionRepository = await self.__chooseRandomTriviaSource(
+            triviaFetchOptions = triviaFetchOptions,
+            triviaSourcesToAvoid = self.__getBusySpoolTriviaSources()
+        )
         triviaSource = triviaQuestionRepository.getTriviaSource()
         question: Optional[AbsTriviaQuestion] = None
 
         try:
-            question = await triviaQuestionRepository.fetchTriviaQuestion(triviaFetchOptions)
+            async with self.__spoolFetchSemaphores[triviaSource]:
+                question = await triviaQuestionRepository.fetchTriviaQuestion(triviaFetchOptions)
         except (NoTriviaCorrectAnswersException, NoTriviaMultipleChoiceResponsesException, NoTriviaQuestionException) as e:
             self.__timber.log('TriviaRepository', f'Failed to fetch trivia question for spool due to malformed data (trivia source was \"{triviaSource}\"): {e}', e, traceback.format_exc())
         except GenericTriviaNetworkException as e:
@@ -448,38 +668,60 @@ class TriviaRepository(TriviaRepositoryInterface):
             self.__timber.log('TriviaRepository', f'Encountered unknown Exception when fetching super trivia question for spool (trivia source was \"{triviaSource}\"): {e}', e, traceback.format_exc())
 
         if question is None:
-            return
+            return False
         elif question.getTriviaType() is not TriviaType.QUESTION_ANSWER or not isinstance(question, QuestionAnswerTriviaQuestion):
             self.__timber.log('TriviaRepository', f'Encountered unexpected super trivia question type ({question}) when spooling a super trivia question')
-            return
+            return False
 
         if not await self.__verifyTriviaQuestionContent(
             question = question,
             triviaFetchOptions = triviaFetchOptions
         ):
             self.__timber.log('TriviaRepository', f'Encountered bad trivia question content when spooling a super trivia question')
-            return
+            return False
 
-        self.__superTriviaQuestionSpool.put(question)
-        self.__timber.log('TriviaRepository', f'Finished spooling up a super trivia question (new qsize: {self.__superTriviaQuestionSpool.qsize()})')
+        await self.__cacheTriviaQuestion(question)
 
-    async def __spoolNewTriviaQuestion(self):
-        if self.__triviaQuestionSpool.qsize() >= await self.__triviaSettingsRepository.getMaxTriviaQuestionSpoolSize():
-            return
+        # The history check here doesn't record anything, that still happens once the question
+        # is actually handed out. But it does mean that repeats are thrown out now, in the
+        # background, rather than in fetchTrivia() with a retry and a sleep.
+        if not await self.__verifyTriviaQuestionIsNotRecentRepeat(
+            question = question,
+            triviaFetchOptions = triviaFetchOptions
+        ):
+            self.__timber.log('TriviaRepository', f'Discarding a super trivia question that would be a repeat for \"{twitchChannel}\"')
+            return False
+
+        superTriviaQuestionSpool.put(question)
+        self.__timber.log('TriviaRepository', f'Finished spooling up a super trivia question for \"{twitchChannel}\" (new qsize: {superTriviaQuestionSpool.qsize()})')
+        return True
+
+    async def __spoolNewTriviaQuestion(self, twitchChannel: str) -> bool:
+        if not utils.isValidStr(twitchChannel):
+            raise ValueError(f'twitchChannel argument is malformed: \"{twitchChannel}\"')
+
+        triviaQuestionSpool = self.__getOrCreateTriviaQuestionSpool(twitchChannel)
+
+        if triviaQuestionSpool.qsize() >= await self.__triviaSettingsRepository.getMaxTriviaQuestionSpoolSize():
+            return False
 
         triviaFetchOptions = TriviaFetchOptions(
-            twitchChannel = await self.__twitchHandleProvider.getTwitchHandle(),
+            twitchChannel = twitchChannel,
             isJokeTriviaRepositoryEnabled = False,
             questionAnswerTriviaConditions = QuestionAnswerTriviaConditions.NOT_ALLOWED
         )
 
-        self.__timber.log('TriviaRepository', f'Spooling up a trivia question (current qsize: {self.__triviaQuestionSpool.qsize()})')
-        triviaQuestionRepository = await self.__chooseRandomTriviaSource(triviaFetchOptions)
+        self.__timber.log('TriviaRepository', f'Spooling up a trivia question for \"{twitchChannel}\" (current qsize: {triviaQuestionSpool.qsize()})')
+        triviaQuestionRepository = await self.__chooseRandomTriviaSource(
+            triviaFetchOptions = triviaFetchOptions,
+            triviaSourcesToAvoid = self.__getBusySpoolTriviaSources()
+        )
         triviaSource = triviaQuestionRepository.getTriviaSource()
         question: Optional[AbsTriviaQuestion] = None
 
         try:
-            question = await triviaQuestionRepository.fetchTriviaQuestion(triviaFetchOptions)
+            async with self.__spoolFetchSemaphores[triviaSource]:
+                question = await triviaQuestionRepository.fetchTriviaQuestion(triviaFetchOptions)
         except (NoTriviaCorrectAnswersException, NoTriviaMultipleChoiceResponsesException, NoTriviaQuestionException) as e:
             self.__timber.log('TriviaRepository', f'Failed to fetch trivia question for spool due to malformed data (trivia source was \"{triviaSource}\"): {e}', e, traceback.format_exc())
         except GenericTriviaNetworkException as e:
@@ -493,20 +735,33 @@ class TriviaRepository(TriviaRepositoryInterface):
             self.__timber.log('TriviaRepository', f'Encountered unknown Exception when fetching trivia question for spool (trivia source was \"{triviaSource}\"): {e}', e, traceback.format_exc())
 
         if question is None:
-            return
+            return False
         elif question.getTriviaType() is TriviaType.QUESTION_ANSWER or isinstance(question, QuestionAnswerTriviaQuestion):
             self.__timber.log('TriviaRepository', f'Encountered unexpected trivia question type ({question}) when spooling a trivia question')
-            return
+            return False
 
         if not await self.__verifyTriviaQuestionContent(
             question = question,
             triviaFetchOptions = triviaFetchOptions
         ):
             self.__timber.log('TriviaRepository', f'Encountered bad trivia question content when spooling a trivia question')
-            return
+            return False
+
+        await self.__cacheTriviaQuestion(question)
+
+        # The history check here doesn't record anything, that still happens once the question
+        # is actually handed out. But it does mean that repeats are thrown out now, in the
+        # background, rather than in fetchTrivia() with a retry and a sleep.
+        if not await self.__verifyTriviaQuestionIsNotRecentRepeat(
+            question = question,
+            triviaFetchOptions = triviaFetchOptions
+        ):
+            self.__timber.log('TriviaRepository', f'Discarding a trivia question that would be a repeat for \"{twitchChannel}\"')
+            return False
 
-        self.__triviaQuestionSpool.put(question)
-        self.__timber.log('TriviaRepository', f'Finished spooling up a trivia question (new qsize: {self.__triviaQuestionSpool.qsize()})')
+        triviaQuestionSpool.put(question)
+        self.__timber.log('TriviaRepository', f'Finished spooling up a trivia question for \"{twitchChannel}\" (new qsize: {triviaQuestionSpool.qsize()})')
+        return True
 
     def startSpooler(self):
         if self.__isSpoolerStarted:
@@ -520,17 +775,26 @@ class TriviaRepository(TriviaRepositoryInterface):
 
     async def __startTriviaQuestionSpooler(self):
         while True:
-            try:
-                await self.__spoolNewTriviaQuestion()
-            except Exception as e:
-                self.__timber.log('TriviaRepository', f'Encountered unknown Exception when refreshing trivia question spool', e, traceback.format_exc())
+            # cleared before refilling, so that a question handed out while the refill is still
+            # going on isn't missed
+            self.__spoolRefillEvent.clear()
+            spooledCount = 0
 
             try:
-                await self.__spoolNewSuperTriviaQuestion()
+                spooledCount = await self.__refillTriviaQuestionSpools()
             except Exception as e:
-                self.__timber.log('TriviaRepository', f'Encountered unknown Exception when refreshing super trivia question spool', e, traceback.format_exc())
+                self.__timber.log('TriviaRepository', f'Encountered unknown Exception when refilling trivia question spools', e, traceback.format_exc())
+
+            # If anything was spooled then go right around again to top off whatever is still
+            # missing. Otherwise, either the spools are full or every fetch failed, so wait until
+            # a spooled question is asked for (or until the loop sleep time runs out).
+            if spooledCount >= 1:
+                continue
 
-            await asyncio.sleep(self.__spoolerLoopSleepTimeSeconds)
+            try:
+                await asyncio.wait_for(self.__spoolRefillEvent.wait(), timeout = self.__spoolerLoopSleepTimeSeconds)
+            except asyncio.TimeoutError:
+                pass
 
     async def __verifyTriviaQuestionContent(
         self,
@@ -577,3 +841,20 @@ class TriviaRepository(TriviaRepositoryInterface):
         else:
             self.__timber.log('TriviaRepository', f'Rejected a trivia question as it ended up being a duplicate (code=\"{triviaContentCode}\")')
             return False
+
+    async def __verifyTriviaQuestionIsNotRecentRepeat(
+        self,
+        question: AbsTriviaQuestion,
+        triviaFetchOptions: TriviaFetchOptions
+    ) -> bool:
+        if not isinstance(question, AbsTriviaQuestion):
+            raise ValueError(f'question argument is malformed: \"{question}\"')
+        elif not isinstance(triviaFetchOptions, TriviaFetchOptions):
+            raise ValueError(f'triviaFetchOptions argument is malformed: \"{triviaFetchOptions}\"')
+
+        triviaContentCode = await self.__triviaVerifier.peekHistory(
+            question = question,
+            triviaFetchOptions = triviaFetchOptions
+        )
+
+        return triviaContentCode is TriviaContentCode.OK
@@ -1,5 +1,7 @@
+import asyncio
 import traceback
-from typing import Any, Dict, List, Optional, Set
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Set
 
 try:
     import CynanBotCommon.utils as utils
@@ -59,7 +61,8 @@ class WillFryTriviaQuestionRepository(AbsTriviaQuestionRepository):
         timber: TimberInterface,
         triviaIdGenerator: TriviaIdGeneratorInterface,
         triviaQuestionCompiler: TriviaQuestionCompiler,
-        triviaSettingsRepository: TriviaSettingsRepositoryInterface
+        triviaSettingsRepository: TriviaSettingsRepositoryInterface,
+        questionBatchSize: int = 50
     ):
         super().__init__(triviaSettingsRepository)
 
@@ -71,44 +74,23 @@ class WillFryTriviaQuestionRepository(AbsTriviaQuestionRepository):
             raise ValueError(f'triviaIdGenerator argument is malformed: \"{triviaIdGenerator}\"')
         elif not isinstance(triviaQuestionCompiler, TriviaQuestionCompiler):
             raise ValueError(f'triviaQuestionCompiler argument is malformed: \"{triviaQuestionCompiler}\"')
+        elif not utils.isValidInt(questionBatchSize):
+            raise ValueError(f'questionBatchSize argument is malformed: \"{questionBatchSize}\"')
+        elif questionBatchSize < 1 or questionBatchSize > 50:
+            raise ValueError(f'questionBatchSize argument is out of bounds: {questionBatchSize}')
 
         self.__networkClientProvider: NetworkClientProvider = networkClientProvider
         self.__timber: TimberInterface = timber
         self.__triviaIdGenerator: TriviaIdGeneratorInterface = triviaIdGenerator
         self.__triviaQuestionCompiler: TriviaQuestionCompiler = triviaQuestionCompiler
+        self.__questionBatchSize: int = questionBatchSize
 
-    async def fetchTriviaQuestion(self, fetchOptions: TriviaFetchOptions) -> AbsTriviaQuestion:
-        if not isinstance(fetchOptions, TriviaFetchOptions):
-            raise ValueError(f'fetchOptions argument is malformed: \"{fetchOptions}\"')
-
-        self.__timber.log('WillFryTriviaQuestionRepository', f'Fetching trivia question... (fetchOptions={fetchOptions})')
-
-        clientSession = await self.__networkClientProvider.get()
-
-        try:
-            response = await clientSession.get('https://the-trivia-api.com/api/questions?limit=1')
-        except GenericNetworkException as e:
-            self.__timber.log('WillFryTriviaQuestionRepository', f'Encountered network error: {e}', e, traceback.format_exc())
-            raise GenericTriviaNetworkException(self.getTriviaSource(), e)
-
-        if response.getStatusCode() != 200:
-            self.__timber.log('WillFryTriviaQuestionRepository', f'Encountered non-200 HTTP status code: \"{response.getStatusCode()}\"')
-            raise GenericTriviaNetworkException(self.getTriviaSource())
+        self.__triviaJsonBufferLock: asyncio.Lock = asyncio.Lock()
+        self.__triviaJsonBuffer: Deque[Dict[str, Any]] = deque()
 
-        jsonResponse: Optional[Dict[str, Any]] = await response.json()
-        await response.close()
-
-        if await self._triviaSettingsRepository.isDebugLoggingEnabled():
-            self.__timber.log('WillFryTriviaQuestionRepository', f'{jsonResponse}')
-
-        if not utils.hasItems(jsonResponse):
-            self.__timber.log('WillFryTriviaQuestionRepository', f'Rejecting Will Fry Trivia\'s JSON data due to null/empty contents: {jsonResponse}')
-            raise MalformedTriviaJsonException(f'Rejecting Will Fry Trivia\'s JSON data due to null/empty contents: {jsonResponse}')
-
-        triviaJson: Dict[str, Any] = jsonResponse[0]
+    async def __createTriviaQuestion(self, triviaJson: Dict[str, Any]) -> AbsTriviaQuestion:
         if not utils.hasItems(triviaJson):
-            self.__timber.log('WillFryTriviaQuestionRepository', f'Rejecting Will Fry Trivia\'s JSON data due to null/empty contents: {jsonResponse}')
-            raise MalformedTriviaJsonException(f'Rejecting Will Fry Trivia\'s JSON data due to null/empty contents: {jsonResponse}')
+            raise ValueError(f'triviaJson argument is malformed: \"{triviaJson}\"')
 
         triviaType = TriviaType.fromStr(utils.getStrFromDict(triviaJson, 'type'))
         category = await self.__triviaQuestionCompiler.compileCategory(utils.getStrFromDict(triviaJson, 'category', fallback = ''))
@@ -169,7 +151,53 @@ class WillFryTriviaQuestionRepository(AbsTriviaQuestionRepository):
                 triviaSource = TriviaSource.WILL_FRY_TRIVIA
             )
 
-        raise UnsupportedTriviaTypeException(f'triviaType \"{triviaType}\" is not supported for Will Fry Trivia: {jsonResponse}')
+        raise UnsupportedTriviaTypeException(f'triviaType \"{triviaType}\" is not supported for Will Fry Trivia: {triviaJson}')
+
+    async def __fetchTriviaJsons(self) -> List[Dict[str, Any]]:
+        self.__timber.log('WillFryTriviaQuestionRepository', f'Fetching batch of trivia questions... (questionBatchSize={self.__questionBatchSize})')
+
+        clientSession = await self.__networkClientProvider.get()
+
+        try:
+            response = await clientSession.get(f'https://the-trivia-api.com/api/questions?limit={self.__questionBatchSize}')
+        except GenericNetworkException as e:
+            self.__timber.log('WillFryTriviaQuestionRepository', f'Encountered network error: {e}', e, traceback.format_exc())
+            raise GenericTriviaNetworkException(self.getTriviaSource(), e)
+
+        if response.getStatusCode() != 200:
+            self.__timber.log('WillFryTriviaQuestionRepository', f'Encountered non-200 HTTP status code: \"{response.getStatusCode()}\"')
+            raise GenericTriviaNetworkException(self.getTriviaSource())
+
+        jsonResponse: Optional[List[Dict[str, Any]]] = await response.json()
+        await response.close()
+
+        if await self._triviaSettingsRepository.isDebugLoggingEnabled():
+            self.__timber.log('WillFryTriviaQuestionRepository', f'{jsonResponse}')
+
+        if not utils.hasItems(jsonResponse):
+            self.__timber.log('WillFryTriviaQuestionRepository', f'Rejecting Will Fry Trivia\'s JSON data due to null/empty contents: {jsonResponse}')
+            raise MalformedTriviaJsonException(f'Rejecting Will Fry Trivia\'s JSON data due to null/empty contents: {jsonResponse}')
+
+        triviaJsons: List[Dict[str, Any]] = list()
+
+        for triviaJson in jsonResponse:
+            if utils.hasItems(triviaJson):
+                triviaJsons.append(triviaJson)
+
+        if not utils.hasItems(triviaJsons):
+            self.__timber.log('WillFryTriviaQuestionRepository', f'Rejecting Will Fry Trivia\'s JSON data due to null/empty contents: {jsonResponse}')
+            raise MalformedTriviaJsonException(f'Rejecting Will Fry Trivia\'s JSON data due to null/empty contents: {jsonResponse}')
+
+        return triviaJsons
+
+    async def fetchTriviaQuestion(self, fetchOptions: TriviaFetchOptions) -> AbsTriviaQuestion:
+        if not isinstance(fetchOptions, TriviaFetchOptions):
+            raise ValueError(f'fetchOptions argument is malformed: \"{fetchOptions}\"')
+
+        self.__timber.log('WillFryTriviaQuestionRepository', f'Fetching trivia question... (fetchOptions={fetchOptions})')
+
+        triviaJson = await self.__retrieveOrFetchTriviaJson()
+        return await self.__createTriviaQuestion(triviaJson)
 
     def getSupportedTriviaTypes(self) -> Set[TriviaType]:
         return { TriviaType.MULTIPLE_CHOICE, TriviaType.TRUE_FALSE }
@@ -179,3 +207,11 @@ class WillFryTriviaQuestionRepository(AbsTriviaQuestionRepository):
 
     async def hasQuestionSetAvailable(self) -> bool:
         return True
+
+    async def __retrieveOrFetchTriviaJson(self) -> Dict[str, Any]:
+        async with self.__triviaJsonBufferLock:
+            if len(self.__triviaJsonBuffer) == 0:
+                self.__triviaJsonBuffer.extend(await self.__fetchTriviaJsons())
+
+            self.__timber.log('WillFryTriviaQuestionRepository', f'Retrieving buffered trivia question (current buffer size: {len(self.__triviaJsonBuffer)})')
+            return self.__triviaJsonBuffer.popleft()
@@ -0,0 +1,64 @@
+try:
+    import CynanBotCommon.utils as utils
+except:
+    import utils
+
+
+class TriviaScoreIncrement():
+
+    def __init__(
+        self,
+        streak: int,
+        superTriviaWinsIncrement: int,
+        triviaLossesIncrement: int,
+        triviaWinsIncrement: int,
+        twitchChannel: str,
+        userId: str
+    ):
+        if not utils.isValidInt(streak):
+            raise ValueError(f'streak argument is malformed: \"{streak}\"')
+        elif streak < utils.getIntMinSafeSize() or streak > utils.getIntMaxSafeSize():
+            raise ValueError(f'streak argument is out of bounds: {streak}')
+        elif not utils.isValidInt(superTriviaWinsIncrement):
+            raise ValueError(f'superTriviaWinsIncrement argument is malformed: \"{superTriviaWinsIncrement}\"')
+        elif superTriviaWinsIncrement < 0 or superTriviaWinsIncrement > utils.getIntMaxSafeSize():
+            raise ValueError(f'superTriviaWinsIncrement argument is out of bounds: {superTriviaWinsIncrement}')
+        elif not utils.isValidInt(triviaLossesIncrement):
+            raise ValueError(f'triviaLossesIncrement argument is malformed: \"{triviaLossesIncrement}\"')
+        elif triviaLossesIncrement < 0 or triviaLossesIncrement > utils.getIntMaxSafeSize():
+            raise ValueError(f'triviaLossesIncrement argument is out of bounds: {triviaLossesIncrement}')
+        elif not utils.isValidInt(triviaWinsIncrement):
+            raise ValueError(f'triviaWinsIncrement argument is malformed: \"{triviaWinsIncrement}\"')
+        elif triviaWinsIncrement < 0 or triviaWinsIncrement > utils.getIntMaxSafeSize():
+            raise ValueError(f'triviaWinsIncrement argument is out of bounds: {triviaWinsIncrement}')
+        elif not utils.isValidStr(twitchChannel):
+            raise ValueError(f'twitchChannel argument is malformed: \"{twitchChannel}\"')
+        elif not utils.isValidStr(userId):
+            raise ValueError(f'userId argument is malformed: \"{userId}\"')
+        elif userId == '0':
+            raise ValueError(f'userId argument is an illegal value: \"{userId}\"')
+
+        self.__streak: int = streak
+        self.__superTriviaWinsIncrement: int = superTriviaWinsIncrement
+        self.__triviaLossesIncrement: int = triviaLossesIncrement
+        self.__triviaWinsIncrement: int = triviaWinsIncrement
+        self.__twitchChannel: str = twitchChannel
+        self.__userId: str = userId
+
+    def getStreak(self) -> int:
+        return self.__streak
+
+    def getSuperTriviaWinsIncrement(self) -> int:
+        return self.__superTriviaWinsIncrement
+
+    def getTriviaLossesIncrement(self) -> int:
+        return self.__triviaLossesIncrement
+
+    def getTriviaWinsIncrement(self) -> int:
+        return self.__triviaWinsIncrement
+
+    def getTwitchChannel(self) -> str:
+        return self.__twitchChannel
+
+    def getUserId(self) -> str:
+        return self.__userId
@@ -1,18 +1,27 @@
+from typing import Any, List
+
 try:
     import CynanBotCommon.utils as utils
     from CynanBotCommon.storage.backingDatabase import BackingDatabase
     from CynanBotCommon.storage.databaseConnection import DatabaseConnection
     from CynanBotCommon.storage.databaseType import DatabaseType
+    from CynanBotCommon.trivia.triviaScoreIncrement import \
+        TriviaScoreIncrement
+    from CynanBotCommon.trivia.triviaScoreRepositoryInterface import \
+        TriviaScoreRepositoryInterface
     from CynanBotCommon.trivia.triviaScoreResult import TriviaScoreResult
 except:
     import utils
     from storage.backingDatabase import BackingDatabase
     from storage.databaseConnection import DatabaseConnection
     from storage.databaseType import DatabaseType
+    from trivia.triviaScoreIncrement import TriviaScoreIncrement
+    from trivia.triviaScoreRepositoryInterface import \
+        TriviaScoreRepositoryInterface
     from trivia.triviaScoreResult import TriviaScoreResult
 
 
-class TriviaScoreRepository():
+class TriviaScoreRepository(TriviaScoreRepositoryInterface):
 
     def __init__(self, backingDatabase: BackingDatabase):
         if not isinstance(backingDatabase, BackingDatabase):
@@ -35,6 +44,25 @@ class TriviaScoreRepository():
             raise ValueError(f'userId argument is an illegal value: \"{userId}\"')
 
         connection = await self.__getDatabaseConnection()
+
+        try:
+            async with connection.transaction():
+                result = await self.__fetchTriviaScore(
+                    connection = connection,
+                    twitchChannel = twitchChannel,
+                    userId = userId
+                )
+        finally:
+            await connection.close()
+
+        return result
+
+    async def __fetchTriviaScore(
+        self,
+        connection: DatabaseConnection,
+        twitchChannel: str,
+        userId: str
+    ) -> TriviaScoreResult:
         record = await connection.fetchRow(
             '''
                 SELECT streak, supertriviawins, trivialosses, triviawins, twitchchannel, userid FROM triviascores
@@ -54,7 +82,6 @@ class TriviaScoreRepository():
                 userId = record[5]
             )
 
-            await connection.close()
             return result
 
         await connection.execute(
@@ -65,7 +92,6 @@ class TriviaScoreRepository():
             0, 0, 0, 0, twitchChannel, userId
         )
 
-        await connection.close()
         return TriviaScoreResult(
             streak = 0,
             superTriviaWins = 0,
@@ -91,33 +117,16 @@ class TriviaScoreRepository():
         elif userId == '0':
             raise ValueError(f'userId argument is an illegal value: \"{userId}\"')
 
-        result = await self.fetchTriviaScore(
+        return await self.__upsertTriviaScore(
+            '''
+                INSERT INTO triviascores (streak, supertriviawins, trivialosses, triviawins, twitchchannel, userid)
+                VALUES (0, 1, 0, 0, $1, $2)
+                ON CONFLICT (twitchchannel, userid) DO UPDATE SET supertriviawins = triviascores.supertriviawins + 1
+            ''',
             twitchChannel = twitchChannel,
             userId = userId
         )
 
-        newSuperTriviaWins: int = result.getSuperTriviaWins() + 1
-
-        newResult = TriviaScoreResult(
-            streak = result.getStreak(),
-            superTriviaWins = newSuperTriviaWins,
-            triviaLosses = result.getTriviaLosses(),
-            triviaWins = result.getTriviaWins(),
-            twitchChannel = result.getTwitchChannel(),
-            userId = result.getUserId()
-        )
-
-        await self.__updateTriviaScore(
-            newStreak = newResult.getStreak(),
-            newSuperTriviaWins = newResult.getSuperTriviaWins(),
-            newTriviaLosses = newResult.getTriviaLosses(),
-            newTriviaWins = newResult.getTriviaWins(),
-            twitchChannel = newResult.getTwitchChannel(),
-            userId = newResult.getUserId()
-        )
-
-        return newResult
-
     async def incrementTriviaLosses(
         self,
         twitchChannel: str,
@@ -130,38 +139,52 @@ class TriviaScoreRepository():
         elif userId == '0':
             raise ValueError(f'userId argument is an illegal value: \"{userId}\"')
 
-        result = await self.fetchTriviaScore(
+        return await self.__upsertTriviaScore(
+            '''
+                INSERT INTO triviascores (streak, supertriviawins, trivialosses, triviawins, twitchchannel, userid)
+                VALUES (-1, 0, 1, 0, $1, $2)
+                ON CONFLICT (twitchchannel, userid) DO UPDATE SET streak = CASE WHEN triviascores.streak <= -1 THEN triviascores.streak - 1 ELSE -1 END, trivialosses = triviascores.trivialosses + 1
+            ''',
             twitchChannel = twitchChannel,
             userId = userId
         )
 
-        newStreak: int = 0
-        if result.getStreak() <= -1:
-            newStreak = result.getStreak() - 1
-        else:
-            newStreak = -1
-
-        newTriviaLosses: int = result.getTriviaLosses() + 1
-
-        newResult = TriviaScoreResult(
-            streak = newStreak,
-            superTriviaWins = result.getSuperTriviaWins(),
-            triviaLosses = newTriviaLosses,
-            triviaWins = result.getTriviaWins(),
-            twitchChannel = result.getTwitchChannel(),
-            userId = result.getUserId()
-        )
+    async def incrementTriviaScores(self, triviaScoreIncrements: List[TriviaScoreIncrement]):
+        if not isinstance(triviaScoreIncrements, List):
+            raise ValueError(f'triviaScoreIncrements argument is malformed: \"{triviaScoreIncrements}\"')
 
-        await self.__updateTriviaScore(
-            newStreak = newResult.getStreak(),
-            newSuperTriviaWins = newResult.getSuperTriviaWins(),
-            newTriviaLosses = newResult.getTriviaLosses(),
-            newTriviaWins = newResult.getTriviaWins(),
-            twitchChannel = newResult.getTwitchChannel(),
-            userId = newResult.getUserId()
-        )
+        records: List[List[Any]] = list()
 
-        return newResult
+        for triviaScoreIncrement in triviaScoreIncrements:
+            if not isinstance(triviaScoreIncrement, TriviaScoreIncrement):
+                raise ValueError(f'triviaScoreIncrements argument contains a malformed value: \"{triviaScoreIncrement}\"')
+
+            records.append([ triviaScoreIncrement.getStreak(), triviaScoreIncrement.getSuperTriviaWinsIncrement(), triviaScoreIncrement.getTriviaLossesIncrement(), triviaScoreIncrement.getTriviaWinsIncrement(), triviaScoreIncrement.getTwitchChannel(), triviaScoreIncrement.getUserId() ])
+
+        if len(records) == 0:
+            return
+
+        # the counts are added onto whatever is stored, so writes made elsewhere since these
+        # increments were built aren't lost. An increment with only wins (or only losses) extends
+        # the stored streak, while one with both ends on a streak that it started itself
+        connection = await self.__getDatabaseConnection()
+
+        try:
+            await connection.executeMany(
+                '''
+                    INSERT INTO triviascores (streak, supertriviawins, trivialosses, triviawins, twitchchannel, userid)
+                    VALUES ($1, $2, $3, $4, $5, $6)
+                    ON CONFLICT (twitchchannel, userid) DO UPDATE SET streak = CASE
+                        WHEN EXCLUDED.trivialosses = 0 AND EXCLUDED.triviawins = 0 THEN triviascores.streak
+                        WHEN EXCLUDED.trivialosses = 0 THEN CASE WHEN triviascores.streak >= 1 THEN triviascores.streak + EXCLUDED.triviawins ELSE EXCLUDED.triviawins END
+                        WHEN EXCLUDED.triviawins = 0 THEN CASE WHEN triviascores.streak <= -1 THEN triviascores.streak - EXCLUDED.trivialosses ELSE 0 - EXCLUDED.trivialosses END
+                        ELSE EXCLUDED.streak
+                    END, supertriviawins = triviascores.supertriviawins + EXCLUDED.supertriviawins, trivialosses = triviascores.trivialosses + EXCLUDED.trivialosses, triviawins = triviascores.triviawins + EXCLUDED.triviawins
+                ''',
+                records
+            )
+        finally:
+            await connection.close()
 
     async def incrementTriviaWins(
         self,
@@ -175,39 +198,16 @@ class TriviaScoreRepository():
         elif userId == '0':
             raise ValueError(f'userId argument is an illegal value: \"{userId}\"')
 
-        result = await self.fetchTriviaScore(
+        return await self.__upsertTriviaScore(
+            '''
+                INSERT INTO triviascores (streak, supertriviawins, trivialosses, triviawins, twitchchannel, userid)
+                VALUES (1, 0, 0, 1, $1, $2)
+                ON CONFLICT (twitchchannel, userid) DO UPDATE SET streak = CASE WHEN triviascores.streak >= 1 THEN triviascores.streak + 1 ELSE 1 END, triviawins = triviascores.triviawins + 1
+            ''',
             twitchChannel = twitchChannel,
             userId = userId
         )
 
-        newStreak: int = 0
-        if result.getStreak() >= 1:
-            newStreak = result.getStreak() + 1
-        else:
-            newStreak = 1
-
-        newTriviaWins: int = result.getTriviaWins() + 1
-
-        newResult = TriviaScoreResult(
-            streak = newStreak,
-            superTriviaWins = result.getSuperTriviaWins(),
-            triviaLosses = result.getTriviaLosses(),
-            triviaWins = newTriviaWins,
-            twitchChannel = result.getTwitchChannel(),
-            userId = result.getUserId()
-        )
-
-        await self.__updateTriviaScore(
-            newStreak = newResult.getStreak(),
-            newSuperTriviaWins = newResult.getSuperTriviaWins(),
-            newTriviaLosses = newResult.getTriviaLosses(),
-            newTriviaWins = newResult.getTriviaWins(),
-            twitchChannel = newResult.getTwitchChannel(),
-            userId = newResult.getUserId()
-        )
-
-        return newResult
-
     async def __initDatabaseTable(self):
         if self.__isDatabaseReady:
             return
@@ -215,79 +215,89 @@ class TriviaScoreRepository():
         self.__isDatabaseReady = True
         connection = await self.__backingDatabase.getConnection()
 
-        if connection.getDatabaseType() is DatabaseType.POSTGRESQL:
-            await connection.createTableIfNotExists(
-                '''
-                    CREATE TABLE IF NOT EXISTS triviascores (
-                        streak integer DEFAULT 0 NOT NULL,
-                        supertriviawins integer DEFAULT 0 NOT NULL,
-                        trivialosses integer DEFAULT 0 NOT NULL,
-                        triviawins integer DEFAULT 0 NOT NULL,
-                        twitchchannel public.citext NOT NULL,
-                        userid public.citext NOT NULL,
-                        PRIMARY KEY (twitchchannel, userid)
-                    )
-                '''
-            )
-        elif connection.getDatabaseType() is DatabaseType.SQLITE:
-            await connection.createTableIfNotExists(
-                '''
-                    CREATE TABLE IF NOT EXISTS triviascores (
-                        streak INTEGER NOT NULL DEFAULT 0,
-                        supertriviawins INTEGER NOT NULL DEFAULT 0,
-                        trivialosses INTEGER NOT NULL DEFAULT 0,
-                        triviawins INTEGER NOT NULL DEFAULT 0,
-                        twitchchannel TEXT NOT NULL COLLATE NOCASE,
-                        userid TEXT NOT NULL COLLATE NOCASE,
-                        PRIMARY KEY (twitchchannel, userid)
-                    )
-                '''
-            )
-        else:
-            raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
-
-        await connection.close()
+        try:
+            if connection.getDatabaseType() is DatabaseType.POSTGRESQL:
+                await connection.createTableIfNotExists(
+                    '''
+                        CREATE TABLE IF NOT EXISTS triviascores (
+                            streak integer DEFAULT 0 NOT NULL,
+                            supertriviawins integer DEFAULT 0 NOT NULL,
+                            trivialosses integer DEFAULT 0 NOT NULL,
+                            triviawins integer DEFAULT 0 NOT NULL,
+                            twitchchannel public.citext NOT NULL,
+                            userid public.citext NOT NULL,
+                            PRIMARY KEY (twitchchannel, userid)
+                        )
+                    '''
+                )
+            elif connection.getDatabaseType() is DatabaseType.SQLITE:
+                await connection.createTableIfNotExists(
+                    '''
+                        CREATE TABLE IF NOT EXISTS triviascores (
+                            streak INTEGER NOT NULL DEFAULT 0,
+                            supertriviawins INTEGER NOT NULL DEFAULT 0,
+                            trivialosses INTEGER NOT NULL DEFAULT 0,
+                            triviawins INTEGER NOT NULL DEFAULT 0,
+                            twitchchannel TEXT NOT NULL COLLATE NOCASE,
+                            userid TEXT NOT NULL COLLATE NOCASE,
+                            PRIMARY KEY (twitchchannel, userid)
+                        )
+                    '''
+                )
+            else:
+                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
+        finally:
+            await connection.close()
 
-    async def __updateTriviaScore(
+    async def __upsertTriviaScore(
         self,
-        newStreak: int,
-        newSuperTriviaWins: int,
-        newTriviaLosses: int,
-        newTriviaWins: int,
+        query: str,
         twitchChannel: str,
         userId: str
-    ):
-        if not utils.isValidInt(newStreak):
-            raise ValueError(f'newStreak argument is malformed: \"{newStreak}\"')
-        elif newStreak < utils.getIntMinSafeSize() or newStreak > utils.getIntMaxSafeSize():
-            raise ValueError(f'newStreak argument is out of boudns: {newStreak}')
-        elif not utils.isValidInt(newSuperTriviaWins):
-            raise ValueError(f'newSuperTriviaWins argument is malformed: \"{newSuperTriviaWins}\"')
-        elif newSuperTriviaWins < 0 or newSuperTriviaWins > utils.getIntMaxSafeSize():
-            raise ValueError(f'newSuperTriviaWins argument is out of bounds: {newSuperTriviaWins}')
-        elif not utils.isValidInt(newTriviaLosses):
-            raise ValueError(f'newTriviaLosses argument is malformed: \"{newTriviaLosses}\"')
-        elif newTriviaLosses < 0 or newTriviaLosses > utils.getIntMaxSafeSize():
-            raise ValueError(f'newTriviaLosses argument is out of bounds: {newTriviaLosses}')
-        elif not utils.isValidInt(newTriviaWins):
-            raise ValueError(f'newTriviaWins argument is malformed: \"{newTriviaWins}\"')
-        elif newTriviaWins < 0 or newTriviaLosses > utils.getIntMaxSafeSize():
-            raise ValueError(f'newTriviaWins argument is out of bounds: {newTriviaWins}')
+    ) -> TriviaScoreResult:
+        if not utils.isValidStr(query):
+            raise ValueError(f'query argument is malformed: \"{query}\"')
         elif not utils.isValidStr(twitchChannel):
             raise ValueError(f'twitchChannel argument is malformed: \"{twitchChannel}\"')
         elif not utils.isValidStr(userId):
             raise ValueError(f'userId argument is malformed: \"{userId}\"')
-        elif userId == '0':
-            raise ValueError(f'userId argument is an illegal value: \"{userId}\"')
 
-        connection = await self.__backingDatabase.getConnection()
-        await connection.execute(
-            '''
-                INSERT INTO triviascores (streak, supertriviawins, trivialosses, triviawins, twitchchannel, userid)
-                VALUES ($1, $2, $3, $4, $5, $6)
-                ON CONFLICT (twitchchannel, userid) DO UPDATE SET streak = EXCLUDED.streak, supertriviawins = EXCLUDED.supertriviawins, triviaLosses = EXCLUDED.trivialosses, triviawins = EXCLUDED.triviawins
-            ''',
-            newStreak, newSuperTriviaWins, newTriviaLosses, newTriviaWins, twitchChannel, userId
-        )
+        # each score change is a single statement, so concurrent updates can't clobber each other.
+        # The new score is read back in the same transaction rather than through RETURNING, which
+        # needs SQLite 3.35+.
+        connection = await self.__getDatabaseConnection()
+
+        try:
+            async with connection.transaction():
+                await connection.execute(query, twitchChannel, userId)
+
+                result = await self.__fetchTriviaScore(
+                    connection = connection,
+                    twitchChannel = twitchChannel,
+                    userId = userId
+                )
+
+                # raising here rolls the score change back
+                self.__validateTriviaScore(result)
+        finally:
+            await connection.close()
 
-        await connection.close()
+        return result
+
+    def __validateTriviaScore(self, triviaScore: TriviaScoreResult):
+        if not utils.isValidInt(triviaScore.getStreak()):
+            raise ValueError(f'streak is malformed: "{triviaScore.getStreak()}"')
+        elif triviaScore.getStreak() < utils.getIntMinSafeSize() or triviaScore.getStreak() > utils.getIntMaxSafeSize():
+            raise ValueError(f'streak is out of bounds: {triviaScore.getStreak()}')
+        elif not utils.isValidInt(triviaScore.getSuperTriviaWins()):
+            raise ValueError(f'superTriviaWins is malformed: "{triviaScore.getSuperTriviaWins()}"')
+        elif triviaScore.getSuperTriviaWins() < 0 or triviaScore.getSuperTriviaWins() > utils.getIntMaxSafeSize():
+            raise ValueError(f'superTriviaWins is out of bounds: {triviaScore.getSuperTriviaWins()}')
+        elif not utils.isValidInt(triviaScore.getTriviaLosses()):
+            raise ValueError(f'triviaLosses is malformed: "{triviaScore.getTriviaLosses()}"')
+        elif triviaScore.getTriviaLosses() < 0 or triviaScore.getTriviaLosses() > utils.getIntMaxSafeSize():
+            raise ValueError(f'triviaLosses is out of bounds: {triviaScore.getTriviaLosses()}')
+        elif not utils.isValidInt(triviaScore.getTriviaWins()):
+            raise ValueError(f'triviaWins is malformed: "{triviaScore.getTriviaWins()}"')
+        elif triviaScore.getTriviaWins() < 0 or triviaScore.getTriviaWins() > utils.getIntMaxSafeSize():
+            raise ValueError(f'triviaWins is out of bounds: {triviaScore.getTriviaWins()}')
@@ -0,0 +1,50 @@
+from abc import ABC, abstractmethod
+from typing import List
+
+try:
+    from CynanBotCommon.trivia.triviaScoreIncrement import \
+        TriviaScoreIncrement
+    from CynanBotCommon.trivia.triviaScoreResult import TriviaScoreResult
+except:
+    from trivia.triviaScoreIncrement import TriviaScoreIncrement
+    from trivia.triviaScoreResult import TriviaScoreResult
+
+
+class TriviaScoreRepositoryInterface(ABC):
+
+    @abstractmethod
+    async def fetchTriviaScore(
+        self,
+        twitchChannel: str,
+        userId: str
+    ) -> TriviaScoreResult:
+        pass
+
+    @abstractmethod
+    async def incrementSuperTriviaWins(
+        self,
+        twitchChannel: str,
+        userId: str
+    ) -> TriviaScoreResult:
+        pass
+
+    @abstractmethod
+    async def incrementTriviaLosses(
+        self,
+        twitchChannel: str,
+        userId: str
+    ) -> TriviaScoreResult:
+        pass
+
+    @abstractmethod
+    async def incrementTriviaScores(self, triviaScoreIncrements: List[TriviaScoreIncrement]):
+        pass
+
+    @abstractmethod
+    async def incrementTriviaWins(
+        self,
+        twitchChannel: str,
+        userId: str
+    ) -> TriviaScoreResult:
+        pass
+
@@ -1,16 +1,17 @@
 from typing import Any, Dict, Optional
 
 try:
-    import CynanBotCommon.utils as utils
     from CynanBotCommon.storage.jsonReaderInterface import JsonReaderInterface
     from CynanBotCommon.trivia.triviaSettingsRepositoryInterface import \
         TriviaSettingsRepositoryInterface
+    from CynanBotCommon.trivia.triviaSettingsSnapshot import \
+        TriviaSettingsSnapshot
     from CynanBotCommon.trivia.triviaSource import TriviaSource
 except:
-    import utils
     from storage.jsonReaderInterface import JsonReaderInterface
     from trivia.triviaSettingsRepositoryInterface import \
         TriviaSettingsRepositoryInterface
+    from trivia.triviaSettingsSnapshot import TriviaSettingsSnapshot
     from trivia.triviaSource import TriviaSource
 
 
@@ -22,164 +23,126 @@ class TriviaSettingsRepository(TriviaSettingsRepositoryInterface):
 
         self.__settingsJsonReader: JsonReaderInterface = settingsJsonReader
 
-        self.__settingsCache: Optional[Dict[str, Any]] = None
+        self.__settingsSnapshot: Optional[TriviaSettingsSnapshot] = None
 
     async def areAdditionalTriviaAnswersEnabled(self) -> bool:
-        jsonContents = await self.__readJson()
-        return utils.getBoolFromDict(jsonContents, 'additional_trivia_answers_enabled', True)
+        settingsSnapshot = await self.getSettingsSnapshot()
+        return settingsSnapshot.areAdditionalTriviaAnswersEnabled()
 
     async def areShinyTriviasEnabled(self) -> bool:
-        jsonContents = await self.__readJson()
-        return utils.getBoolFromDict(jsonContents, 'shiny_trivias_enabled', True)
+        settingsSnapshot = await self.getSettingsSnapshot()
+        return settingsSnapshot.areShinyTriviasEnabled()
 
     async def areToxicTriviasEnabled(self) -> bool:
-        jsonContents = await self.__readJson()
-        return utils.getBoolFromDict(jsonContents, 'toxic_trivias_enabled', True)
+        settingsSnapshot = await self.getSettingsSnapshot()
+        return settingsSnapshot.areToxicTriviasEnabled()
 
     async def clearCaches(self):
-        self.__settingsCache = None
+        self.__settingsSnapshot = None
 
     async def getAvailableTriviaSourcesAndWeights(self) -> Dict[TriviaSource, int]:
-        jsonContents = await self.__readJson()
-
-        triviaSourcesJson: Dict[str, Any] = jsonContents['trivia_sources']
-        if not utils.hasItems(triviaSourcesJson):
-            raise RuntimeError(f'\"trivia_sources\" field is malformed: \"{triviaSourcesJson}\"')
-
-        triviaSources: Dict[TriviaSource, int] = dict()
-
-        for key, triviaSourceJson in triviaSourcesJson.items():
-            triviaSource = TriviaSource.fromStr(key)
-
-            isEnabled = utils.getBoolFromDict(triviaSourceJson, 'is_enabled', False)
-            if not isEnabled:
-                continue
-
-            weight = utils.getIntFromDict(triviaSourceJson, 'weight', 1)
-            if weight < 1:
-                raise ValueError(f'triviaSource \"{triviaSource}\" has an invalid weight: \"{weight}\"')
-
-            triviaSources[triviaSource] = weight
-
-        if not utils.hasItems(triviaSources):
-            raise RuntimeError(f'triviaSources is empty: \"{triviaSources}\"')
-
-        return triviaSources
+        settingsSnapshot = await self.getSettingsSnapshot()
+        return settingsSnapshot.getAvailableTriviaSourcesAndWeights()
 
     async def getLevenshteinThresholdGrowthRate(self) -> int:
-        jsonContents = await self.__readJson()
-        return utils.getIntFromDict(jsonContents, 'levenshtein_threshold_growth_rate', 7)
+        settingsSnapshot = await self.getSettingsSnapshot()
+        return settingsSnapshot.getLevenshteinThresholdGrowthRate()
 
     async def getMaxAdditionalTriviaAnswerLength(self) -> int:
-        jsonContents = await self.__readJson()
-        return utils.getIntFromDict(jsonContents, 'max_additional_trivia_answer_length', 48)
+        settingsSnapshot = await self.getSettingsSnapshot()
+        return settingsSnapshot.getMaxAdditionalTriviaAnswerLength()
 
     async def getMaxAdditionalTriviaAnswers(self) -> int:
-        jsonContents = await self.__readJson()
-        return utils.getIntFromDict(jsonContents, 'max_additional_trivia_answers', 5)
+        settingsSnapshot = await self.getSettingsSnapshot()
+        return settingsSnapshot.getMaxAdditionalTriviaAnswers()
 
     async def getMaxAnswerLength(self) -> int:
-        jsonContents = await self.__readJson()
-        return utils.getIntFromDict(jsonContents, 'max_answer_length', 80)
+        settingsSnapshot = await self.getSettingsSnapshot()
+        return settingsSnapshot.getMaxAnswerLength()
 
     async def getMaxMultipleChoiceResponses(self) -> int:
-        jsonContents = await self.__readJson()
-        maxMultipleChoiceResponses = utils.getIntFromDict(jsonContents, 'max_multiple_choice_responses', 6)
-        minMultipleChoiceResponses = utils.getIntFromDict(jsonContents, 'min_multiple_choice_responses', 2)
-
-        if minMultipleChoiceResponses < 2 or minMultipleChoiceResponses > utils.getIntMaxSafeSize():
-            raise ValueError(f'\"min_multiple_choice_responses\" is out of bounds: {minMultipleChoiceResponses}')
-        elif maxMultipleChoiceResponses < minMultipleChoiceResponses:
-            raise ValueError(f'\"min_multiple_choice_responses\" ({minMultipleChoiceResponses}) is less than \"max_multiple_choice_responses\" ({maxMultipleChoiceResponses})')
-
-        return maxMultipleChoiceResponses
+        settingsSnapshot = await self.getSettingsSnapshot()
+        return settingsSnapshot.getMaxMultipleChoiceResponses()
 
     async def getMaxQuestionLength(self) -> int:
-        jsonContents = await self.__readJson()
-        return utils.getIntFromDict(jsonContents, 'max_question_length', 350)
+        settingsSnapshot = await self.getSettingsSnapshot()
+        return settingsSnapshot.getMaxQuestionLength()
 
     async def getMaxPhraseAnswerLength(self) -> int:
-        jsonContents = await self.__readJson()
-        return utils.getIntFromDict(jsonContents, 'max_phrase_answer_length', 32)
+        settingsSnapshot = await self.getSettingsSnapshot()
+        return settingsSnapshot.getMaxPhraseAnswerLength()
 
     async def getMaxPhraseGuessLength(self) -> int:
-        jsonContents = await self.__readJson()
-        return utils.getIntFromDict(jsonContents, 'max_phrase_guess_length', 48)
+        settingsSnapshot = await self.getSettingsSnapshot()
+        return settingsSnapshot.getMaxPhraseGuessLength()
 
     async def getMaxSuperTriviaQuestionSpoolSize(self) -> int:
-        jsonContents = await self.__readJson()
-        return utils.getIntFromDict(jsonContents, 'max_super_trivia_question_spool_size', 5)
+        settingsSnapshot = await self.getSettingsSnapshot()
+        return settingsSnapshot.getMaxSuperTriviaQuestionSpoolSize()
 
     async def getMaxTriviaQuestionSpoolSize(self) -> int:
-        jsonContents = await self.__readJson()
-        return utils.getIntFromDict(jsonContents, 'max_trivia_question_spool_size', 5)
+        settingsSnapshot = await self.getSettingsSnapshot()
+        return settingsSnapshot.getMaxTriviaQuestionSpoolSize()
 
     async def getMaxRetryCount(self) -> int:
-        jsonContents = await self.__readJson()
-        maxRetryCount = utils.getIntFromDict(jsonContents, 'max_retry_count', 5)
-
-        if maxRetryCount < 2:
-            raise ValueError(f'max_retry_count is too small: \"{maxRetryCount}\"')
-
-        return maxRetryCount
+        settingsSnapshot = await self.getSettingsSnapshot()
+        return settingsSnapshot.getMaxRetryCount()
 
     async def getMaxSuperTriviaGameQueueSize(self) -> int:
-        jsonContents = await self.__readJson()
-        maxSuperGameQueueSize = utils.getIntFromDict(jsonContents, 'max_super_game_queue_size', 50)
-
-        if maxSuperGameQueueSize < -1:
-            raise ValueError(f'max_super_game_queue_size is too small: \"{maxSuperGameQueueSize}\"')
-
-        return maxSuperGameQueueSize
+        settingsSnapshot = await self.getSettingsSnapshot()
+        return settingsSnapshot.getMaxSuperTriviaGameQueueSize()
 
     async def getMinDaysBeforeRepeatQuestion(self) -> int:
-        jsonContents = await self.__readJson()
-        return utils.getIntFromDict(jsonContents, 'min_days_before_repeat_question', 10)
+        settingsSnapshot = await self.getSettingsSnapshot()
+        return settingsSnapshot.getMinDaysBeforeRepeatQuestion()
 
     async def getMinMultipleChoiceResponses(self) -> int:
-        jsonContents = await self.__readJson()
-        maxMultipleChoiceResponses = utils.getIntFromDict(jsonContents, 'max_multiple_choice_responses', 6)
-        minMultipleChoiceResponses = utils.getIntFromDict(jsonContents, 'min_multiple_choice_responses', 2)
+        settingsSnapshot = await self.getSettingsSnapshot()
+        return settingsSnapshot.getMinMultipleChoiceResponses()
 
-        if minMultipleChoiceResponses < 2 or minMultipleChoiceResponses > utils.getIntMaxSafeSize():
-            raise ValueError(f'\"min_multiple_choice_responses\" is out of bounds: {minMultipleChoiceResponses}')
-        elif maxMultipleChoiceResponses < minMultipleChoiceResponses:
-            raise ValueError(f'\"min_multiple_choice_responses\" ({minMultipleChoiceResponses}) is less than \"max_multiple_choice_responses\" ({maxMultipleChoiceResponses})')
+    async def getSettingsSnapshot(self) -> TriviaSettingsSnapshot:
+        settingsSnapshot = self.__settingsSnapshot
 
-        return minMultipleChoiceResponses
+        if settingsSnapshot is not None:
+            return settingsSnapshot
 
-    async def getShinyProbability(self) -> float:
         jsonContents = await self.__readJson()
-        return utils.getFloatFromDict(jsonContents, 'shiny_probability', 0.03)
+        settingsSnapshot = TriviaSettingsSnapshot(jsonContents)
+
+        # replacing the snapshot is a single assignment, so no caller ever sees a mix of old and
+        # new settings
+        self.__settingsSnapshot = settingsSnapshot
+        return settingsSnapshot
+
+    async def getShinyProbability(self) -> float:
+        settingsSnapshot = await self.getSettingsSnapshot()
+        return settingsSnapshot.getShinyProbability()
 
     async def getSuperTriviaCooldownSeconds(self) -> int:
-        jsonContents = await self.__readJson()
-        return utils.getIntFromDict(jsonContents, 'super_trivia_cooldown_seconds', 8)
+        settingsSnapshot = await self.getSettingsSnapshot()
+        return settingsSnapshot.getSuperTriviaCooldownSeconds()
 
     async def getSuperTriviaFirstQuestionDelaySeconds(self) -> int:
-        jsonContents = await self.__readJson()
-        return utils.getIntFromDict(jsonContents, 'super_trivia_first_question_delay_seconds', 3)
+        settingsSnapshot = await self.getSettingsSnapshot()
+        return settingsSnapshot.getSuperTriviaFirstQuestionDelaySeconds()
 
     async def getToxicProbability(self) -> float:
-        jsonContents = await self.__readJson()
-        return utils.getFloatFromDict(jsonContents, 'toxic_probability', 0.03)
+        settingsSnapshot = await self.getSettingsSnapshot()
+        return settingsSnapshot.getToxicProbability()
 
     async def getTriviaSourceInstabilityThreshold(self) -> int:
-        jsonContents = await self.__readJson()
-        return utils.getIntFromDict(jsonContents, 'trivia_source_instability_threshold', 3)
+        settingsSnapshot = await self.getSettingsSnapshot()
+        return settingsSnapshot.getTriviaSourceInstabilityThreshold()
 
     async def isBanListEnabled(self) -> bool:
-        jsonContents = await self.__readJson()
-        return utils.getBoolFromDict(jsonContents, 'is_ban_list_enabled', True)
+        settingsSnapshot = await self.getSettingsSnapshot()
+        return settingsSnapshot.isBanListEnabled()
 
     async def isDebugLoggingEnabled(self) -> bool:
-        jsonContents = await self.__readJson()
-        return utils.getBoolFromDict(jsonContents, 'debug_logging_enabled', True)
+        settingsSnapshot = await self.getSettingsSnapshot()
+        return settingsSnapshot.isDebugLoggingEnabled()
 
     async def __readJson(self) -> Dict[str, Any]:
-        if self.__settingsCache is not None:
-            return self.__settingsCache
-
         jsonContents: Optional[Dict[str, Any]] = None
 
         if await self.__settingsJsonReader.fileExistsAsync():
@@ -190,5 +153,4 @@ class TriviaSettingsRepository(TriviaSettingsRepositoryInterface):
         if jsonContents is None:
             raise IOError(f'Error reading from trivia settings file: {self.__settingsJsonReader}')
 
-        self.__settingsCache = jsonContents
         return jsonContents
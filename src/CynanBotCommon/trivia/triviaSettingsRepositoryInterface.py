@@ -3,9 +3,12 @@ from typing import Dict
 
 try:
     from CynanBotCommon.clearable import Clearable
+    from CynanBotCommon.trivia.triviaSettingsSnapshot import \
+        TriviaSettingsSnapshot
     from CynanBotCommon.trivia.triviaSource import TriviaSource
 except:
     from clearable import Clearable
+    from trivia.triviaSettingsSnapshot import TriviaSettingsSnapshot
     from trivia.triviaSource import TriviaSource
 
 
@@ -83,6 +86,10 @@ class TriviaSettingsRepositoryInterface(Clearable):
     async def getMinMultipleChoiceResponses(self) -> int:
         pass
 
+    @abstractmethod
+    async def getSettingsSnapshot(self) -> TriviaSettingsSnapshot:
+        pass
+
     @abstractmethod
     async def getShinyProbability(self) -> float:
         pass
@@ -0,0 +1,192 @@
+import copy
+from typing import Any, Dict, Optional
+
+try:
+    import CynanBotCommon.utils as utils
+    from CynanBotCommon.trivia.triviaSource import TriviaSource
+except:
+    import utils
+    from trivia.triviaSource import TriviaSource
+
+
+# An immutable view of every trivia setting. A new snapshot is created whenever the settings are
+# reloaded, so anything holding onto an older snapshot keeps seeing consistent values for as long
+# as it holds it. Each setting is parsed and validated the first time it's asked for, so one bad
+# setting only breaks its own getter rather than every getter.
+class TriviaSettingsSnapshot():
+
+    __slots__ = (
+        '__jsonContents',
+        '__parsedSettings',
+    )
+
+    def __init__(self, jsonContents: Dict[str, Any]):
+        if not isinstance(jsonContents, Dict):
+            raise ValueError(f'jsonContents argument is malformed: \"{jsonContents}\"')
+
+        self.__jsonContents: Dict[str, Any] = copy.deepcopy(jsonContents)
+        self.__parsedSettings: Dict[str, Any] = dict()
+
+    def areAdditionalTriviaAnswersEnabled(self) -> bool:
+        return self.__getBool('additional_trivia_answers_enabled', True)
+
+    def areShinyTriviasEnabled(self) -> bool:
+        return self.__getBool('shiny_trivias_enabled', True)
+
+    def areToxicTriviasEnabled(self) -> bool:
+        return self.__getBool('toxic_trivias_enabled', True)
+
+    def getAvailableTriviaSourcesAndWeights(self) -> Dict[TriviaSource, int]:
+        triviaSources: Optional[Dict[TriviaSource, int]] = self.__parsedSettings.get('trivia_sources')
+
+        if triviaSources is None:
+            triviaSources = self.__parseTriviaSourcesAndWeights()
+            self.__parsedSettings['trivia_sources'] = triviaSources
+
+        if not utils.hasItems(triviaSources):
+            raise RuntimeError(f'triviaSources is empty: \"{triviaSources}\"')
+
+        return dict(triviaSources)
+
+    def __getBool(self, key: str, fallback: bool) -> bool:
+        value: Optional[bool] = self.__parsedSettings.get(key)
+
+        if value is None:
+            value = utils.getBoolFromDict(self.__jsonContents, key, fallback)
+            self.__parsedSettings[key] = value
+
+        return value
+
+    def __getFloat(self, key: str, fallback: float) -> float:
+        value: Optional[float] = self.__parsedSettings.get(key)
+
+        if value is None:
+            value = utils.getFloatFromDict(self.__jsonContents, key, fallback)
+            self.__parsedSettings[key] = value
+
+        return value
+
+    def __getInt(self, key: str, fallback: int) -> int:
+        value: Optional[int] = self.__parsedSettings.get(key)
+
+        if value is None:
+            value = utils.getIntFromDict(self.__jsonContents, key, fallback)
+            self.__parsedSettings[key] = value
+
+        return value
+
+    def getLevenshteinThresholdGrowthRate(self) -> int:
+        return self.__getInt('levenshtein_threshold_growth_rate', 7)
+
+    def getMaxAdditionalTriviaAnswerLength(self) -> int:
+        return self.__getInt('max_additional_trivia_answer_length', 48)
+
+    def getMaxAdditionalTriviaAnswers(self) -> int:
+        return self.__getInt('max_additional_trivia_answers', 5)
+
+    def getMaxAnswerLength(self) -> int:
+        return self.__getInt('max_answer_length', 80)
+
+    def getMaxMultipleChoiceResponses(self) -> int:
+        self.__validateMultipleChoiceResponses()
+        return self.__getInt('max_multiple_choice_responses', 6)
+
+    def getMaxPhraseAnswerLength(self) -> int:
+        return self.__getInt('max_phrase_answer_length', 32)
+
+    def getMaxPhraseGuessLength(self) -> int:
+        return self.__getInt('max_phrase_guess_length', 48)
+
+    def getMaxQuestionLength(self) -> int:
+        return self.__getInt('max_question_length', 350)
+
+    def getMaxRetryCount(self) -> int:
+        maxRetryCount = self.__getInt('max_retry_count', 5)
+
+        if maxRetryCount < 2:
+            raise ValueError(f'max_retry_count is too small: \"{maxRetryCount}\"')
+
+        return maxRetryCount
+
+    def getMaxSuperTriviaGameQueueSize(self) -> int:
+        maxSuperGameQueueSize = self.__getInt('max_super_game_queue_size', 50)
+
+        if maxSuperGameQueueSize < -1:
+            raise ValueError(f'max_super_game_queue_size is too small: \"{maxSuperGameQueueSize}\"')
+
+        return maxSuperGameQueueSize
+
+    def getMaxSuperTriviaQuestionSpoolSize(self) -> int:
+        return self.__getInt('max_super_trivia_question_spool_size', 5)
+
+    def getMaxTriviaQuestionSpoolSize(self) -> int:
+        return self.__getInt('max_trivia_question_spool_size', 5)
+
+    def getMinDaysBeforeRepeatQuestion(self) -> int:
+        return self.__getInt('min_days_before_repeat_question', 10)
+
+    def getMinMultipleChoiceResponses(self) -> int:
+        self.__validateMultipleChoiceResponses()
+        return self.__getInt('min_multiple_choice_responses', 2)
+
+    def getShinyProbability(self) -> float:
+        return self.__getFloat('shiny_probability', 0.03)
+
+    def getSuperTriviaCooldownSeconds(self) -> int:
+        return self.__getInt('super_trivia_cooldown_seconds', 8)
+
+    def getSuperTriviaFirstQuestionDelaySeconds(self) -> int:
+        return self.__getInt('super_trivia_first_question_delay_seconds', 3)
+
+    def getToxicProbability(self) -> float:
+        return self.__getFloat('toxic_probability', 0.03)
+
+    def getTriviaSourceInstabilityThreshold(self) -> int:
+        return self.__getInt('trivia_source_instability_threshold', 3)
+
+    def isBanListEnabled(self) -> bool:
+        return self.__getBool('is_ban_list_enabled', True)
+
+    def isDebugLoggingEnabled(self) -> bool:
+        return self.__getBool('debug_logging_enabled', True)
+
+    def __parseTriviaSourcesAndWeights(self) -> Dict[TriviaSource, int]:
+        triviaSources: Dict[TriviaSource, int] = dict()
+        triviaSourcesJson: Optional[Dict[str, Any]] = self.__jsonContents.get('trivia_sources')
+
+        if not utils.hasItems(triviaSourcesJson):
+            return triviaSources
+
+        for key, triviaSourceJson in triviaSourcesJson.items():
+            triviaSource = TriviaSource.fromStr(key)
+
+            isEnabled = utils.getBoolFromDict(triviaSourceJson, 'is_enabled', False)
+            if not isEnabled:
+                continue
+
+            weight = utils.getIntFromDict(triviaSourceJson, 'weight', 1)
+            if weight < 1:
+                raise ValueError(f'triviaSource \"{triviaSource}\" has an invalid weight: \"{weight}\"')
+
+            triviaSources[triviaSource] = weight
+
+        return triviaSources
+
+    def __validateMultipleChoiceResponses(self):
+        maxMultipleChoiceResponses = self.__getInt('max_multiple_choice_responses', 6)
+        minMultipleChoiceResponses = self.__getInt('min_multiple_choice_responses', 2)
+
+        if minMultipleChoiceResponses < 2 or minMultipleChoiceResponses > utils.getIntMaxSafeSize():
+            raise ValueError(f'\"min_multiple_choice_responses\" is out of bounds: {minMultipleChoiceResponses}')
+        elif maxMultipleChoiceResponses < minMultipleChoiceResponses:
+            raise ValueError(f'\"min_multiple_choice_responses\" ({minMultipleChoiceResponses}) is less than \"max_multiple_choice_responses\" ({maxMultipleChoiceResponses})')
+
+    def __delattr__(self, name: str):
+        raise AttributeError(f'TriviaSettingsSnapshot is immutable, can\'t delete \"{name}\"')
+
+    def __setattr__(self, name: str, value: Any):
+        # each attribute can only be set once, and that happens in the constructor
+        if hasattr(self, name):
+            raise AttributeError(f'TriviaSettingsSnapshot is immutable, can\'t set \"{name}\"')
+
+        super().__setattr__(name, value)
@@ -108,3 +108,18 @@ class TriviaVerifier(TriviaVerifierInterface):
             return contentCode
 
         return TriviaContentCode.OK
+
+    async def peekHistory(
+        self,
+        question: AbsTriviaQuestion,
+        triviaFetchOptions: TriviaFetchOptions
+    ) -> TriviaContentCode:
+        if not isinstance(question, AbsTriviaQuestion):
+            raise ValueError(f'question argument is malformed: \"{question}\"')
+        elif not isinstance(triviaFetchOptions, TriviaFetchOptions):
+            raise ValueError(f'triviaFetchOptions argument is malformed: \"{triviaFetchOptions}\"')
+
+        return await self.__triviaHistoryRepository.peek(
+            question = question,
+            twitchChannel = triviaFetchOptions.getTwitchChannel()
+        )
@@ -29,3 +29,11 @@ class TriviaVerifierInterface(ABC):
         triviaFetchOptions: TriviaFetchOptions
     ) -> TriviaContentCode:
         pass
+
+    @abstractmethod
+    async def peekHistory(
+        self,
+        question: AbsTriviaQuestion,
+        triviaFetchOptions: TriviaFetchOptions
+    ) -> TriviaContentCode:
+        pass
@@ -207,16 +207,18 @@ class TwitchTokensRepository(TwitchTokensRepositoryInterface):
             return self.__cache[twitchChannel.lower()]
 
         connection = await self.__getDatabaseConnection()
-        record = await connection.fetchRow(
-            '''
-                SELECT expirationtime, accesstoken, refreshtoken FROM twitchtokens
-                WHERE twitchchannel = $1
-                LIMIT 1
-            ''',
-            twitchChannel
-        )
 
-        await connection.close()
+        try:
+            record = await connection.fetchRow(
+                '''
+                    SELECT expirationtime, accesstoken, refreshtoken FROM twitchtokens
+                    WHERE twitchchannel = $1
+                    LIMIT 1
+                ''',
+                twitchChannel
+            )
+        finally:
+            await connection.close()
 
         if not utils.hasItems(record):
             self.__cache.pop(twitchChannel.lower(), None)
@@ -252,32 +254,34 @@ class TwitchTokensRepository(TwitchTokensRepositoryInterface):
         self.__isDatabaseReady = True
         connection = await self.__backingDatabase.getConnection()
 
-        if connection.getDatabaseType() is DatabaseType.POSTGRESQL:
-            await connection.createTableIfNotExists(
-                '''
-                    CREATE TABLE IF NOT EXISTS twitchtokens (
-                        expirationtime text DEFAULT NULL,
-                        accesstoken text NOT NULL,
-                        refreshtoken text NOT NULL,
-                        twitchchannel public.citext NOT NULL PRIMARY KEY
-                    )
-                '''
-            )
-        elif connection.getDatabaseType() is DatabaseType.SQLITE:
-            await connection.createTableIfNotExists(
-                '''
-                    CREATE TABLE IF NOT EXISTS twitchtokens (
-                        expirationtime TEXT DEFAULT NULL,
-                        accesstoken TEXT NOT NULL,
-                        refreshtoken TEXT NOT NULL,
-                        twitchchannel TEXT NOT NULL PRIMARY KEY COLLATE NOCASE
-                    )
-                '''
-            )
-        else:
-            raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
+        try:
+            if connection.getDatabaseType() is DatabaseType.POSTGRESQL:
+                await connection.createTableIfNotExists(
+                    '''
+                        CREATE TABLE IF NOT EXISTS twitchtokens (
+                            expirationtime text DEFAULT NULL,
+                            accesstoken text NOT NULL,
+                            refreshtoken text NOT NULL,
+                            twitchchannel public.citext NOT NULL PRIMARY KEY
+                        )
+                    '''
+                )
+            elif connection.getDatabaseType() is DatabaseType.SQLITE:
+                await connection.createTableIfNotExists(
+                    '''
+                        CREATE TABLE IF NOT EXISTS twitchtokens (
+                            expirationtime TEXT DEFAULT NULL,
+                            accesstoken TEXT NOT NULL,
+                            refreshtoken TEXT NOT NULL,
+                            twitchchannel TEXT NOT NULL PRIMARY KEY COLLATE NOCASE
+                        )
+                    '''
+                )
+            else:
+                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
+        finally:
+            await connection.close()
 
-        await connection.close()
         await self.__consumeSeedFile()
 
     async def __refreshTokensDetails(
@@ -316,15 +320,18 @@ class TwitchTokensRepository(TwitchTokensRepositoryInterface):
         self.__timber.log('TwitchTokensRepository', f'Removing user \"{twitchChannel}\"...')
 
         connection = await self.__getDatabaseConnection()
-        await connection.execute(
-            '''
-                DELETE FROM twitchtokens
-                WHERE twitchchannel = $1
-            ''',
-            twitchChannel
-        )
 
-        await connection.close()
+        try:
+            await connection.execute(
+                '''
+                    DELETE FROM twitchtokens
+                    WHERE twitchchannel = $1
+                ''',
+                twitchChannel
+            )
+        finally:
+            await connection.close()
+
         self.__cache.pop(twitchChannel.lower(), None)
         self.__tokenExpirationTimes.pop(twitchChannel.lower(), None)
 
@@ -379,16 +386,19 @@ class TwitchTokensRepository(TwitchTokensRepositoryInterface):
             raise ValueError(f'twitchChannel argument is malformed: \"{twitchChannel}\"')
 
         connection = await self.__getDatabaseConnection()
-        await connection.execute(
-            '''
-                UPDATE twitchtokens
-                SET expirationtime = $1
-                WHERE twitchchannel = $2
-            ''',
-            expirationTime.isoformat(), twitchChannel
-        )
 
-        await connection.close()
+        try:
+            await connection.execute(
+                '''
+                    UPDATE twitchtokens
+                    SET expirationtime = $1
+                    WHERE twitchchannel = $2
+                ''',
+                expirationTime.isoformat(), twitchChannel
+            )
+        finally:
+            await connection.close()
+
         self.__cache.pop(twitchChannel.lower(), None)
         self.__tokenExpirationTimes[twitchChannel.lower()] = expirationTime
 
@@ -410,35 +420,36 @@ class TwitchTokensRepository(TwitchTokensRepositoryInterface):
 
         connection = await self.__getDatabaseConnection()
 
-        if tokensDetails is None:
-            await connection.execute(
-                '''
-                    DELETE FROM twitchtokens
-                    WHERE twitchchannel = $1
-                ''',
-                twitchChannel
-            )
-
-            self.__cache.pop(twitchChannel.lower(), None)
-            self.__tokenExpirationTimes.pop(twitchChannel.lower(), None)
-            self.__timber.log('TwitchTokensRepository', f'Twitch tokens details for \"{twitchChannel}\" has been deleted')
-        else:
-            expirationTime = tokensDetails.getExpirationTime()
-
-            await connection.execute(
-                '''
-                    INSERT INTO twitchtokens (expirationtime, accesstoken, refreshtoken, twitchchannel)
-                    VALUES ($1, $2, $3, $4)
-                    ON CONFLICT (twitchchannel) DO UPDATE SET expirationtime = EXCLUDED.expirationtime, accesstoken = EXCLUDED.accesstoken, refreshtoken = EXCLUDED.refreshtoken
-                ''',
-                expirationTime.isoformat(), tokensDetails.getAccessToken(), tokensDetails.getRefreshToken(), twitchChannel
-            )
+        try:
+            if tokensDetails is None:
+                await connection.execute(
+                    '''
+                        DELETE FROM twitchtokens
+                        WHERE twitchchannel = $1
+                    ''',
+                    twitchChannel
+                )
 
-            self.__cache[twitchChannel.lower()] = tokensDetails
-            self.__tokenExpirationTimes[twitchChannel.lower()] = expirationTime
-            self.__timber.log('TwitchTokensRepository', f'Twitch tokens details for \"{twitchChannel}\" has been updated ({tokensDetails})')
+                self.__cache.pop(twitchChannel.lower(), None)
+                self.__tokenExpirationTimes.pop(twitchChannel.lower(), None)
+                self.__timber.log('TwitchTokensRepository', f'Twitch tokens details for \"{twitchChannel}\" has been deleted')
+            else:
+                expirationTime = tokensDetails.getExpirationTime()
+
+                await connection.execute(
+                    '''
+                        INSERT INTO twitchtokens (expirationtime, accesstoken, refreshtoken, twitchchannel)
+                        VALUES ($1, $2, $3, $4)
+                        ON CONFLICT (twitchchannel) DO UPDATE SET expirationtime = EXCLUDED.expirationtime, accesstoken = EXCLUDED.accesstoken, refreshtoken = EXCLUDED.refreshtoken
+                    ''',
+                    expirationTime.isoformat(), tokensDetails.getAccessToken(), tokensDetails.getRefreshToken(), twitchChannel
+                )
 
-        await connection.close()
+                self.__cache[twitchChannel.lower()] = tokensDetails
+                self.__tokenExpirationTimes[twitchChannel.lower()] = expirationTime
+                self.__timber.log('TwitchTokensRepository', f'Twitch tokens details for \"{twitchChannel}\" has been updated ({tokensDetails})')
+        finally:
+            await connection.close()
 
     async def validateAndRefreshAccessToken(self, twitchChannel: str):
         if not utils.isValidStr(twitchChannel):
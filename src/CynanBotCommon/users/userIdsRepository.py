@@ -1,5 +1,5 @@
 import traceback
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
 try:
     import CynanBotCommon.utils as utils
@@ -84,20 +84,22 @@ class UserIdsRepository(UserIdsRepositoryInterface):
             raise ValueError(f'twitchAccessToken argument is malformed: \"{twitchAccessToken}\"')
 
         connection = await self.__getDatabaseConnection()
-        record = await connection.fetchRow(
-            '''
-                SELECT userid FROM userids
-                WHERE username = $1
-                LIMIT 1
-            ''',
-            userName
-        )
 
-        userId: Optional[str] = None
-        if utils.hasItems(record):
-            userId = record[0]
+        try:
+            record = await connection.fetchRow(
+                '''
+                    SELECT userid FROM userids
+                    WHERE username = $1
+                    LIMIT 1
+                ''',
+                userName
+            )
 
-        await connection.close()
+            userId: Optional[str] = None
+            if utils.hasItems(record):
+                userId = record[0]
+        finally:
+            await connection.close()
 
         if utils.isValidStr(userId):
             return userId
@@ -154,20 +156,22 @@ class UserIdsRepository(UserIdsRepositoryInterface):
             raise ValueError(f'twitchAccessToken argument is malformed: \"{twitchAccessToken}\"')
 
         connection = await self.__getDatabaseConnection()
-        record = await connection.fetchRow(
-            '''
-                SELECT username FROM userids
-                WHERE userid = $1
-                LIMIT 1
-            ''',
-            userId
-        )
 
-        userName: Optional[str] = None
-        if utils.hasItems(record):
-            userName = record[0]
+        try:
+            record = await connection.fetchRow(
+                '''
+                    SELECT username FROM userids
+                    WHERE userid = $1
+                    LIMIT 1
+                ''',
+                userId
+            )
 
-        await connection.close()
+            userName: Optional[str] = None
+            if utils.hasItems(record):
+                userName = record[0]
+        finally:
+            await connection.close()
 
         if utils.isValidStr(userName):
             return userName
@@ -207,28 +211,29 @@ class UserIdsRepository(UserIdsRepositoryInterface):
         self.__isDatabaseReady = True
         connection = await self.__backingDatabase.getConnection()
 
-        if connection.getDatabaseType() is DatabaseType.POSTGRESQL:
-            await connection.createTableIfNotExists(
-                '''
-                    CREATE TABLE IF NOT EXISTS userids (
-                        userid public.citext NOT NULL PRIMARY KEY,
-                        username public.citext NOT NULL
-                    )
-                '''
-            )
-        elif connection.getDatabaseType() is DatabaseType.SQLITE:
-            await connection.createTableIfNotExists(
-                '''
-                    CREATE TABLE IF NOT EXISTS userids (
-                        userid TEXT NOT NULL PRIMARY KEY COLLATE NOCASE,
-                        username TEXT NOT NULL COLLATE NOCASE
-                    )
-                '''
-            )
-        else:
-            raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
-
-        await connection.close()
+        try:
+            if connection.getDatabaseType() is DatabaseType.POSTGRESQL:
+                await connection.createTableIfNotExists(
+                    '''
+                        CREATE TABLE IF NOT EXISTS userids (
+                            userid public.citext NOT NULL PRIMARY KEY,
+                            username public.citext NOT NULL
+                        )
+                    '''
+                )
+            elif connection.getDatabaseType() is DatabaseType.SQLITE:
+                await connection.createTableIfNotExists(
+                    '''
+                        CREATE TABLE IF NOT EXISTS userids (
+                            userid TEXT NOT NULL PRIMARY KEY COLLATE NOCASE,
+                            username TEXT NOT NULL COLLATE NOCASE
+                        )
+                    '''
+                )
+            else:
+                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
+        finally:
+            await connection.close()
 
     async def requireAnonymousUserId(self, twitchAccessToken: str) -> str:
         if not utils.isValidStr(twitchAccessToken):
@@ -313,13 +318,48 @@ class UserIdsRepository(UserIdsRepositoryInterface):
             raise ValueError(f'userName argument is malformed: \"{userName}\"')
 
         connection = await self.__getDatabaseConnection()
-        await connection.execute(
-            '''
-                INSERT INTO userids (userid, username)
-                VALUES ($1, $2)
-                ON CONFLICT (userid) DO UPDATE SET username = EXCLUDED.username
-            ''',
-            userId, userName
-        )
 
-        await connection.close()
+        try:
+            await connection.execute(
+                '''
+                    INSERT INTO userids (userid, username)
+                    VALUES ($1, $2)
+                    ON CONFLICT (userid) DO UPDATE SET username = EXCLUDED.username
+                ''',
+                userId, userName
+            )
+        finally:
+            await connection.close()
+
+    async def setUsers(self, userIdsToUserNames: Dict[str, str]):
+        if not isinstance(userIdsToUserNames, Dict):
+            raise ValueError(f'userIdsToUserNames argument is malformed: \"{userIdsToUserNames}\"')
+
+        records: List[List[Any]] = list()
+
+        for userId, userName in userIdsToUserNames.items():
+            if not utils.isValidStr(userId):
+                raise ValueError(f'userId value is malformed: \"{userId}\"')
+            elif userId == '0':
+                raise ValueError(f'userId value is an illegal value: \"{userId}\"')
+            elif not utils.isValidStr(userName):
+                raise ValueError(f'userName value is malformed: \"{userName}\"')
+
+            records.append([ userId, userName ])
+
+        if len(records) == 0:
+            return
+
+        connection = await self.__getDatabaseConnection()
+
+        try:
+            await connection.executeMany(
+                '''
+                    INSERT INTO userids (userid, username)
+                    VALUES ($1, $2)
+                    ON CONFLICT (userid) DO UPDATE SET username = EXCLUDED.username
+                ''',
+                records
+            )
+        finally:
+            await connection.close()
@@ -1,5 +1,5 @@
 from abc import abstractmethod
-from typing import Optional
+from typing import Dict, Optional
 
 try:
     from CynanBotCommon.clearable import Clearable
@@ -76,3 +76,7 @@ class UserIdsRepositoryInterface(Clearable):
     @abstractmethod
     async def setUser(self, userId: str, userName: str):
         pass
+
+    @abstractmethod
+    async def setUsers(self, userIdsToUserNames: Dict[str, str]):
+        pass
@@ -0,0 +1,77 @@
+import asyncio
+import time
+from typing import List
+
+try:
+    from CynanBotCommon.timber.timberStub import TimberStub
+    from CynanBotCommon.trivia.triviaAnswerCompiler import \
+        TriviaAnswerCompiler
+except:
+    from timber.timberStub import TimberStub
+    from trivia.triviaAnswerCompiler import TriviaAnswerCompiler
+
+# This file is meant to be run separately from the others in this repository. It measures how long
+# TriviaAnswerCompiler takes to compile a batch of guesses that look like what chatters actually
+# type during a super trivia game.
+
+guesses: List[str] = [
+    'north korea',
+    'Kurt Vonnegut',
+    'the united states of america',
+    'ww2',
+    'Mt. Everest',
+    'a',
+    'true',
+    'its a bunny',
+    'Dr. Who?',
+    'Ｐｉｋａｃｈｕ',
+    '𝓶𝓮𝓽𝓻𝓸𝓲𝓭',
+    'Pokémon Café',
+    'naïve résumé',
+    'stashiocat & imyt',
+    'the 1990s',
+    'x = 5',
+    'George Washington Carver',
+    '<i>Gone with the Wind</i>',
+    'FDR',
+    'Jalapeño',
+]
+
+iterations: int = 2000
+
+async def __benchmark():
+    triviaAnswerCompiler = TriviaAnswerCompiler(timber = TimberStub())
+
+    # warm up
+    for guess in guesses:
+        await triviaAnswerCompiler.compileTextAnswer(guess)
+
+    compiledGuesses = iterations * len(guesses)
+
+    # every guess is compiled from scratch
+    elapsed: float = 0
+
+    for _ in range(iterations):
+        await triviaAnswerCompiler.clearCaches()
+        start = time.perf_counter()
+
+        for guess in guesses:
+            await triviaAnswerCompiler.compileTextAnswer(guess)
+
+        elapsed += time.perf_counter() - start
+
+    print(f'Uncached: compiled {compiledGuesses} guesses in {elapsed:.3f}s ({elapsed / compiledGuesses * 1000000:.2f}µs per guess)')
+
+    # every guess has already been seen before, as happens when chat repeats a guess
+    start = time.perf_counter()
+
+    for _ in range(iterations):
+        for guess in guesses:
+            await triviaAnswerCompiler.compileTextAnswer(guess)
+
+    elapsed = time.perf_counter() - start
+    print(f'Cached: compiled {compiledGuesses} guesses in {elapsed:.3f}s ({elapsed / compiledGuesses * 1000000:.2f}µs per guess)')
+    print(f'Cache hits: {triviaAnswerCompiler.getCacheHitCount()}, cache misses: {triviaAnswerCompiler.getCacheMissCount()}')
+
+
+asyncio.run(__benchmark())
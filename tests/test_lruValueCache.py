@@ -0,0 +1,96 @@
+try:
+    from CynanBotCommon.lruValueCache import LruValueCache
+except:
+    from lruValueCache import LruValueCache
+
+
+class TestLruValueCache():
+
+    def test_constructWithOneCapacity(self):
+        lruValueCache: LruValueCache = None
+        exception: Exception = None
+
+        try:
+            lruValueCache = LruValueCache(1)
+        except Exception as e:
+            exception = e
+
+        assert lruValueCache is not None
+        assert exception is None
+
+    def test_constructWithZeroCapacity(self):
+        lruValueCache: LruValueCache = None
+        exception: Exception = None
+
+        try:
+            lruValueCache = LruValueCache(0)
+        except Exception as e:
+            exception = e
+
+        assert lruValueCache is None
+        assert exception is not None
+        assert isinstance(exception, ValueError)
+
+    def test_clear(self):
+        lruValueCache = LruValueCache(3)
+        lruValueCache.put('charmander', 4)
+        lruValueCache.put('squirtle', 7)
+        assert lruValueCache.getSize() == 2
+
+        lruValueCache.clear()
+        assert lruValueCache.getSize() == 0
+        assert lruValueCache.get('charmander') is None
+        assert lruValueCache.get('squirtle') is None
+
+    def test_get(self):
+        lruValueCache = LruValueCache(3)
+        assert lruValueCache.get('charmander') is None
+
+        lruValueCache.put('charmander', 4)
+        lruValueCache.put('squirtle', 7)
+        lruValueCache.put('bulbasaur', 1)
+        assert lruValueCache.get('charmander') == 4
+        assert lruValueCache.get('squirtle') == 7
+        assert lruValueCache.get('bulbasaur') == 1
+
+        lruValueCache.put('pikachu', 25)
+        assert lruValueCache.get('charmander') is None
+        assert lruValueCache.get('squirtle') == 7
+        assert lruValueCache.get('bulbasaur') == 1
+        assert lruValueCache.get('pikachu') == 25
+
+        # squirtle was used least recently, so it's the next to be evicted
+        lruValueCache.get('bulbasaur')
+        lruValueCache.get('pikachu')
+        lruValueCache.put('mew', 151)
+        assert lruValueCache.get('squirtle') is None
+        assert lruValueCache.get('bulbasaur') == 1
+        assert lruValueCache.get('pikachu') == 25
+        assert lruValueCache.get('mew') == 151
+        assert lruValueCache.getSize() == 3
+
+    def test_getHitCountAndGetMissCount(self):
+        lruValueCache = LruValueCache(3)
+        assert lruValueCache.getHitCount() == 0
+        assert lruValueCache.getMissCount() == 0
+
+        lruValueCache.get('charmander')
+        assert lruValueCache.getHitCount() == 0
+        assert lruValueCache.getMissCount() == 1
+
+        lruValueCache.put('charmander', 4)
+        lruValueCache.get('charmander')
+        lruValueCache.get('charmander')
+        assert lruValueCache.getHitCount() == 2
+        assert lruValueCache.getMissCount() == 1
+
+    def test_putWithNoneValue(self):
+        lruValueCache = LruValueCache(3)
+        exception: Exception = None
+
+        try:
+            lruValueCache.put('charmander', None)
+        except Exception as e:
+            exception = e
+
+        assert isinstance(exception, ValueError)